@@ -0,0 +1,257 @@
+# coding=utf-8
+"""Decide which bugs are fixed from a local snapshot of the issue tracker.
+
+``pulp_smash.selectors.bug_is_fixed`` asks the Pulp issue tracker about each
+bug the first time it is referenced, so test runs depend on the tracker being
+reachable, and skip decisions change whenever an issue changes. This module
+resolves every issue referenced by the tests once, stores the results in a
+JSON file, and evaluates :func:`bug_is_fixed` from that file in memory.
+
+To create or refresh the snapshot:
+
+.. code-block:: sh
+
+    python -m pulp_2_tests.bug_status collect --output bug_status.json
+
+To use it, point ``PULP_2_TESTS_BUG_STATUS`` at the file. No snapshot is
+read unless the variable is set, and a warning is emitted if the snapshot is
+older than :data:`MAX_SNAPSHOT_AGE`. Without a snapshot, or for bugs missing
+from it, :func:`bug_is_fixed` falls back to
+``pulp_smash.selectors.bug_is_fixed``.
+
+The snapshot is a JSON object such as the following::
+
+    {
+        "version": 1,
+        "created": "2019-03-01T12:00:00+00:00",
+        "tracker": "https://pulp.plan.io",
+        "bugs": {
+            "2277": {"status": "CLOSED - CURRENTRELEASE",
+                     "target_platform_release": "2.13"}
+        }
+    }
+"""
+import datetime
+import json
+import os
+import re
+import sys
+import threading
+import warnings
+
+import requests
+from packaging.version import InvalidVersion, Version
+from pulp_smash import selectors
+
+from pulp_2_tests.lazy import parse_datetime
+
+SNAPSHOT_VERSION = 1
+"""The version of the snapshot file format."""
+
+TRACKER_URL = 'https://pulp.plan.io'
+"""The Redmine instance tracking Pulp issues."""
+
+MAX_SNAPSHOT_AGE = datetime.timedelta(days=14)
+"""How old a snapshot may be before :func:`load_snapshot` warns about it."""
+
+TESTABLE_STATUSES = frozenset((
+    'MODIFIED',
+    'ON_QA',
+    'VERIFIED',
+    'CLOSED - CURRENTRELEASE',
+    'CLOSED - WORKSFORME',
+))
+"""Statuses of bugs that are fixed, as understood by Pulp Smash."""
+
+UNTESTABLE_STATUSES = frozenset((
+    'NEW',
+    'ASSIGNED',
+    'POST',
+    'CLOSED - DUPLICATE',
+    'CLOSED - NOTABUG',
+    'CLOSED - WONTFIX',
+))
+"""Statuses of bugs that are not fixed, as understood by Pulp Smash."""
+
+_ISSUE_ID_PATTERNS = (
+    re.compile(r'bug_is_fixed\(\s*(\d+)'),
+    re.compile(r'maybe_disable_selinux\([^)]*?(\d+)\s*\)'),
+    re.compile(r'pulp\.plan\.io/issues/(\d+)'),
+)
+
+_SNAPSHOT = None
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def get_snapshot_path():
+    """Return the path to the snapshot file, or ``None`` if there is none.
+
+    The path is read from the ``PULP_2_TESTS_BUG_STATUS`` environment
+    variable. Snapshot files lying around are deliberately ignored, so that an
+    outdated snapshot can't silently override the issue tracker.
+    """
+    return os.environ.get('PULP_2_TESTS_BUG_STATUS') or None
+
+
+def _warn_if_stale(snapshot, snapshot_path):
+    """Warn if ``snapshot`` is older than :data:`MAX_SNAPSHOT_AGE`."""
+    created = parse_datetime(snapshot['created'])
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=datetime.timezone.utc)
+    age = datetime.datetime.now(datetime.timezone.utc) - created
+    if age > MAX_SNAPSHOT_AGE:
+        warnings.warn(
+            'The bug status snapshot {} was collected {} days ago. Bugs may '
+            'have changed status since. Refresh it with "python -m '
+            'pulp_2_tests.bug_status collect".'
+            .format(snapshot_path, age.days)
+        )
+
+
+def load_snapshot(path=None):
+    """Return the bugs in a snapshot file, as a dict, and cache them.
+
+    :param path: The snapshot file. Defaults to :func:`get_snapshot_path`.
+    :returns: A dict mapping issue IDs, as integers, to dicts with "status"
+        and "target_platform_release" keys. The dict is empty if there is no
+        snapshot.
+    :raises ValueError: If the snapshot has an unsupported version.
+    """
+    global _SNAPSHOT  # pylint:disable=global-statement
+    with _SNAPSHOT_LOCK:
+        if _SNAPSHOT is not None and path is None:
+            return _SNAPSHOT
+        snapshot_path = get_snapshot_path() if path is None else path
+        bugs = {}
+        if snapshot_path is not None:
+            with open(snapshot_path) as handle:
+                snapshot = json.load(handle)
+            if snapshot.get('version') != SNAPSHOT_VERSION:
+                raise ValueError(
+                    'Unsupported bug status snapshot version {!r} in {}.'
+                    .format(snapshot.get('version'), snapshot_path)
+                )
+            _warn_if_stale(snapshot, snapshot_path)
+            bugs = {int(key): value for key, value in snapshot['bugs'].items()}
+        _SNAPSHOT = bugs
+        return _SNAPSHOT
+
+
+def bug_is_fixed(bug_id, pulp_version):
+    """Tell whether bug ``bug_id`` is fixed in version ``pulp_version``.
+
+    This function is like ``pulp_smash.selectors.bug_is_fixed``, except that
+    bugs present in the snapshot are evaluated without contacting the issue
+    tracker.
+
+    :param bug_id: An integer bug ID.
+    :param pulp_version: A ``packaging.version.Version`` object.
+    :returns: True if the bug is fixed, and false otherwise.
+    """
+    bug = load_snapshot().get(bug_id)
+    if bug is None:
+        return selectors.bug_is_fixed(bug_id, pulp_version)
+    if bug['status'] not in TESTABLE_STATUSES:
+        return False
+    release = bug['target_platform_release']
+    return release is None or Version(release) <= pulp_version
+
+
+def collect_issue_ids(top=None):
+    """Return the sorted IDs of the Pulp issues referenced by the tests.
+
+    :param top: The directory to search. Defaults to the ``pulp_2_tests``
+        package.
+    """
+    if top is None:
+        top = os.path.dirname(os.path.abspath(__file__))
+    issue_ids = set()
+    for dirpath, _, filenames in os.walk(top):
+        for filename in filenames:
+            if not filename.endswith('.py'):
+                continue
+            with open(os.path.join(dirpath, filename)) as handle:
+                source = handle.read()
+            for pattern in _ISSUE_ID_PATTERNS:
+                issue_ids.update(int(i) for i in pattern.findall(source))
+    return sorted(issue_ids)
+
+
+def fetch_bug(bug_id, session=None):
+    """Fetch the status and target platform release of one bug.
+
+    :returns: A dict with "status" and "target_platform_release" keys.
+    """
+    if session is None:
+        session = requests
+    response = session.get('{}/issues/{}.json'.format(TRACKER_URL, bug_id))
+    response.raise_for_status()
+    issue = response.json()['issue']
+    release = None
+    for field in issue.get('custom_fields', ()):
+        if field.get('name') == 'Platform Release' and field.get('value'):
+            try:
+                release = str(Version(field['value']))
+            except InvalidVersion:
+                pass
+    return {
+        'status': issue['status']['name'],
+        'target_platform_release': release,
+    }
+
+
+def create_snapshot(issue_ids, max_workers=8):
+    """Resolve ``issue_ids`` against the tracker, and return a snapshot.
+
+    :raises ValueError: If any bug has a status unknown to this module.
+    """
+    # Imported here, as nearly every test module imports this module, but
+    # only the command line interface needs the following.
+    from concurrent.futures import ThreadPoolExecutor  # pylint:disable=import-outside-toplevel
+    session = requests.Session()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        bugs = dict(zip(
+            issue_ids,
+            executor.map(lambda bug_id: fetch_bug(bug_id, session), issue_ids),
+        ))
+    known = TESTABLE_STATUSES | UNTESTABLE_STATUSES
+    for bug_id, bug in bugs.items():
+        if bug['status'] not in known:
+            raise ValueError('Bug {} has an unknown status: {}'.format(
+                bug_id, bug['status']))
+    return {
+        'version': SNAPSHOT_VERSION,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'tracker': TRACKER_URL,
+        'bugs': {str(bug_id): bug for bug_id, bug in sorted(bugs.items())},
+    }
+
+
+def main():
+    """Parse arguments, and collect a snapshot or list issue IDs."""
+    import argparse  # pylint:disable=import-outside-toplevel
+    parser = argparse.ArgumentParser(
+        prog='python -m pulp_2_tests.bug_status',
+        description='Snapshot the status of the Pulp issues the tests use.',
+    )
+    parser.add_argument('action', choices=('collect', 'list'))
+    parser.add_argument(
+        '--output', default='bug_status.json',
+        help='Where to write the snapshot. (default: %(default)s)',
+    )
+    args = parser.parse_args()
+    issue_ids = collect_issue_ids()
+    if args.action == 'list':
+        print('\n'.join(str(issue_id) for issue_id in issue_ids))
+        return 0
+    snapshot = create_snapshot(issue_ids)
+    with open(args.output, 'w') as handle:
+        json.dump(snapshot, handle, indent=2, sort_keys=True)
+        handle.write('\n')
+    print('Wrote the status of {} bugs to {}'.format(
+        len(snapshot['bugs']), args.output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+# coding=utf-8
+"""Probe what a Pulp host is capable of, once per test session.
+
+Many tests decide whether to skip by asking the Pulp host which OS it runs,
+which version of RPM it has, whether FIPS mode is enabled, and so on. Asking
+costs at least one SSH round trip per question, and the same questions are
+asked by many test cases. :func:`get_capabilities` instead asks every question
+in a single round trip the first time a host is probed, and caches the answers
+in an immutable :class:`Capabilities` object:
+
+.. code-block:: python
+
+    from pulp_smash import config
+    from pulp_2_tests.capabilities import get_capabilities
+
+    caps = get_capabilities(config.get_config())
+    if caps.os_is('fedora', '28') or caps.fips_enabled:
+        ...
+
+The capabilities describe the host as it was when first probed. Tests that
+change the host, such as by toggling SELinux, should inspect the host
+directly.
+"""
+import threading
+from collections import namedtuple
+
+from packaging.version import InvalidVersion, Version
+from pulp_smash import api, cli, config
+
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.constants import RPM_PKG_RICH_WEAK_VERSION
+
+PLUGIN_TYPES_PATH = '/pulp/api/v2/plugins/types/'
+"""The path to the list of content unit types installed in Pulp."""
+
+_PROBE_COMMANDS = (
+    ('cat', '/etc/os-release'),
+    ('cat', '/etc/redhat-release'),
+    ('rpm', '--version'),
+    ('cat', '/proc/sys/crypto/fips_enabled'),
+    ('getenforce',),
+)
+
+_CAPABILITIES = {}
+_CAPABILITIES_LOCK = threading.Lock()
+
+
+class Capabilities(namedtuple('Capabilities', (
+        'hostname',
+        'pulp_version',
+        'os_id',
+        'os_version_id',
+        'redhat_release',
+        'rpm_version',
+        'unit_types',
+        'fips_enabled',
+        'selinux_mode',
+))):
+    """What a Pulp host is capable of.
+
+    :param hostname: The hostname of the probed host.
+    :param pulp_version: The Pulp version, as a ``packaging.version.Version``.
+    :param os_id: The ``ID`` field of ``/etc/os-release``, such as "fedora".
+    :param os_version_id: The ``VERSION_ID`` field of ``/etc/os-release``,
+        such as "28".
+    :param redhat_release: The content of ``/etc/redhat-release``, or an empty
+        string.
+    :param rpm_version: The version of RPM, as a ``packaging.version.Version``,
+        or ``None``.
+    :param unit_types: A frozenset of the content unit types installed in
+        Pulp, such as "rpm" and "docker_image".
+    :param fips_enabled: Whether the kernel runs in FIPS mode.
+    :param selinux_mode: The output of ``getenforce``, such as "Enforcing", or
+        ``None`` if SELinux isn't available.
+    """
+
+    __slots__ = ()
+
+    def os_is(self, os_id, os_version_id=None):
+        """Tell whether the host runs the given OS and, optionally, version."""
+        return self.os_id == os_id and (
+            os_version_id is None or self.os_version_id == os_version_id
+        )
+
+    @property
+    def os_is_rhel6(self):
+        """Tell whether the host runs RHEL 6."""
+        return ('red hat enterprise linux server release 6' in
+                self.redhat_release.lower())
+
+    @property
+    def supports_modularity(self):
+        """Tell whether the host `supports modularity`_.
+
+        .. _supports modularity:
+            https://fedoraproject.org/wiki/Changes/F28AddonModularity
+        """
+        try:
+            return (self.os_id == 'fedora' and
+                    Version(self.os_version_id) >= Version('28'))
+        except InvalidVersion:
+            return False
+
+    @property
+    def supports_rich_weak_dependencies(self):
+        """Tell whether the host's RPM supports rich and weak dependencies."""
+        return (self.rpm_version is not None and
+                self.rpm_version >= Version(RPM_PKG_RICH_WEAK_VERSION))
+
+
+def _parse_os_release(text):
+    """Parse the content of ``/etc/os-release`` into a dict."""
+    fields = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition('=')
+        if sep and not key.startswith('#'):
+            fields[key.strip()] = value.strip().strip('"\'')
+    return fields
+
+
+def _parse_rpm_version(text):
+    """Parse the output of ``rpm --version``, such as "RPM version 4.14.2"."""
+    try:
+        return Version(text.split()[2])
+    except (IndexError, InvalidVersion):
+        return None
+
+
+def probe(cfg, pulp_host=None):
+    """Probe a Pulp host, and return its :class:`Capabilities`.
+
+    Every command is executed in a single round trip to the host, and the
+    installed unit types are fetched with a single API call. Prefer
+    :func:`get_capabilities`, which caches the result.
+    """
+    if pulp_host is None:
+        pulp_host = cfg.get_hosts('shell')[0]
+    results = ssh.Client(
+        cfg, cli.echo_handler, pulp_host=pulp_host
+    ).run_batch(_PROBE_COMMANDS)
+    os_release, redhat_release, rpm_version, fips, selinux = (
+        results[0], results[1], results[2], results[3], results[4])
+    fields = _parse_os_release(os_release.stdout)
+    unit_types = http_pool.Client(cfg, api.json_handler).get(PLUGIN_TYPES_PATH)
+    return Capabilities(
+        hostname=pulp_host.hostname,
+        pulp_version=cfg.pulp_version,
+        os_id=fields.get('ID'),
+        os_version_id=fields.get('VERSION_ID'),
+        redhat_release=(
+            redhat_release.stdout.strip()
+            if redhat_release.returncode == 0 else ''
+        ),
+        rpm_version=_parse_rpm_version(rpm_version.stdout),
+        unit_types=frozenset(unit_type['id'] for unit_type in unit_types),
+        fips_enabled=fips.returncode == 0 and fips.stdout.strip() == '1',
+        selinux_mode=(
+            selinux.stdout.strip() or None
+            if selinux.returncode == 0 else None
+        ),
+    )
+
+
+def get_capabilities(cfg, pulp_host=None):
+    """Return the :class:`Capabilities` of a Pulp host.
+
+    The host is probed the first time this function is called for it. Later
+    calls return the cached capabilities.
+
+    :param cfg: Information about a Pulp deployment.
+    :param pulp_host: The host to probe. Defaults to the first host with the
+        "shell" role.
+    """
+    if pulp_host is None:
+        pulp_host = cfg.get_hosts('shell')[0]
+    with _CAPABILITIES_LOCK:
+        if pulp_host.hostname not in _CAPABILITIES:
+            _CAPABILITIES[pulp_host.hostname] = probe(cfg, pulp_host)
+        return _CAPABILITIES[pulp_host.hostname]
+
+
+def require_unit_types(required_unit_types, exc):
+    """Skip a test if one or more unit types aren't installed in Pulp.
+
+    This function is like ``pulp_smash.pulp2.utils.require_unit_types``,
+    except that the installed unit types are read from
+    :func:`get_capabilities`.
+
+    :param required_unit_types: A set of unit types, such as ``{'rpm'}``.
+    :param exc: The exception to raise, such as ``unittest.SkipTest``.
+    """
+    missing = set(required_unit_types) - get_capabilities(
+        config.get_config()).unit_types
+    if missing:
+        raise exc(
+            'The following unit types are not supported by the Pulp system '
+            'under test: {}'.format(missing)
+        )
@@ -1,11 +1,23 @@
 # coding=utf-8
 """Values usable by multiple test modules."""
+import os
 from types import MappingProxyType  # used to form an immutable dictionary
 from urllib.parse import quote_plus, urljoin
 
-from pulp_smash.constants import PULP_FIXTURES_BASE_URL
+from pulp_smash import constants
 
 
+PULP_FIXTURES_BASE_URL = os.environ.get(
+    'PULP_2_TESTS_FIXTURES_BASE_URL',
+    constants.PULP_FIXTURES_BASE_URL,
+).rstrip('/') + '/'
+"""The URL to the root of the fixtures.
+
+Defaults to ``pulp_smash.constants.PULP_FIXTURES_BASE_URL``. Set the
+``PULP_2_TESTS_FIXTURES_BASE_URL`` environment variable to use a mirror
+instead, such as one served by :mod:`pulp_2_tests.fixtures_mirror`.
+"""
+
 DOCKER_IMAGE_URL = urljoin(PULP_FIXTURES_BASE_URL, 'docker/busybox:latest.tar')
 """The URL to a Docker image as created by ``docker save``."""
 
@@ -0,0 +1,269 @@
+# coding=utf-8
+"""A cache for fixture files downloaded by the tests.
+
+Many test cases download the same fixture files, such as
+:data:`pulp_2_tests.constants.RPM_UNSIGNED_URL`, with
+``pulp_smash.utils.http_get``, only to upload them to Pulp. The functions in
+this module are drop-in replacements for ``pulp_smash.utils.http_get`` and
+``pulp_smash.utils.get_sha256_checksum`` that cache fixture files:
+
+* In memory, for the lifetime of the process. Repeat fetches cost nothing.
+* On disk, across processes and test runs. The first fetch of a URL by a
+  process revalidates the file with a conditional request, using its ETag or
+  modification time, and reads the file from disk if it hasn't changed. If
+  the server can't be reached, the file on disk is used as-is.
+
+Files on disk are stored by their SHA256 checksum, which is also reused when a
+checksum is asked for. The least recently used files are evicted when the disk
+cache grows beyond its maximum size.
+
+Only URLs below :data:`pulp_2_tests.constants.PULP_FIXTURES_BASE_URL` are
+cached, as they are immutable in practice. Other URLs, such as those of
+published Pulp repositories, are always downloaded.
+
+The disk cache is stored in ``$XDG_CACHE_HOME/pulp_2_tests/downloads``. Set
+``PULP_2_TESTS_DOWNLOAD_CACHE`` to use another directory, or to an empty
+string to disable the disk cache.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import requests
+from pulp_smash import utils
+
+from pulp_2_tests.constants import PULP_FIXTURES_BASE_URL
+
+
+def _get_default_cache_dir():
+    """Return the default disk cache directory, or ``None`` if disabled."""
+    cache_dir = os.environ.get('PULP_2_TESTS_DOWNLOAD_CACHE')
+    if cache_dir is not None:
+        return cache_dir or None
+    cache_home = os.environ.get(
+        'XDG_CACHE_HOME',
+        os.path.join(os.path.expanduser('~'), '.cache'),
+    )
+    return os.path.join(cache_home, 'pulp_2_tests', 'downloads')
+
+
+class DownloadCache():
+    """A memory and disk cache of downloaded files, keyed by URL.
+
+    :param cache_dir: The directory holding the disk cache, or ``None`` to
+        only cache files in memory.
+    :param max_size: The maximum size of the disk cache, in bytes.
+    :param max_memory_size: The maximum size of the memory cache, in bytes.
+    """
+
+    def __init__(
+            self,
+            cache_dir=None,
+            max_size=2 * 1024 ** 3,
+            max_memory_size=256 * 1024 ** 2):
+        """Initialize instance attributes."""
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.max_memory_size = max_memory_size
+        self._memory = OrderedDict()  # url → (content, sha256)
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self._url_locks = {}
+
+    def get(self, url):
+        """Return the content at ``url``, as bytes.
+
+        :raises requests.exceptions.HTTPError: If the download fails.
+        """
+        return self._get(url)[0]
+
+    def get_sha256_checksum(self, url):
+        """Return the SHA256 checksum of the content at ``url``."""
+        return self._get(url)[1]
+
+    def clear(self):
+        """Empty the memory cache. The disk cache is left untouched."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+
+    def _get(self, url):
+        """Return a ``(content, sha256)`` tuple for ``url``."""
+        with self._lock:
+            lock = self._url_locks.setdefault(url, threading.Lock())
+        with lock:
+            with self._lock:
+                if url in self._memory:
+                    self._memory.move_to_end(url)
+                    return self._memory[url]
+            entry = self._fetch(url)
+            self._remember(url, entry)
+            return entry
+
+    def _remember(self, url, entry):
+        """Add ``entry`` to the memory cache, evicting old entries."""
+        size = len(entry[0])
+        if size > self.max_memory_size:
+            return
+        with self._lock:
+            self._memory[url] = entry
+            self._memory_size += size
+            while self._memory_size > self.max_memory_size:
+                _, (content, _) = self._memory.popitem(last=False)
+                self._memory_size -= len(content)
+
+    def _fetch(self, url):
+        """Download or revalidate ``url``. Return ``(content, sha256)``."""
+        meta = self._read_meta(url)
+        cached = self._read_blob(meta['sha256']) if meta else None
+        headers = {}
+        if cached is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        try:
+            response = requests.get(url, headers=headers)
+        except requests.exceptions.ConnectionError:
+            if cached is None:
+                raise
+            return cached, meta['sha256']
+        if response.status_code == 304 and cached is not None:
+            self._touch(url)
+            return cached, meta['sha256']
+        response.raise_for_status()
+        content = response.content
+        checksum = hashlib.sha256(content).hexdigest()
+        self._write(url, content, checksum, response.headers)
+        return content, checksum
+
+    def _path(self, *parts):
+        """Return a path inside the disk cache."""
+        return os.path.join(self.cache_dir, *parts)
+
+    def _meta_path(self, url):
+        """Return the path to the metadata file for ``url``."""
+        name = hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json'
+        return self._path('index', name)
+
+    def _read_meta(self, url):
+        """Return the metadata stored for ``url``, or ``None``."""
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._meta_path(url)) as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def _read_blob(self, checksum):
+        """Return the stored file with the given checksum, or ``None``.
+
+        Files that don't match their checksum are ignored.
+        """
+        try:
+            with open(self._path('blobs', checksum), 'rb') as handle:
+                content = handle.read()
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != checksum:
+            return None
+        return content
+
+    def _touch(self, url):
+        """Mark ``url`` as recently used."""
+        try:
+            os.utime(self._meta_path(url))
+        except OSError:
+            pass
+
+    def _write(self, url, content, checksum, headers):
+        """Store ``content`` on disk, and evict old files if needed."""
+        if self.cache_dir is None:
+            return
+        _atomic_write(self._path('blobs', checksum), content)
+        _atomic_write(self._meta_path(url), json.dumps({
+            'url': url,
+            'sha256': checksum,
+            'size': len(content),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }).encode('utf-8'))
+        self._evict()
+
+    def _evict(self):
+        """Delete the least recently used files until the cache is small."""
+        metas = []
+        index_dir = self._path('index')
+        for name in os.listdir(index_dir):
+            path = os.path.join(index_dir, name)
+            try:
+                with open(path) as handle:
+                    meta = json.load(handle)
+                metas.append((os.stat(path).st_mtime, path, meta))
+            except (OSError, ValueError):
+                continue
+        metas.sort(key=lambda item: item[0])
+        sizes = {meta['sha256']: meta['size'] for _, _, meta in metas}
+        refs = {}
+        for _, _, meta in metas:
+            refs[meta['sha256']] = refs.get(meta['sha256'], 0) + 1
+        total = sum(sizes.values())
+        for _, path, meta in metas:
+            if total <= self.max_size:
+                break
+            _remove(path)
+            refs[meta['sha256']] -= 1
+            if refs[meta['sha256']] == 0:
+                _remove(self._path('blobs', meta['sha256']))
+                total -= sizes[meta['sha256']]
+
+
+def _atomic_write(path, content):
+    """Write ``content`` to ``path``, such that readers never see a part."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(handle, 'wb') as tmp:
+        tmp.write(content)
+    os.replace(tmp_path, path)
+
+
+def _remove(path):
+    """Remove ``path``, if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+_CACHE = DownloadCache(_get_default_cache_dir())
+
+
+def _is_cacheable(url, kwargs):
+    """Tell whether a download may be served from the cache."""
+    return not kwargs and url.startswith(PULP_FIXTURES_BASE_URL)
+
+
+def http_get(url, **kwargs):
+    """Issue a HTTP GET request and return the response body.
+
+    This function is like ``pulp_smash.utils.http_get``, except that fixture
+    files are cached.
+    """
+    if _is_cacheable(url, kwargs):
+        return _CACHE.get(url)
+    return utils.http_get(url, **kwargs)
+
+
+def get_sha256_checksum(url):
+    """Return the SHA256 checksum of the file at ``url``.
+
+    This function is like ``pulp_smash.utils.get_sha256_checksum``, except
+    that fixture files and their checksums are cached.
+    """
+    if _is_cacheable(url, {}):
+        return _CACHE.get_sha256_checksum(url)
+    return utils.get_sha256_checksum(url)
@@ -0,0 +1,267 @@
+# coding=utf-8
+"""A local, caching mirror of the Pulp fixtures.
+
+Most fixture URLs in :mod:`pulp_2_tests.constants` point at
+``pulp_smash.constants.PULP_FIXTURES_BASE_URL``, which is on the internet. Pulp
+fetches feeds from there on every sync, and helpers such as
+``pulp_smash.utils.http_get`` download fixture files on every run. This module
+provides a small threaded HTTP server that serves the fixtures from an on-disk
+cache. Files missing from the cache are downloaded from upstream the first
+time they are requested, unless the server is offline. To use it:
+
+.. code-block:: sh
+
+    # Optionally, prefetch every fixture referenced by the constants.
+    python -m pulp_2_tests.fixtures_mirror populate --cache ~/fixtures
+    # Serve the fixtures on an address reachable from the Pulp hosts.
+    python -m pulp_2_tests.fixtures_mirror serve --cache ~/fixtures \\
+        --bind 0.0.0.0 --port 8000
+    # Point the constants at the mirror, and run the tests.
+    export PULP_2_TESTS_FIXTURES_BASE_URL=http://mirror.example.com:8000/
+    python -m unittest discover pulp_2_tests.tests
+
+Once the cache is populated, ``serve --offline`` runs without network access.
+"""
+import argparse
+import http.server
+import mimetypes
+import os
+import posixpath
+import re
+import shutil
+import socketserver
+import sys
+import tempfile
+import threading
+from collections import deque
+from urllib.parse import unquote, urljoin, urlsplit
+
+import requests
+from pulp_smash.constants import PULP_FIXTURES_BASE_URL
+
+_INDEX_NAME = '.pulp-2-tests-index.html'
+"""The name under which directory listings are stored in the cache."""
+
+_HREF_RE = re.compile(r'href="([^"?#]+)"', re.IGNORECASE)
+
+
+class FixtureCache():
+    """An on-disk cache of files fetched from the fixtures server.
+
+    :param cache_dir: The directory in which to store files.
+    :param upstream: The base URL of the fixtures server.
+    :param offline: If true, never contact ``upstream``.
+    """
+
+    def __init__(self, cache_dir, upstream=PULP_FIXTURES_BASE_URL,
+                 offline=False):
+        """Initialize instance attributes."""
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.upstream = upstream.rstrip('/') + '/'
+        self.offline = offline
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        self._session = requests.Session()
+
+    def local_path(self, path):
+        """Return where the file at URL ``path`` is stored.
+
+        Directory listings, whose paths end with a slash, are stored in a
+        hidden file in the matching directory. Paths can't escape the cache.
+        """
+        path = unquote(path)
+        parts = posixpath.normpath('/' + path.lstrip('/')).split('/')
+        parts = [part for part in parts if part]
+        if not parts or path.endswith('/'):
+            parts.append(_INDEX_NAME)
+        return os.path.join(self.cache_dir, *parts)
+
+    def get(self, path):
+        """Return the local path to the file at URL ``path``.
+
+        Download the file from upstream if it isn't cached yet. Concurrent
+        requests for the same file wait for a single download.
+
+        :param path: A URL path relative to the fixtures base URL, such as
+            ``rpm-signed/repodata/repomd.xml``.
+        :returns: A filesystem path, or ``None`` if the file is not available.
+        """
+        local_path = self.local_path(path)
+        with self._locks_lock:
+            lock = self._locks.setdefault(local_path, threading.Lock())
+        with lock:
+            if os.path.isfile(local_path):
+                return local_path
+            if self.offline:
+                return None
+            return self._download(path, local_path)
+
+    def _download(self, path, local_path):
+        """Download ``path`` to ``local_path``. Return ``local_path``."""
+        response = self._session.get(
+            urljoin(self.upstream, path.lstrip('/')),
+            headers={'Accept-Encoding': 'identity'},
+            stream=True,
+        )
+        with response:
+            if response.status_code != 200:
+                return None
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            handle, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(local_path))
+            with os.fdopen(handle, 'wb') as tmp:
+                shutil.copyfileobj(response.raw, tmp)
+        os.replace(tmp_path, local_path)
+        return local_path
+
+    def populate(self, paths):
+        """Download the given files and directory trees into the cache.
+
+        Directory trees, whose paths end with a slash, are crawled by following
+        the links in upstream's directory listings. Trees without a listing are
+        skipped; their files are fetched on first use instead.
+
+        :param paths: An iterable of URL paths relative to the fixtures base
+            URL.
+        :returns: The number of files that are cached.
+        """
+        count = 0
+        seen = set()
+        queue = deque(paths)
+        while queue:
+            path = queue.popleft()
+            if path in seen:
+                continue
+            seen.add(path)
+            local_path = self.get(path)
+            if local_path is None or not path.endswith('/'):
+                count += local_path is not None
+                continue
+            with open(local_path, errors='replace') as handle:
+                listing = handle.read()
+            for href in _HREF_RE.findall(listing):
+                child = urljoin(path, href)
+                if child.startswith(path) and child != path:
+                    queue.append(child)
+        return count
+
+
+def get_fixture_paths():
+    """Return the fixture paths referenced by :mod:`pulp_2_tests.constants`.
+
+    Each path is relative to the fixtures base URL, and ends with a slash if
+    it refers to a directory tree.
+    """
+    # Imported here, so that the constants may be pointed at a mirror started
+    # by the same process.
+    from pulp_2_tests import constants  # pylint:disable=import-outside-toplevel
+    base = constants.PULP_FIXTURES_BASE_URL
+    paths = set()
+    for value in vars(constants).values():
+        if isinstance(value, str) and value.startswith(base):
+            paths.add(value[len(base):])
+    paths.discard('')
+    return sorted(paths)
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve files from the server's :class:`FixtureCache`."""
+
+    def do_GET(self):  # pylint:disable=invalid-name
+        """Serve a file, including its body."""
+        self._serve(True)
+
+    def do_HEAD(self):  # pylint:disable=invalid-name
+        """Serve a file, excluding its body."""
+        self._serve(False)
+
+    def _serve(self, send_body):
+        """Serve the file at ``self.path``."""
+        path = urlsplit(self.path).path
+        local_path = self.server.cache.get(path)
+        if local_path is None:
+            self.send_error(404)
+            return
+        content_type = 'text/html'
+        if not local_path.endswith(_INDEX_NAME):
+            content_type = (
+                mimetypes.guess_type(path)[0] or 'application/octet-stream'
+            )
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(os.path.getsize(local_path)))
+        self.end_headers()
+        if send_body:
+            with open(local_path, 'rb') as handle:
+                shutil.copyfileobj(handle, self.wfile)
+
+    def log_message(self, format, *args):  # pylint:disable=redefined-builtin
+        """Log only when the server is verbose."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class FixtureServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """A threaded HTTP server that serves a :class:`FixtureCache`.
+
+    :param cache: A :class:`FixtureCache`.
+    :param address: A ``(host, port)`` tuple. A port of 0 picks a free port.
+    :param verbose: Whether to log each request to stderr.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, cache, address=('', 0), verbose=False):
+        """Initialize instance attributes, and bind to ``address``."""
+        super().__init__(address, _RequestHandler)
+        self.cache = cache
+        self.verbose = verbose
+
+    def start(self):
+        """Serve requests in a daemon thread. Return the thread."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+def main():
+    """Parse arguments, and populate the cache or serve it."""
+    parser = argparse.ArgumentParser(
+        prog='python -m pulp_2_tests.fixtures_mirror',
+        description='Mirror the Pulp fixtures locally.',
+    )
+    parser.add_argument(
+        'action', choices=('populate', 'serve'),
+        help='Prefetch the fixtures, or serve them.',
+    )
+    parser.add_argument(
+        '--cache', required=True, help='The directory holding the fixtures.')
+    parser.add_argument(
+        '--upstream', default=PULP_FIXTURES_BASE_URL,
+        help='The fixtures server to mirror. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--offline', action='store_true',
+        help='Only serve files that are already cached.',
+    )
+    parser.add_argument('--bind', default='', help='The address to bind to.')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+    cache = FixtureCache(args.cache, args.upstream, args.offline)
+    if args.action == 'populate':
+        count = cache.populate(get_fixture_paths())
+        print('{} files cached in {}'.format(count, cache.cache_dir))
+        return 0
+    server = FixtureServer(cache, (args.bind, args.port), args.verbose)
+    print('Serving {} on port {}'.format(
+        cache.cache_dir, server.server_address[1]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# coding=utf-8
+"""A pool of persistent HTTP sessions to the Pulp API.
+
+``pulp_smash.api.Client`` sends each request with ``requests.request``, which
+opens a new connection, and performs a new TLS handshake, for every request.
+:class:`Client` is a drop-in replacement that instead sends requests through a
+``requests.Session`` per host, shared by every thread. Connections are kept
+alive and reused by every client targeting the same host, so the TLS handshake
+is paid once per connection instead of once per request. A typical usage is as
+follows:
+
+.. code-block:: python
+
+    from pulp_smash import api
+
+    from pulp_2_tests import http_pool
+
+    client = http_pool.Client(cfg, api.json_handler)
+    client.get(REPOSITORY_PATH)
+
+Each session keeps up to :data:`POOL_SIZE` idle connections. Its connection
+pool is thread-safe, so threads started and stopped by short-lived executors
+borrow connections from it instead of each opening, and leaking, their own.
+"""
+import atexit
+import os
+import threading
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from pulp_smash import api
+from requests.adapters import HTTPAdapter
+
+POOL_SIZE = int(os.environ.get('PULP_2_TESTS_HTTP_POOL_SIZE', '10'))
+"""The number of connections each session keeps open.
+
+Set the ``PULP_2_TESTS_HTTP_POOL_SIZE`` environment variable to change it.
+Tests that send requests from many threads at once may need a larger pool.
+"""
+
+_SESSIONS = {}  # (scheme, netloc) → requests.Session
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _make_session():
+    """Return a new ``requests.Session`` with a pool of :data:`POOL_SIZE`."""
+    session = requests.Session()
+    for prefix in ('http://', 'https://'):
+        session.mount(prefix, HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+        ))
+    return session
+
+
+def get_session(url):
+    """Return the session for the host ``url`` points to.
+
+    :param url: Any URL on the host, such as the URL of a request.
+    :returns: A ``requests.Session``, created on first use and shared by every
+        thread.
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    with _SESSIONS_LOCK:
+        if key not in _SESSIONS:
+            _SESSIONS[key] = _make_session()
+        return _SESSIONS[key]
+
+
+@atexit.register
+def close_sessions():
+    """Close every pooled session."""
+    with _SESSIONS_LOCK:
+        sessions = tuple(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        session.close()
+
+
+class Client(api.Client):
+    """A client for sending requests through a pooled HTTP session.
+
+    This class has the same interface as ``pulp_smash.api.Client``. Every
+    request is sent with :func:`get_session`, so the client may be created
+    and thrown away as often as needed without opening new connections.
+    """
+
+    def request(self, method, url, **kwargs):
+        """Send an HTTP request, and return ``self.response_handler(...)``.
+
+        Arguments are the same as for ``pulp_smash.api.Client.request``.
+        """
+        request_kwargs = self.request_kwargs.copy()
+        request_kwargs['url'] = urljoin(request_kwargs['url'], url)
+        request_kwargs.update(kwargs)
+        session = get_session(request_kwargs['url'])
+        return self.response_handler(
+            self,
+            session.request(method, **request_kwargs),
+        )
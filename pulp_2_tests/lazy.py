@@ -0,0 +1,60 @@
+# coding=utf-8
+"""Stand-ins for heavy third-party callables, imported on first use.
+
+Importing a test module should be cheap, because many test modules are skipped
+by ``set_up_module`` before any test runs, and because test discovery imports
+every test module. Libraries such as ``jsonschema``, ``dateutil`` and
+``pytest`` each take tens of milliseconds to import, yet are only needed by a
+few tests. The functions in this module import them when first called:
+
+.. code-block:: python
+
+    from pulp_2_tests.lazy import pytest_mark, validate
+
+    @pytest_mark('recursive_conservative')
+    class MyTestCase(unittest.TestCase):
+
+        def test_schema(self):
+            validate(response.json(), SCHEMA)
+
+Run ``scripts/import_benchmark.py`` to see what importing the tests costs.
+"""
+import sys
+
+
+def validate(instance, schema):
+    """Validate ``instance`` against a JSON schema.
+
+    This function is like ``jsonschema.validate``.
+
+    :raises jsonschema.exceptions.ValidationError: If ``instance`` is invalid.
+    """
+    import jsonschema  # pylint:disable=import-outside-toplevel
+    jsonschema.validate(instance, schema)
+
+
+def parse_datetime(timestr):
+    """Parse a date and time, such as an ISO 8601 timestamp.
+
+    This function is like ``dateutil.parser.parse``.
+
+    :returns: A ``datetime.datetime`` object.
+    """
+    from dateutil import parser  # pylint:disable=import-outside-toplevel
+    return parser.parse(timestr)
+
+
+def pytest_mark(name):
+    """Return the pytest marker named ``name``, if pytest is running.
+
+    Markers only matter to pytest, and pytest is always imported when it
+    collects tests. If pytest hasn't been imported, such as when the tests are
+    run with unittest, return a decorator that does nothing.
+
+    :param name: The name of a marker registered in ``pytest.ini``.
+    :returns: A ``pytest.MarkDecorator``, or a function returning its
+        argument.
+    """
+    if 'pytest' in sys.modules:
+        return getattr(sys.modules['pytest'].mark, name)
+    return lambda obj: obj
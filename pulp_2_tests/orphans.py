@@ -0,0 +1,191 @@
+# coding=utf-8
+"""Tools for inspecting and deleting orphaned content units cheaply.
+
+Listing the orphans of a type, with ``GET ORPHANS_PATH/<type>/``, returns
+every orphan of that type in one response. On a long-lived Pulp host, there
+may be hundreds of thousands of them. The functions in this module instead
+work from the per-type counts that Pulp reports, search for orphans a page at
+a time, and delete them in batches:
+
+.. code-block:: python
+
+    from pulp_2_tests.orphans import (
+        delete_orphans,
+        get_orphan_counts,
+        sample_orphans,
+    )
+
+    counts = get_orphan_counts(cfg)
+    orphans = sample_orphans(cfg, 'erratum', 10)
+    delete_orphans(cfg, orphans)
+
+Searching for orphans costs one request per page of units of the type,
+whether the units are orphaned or not. :func:`sample_orphans` caps the number
+of pages it searches, and may find fewer orphans than requested.
+
+To delete every orphan, or every orphan of a type, send ``DELETE`` to
+``ORPHANS_PATH`` or ``ORPHANS_PATH/<type>/``: Pulp does so server-side.
+"""
+import uuid
+from urllib.parse import urljoin
+
+from pulp_smash import api
+from pulp_smash.pulp2.constants import CONTENT_UNITS_PATH, ORPHANS_PATH
+
+from pulp_2_tests import http_pool
+from pulp_2_tests.tasks import get_task_poller
+
+DELETE_ORPHANS_PATH = '/pulp/api/v2/content/actions/delete_orphans/'
+"""The path at which specific orphans may be deleted."""
+
+BATCH_SIZE = 1000
+"""The default number of orphans deleted per task by :func:`delete_orphans`."""
+
+
+def get_orphan_counts(cfg, type_ids=None):
+    """Return the number of orphaned content units of each type.
+
+    :param cfg: Information about a Pulp deployment.
+    :param type_ids: An iterable of unit type IDs. If given, the returned dict
+        has exactly these keys, and types Pulp doesn't report are counted as
+        zero. Otherwise, every type Pulp reports is returned.
+    :returns: A dict mapping unit type IDs to counts.
+    """
+    summary = http_pool.Client(cfg, api.json_handler).get(ORPHANS_PATH)
+    counts = {type_id: info['count'] for type_id, info in summary.items()}
+    if type_ids is None:
+        return counts
+    return {type_id: counts.get(type_id, 0) for type_id in type_ids}
+
+
+def count_orphans(cfg):
+    """Return the total number of orphaned content units, of every type."""
+    return sum(get_orphan_counts(cfg).values())
+
+
+def iter_orphans(cfg, type_id, page_size=100, start_id=None, max_pages=None):
+    """Search for orphaned units of type ``type_id``, and yield them.
+
+    Units of the given type are searched a page at a time, in order of ID, and
+    only those belonging to no repository are yielded. Only the units' IDs and
+    repository memberships are fetched. Each page is fetched with a filter on
+    the last ID seen, so that no page costs more than the one before.
+
+    Finding orphans this way costs one request per page of units of the type,
+    orphaned or not. Without ``max_pages``, finding every orphan means paging
+    through every unit of the type, which is slow on hosts with many units of
+    that type in repositories.
+
+    :param cfg: Information about a Pulp deployment.
+    :param type_id: A unit type ID, such as "erratum".
+    :param page_size: The number of units fetched per request.
+    :param start_id: A unit ID. If given, units with this ID or higher are
+        searched first, and then units with lower IDs. By default, units are
+        searched from the lowest ID.
+    :param max_pages: The maximum number of pages to fetch. By default, pages
+        are fetched until every unit of the type has been searched.
+    :returns: A generator of dicts with the ``_id``, ``_content_type_id`` and
+        ``_href`` of each orphan, like those listed at
+        ``ORPHANS_PATH/<type>/``.
+    """
+    client = http_pool.Client(cfg, api.json_handler)
+    path = urljoin(CONTENT_UNITS_PATH, '{}/search/'.format(type_id))
+    if start_id is None:
+        id_ranges = ({},)
+    else:
+        id_ranges = ({'$gte': start_id}, {'$lt': start_id})
+    pages = 0
+    for id_range in id_ranges:
+        last_id = None
+        while max_pages is None or pages < max_pages:
+            id_filter = dict(id_range)
+            if last_id is not None:
+                id_filter['$gt'] = last_id
+            criteria = {
+                'fields': ['_id'],
+                'limit': page_size,
+                'sort': [['_id', 'ascending']],
+            }
+            if id_filter:
+                criteria['filters'] = {'_id': id_filter}
+            page = client.post(
+                path, {'criteria': criteria, 'include_repos': True})
+            pages += 1
+            for unit in page:
+                if not unit['repository_memberships']:
+                    yield {
+                        '_content_type_id': type_id,
+                        '_href': urljoin(
+                            ORPHANS_PATH,
+                            '{}/{}/'.format(type_id, unit['_id']),
+                        ),
+                        '_id': unit['_id'],
+                    }
+            if len(page) < page_size:
+                break
+            last_id = page[-1]['_id']
+
+
+def sample_orphans(cfg, type_id, count, page_size=100, max_pages=10):
+    """Return up to ``count`` orphaned units of type ``type_id``.
+
+    Units are searched from a random ID, as Pulp generates unit IDs randomly,
+    and pages are fetched until enough orphans are found or ``max_pages``
+    pages have been fetched. See :func:`iter_orphans`. Orphans found this way
+    are close to each other in order of ID, and may be fewer than ``count``,
+    or none, even if Pulp has enough orphans: orphans may lie beyond the
+    pages searched.
+
+    :returns: A list of at most ``count`` orphans.
+    """
+    orphans = []
+    start_id = str(uuid.uuid4())
+    for orphan in iter_orphans(cfg, type_id, page_size, start_id, max_pages):
+        orphans.append(orphan)
+        if len(orphans) >= count:
+            break
+    return orphans
+
+
+def delete_orphans(cfg, orphans, batch_size=BATCH_SIZE, progress=None):
+    """Delete the given orphans, ``batch_size`` orphans per task.
+
+    Every batch is requested at once, and then waited on. Pulp runs orphan
+    deletion tasks one after another.
+
+    :param cfg: Information about a Pulp deployment.
+    :param orphans: An iterable of dicts with the ``_id`` and
+        ``_content_type_id`` of each orphan, such as those returned by
+        :func:`sample_orphans`.
+    :param batch_size: The number of orphans deleted per task.
+    :param progress: A function called with ``(deleted, total)`` each time a
+        batch is deleted, where ``deleted`` counts the orphans in every batch
+        deleted so far.
+    :returns: The tasks spawned for each batch, as a list of lists.
+    :raises pulp_smash.exceptions.TaskReportError: If a task fails.
+    """
+    units = [
+        {'content_type_id': orphan['_content_type_id'],
+         'unit_id': orphan['_id']}
+        for orphan in orphans
+    ]
+    batches = [
+        units[i:i + batch_size] for i in range(0, len(units), batch_size)
+    ]
+    client = http_pool.Client(cfg, api.code_handler)
+    poller = get_task_poller(cfg)
+    futures = [
+        poller.submit(
+            client.post(DELETE_ORPHANS_PATH, batch).json(),
+            check_errors=True,
+        )
+        for batch in batches
+    ]
+    tasks = []
+    deleted = 0
+    for batch, future in zip(batches, futures):
+        tasks.append(future.result())
+        deleted += len(batch)
+        if progress is not None:
+            progress(deleted, len(units))
+    return tasks
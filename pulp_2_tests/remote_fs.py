@@ -0,0 +1,202 @@
+# coding=utf-8
+"""Capture and compare snapshots of a directory tree on a Pulp host.
+
+Many tests make assertions about the files Pulp has published, copied or
+exported. Probing the filesystem with one ``ls``, ``find``, ``stat`` or
+``readlink`` command per assertion costs one round trip per command.
+:func:`take_snapshot` instead lists a whole directory tree with a single
+round trip, and returns an in-memory :class:`Snapshot` that can be queried
+any number of times. A typical usage is as follows:
+
+.. code-block:: python
+
+    from pulp_2_tests.remote_fs import take_snapshot
+
+    before = take_snapshot(cfg, path)
+    publish_repo(cfg, repo)
+    after = take_snapshot(cfg, path)
+    self.assertEqual(len(after.glob('*.rpm', 'f')), RPM_SIGNED_FEED_COUNT)
+    self.assertEqual(before.diff(after).removed, ())
+
+File names containing tabs or newlines are not supported.
+"""
+import fnmatch
+import os
+from collections import namedtuple
+
+from pulp_2_tests import ssh
+
+Entry = namedtuple('Entry', 'path type size mtime target sha256')
+"""Information about one file in a :class:`Snapshot`.
+
+``path`` is relative to the snapshot's root. ``type`` is a file type as
+reported by ``find -printf %y``, such as ``'f'``, ``'d'`` or ``'l'``.
+``mtime`` is a float. ``target`` is the target of a symbolic link, and
+``sha256`` the checksum of a regular file, or ``None``.
+"""
+
+SnapshotDiff = namedtuple('SnapshotDiff', 'added removed changed')
+"""The differences between two :class:`Snapshot` objects.
+
+Each field is a sorted tuple of relative paths.
+"""
+
+_FIND_FORMAT = '%P\\t%y\\t%s\\t%T@\\t%l\\n'
+
+
+class Snapshot():
+    """An indexed listing of a directory tree on a Pulp host.
+
+    :param root: The absolute path to the directory tree.
+    :param entries: An iterable of :class:`Entry` objects.
+    """
+
+    def __init__(self, root, entries):
+        """Initialize instance attributes and build indices."""
+        self.root = root
+        self.entries = {entry.path: entry for entry in entries}
+        self._children = {}
+        for path in self.entries:
+            parent, name = os.path.split(path)
+            self._children.setdefault(parent, []).append(name)
+        for names in self._children.values():
+            names.sort()
+
+    def __contains__(self, path):
+        """Tell whether ``path``, relative to the root, exists."""
+        return path in self.entries
+
+    def __getitem__(self, path):
+        """Return the :class:`Entry` for ``path``, relative to the root."""
+        return self.entries[path]
+
+    def __len__(self):
+        """Return the number of files in the snapshot, excluding the root."""
+        return len(self.entries)
+
+    def listdir(self, path='', hidden=False):
+        """Return the sorted names of the files in a directory.
+
+        :param path: A directory path, relative to the root.
+        :param hidden: Whether to include names starting with a dot, like
+            ``ls -A`` does.
+        :returns: A list of file names.
+        """
+        names = self._children.get(path, [])
+        if hidden:
+            return list(names)
+        return [name for name in names if not name.startswith('.')]
+
+    def glob(self, pattern, type_=None):
+        """Return the sorted paths that match ``pattern``.
+
+        :param pattern: A shell-style pattern, as accepted by ``fnmatch``. It
+            is matched against each relative path, and a ``*`` may match
+            ``/``.
+        :param type_: If given, only return files of this type, such as
+            ``'f'`` or ``'l'``.
+        :returns: A list of relative paths.
+        """
+        return sorted(
+            path for path, entry in self.entries.items()
+            if fnmatch.fnmatch(path, pattern) and
+            (type_ is None or entry.type == type_)
+        )
+
+    def diff(self, other):
+        """Compare this snapshot to a later snapshot of the same tree.
+
+        A path has changed if its type, size, mtime or symlink target differ,
+        or if both snapshots have a checksum for it and the checksums differ.
+
+        :param other: A :class:`Snapshot`.
+        :returns: A :class:`SnapshotDiff`.
+        """
+        ours = set(self.entries)
+        theirs = set(other.entries)
+        return SnapshotDiff(
+            tuple(sorted(theirs - ours)),
+            tuple(sorted(ours - theirs)),
+            tuple(sorted(
+                path for path in ours & theirs
+                if not _same(self.entries[path], other.entries[path])
+            )),
+        )
+
+
+def _same(entry, other):
+    """Tell whether two :class:`Entry` objects describe the same file."""
+    if entry.sha256 is None or other.sha256 is None:
+        entry = entry._replace(sha256=None)
+        other = other._replace(sha256=None)
+    return entry == other
+
+
+def take_snapshot(
+        cfg,
+        path,
+        checksums=False,
+        max_depth=None,
+        pulp_host=None):
+    """Capture the directory tree rooted at ``path`` on a Pulp host.
+
+    All information is gathered with one round trip, and commands are run
+    with ``sudo`` if needed. If ``path`` is a symbolic link, it is followed.
+    The root itself is not included in the snapshot.
+
+    :param cfg: Information about the host being targeted.
+    :param path: The absolute path to a directory.
+    :param checksums: Whether to compute the SHA256 checksum of every regular
+        file. This may be slow for large trees.
+    :param max_depth: If given, do not descend more than this many levels
+        below ``path``.
+    :param pulp_host: The host to target. Defaults to the first host with the
+        "shell" role.
+    :returns: A :class:`Snapshot`.
+    :raises pulp_smash.exceptions.CalledProcessError: If ``path`` can't be
+        listed.
+    """
+    find = ['find', '-H', path, '-mindepth', '1']
+    if max_depth is not None:
+        find.extend(('-maxdepth', str(max_depth)))
+    commands = [find + ['-printf', _FIND_FORMAT]]
+    if checksums:
+        commands.append(find + ['-type', 'f', '-exec', 'sha256sum', '{}', '+'])
+    results = ssh.Client(cfg, pulp_host=pulp_host).run_batch(
+        commands, sudo=True
+    )
+    sha256s = _parse_checksums(path, results[1].stdout) if checksums else {}
+    return Snapshot(path, [
+        _parse_entry(line, sha256s)
+        for line in results[0].stdout.splitlines()
+    ])
+
+
+def _parse_checksums(path, output):
+    """Parse the output of ``sha256sum`` for files below ``path``.
+
+    :returns: A dict mapping paths relative to ``path`` to checksums.
+    """
+    prefix = path.rstrip('/') + '/'
+    sha256s = {}
+    for line in output.splitlines():
+        checksum, file_path = line.split('  ', 1)
+        sha256s[file_path[len(prefix):]] = checksum
+    return sha256s
+
+
+def _parse_entry(line, sha256s):
+    """Parse a line printed by ``find`` with :data:`_FIND_FORMAT`.
+
+    :param sha256s: A dict mapping relative paths to checksums.
+    :returns: An :class:`Entry`.
+    """
+    rel_path, type_, size, mtime, target = line.split('\t')
+    return Entry(
+        rel_path,
+        type_,
+        int(size),
+        float(mtime),
+        target if type_ == 'l' else None,
+        sha256s.get(rel_path),
+    )
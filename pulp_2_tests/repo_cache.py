@@ -0,0 +1,215 @@
+# coding=utf-8
+"""A cache of read-only, synced source repositories.
+
+Many test cases create a repository with a well-known feed, sync it, and then
+only read from it or copy units out of it. Syncing the same feed again for each
+test case is slow and redundant. The functions in this module hand out a single
+synced repository per feed URL and importer configuration, for the lifetime of
+the test run. A typical usage is as follows:
+
+.. code-block:: python
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cfg = config.get_config()
+        body = gen_repo()
+        body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
+        cls.source_repo = acquire_source_repo(cls.cfg, body)
+
+    @classmethod
+    def tearDownClass(cls):
+        release_source_repo(cls.source_repo)
+
+Consumers must not modify a source repository in any way. They must not sync,
+publish, upload to, or remove units from it, and they must not add
+distributors to it. Repositories that need any of these operations should be
+created the usual way.
+
+Source repositories keep their content units from becoming orphans. Test cases
+that need certain content to be absent from Pulp, such as test cases that count
+orphans, should call :func:`invalidate_source_repos` before they start.
+
+Each handed-out repository is reference counted. Source repositories are
+deleted when the Python interpreter exits, or when
+:func:`invalidate_source_repos` is called and no consumer holds a reference to
+them.
+"""
+import atexit
+import copy
+import json
+import threading
+
+from pulp_smash import api
+from pulp_smash.pulp2.constants import REPOSITORY_PATH
+from requests.exceptions import HTTPError
+
+from pulp_2_tests import http_pool
+from pulp_2_tests.tasks import sync_repo_async
+
+
+class _Entry():  # pylint:disable=too-few-public-methods
+    """A cached source repository and the number of consumers using it."""
+
+    def __init__(self):
+        """Initialize instance attributes."""
+        self.lock = threading.Lock()
+        self.cfg = None
+        self.repo = None
+        self.refs = 0
+        self.stale = False
+
+
+class SourceRepoCache():
+    """A reference-counted cache of synced repositories.
+
+    Most callers should use the module-level functions, which share a single
+    instance of this class.
+    """
+
+    def __init__(self):
+        """Initialize instance attributes."""
+        self._entries = {}
+        self._by_href = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(cfg, body):
+        """Return the cache key for a repository body.
+
+        The key is made from the Pulp host, the importer type, the importer
+        configuration (which includes the feed URL) and the repository notes.
+        The repository ID and any distributors are ignored.
+        """
+        return (
+            cfg.get_hosts('api')[0].hostname,
+            body['importer_type_id'],
+            json.dumps(body.get('importer_config', {}), sort_keys=True),
+            json.dumps(body.get('notes', {}), sort_keys=True),
+        )
+
+    def acquire(self, cfg, body):
+        """Return a synced repository matching ``body``.
+
+        If no matching repository is cached, or if the cached repository has
+        been deleted (e.g. by ``pulp_smash.pulp2.utils.reset_pulp``), create
+        and sync a new one. Concurrent callers asking for the same repository
+        wait for a single sync.
+
+        :param cfg: Information about a Pulp deployment.
+        :param body: A repository body, such as one returned by ``gen_repo``.
+            Distributors are ignored.
+        :returns: A detailed dict of information about the repository. This
+            dict is a copy, and may be freely mutated by the caller.
+        """
+        key = self.get_key(cfg, body)
+        with self._lock:
+            entry = self._entries.setdefault(key, _Entry())
+            entry.refs += 1
+        try:
+            with entry.lock:
+                if entry.repo is None or not self._exists(entry):
+                    entry.cfg = cfg
+                    entry.repo = self._create(cfg, body)
+                    with self._lock:
+                        self._by_href[entry.repo['_href']] = entry
+                return copy.deepcopy(entry.repo)
+        except:  # noqa:E722
+            self._decref(entry)
+            raise
+
+    def release(self, repo):
+        """Release a repository returned by :meth:`acquire`.
+
+        :param repo: A dict of information about a repository, as returned by
+            :meth:`acquire`.
+        """
+        with self._lock:
+            entry = self._by_href[repo['_href']]
+        self._decref(entry)
+
+    def invalidate(self):
+        """Delete all source repositories once they are no longer in use.
+
+        Call this after a test that destroys or corrupts Pulp's state.
+        Unreferenced repositories are deleted immediately. Referenced
+        repositories are deleted when their last consumer releases them. Later
+        calls to :meth:`acquire` create new repositories.
+        """
+        with self._lock:
+            entries = tuple(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            with self._lock:
+                entry.stale = True
+                unused = entry.refs == 0
+            if unused:
+                self._delete(entry)
+
+    def _decref(self, entry):
+        """Decrement ``entry``'s reference count, and delete it if stale."""
+        with self._lock:
+            entry.refs -= 1
+            delete = entry.stale and entry.refs == 0
+        if delete:
+            self._delete(entry)
+
+    def _delete(self, entry):
+        """Delete ``entry``'s repository, if it exists."""
+        with entry.lock:
+            if entry.repo is None:
+                return
+            with self._lock:
+                self._by_href.pop(entry.repo['_href'], None)
+            try:
+                http_pool.Client(entry.cfg).delete(entry.repo['_href'])
+            except HTTPError:
+                pass  # The repository has already been deleted.
+            entry.repo = None
+
+    @staticmethod
+    def _exists(entry):
+        """Tell whether ``entry``'s repository still exists."""
+        response = http_pool.Client(entry.cfg, api.echo_handler).get(
+            entry.repo['_href']
+        )
+        return response.status_code == 200
+
+    @staticmethod
+    def _create(cfg, body):
+        """Create and sync a repository. Delete it if the sync fails."""
+        body = copy.deepcopy(body)
+        body.pop('distributors', None)
+        client = http_pool.Client(cfg, api.json_handler)
+        repo = client.post(REPOSITORY_PATH, body)
+        try:
+            sync_repo_async(cfg, repo).result()
+            return client.get(repo['_href'], params={'details': True})
+        except:  # noqa:E722
+            client.delete(repo['_href'])
+            raise
+
+
+_CACHE = SourceRepoCache()
+atexit.register(_CACHE.invalidate)
+
+
+def acquire_source_repo(cfg, body):
+    """Return a shared, synced repository matching ``body``.
+
+    See :meth:`SourceRepoCache.acquire`. Every call must be paired with a call
+    to :func:`release_source_repo`.
+    """
+    return _CACHE.acquire(cfg, body)
+
+
+def release_source_repo(repo):
+    """Release a repository returned by :func:`acquire_source_repo`."""
+    _CACHE.release(repo)
+
+
+def invalidate_source_repos():
+    """Discard all shared source repositories.
+
+    See :meth:`SourceRepoCache.invalidate`.
+    """
+    _CACHE.invalidate()
@@ -0,0 +1,128 @@
+# coding=utf-8
+"""Collect the SELinux labels of processes and files on a Pulp host at once.
+
+Verifying SELinux labels with one ``ps`` or ``getfattr`` command per service
+or path costs one round trip per assertion. :func:`collect_labels` instead
+lists the label of every process, and of every file below the paths Pulp
+owns, in a single round trip, and returns an in-memory :class:`LabelAudit`
+that can be queried any number of times:
+
+.. code-block:: python
+
+    from pulp_2_tests.selinux_labels import collect_labels, strip_user
+
+    audit = collect_labels(cfg)
+    for proc in audit.processes_matching('resource_manager'):
+        assert strip_user(proc.label) == ':system_r:celery_t:s0'
+    for file_ in audit.files_below('/var/cache/pulp'):
+        assert strip_user(file_.label) == ':object_r:pulp_var_cache_t:s0'
+
+File names containing tabs or newlines are not supported.
+"""
+import bisect
+from collections import namedtuple
+
+from pulp_smash import cli
+
+from pulp_2_tests import ssh
+
+AUDITED_PATHS = (
+    '/etc/pki/pulp',
+    '/etc/pulp',
+    '/usr/bin/celery',
+    '/usr/bin/pulp_streamer',
+    '/usr/share/pulp/wsgi',
+    '/var/cache/pulp',
+    '/var/lib/pulp',
+    '/var/log/pulp',
+    '/var/run/pulp',
+)
+"""The paths whose labels are collected by default, recursively."""
+
+ProcessLabel = namedtuple('ProcessLabel', 'pid label args')
+"""The SELinux label of one process, and the arguments it was invoked with."""
+
+FileLabel = namedtuple('FileLabel', 'path label')
+"""The SELinux label of one file. ``path`` is absolute."""
+
+
+def strip_user(label):
+    """Strip the "user" segment from an SELinux label.
+
+    For example, ``system_u:object_r:passwd_file_t:s0`` becomes
+    ``:object_r:passwd_file_t:s0``. The "user" segment is known to vary. See
+    `Pulp Smash #444 (comment)
+    <https://github.com/PulpQE/pulp-smash/issues/444#issuecomment-265798957>`_.
+    """
+    return label[label.find(':'):]
+
+
+class LabelAudit():
+    """An indexed table of the SELinux labels on a Pulp host.
+
+    :param processes: An iterable of :class:`ProcessLabel` objects.
+    :param files: An iterable of :class:`FileLabel` objects.
+    """
+
+    def __init__(self, processes, files):
+        """Initialize instance attributes and build indices."""
+        self.processes = tuple(processes)
+        self.files = {file_.path: file_ for file_ in files}
+        self._paths = sorted(self.files)
+
+    def processes_matching(self, arg):
+        """Return the processes whose argument string contains ``arg``."""
+        return [proc for proc in self.processes if arg in proc.args]
+
+    def files_below(self, path):
+        """Return ``path`` and every file below it, sorted by path.
+
+        :param path: An absolute path, such as ``/var/lib/pulp``.
+        :returns: A list of :class:`FileLabel` objects.
+        """
+        path = path.rstrip('/')
+        found = [self.files[path]] if path in self.files else []
+        prefix = path + '/'
+        start = bisect.bisect_left(self._paths, prefix)
+        for other in self._paths[start:]:
+            if not other.startswith(prefix):
+                break
+            found.append(self.files[other])
+        return found
+
+
+def collect_labels(cfg, paths=AUDITED_PATHS, pulp_host=None):
+    """Collect the labels of every process, and of every file below ``paths``.
+
+    All labels are collected with one round trip, with ``sudo`` if needed.
+    Paths that don't exist are skipped. Symbolic links given in ``paths`` are
+    followed, but symbolic links below them are skipped, as ``getfattr
+    --recursive`` does.
+
+    :param cfg: Information about the host being targeted.
+    :param paths: An iterable of absolute paths.
+    :param pulp_host: The host to target. Defaults to the first host with the
+        "shell" role.
+    :returns: A :class:`LabelAudit`.
+    :raises pulp_smash.exceptions.CalledProcessError: If processes can't be
+        listed.
+    """
+    results = ssh.Client(
+        cfg, cli.echo_handler, pulp_host=pulp_host
+    ).run_batch((
+        ('ps', '-A', '-w', '-w', '-o', 'pid=,label=,args='),
+        ('find', '-H') + tuple(paths) +
+        ('!', '-type', 'l', '-printf', '%p\\t%Z\\n'),
+    ), sudo=True)
+    ps_result, find_result = results[0], results[1]
+    ps_result.check_returncode()
+    processes = []
+    for line in ps_result.stdout.splitlines():
+        fields = line.split(maxsplit=2)
+        if len(fields) == 3:
+            processes.append(ProcessLabel(int(fields[0]), *fields[1:]))
+    files = []
+    for line in find_result.stdout.splitlines():
+        path, _, label = line.partition('\t')
+        files.append(FileLabel(path.rstrip('/') or '/', label))
+    return LabelAudit(processes, files)
@@ -0,0 +1,301 @@
+# coding=utf-8
+"""Track the services a test touches, and restore only those.
+
+Tests that stop Pulp's services, or its broker, must leave them running for
+the tests that follow. Stopping and starting every service in
+``PULP_SERVICES`` after each such test restarts the whole stack even if the
+test only stopped one service, and doesn't tell when the stack is usable
+again. :class:`ServiceTracker` wraps ``pulp_smash.cli.GlobalServiceManager``,
+records which services a test touches and whether each was running, and
+brings back only the services whose state changed. It then checks that Pulp
+works, by dispatching a task and waiting for a worker to finish it:
+
+.. code-block:: python
+
+    from pulp_2_tests.services import ServiceTracker
+
+    def setUp(self):
+        self.services = ServiceTracker(self.cfg)
+
+    def test_something(self):
+        self.services.stop(('pulp_workers',))
+        ...
+
+    def tearDown(self):
+        self.services.restore()
+
+The state of each service is read on the default Pulp host, or on the host
+passed to :class:`ServiceTracker`, with ``systemctl`` or ``service``.
+"""
+import time
+from urllib.parse import urljoin
+
+from pulp_smash import api, cli, exceptions, utils
+from pulp_smash.pulp2.constants import PULP_SERVICES, REPOSITORY_PATH
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.tasks import get_task_poller
+from pulp_2_tests.waiters import WaitTimeoutError, wait_until
+
+TASK_SERVICES = PULP_SERVICES.union((
+    'mongod',
+    'qpidd',
+    'rabbitmq-server',
+))
+"""Services which must work for Pulp to dispatch and execute a task.
+
+If any of these services is restored, :meth:`ServiceTracker.restore` checks
+that Pulp works by dispatching a task. A worker that has lost its connection
+to the broker is still listed by Pulp's status endpoint, but never executes a
+task.
+"""
+
+_SYSTEMD_STATES = frozenset((
+    'activating',
+    'active',
+    'deactivating',
+    'failed',
+    'inactive',
+    'reloading',
+    'unknown',
+))
+
+_DETECT_SERVICE_MANAGER = '''\
+if which systemctl >/dev/null 2>&1; then
+    echo systemd
+elif which service >/dev/null 2>&1 || test -x /sbin/service; then
+    echo sysv
+fi
+'''
+
+
+class ServiceStateError(Exception):
+    """The state of some services can't be read."""
+
+
+def get_service_manager(cfg, pulp_host=None):
+    """Return the service manager on a host, as "systemd" or "sysv".
+
+    The service manager is detected as ``pulp_smash.cli.ServiceManager``
+    does.
+
+    :raises ServiceStateError: If no known service manager is found.
+    """
+    service_manager = ssh.Client(
+        cfg, cli.echo_handler, pulp_host=pulp_host
+    ).run(('sh', '-c', _DETECT_SERVICE_MANAGER)).stdout.strip()
+    if service_manager not in ('systemd', 'sysv'):
+        raise ServiceStateError(
+            'Neither systemctl nor service is available on the Pulp host.')
+    return service_manager
+
+
+def get_active_states(cfg, services, pulp_host=None, service_manager=None):
+    """Tell whether each service is active, with one round trip.
+
+    :param cfg: Information about a Pulp deployment.
+    :param services: An iterable of service names, such as ``('httpd',)``.
+    :param pulp_host: The host to target. Defaults to the first host with the
+        "shell" role.
+    :param service_manager: "systemd" or "sysv". Detected with
+        :func:`get_service_manager` by default.
+    :returns: A dict mapping each service to a boolean.
+    :raises ServiceStateError: If the state of a service can't be read.
+    """
+    services = sorted(services)
+    if not services:
+        return {}
+    if service_manager is None:
+        service_manager = get_service_manager(cfg, pulp_host)
+    client = ssh.Client(cfg, cli.echo_handler, pulp_host=pulp_host)
+    if service_manager == 'sysv':
+        results = client.run_batch(
+            [('service', service, 'status') for service in services],
+            sudo=True,
+        )
+        return {
+            service: result.returncode == 0
+            for service, result in zip(services, results)
+        }
+    # `systemctl is-active` exits non-zero if any service is inactive, so its
+    # output is checked instead.
+    result = client.run(('systemctl', 'is-active') + tuple(services))
+    states = result.stdout.split()
+    if len(states) != len(services) or not _SYSTEMD_STATES.issuperset(states):
+        raise ServiceStateError(
+            'Failed to read the state of services {}: {!r} {!r}'
+            .format(services, result.stdout, result.stderr)
+        )
+    return {
+        service: state == 'active' for service, state in zip(services, states)
+    }
+
+
+def dispatch_trivial_task(cfg, timeout=120, pulp_host=None):
+    """Dispatch a task that does next to nothing, and wait until it finishes.
+
+    An empty repository is created, and then deleted. Deleting a repository
+    is a task, which is dispatched through the broker to the resource manager
+    and then to a worker, like most tasks.
+
+    :param cfg: Information about a Pulp deployment.
+    :param timeout: How many seconds to wait at most, for Pulp to accept the
+        task and for the task to finish.
+    :param pulp_host: The host to target. Defaults to the first host with the
+        "api" role.
+    :returns: The final states of the task, as a tuple.
+    :raises pulp_2_tests.waiters.WaitTimeoutError: If the task isn't accepted
+        or doesn't finish within ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    client = http_pool.Client(cfg, api.echo_handler, pulp_host=pulp_host)
+    repo_id = utils.uuid4()
+    repo_path = urljoin(REPOSITORY_PATH, repo_id + '/')
+
+    def request(method, path, body, status_codes):
+        """Send a request, and return the response if its status matches."""
+        try:
+            response = client.request(method, path, json=body)
+        except RequestsConnectionError:
+            return None
+        return response if response.status_code in status_codes else None
+
+    # If a response is lost, the repository may already exist.
+    wait_until(
+        lambda: request('POST', REPOSITORY_PATH, {'id': repo_id}, (201, 409)),
+        timeout,
+        'Pulp to create a repository',
+    )
+    call_report = wait_until(
+        lambda: request('DELETE', repo_path, None, (202,)),
+        max(deadline - time.monotonic(), 1),
+        'Pulp to accept a task',
+    ).json()
+    future = get_task_poller(cfg, pulp_host).submit(
+        call_report,
+        timeout=max(deadline - time.monotonic(), 1),
+        check_errors=True,
+    )
+    try:
+        return future.result()
+    except exceptions.TaskTimedOutError as err:
+        raise WaitTimeoutError(
+            'a trivial task to finish', timeout, call_report) from err
+
+
+class ServiceTracker():
+    """Start, stop and restart services, and remember which were touched.
+
+    The first time a service is touched, whether it's active is recorded.
+    :meth:`restore` returns every touched service to that state.
+
+    :param cfg: Information about a Pulp deployment.
+    :param pulp_host: The host on which service states are read. Defaults to
+        the first host with the "shell" role.
+    """
+
+    def __init__(self, cfg, pulp_host=None):
+        """Initialize instance attributes."""
+        self.cfg = cfg
+        self.pulp_host = pulp_host
+        self.svc_mgr = cli.GlobalServiceManager(cfg)
+        self.original = {}  # service → whether it was active
+        self._service_manager = None
+
+    def get_active_states(self, services):
+        """Call :func:`get_active_states`. Detect the service manager once."""
+        if self._service_manager is None:
+            self._service_manager = get_service_manager(
+                self.cfg, self.pulp_host)
+        return get_active_states(
+            self.cfg, services, self.pulp_host, self._service_manager)
+
+    def track(self, services):
+        """Record the state of ``services``, without touching them.
+
+        Use this for services a test may disturb indirectly, such as the
+        services connected to a broker the test stops. Services already
+        tracked are ignored.
+        """
+        new = set(services).difference(self.original)
+        self.original.update(self.get_active_states(new))
+
+    def start(self, services):
+        """Track and start ``services``."""
+        self.track(services)
+        self.svc_mgr.start(services)
+
+    def stop(self, services):
+        """Track and stop ``services``."""
+        self.track(services)
+        self.svc_mgr.stop(services)
+
+    def restart(self, services):
+        """Track and restart ``services``."""
+        self.track(services)
+        self.svc_mgr.restart(services)
+
+    def wait_until_healthy(self, timeout=180):
+        """Wait until the tracked services are back, and Pulp works.
+
+        First, wait until every tracked service is in the state it was first
+        tracked in. Then, if any of :data:`TASK_SERVICES` should be active,
+        dispatch a task with :func:`dispatch_trivial_task` and wait until it
+        finishes.
+
+        :raises pulp_2_tests.waiters.WaitTimeoutError: If the services aren't
+            back and working after ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        wait_until(
+            lambda: self.get_active_states(self.original) == self.original,
+            timeout,
+            'services {} to be in their original state'
+            .format(sorted(self.original)),
+        )
+        if any(active and service in TASK_SERVICES
+               for service, active in self.original.items()):
+            dispatch_trivial_task(
+                self.cfg, max(deadline - time.monotonic(), 1))
+
+    def restore(self, timeout=180):
+        """Return the tracked services to their original state.
+
+        Services that were active and are now stopped are started, and vice
+        versa, each group with one call to ``GlobalServiceManager``. Services
+        already in their original state aren't touched. If the tracked
+        services then aren't healthy, as when a worker failed to reconnect to
+        the broker, every tracked service that was active is restarted once.
+        Afterwards, no service is tracked.
+
+        :param timeout: How many seconds to wait for the services to become
+            healthy, each time.
+        :raises pulp_2_tests.waiters.WaitTimeoutError: If the services don't
+            become healthy even after being restarted.
+        """
+        if not self.original:
+            return
+        current = self.get_active_states(self.original)
+        to_stop = {
+            service for service, active in self.original.items()
+            if not active and current[service]
+        }
+        to_start = {
+            service for service, active in self.original.items()
+            if active and not current[service]
+        }
+        if to_stop:
+            self.svc_mgr.stop(to_stop)
+        if to_start:
+            self.svc_mgr.start(to_start)
+        try:
+            self.wait_until_healthy(timeout)
+        except WaitTimeoutError:
+            running = {
+                service for service, active in self.original.items() if active
+            }
+            if running:
+                self.svc_mgr.restart(running)
+            self.wait_until_healthy(timeout)
+        self.original.clear()
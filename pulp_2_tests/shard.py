@@ -0,0 +1,395 @@
+# coding=utf-8
+"""Run the tests in parallel, with one shard of test modules per Pulp host.
+
+By default, the tests run serially against the single host described by the
+Pulp Smash configuration file. This module splits the test modules in
+:mod:`pulp_2_tests.tests` across several Pulp deployments, each described by
+its own Pulp Smash configuration file, and runs one shard per deployment in a
+child process:
+
+.. code-block:: sh
+
+    python -m pulp_2_tests.shard --config host1.json --config host2.json
+
+Test modules may also be listed, in which case only they are run:
+
+.. code-block:: sh
+
+    python -m pulp_2_tests.shard -c host1.json -c host2.json \\
+        pulp_2_tests.tests.rpm.api_v2.test_copy \\
+        pulp_2_tests.tests.rpm.api_v2.test_errata
+
+Shards are balanced by the duration of each module in previous runs, which is
+stored in a JSON file. (See ``--durations``.) Modules that have never been run
+are assumed to take as long as an average module.
+
+Each shard runs its modules one after another. Destructive test modules,
+which restart or stop services, kill workers or reset Pulp (see
+:data:`DESTRUCTIVE_PATTERNS`), leave their host in a state that the modules
+run after them can't rely on: services may still be coming back, and
+``reset_pulp`` deletes every repository, including the source repositories
+shared by other modules. When more than one host is given, destructive modules
+are all run on a host of their own, and no other module runs on that host.
+With a single host, they are run last.
+
+The results of all shards are merged into one JSON report, and a summary is
+printed. The exit code is non-zero if any test failed or any shard crashed.
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+DESTRUCTIVE_PATTERNS = (
+    r'\breset_pulp\(',
+    r'\bGlobalServiceManager\(',
+    r'\bServiceTracker\(',
+    r'\bclass MaxTasksPerChildTestCase\b',
+    r'\bclass MissingWorkersTestCase\b',
+    r'\bclass TaskDispatchTestCase\b',
+)
+"""Regular expressions matching the source code of destructive modules."""
+
+TESTS_PACKAGE = 'pulp_2_tests.tests'
+"""The package in which test modules are discovered."""
+
+
+def discover_modules(package=TESTS_PACKAGE):
+    """Return the sorted names of the test modules in ``package``.
+
+    Modules are found by walking the package's directory, and are not
+    imported.
+    """
+    top = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    package_dir = os.path.join(top, *package.split('.'))
+    modules = []
+    for dirpath, dirnames, filenames in os.walk(package_dir):
+        dirnames[:] = [
+            name for name in dirnames
+            if os.path.exists(os.path.join(dirpath, name, '__init__.py'))
+        ]
+        for filename in filenames:
+            if filename.startswith('test_') and filename.endswith('.py'):
+                path = os.path.relpath(os.path.join(dirpath, filename), top)
+                modules.append(path[:-len('.py')].replace(os.sep, '.'))
+    return sorted(modules)
+
+
+def is_destructive(module):
+    """Tell whether a test module matches any :data:`DESTRUCTIVE_PATTERNS`."""
+    top = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = os.path.join(top, *module.split('.')) + '.py'
+    with open(path) as handle:
+        source = handle.read()
+    return any(re.search(pattern, source) for pattern in DESTRUCTIVE_PATTERNS)
+
+
+def load_durations(path):
+    """Load a dict of module durations, in seconds, from a JSON file.
+
+    Return an empty dict if ``path`` does not exist.
+    """
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {}
+
+
+def save_durations(path, durations):
+    """Merge ``durations`` into the module durations stored at ``path``."""
+    merged = load_durations(path)
+    merged.update(durations)
+    with open(path, 'w') as handle:
+        json.dump(merged, handle, indent=2, sort_keys=True)
+
+
+def plan_shards(modules, num_hosts, durations=None):
+    """Split test modules into one shard per host.
+
+    When there are several hosts and any destructive modules, the last shard
+    holds every destructive module, and nothing else. The remaining modules
+    are distributed over the other shards, longest first, each going to the
+    shard with the least total expected duration. With a single host, the
+    destructive modules are run last.
+
+    :param modules: An iterable of test module names.
+    :param num_hosts: The number of hosts available.
+    :param durations: A dict mapping module names to durations in seconds.
+    :returns: A list of ``num_hosts`` lists of module names. Some may be
+        empty.
+    """
+    if durations is None:
+        durations = {}
+    known = [durations[module] for module in modules if module in durations]
+    default = sum(known) / len(known) if known else 1.0
+
+    def expected(module):
+        return durations.get(module, default)
+
+    destructive = [module for module in modules if is_destructive(module)]
+    others = [module for module in modules if module not in destructive]
+    if num_hosts == 1:
+        return [others + destructive]
+    shards = [[] for _ in range(num_hosts)]
+    if destructive:
+        shards[-1] = destructive
+        balanced = shards[:-1]
+    else:
+        balanced = shards
+    loads = [0.0] * len(balanced)
+    for module in sorted(others, key=lambda mod: (-expected(mod), mod)):
+        i = loads.index(min(loads))
+        balanced[i].append(module)
+        loads[i] += expected(module)
+    return shards
+
+
+class _RecordingResult(unittest.TextTestResult):
+    """A test result that also records each test's outcome and duration."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize instance attributes."""
+        super().__init__(*args, **kwargs)
+        self.records = []
+        self._started = None
+
+    def startTest(self, test):
+        """Note when ``test`` starts."""
+        self._started = time.monotonic()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        """Forget when ``test`` started."""
+        super().stopTest(test)
+        self._started = None
+
+    def _record(self, test, outcome, details=None):
+        """Record the outcome of ``test``.
+
+        Errors and skips raised by module and class fixtures are recorded too,
+        with a duration of zero.
+        """
+        duration = 0.0
+        if self._started is not None:
+            duration = time.monotonic() - self._started
+        self.records.append({
+            'id': test.id(),
+            'outcome': outcome,
+            'duration': duration,
+            'details': details,
+        })
+
+    def addSuccess(self, test):
+        """Record a success."""
+        super().addSuccess(test)
+        self._record(test, 'success')
+
+    def addError(self, test, err):
+        """Record an error."""
+        super().addError(test, err)
+        self._record(test, 'error', self.errors[-1][1])
+
+    def addFailure(self, test, err):
+        """Record a failure."""
+        super().addFailure(test, err)
+        self._record(test, 'failure', self.failures[-1][1])
+
+    def addSkip(self, test, reason):
+        """Record a skipped test."""
+        super().addSkip(test, reason)
+        self._record(test, 'skip', reason)
+
+    def addExpectedFailure(self, test, err):
+        """Record an expected failure."""
+        super().addExpectedFailure(test, err)
+        self._record(test, 'expected failure')
+
+    def addUnexpectedSuccess(self, test):
+        """Record an unexpected success."""
+        super().addUnexpectedSuccess(test)
+        self._record(test, 'unexpected success')
+
+
+def run_worker(modules, report_path):
+    """Run test modules one after another, and write a JSON report.
+
+    This function is executed in each shard's child process.
+
+    :param modules: An iterable of test module names.
+    :param report_path: Where to write the report. The report is a dict with
+        a "durations" key, mapping module names to durations, and a "tests"
+        key, listing the outcome of each test.
+    :returns: True if every test passed, and false otherwise.
+    """
+    loader = unittest.TestLoader()
+    runner = unittest.TextTestRunner(
+        verbosity=2,
+        resultclass=_RecordingResult,
+    )
+    durations = {}
+    records = []
+    success = True
+    for module in modules:
+        started = time.monotonic()
+        result = runner.run(loader.loadTestsFromName(module))
+        durations[module] = time.monotonic() - started
+        records.extend(result.records)
+        success = success and result.wasSuccessful()
+    with open(report_path, 'w') as handle:
+        json.dump({'durations': durations, 'tests': records}, handle)
+    return success
+
+
+def _start_shard(modules, config_path, workdir, index):
+    """Start a child process running ``modules`` against one host.
+
+    The child process finds its Pulp Smash configuration file through the
+    ``XDG_CONFIG_HOME`` environment variable, which points to a private
+    directory containing a copy of ``config_path``.
+
+    :returns: A ``(process, report_path, log_path)`` tuple.
+    """
+    xdg_config_home = os.path.join(workdir, 'shard-{}'.format(index))
+    os.makedirs(os.path.join(xdg_config_home, 'pulp_smash'))
+    shutil.copy(
+        config_path,
+        os.path.join(xdg_config_home, 'pulp_smash', 'settings.json'),
+    )
+    env = os.environ.copy()
+    env['XDG_CONFIG_HOME'] = xdg_config_home
+    env['PULP_SMASH_CONFIG_FILE'] = 'settings.json'
+    report_path = os.path.join(workdir, 'shard-{}.json'.format(index))
+    log_path = os.path.join(workdir, 'shard-{}.log'.format(index))
+    with open(log_path, 'w') as log:
+        # The child process outlives this function. It's waited on by
+        # run_shards.
+        process = subprocess.Popen(  # pylint:disable=consider-using-with
+            [sys.executable, '-m', 'pulp_2_tests.shard', '--worker'] +
+            [report_path] + list(modules),
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    return process, report_path, log_path
+
+
+def _collect_reports(running):
+    """Wait for each shard to exit, and collect the reports they wrote.
+
+    :param running: A list of ``(config_path, process, report_path,
+        log_path)`` tuples, one per shard.
+    :returns: A ``(success, durations, tests)`` tuple. ``success`` tells
+        whether every shard exited cleanly, ``durations`` maps modules to
+        durations, and ``tests`` lists the outcome of each test, with the
+        configuration file of the host it ran against.
+    """
+    success = True
+    durations = {}
+    tests = []
+    for config_path, process, shard_report, log_path in running:
+        returncode = process.wait()
+        success = success and returncode == 0
+        try:
+            with open(shard_report) as handle:
+                report = json.load(handle)
+        except FileNotFoundError:
+            print('Shard for {} crashed. See {}'.format(config_path, log_path))
+            continue
+        durations.update(report['durations'])
+        for record in report['tests']:
+            record['config'] = config_path
+            tests.append(record)
+    return success, durations, tests
+
+
+def _print_summary(tests):
+    """Print the tests that failed, and how many tests had each outcome."""
+    counts = {}
+    for record in tests:
+        counts[record['outcome']] = counts.get(record['outcome'], 0) + 1
+        if record['outcome'] in ('error', 'failure'):
+            print('{}: {} ({})'.format(
+                record['outcome'].upper(), record['id'], record['config']))
+    print('Ran {} tests: {}'.format(len(tests), ', '.join(
+        '{} {}'.format(count, outcome)
+        for outcome, count in sorted(counts.items())
+    )))
+
+
+def run_shards(config_paths, modules, durations_path, report_path):
+    """Run test modules across several hosts, and merge the results.
+
+    :param config_paths: A list of paths to Pulp Smash configuration files,
+        one per host.
+    :param modules: A list of test module names.
+    :param durations_path: The JSON file holding module durations. It is
+        read to balance shards, and updated afterwards.
+    :param report_path: Where to write the merged JSON report.
+    :returns: True if every test passed and every shard exited cleanly, and
+        false otherwise.
+    """
+    shards = plan_shards(
+        modules,
+        len(config_paths),
+        load_durations(durations_path),
+    )
+    workdir = tempfile.mkdtemp(prefix='pulp-2-tests-shards-')
+    running = []
+    for index, (shard, config_path) in enumerate(zip(shards, config_paths)):
+        if shard:
+            print('Shard {} ({}): {} modules'.format(
+                index, config_path, len(shard)))
+            running.append((config_path,) + _start_shard(
+                shard, config_path, workdir, index))
+    success, durations, tests = _collect_reports(running)
+    save_durations(durations_path, durations)
+    with open(report_path, 'w') as handle:
+        json.dump({'tests': tests}, handle, indent=2)
+    _print_summary(tests)
+    print('Merged report: {}. Shard logs: {}'.format(report_path, workdir))
+    return success
+
+
+def main():
+    """Parse arguments, and run the tests or a single shard."""
+    parser = argparse.ArgumentParser(
+        prog='python -m pulp_2_tests.shard',
+        description='Run Pulp 2 Tests in parallel against several hosts.',
+    )
+    parser.add_argument(
+        '-c', '--config', action='append', default=[], dest='configs',
+        help='A Pulp Smash configuration file. Pass once per host.',
+    )
+    parser.add_argument(
+        '--durations', default='.pulp_2_tests_durations.json',
+        help='A JSON file of module durations from previous runs. '
+        '(default: %(default)s)',
+    )
+    parser.add_argument(
+        '--report', default='pulp_2_tests_report.json',
+        help='Where to write the merged JSON report. (default: %(default)s)',
+    )
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument(
+        'modules', nargs='*',
+        help='Test modules to run. (default: all of {})'.format(TESTS_PACKAGE),
+    )
+    args = parser.parse_args()
+    if args.worker:
+        return 0 if run_worker(args.modules, args.worker) else 1
+    if not args.configs:
+        parser.error('at least one --config is required')
+    modules = args.modules or discover_modules()
+    success = run_shards(args.configs, modules, args.durations, args.report)
+    return 0 if success else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+# coding=utf-8
+"""A pool of persistent shell sessions, one per Pulp host.
+
+``pulp_smash.cli.Client`` runs each command with a fresh ``ssh`` process, so
+every command pays for an SSH handshake. :class:`Client` is a drop-in
+replacement that instead runs commands through a single long-lived shell
+session per host. The session is opened on first use, shared by every client
+targeting the same host, and re-opened if it dies. A typical usage is as
+follows:
+
+.. code-block:: python
+
+    from pulp_smash import cli
+
+    from pulp_2_tests import ssh
+
+    client = ssh.Client(cfg, cli.echo_handler)
+    client.run(('ls', '-1', path), sudo=True)
+
+Several commands may also be sent to the remote shell in one round trip with
+:meth:`Client.run_batch`.
+"""
+import atexit
+import re
+import shlex
+import threading
+
+from pulp_smash import cli, utils
+
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+class _Session():
+    """A persistent shell session to one host, and a lock guarding it."""
+
+    def __init__(self, cfg, pulp_host):
+        """Initialize instance attributes."""
+        self.cfg = cfg
+        self.pulp_host = pulp_host
+        self.lock = threading.RLock()
+        self.machine = cli.Client(cfg, pulp_host=pulp_host).machine
+        self._shell = None
+        self._is_root = None
+
+    def run(self, command, retcode=None):
+        """Run ``command`` in the shell, opening the shell if necessary.
+
+        :param command: A string to be interpreted by the remote shell.
+        :param retcode: Passed to ``plumbum``'s ``ShellSession.run``.
+        :returns: A ``(returncode, stdout, stderr)`` tuple.
+        """
+        with self.lock:
+            if self._shell is None or not self._shell.alive():
+                self._shell = self.machine.session()
+            return self._shell.run(command, retcode=retcode)
+
+    def is_root(self):
+        """Tell whether commands are executed as root. Cache the answer."""
+        with self.lock:
+            if self._is_root is None:
+                self._is_root = self.run('id -u')[1].strip() == '0'
+            return self._is_root
+
+    def close(self):
+        """Close the shell, if it is open."""
+        with self.lock:
+            if self._shell is not None:
+                self._shell.close()
+                self._shell = None
+
+
+def _get_session(cfg, pulp_host=None):
+    """Return the shared :class:`_Session` for the given host."""
+    if pulp_host is None:
+        pulp_host = cfg.get_hosts('shell')[0]
+    with _SESSIONS_LOCK:
+        if pulp_host.hostname not in _SESSIONS:
+            _SESSIONS[pulp_host.hostname] = _Session(cfg, pulp_host)
+        return _SESSIONS[pulp_host.hostname]
+
+
+@atexit.register
+def close_sessions():
+    """Close every pooled shell session."""
+    with _SESSIONS_LOCK:
+        sessions = tuple(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        session.close()
+
+
+def is_root(cfg, pulp_host=None):
+    """Tell whether commands on the given host are executed as root.
+
+    This function is like ``pulp_smash.cli.is_root``, except that the answer
+    is cached for the lifetime of the pooled session.
+    """
+    return _get_session(cfg, pulp_host).is_root()
+
+
+class Client():
+    """A client for running commands through a pooled shell session.
+
+    This class has the same interface as ``pulp_smash.cli.Client``. The
+    ``response_handler`` defaults to ``pulp_smash.cli.code_handler``.
+
+    :param cfg: Information about the host being targeted.
+    :param response_handler: A callback function. Each time a command is run,
+        its result is wrapped in a ``pulp_smash.cli.CompletedProcess``, and
+        passed to this function.
+    :param pulp_host: The host to target. Defaults to the first host with the
+        "shell" role.
+    """
+
+    def __init__(self, cfg, response_handler=None, pulp_host=None):
+        """Initialize instance attributes."""
+        self.cfg = cfg
+        self.response_handler = (
+            cli.code_handler if response_handler is None else response_handler
+        )
+        self._session = _get_session(cfg, pulp_host)
+
+    @property
+    def machine(self):
+        """Return the pooled ``plumbum`` machine for the targeted host."""
+        return self._session.machine
+
+    def _prepare(self, args, sudo):
+        """Prepend ``sudo`` to ``args`` if needed, and build a shell string."""
+        args = tuple(args)
+        if sudo and args[0] != 'sudo' and not self._session.is_root():
+            args = ('sudo',) + args
+        return args, ' '.join(shlex.quote(arg) for arg in args)
+
+    def run(self, args, sudo=False):
+        """Run a command and return ``self.response_handler(result)``.
+
+        :param args: A list or tuple of arguments, such as ``('ls', '-1')``.
+            Arguments are quoted, so no shell expansion takes place.
+        :param sudo: If true, run the command with ``sudo``, unless commands
+            are already executed as root.
+        :returns: The return value of ``self.response_handler``.
+        """
+        args, command = self._prepare(args, sudo)
+        code, stdout, stderr = self._session.run(command)
+        return self.response_handler(
+            cli.CompletedProcess(args, code, stdout, stderr)
+        )
+
+    def run_shell(self, command, retcode=0):
+        """Run a string through the remote shell, with shell expansion.
+
+        This method replaces ``client.machine.session().run(command)``.
+
+        :param command: A string to be interpreted by the remote shell.
+        :param retcode: The expected return code. Pass ``None`` to accept any.
+        :returns: A ``(returncode, stdout, stderr)`` tuple.
+        """
+        return self._session.run(command, retcode=retcode)
+
+    def run_batch(self, commands, sudo=False):
+        """Run several commands with a single round trip to the host.
+
+        The commands are executed one after another by the remote shell. Each
+        command's output and return code is captured separately. A failing
+        command does not prevent subsequent commands from running.
+
+        :param commands: An iterable of argument tuples, each as accepted by
+            :meth:`run`.
+        :param sudo: Whether to run each command with ``sudo``.
+        :returns: A list, where each item is the return value of
+            ``self.response_handler`` for one command.
+        """
+        marker = 'PULP_2_TESTS_' + utils.uuid4()
+        prepared = [self._prepare(args, sudo) for args in commands]
+        script = ' ; '.join(
+            "{cmd} ; printf '\\n%s %d\\n' {m} $? ; printf '\\n%s\\n' {m} >&2"
+            .format(cmd=command, m=marker)
+            for _, command in prepared
+        )
+        _, stdout, stderr = self._session.run(script)
+        stdouts = re.split(r'\n{} (\d+)\n'.format(marker), stdout)
+        stderrs = stderr.split('\n{}\n'.format(marker))
+        results = []
+        for i, (args, _) in enumerate(prepared):
+            results.append(self.response_handler(cli.CompletedProcess(
+                args,
+                int(stdouts[2 * i + 1]),
+                stdouts[2 * i],
+                stderrs[i],
+            )))
+        return results
@@ -0,0 +1,495 @@
+# coding=utf-8
+"""Tools for waiting on many Pulp tasks at once.
+
+``pulp_smash.api.poll_spawned_tasks`` polls one task at a time, with one HTTP
+request per task per poll. When a test waits on several task trees, it waits on
+them one after another. The :class:`TaskPoller` defined here tracks any number
+of task trees at once. Each poll is a single search request for all pending
+tasks, and the delay between polls backs off while nothing changes. A typical
+usage is as follows:
+
+.. code-block:: python
+
+    from pulp_2_tests import http_pool
+    from pulp_2_tests.tasks import get_task_poller
+
+    client = http_pool.Client(cfg, api.code_handler)
+    poller = get_task_poller(cfg)
+    futures = [
+        poller.submit(client.post(path, body).json())
+        for path, body in ...
+    ]
+    for future in futures:
+        tasks = future.result()
+
+Most callers should use :func:`poll_spawned_tasks`, :func:`sync_repo_async`,
+:func:`publish_repo_async` or their siblings instead of creating pollers
+directly.
+
+:class:`RepoFactory` builds on the poller to create, sync and publish several
+repositories concurrently.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from pulp_smash import api, exceptions
+from pulp_smash.pulp2.constants import REPOSITORY_PATH, TASKS_PATH
+from requests.exceptions import RequestException
+
+from pulp_2_tests import http_pool
+
+TASK_END_STATES = ('canceled', 'error', 'finished', 'skipped', 'timed out')
+"""The states a Pulp 2 task may be in once it has stopped executing."""
+
+TASK_SEARCH_PATH = urljoin(TASKS_PATH, 'search/')
+"""The path at which tasks may be searched."""
+
+_POLLERS = {}
+_POLLERS_LOCK = threading.Lock()
+
+
+class _TaskTree():  # pylint:disable=too-few-public-methods
+    """The state of one call report's spawned tasks, as seen by a poller."""
+
+    def __init__(self, call_report, deadline, check_errors):
+        """Initialize instance attributes."""
+        self.future = Future()
+        self.root_ids = tuple(
+            task['task_id'] for task in call_report['spawned_tasks']
+        )
+        self.pending = list(self.root_ids)
+        self.done = {}
+        self.deadline = deadline
+        self.check_errors = check_errors
+
+    def ordered_tasks(self):
+        """Return every final task, in the order ``poll_spawned_tasks`` uses.
+
+        That is, each task is followed by the tasks it spawned, depth first.
+        """
+        tasks = []
+        stack = list(reversed(self.root_ids))
+        while stack:
+            task = self.done[stack.pop()]
+            tasks.append(task)
+            stack.extend(
+                child['task_id'] for child in reversed(task['spawned_tasks'])
+            )
+        return tuple(tasks)
+
+
+class TaskPoller():  # pylint:disable=too-many-instance-attributes
+    """Wait on many spawned task trees at once.
+
+    A background thread polls Pulp on behalf of all submitted call reports. On
+    each tick, it searches for every pending task with a single request in the
+    form ``{'task_id': {'$in': [...]}}``. When a task reaches a final state,
+    the tasks it spawned are polled in turn. When every task in a tree has
+    reached a final state, the tree's future is resolved.
+
+    The delay between ticks starts at ``min_interval`` seconds. Each tick in
+    which no task finishes multiplies the delay by ``backoff``, up to
+    ``max_interval`` seconds. Submitting a call report, or seeing a task
+    finish, resets the delay.
+
+    If a poll fails, as when Pulp is being restarted, polling goes on with the
+    same back off, and each tree only fails once its deadline has passed.
+    Trees whose future has been cancelled are dropped.
+
+    :param cfg: Information about a Pulp deployment.
+    :param pulp_host: The host to poll. Defaults to the first host with the
+        "api" role.
+    :param min_interval: The shortest delay between polls, in seconds.
+    :param max_interval: The longest delay between polls, in seconds.
+    :param backoff: The factor by which the delay grows while idle.
+    """
+
+    def __init__(  # pylint:disable=too-many-arguments
+            self,
+            cfg,
+            pulp_host=None,
+            min_interval=0.3,
+            max_interval=5,
+            backoff=1.5):
+        """Initialize instance attributes."""
+        self._client = http_pool.Client(
+            cfg, api.json_handler, pulp_host=pulp_host)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._interval = min_interval
+        self._trees = []
+        self._cond = threading.Condition()
+        self._thread = None
+        self._shutdown = False
+
+    def submit(self, call_report, timeout=1800, check_errors=False):
+        """Start waiting on the tasks spawned by ``call_report``.
+
+        :param call_report: A call report, as a dict. This is the decoded body
+            of an HTTP 202 response.
+        :param timeout: How long to wait, in seconds, before giving up on the
+            task tree.
+        :param check_errors: If true, the future raises a
+            ``pulp_smash.exceptions.TaskReportError`` if any task has an error
+            or a traceback, like ``pulp_smash.api.safe_handler`` does.
+        :returns: A ``concurrent.futures.Future``. Its result is a tuple of
+            final task states, in the same order as yielded by
+            ``pulp_smash.api.poll_spawned_tasks``. It raises a
+            ``pulp_smash.exceptions.TaskTimedOutError`` if ``timeout`` is
+            exceeded.
+        """
+        tree = _TaskTree(call_report, time.monotonic() + timeout, check_errors)
+        if not tree.pending:
+            tree.future.set_result(())
+            return tree.future
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit to a shut down poller.')
+            self._trees.append(tree)
+            self._interval = self.min_interval
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return tree.future
+
+    def shutdown(self, wait=True):
+        """Stop polling once every submitted task tree has been resolved.
+
+        :param wait: Whether to block until the background thread exits.
+        """
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+    def _run(self):
+        """Poll until shut down. Executed in a background thread."""
+        while True:
+            with self._cond:
+                while not self._trees and not self._shutdown:
+                    self._cond.wait()
+                if not self._trees:
+                    return
+                trees = tuple(self._trees)
+            try:
+                finished = self._tick(trees)
+            except (RequestException, ValueError) as err:
+                # Pulp may be restarting, or answering with an error page.
+                finished = self._expire(trees, err)
+                self._update_interval(False)
+            except Exception as err:  # pylint:disable=broad-except
+                finished = trees
+                for tree in trees:
+                    if not tree.future.done():
+                        tree.future.set_exception(err)
+            with self._cond:
+                for tree in finished:
+                    self._trees.remove(tree)
+                if not self._trees:
+                    continue
+                self._cond.wait(self._interval)
+
+    def _tick(self, trees):
+        """Poll all pending tasks once, and resolve finished trees.
+
+        :returns: The trees that have been resolved, or cancelled.
+        """
+        finished = [tree for tree in trees if tree.future.done()]
+        trees = [tree for tree in trees if not tree.future.done()]
+        if not trees:
+            return finished
+        task_ids = sorted({
+            task_id for tree in trees for task_id in tree.pending
+        })
+        tasks = self._client.post(TASK_SEARCH_PATH, {
+            'criteria': {'filters': {'task_id': {'$in': task_ids}}}
+        })
+        tasks = {task['task_id']: task for task in tasks}
+        progressed = False
+        for tree in trees:
+            pending = []
+            for task_id in tree.pending:
+                task = tasks.get(task_id)
+                if task is None or task['state'] not in TASK_END_STATES:
+                    pending.append(task_id)
+                    continue
+                progressed = True
+                tree.done[task_id] = task
+                pending.extend(
+                    child['task_id'] for child in task['spawned_tasks']
+                )
+            tree.pending = pending
+            if not pending:
+                finished.append(tree)
+                self._resolve(tree)
+        finished.extend(self._expire(
+            [tree for tree in trees if tree not in finished]))
+        self._update_interval(progressed)
+        return finished
+
+    @staticmethod
+    def _expire(trees, cause=None):
+        """Fail the trees whose deadline has passed, or drop cancelled trees.
+
+        :param cause: The error with which the last poll failed, if any.
+        :returns: The trees that have failed, or been cancelled.
+        """
+        now = time.monotonic()
+        expired = []
+        for tree in trees:
+            if tree.future.done():
+                expired.append(tree)
+            elif now > tree.deadline:
+                expired.append(tree)
+                err = exceptions.TaskTimedOutError(
+                    'Timed out while waiting on tasks {}.'.format(tree.pending)
+                )
+                err.__cause__ = cause
+                tree.future.set_exception(err)
+        return expired
+
+    def _update_interval(self, progressed):
+        """Reset the delay between polls if any task finished, or back off."""
+        with self._cond:
+            if progressed:
+                self._interval = self.min_interval
+            else:
+                self._interval = min(
+                    self._interval * self.backoff,
+                    self.max_interval,
+                )
+
+    @staticmethod
+    def _resolve(tree):
+        """Set the result (or exception) of a tree whose tasks are all done."""
+        tasks = tree.ordered_tasks()
+        if tree.check_errors:
+            for task in tasks:
+                if task.get('error') or task.get('traceback'):
+                    tree.future.set_exception(exceptions.TaskReportError(
+                        'Task report {} contains an error or traceback.'
+                        .format(task['_href']),
+                        task,
+                    ))
+                    return
+        tree.future.set_result(tasks)
+
+
+def get_task_poller(cfg, pulp_host=None):
+    """Return a :class:`TaskPoller` shared by all callers in this process.
+
+    One poller is created per Pulp host, so that all waits targeting a host
+    share a single polling loop.
+
+    :param cfg: Information about a Pulp deployment.
+    :param pulp_host: The host to poll. Defaults to the first host with the
+        "api" role.
+    :returns: A :class:`TaskPoller`.
+    """
+    if pulp_host is None:
+        pulp_host = cfg.get_hosts('api')[0]
+    with _POLLERS_LOCK:
+        if pulp_host.hostname not in _POLLERS:
+            _POLLERS[pulp_host.hostname] = TaskPoller(cfg, pulp_host)
+        return _POLLERS[pulp_host.hostname]
+
+
+def poll_spawned_tasks(cfg, call_report, pulp_host=None):
+    """Wait on the tasks spawned by ``call_report``, and return them.
+
+    This function is a drop-in replacement for
+    ``tuple(pulp_smash.api.poll_spawned_tasks(cfg, call_report))``, except
+    that it waits through the shared poller returned by
+    :func:`get_task_poller`.
+
+    :param cfg: Information about a Pulp deployment.
+    :param call_report: A call report, as a dict.
+    :param pulp_host: The host to poll.
+    :returns: A tuple of final task states.
+    """
+    return get_task_poller(cfg, pulp_host).submit(call_report).result()
+
+
+def sync_repo_async(cfg, repo, body=None):
+    """Start syncing ``repo``, and return a future for its tasks.
+
+    Unlike ``pulp_smash.pulp2.utils.sync_repo``, this function returns as soon
+    as Pulp has accepted the request, so that several syncs can be waited on
+    at once.
+
+    :param cfg: Information about a Pulp deployment.
+    :param repo: A dict of information about a repository.
+    :param body: The body of the sync request. Defaults to ``{}``.
+    :returns: A future, as returned by :meth:`TaskPoller.submit`. It raises a
+        ``pulp_smash.exceptions.TaskReportError`` if any task fails.
+    """
+    if body is None:
+        body = {}
+    call_report = http_pool.Client(cfg, api.code_handler).post(
+        urljoin(repo['_href'], 'actions/sync/'),
+        body,
+    ).json()
+    return get_task_poller(cfg).submit(call_report, check_errors=True)
+
+
+def publish_repo_async(cfg, repo, body=None):
+    """Start publishing ``repo``, and return a future for its tasks.
+
+    See :func:`sync_repo_async`.
+
+    :param cfg: Information about a Pulp deployment.
+    :param repo: A dict of information about a repository.
+    :param body: The body of the publish request. Defaults to
+        ``{'id': repo['distributors'][0]['id']}``.
+    :returns: A future, as returned by :meth:`TaskPoller.submit`.
+    """
+    if body is None:
+        body = {'id': repo['distributors'][0]['id']}
+    call_report = http_pool.Client(cfg, api.code_handler).post(
+        urljoin(repo['_href'], 'actions/publish/'),
+        body,
+    ).json()
+    return get_task_poller(cfg).submit(call_report, check_errors=True)
+
+
+def associate_units_async(cfg, repo, source_repo, criteria):
+    """Start copying units from ``source_repo`` into ``repo``.
+
+    See :func:`sync_repo_async`.
+
+    :param cfg: Information about a Pulp deployment.
+    :param repo: A dict of information about the destination repository.
+    :param source_repo: A dict of information about the source repository.
+    :param criteria: A unit association criteria, as a dict.
+    :returns: A future, as returned by :meth:`TaskPoller.submit`.
+    """
+    call_report = http_pool.Client(cfg, api.code_handler).post(
+        urljoin(repo['_href'], 'actions/associate/'),
+        {'source_repo_id': source_repo['id'], 'criteria': criteria},
+    ).json()
+    return get_task_poller(cfg).submit(call_report, check_errors=True)
+
+
+def unassociate_units_async(cfg, repo, criteria):
+    """Start removing the units matching ``criteria`` from ``repo``.
+
+    See :func:`sync_repo_async`. Pulp runs the tasks that modify a repository
+    one after another, in the order they were requested. Several removals may
+    thus be requested at once and waited on together, without changing the
+    order in which they are applied:
+
+    .. code-block:: python
+
+        futures = [
+            unassociate_units_async(cfg, repo, criteria)
+            for criteria in criteria_list
+        ]
+        for future in futures:
+            future.result()
+
+    :param cfg: Information about a Pulp deployment.
+    :param repo: A dict of information about a repository.
+    :param criteria: A unit association criteria, as a dict.
+    :returns: A future, as returned by :meth:`TaskPoller.submit`.
+    """
+    call_report = http_pool.Client(cfg, api.code_handler).post(
+        urljoin(repo['_href'], 'actions/unassociate/'),
+        {'criteria': criteria},
+    ).json()
+    return get_task_poller(cfg).submit(call_report, check_errors=True)
+
+
+class RepoFactoryError(Exception):
+    """One or more repositories could not be set up by a :class:`RepoFactory`.
+
+    :param errors: A list of ``(body, exception)`` tuples, one per failed
+        repository.
+    """
+
+    def __init__(self, errors):
+        """Initialize instance attributes."""
+        super().__init__(
+            '{} repositories could not be set up: {}'.format(
+                len(errors),
+                [repr(error) for _, error in errors],
+            )
+        )
+        self.errors = errors
+
+
+class RepoFactory():  # pylint:disable=too-few-public-methods
+    """Create, sync and publish several repositories concurrently.
+
+    Each repository is set up by a worker from a bounded thread pool. Workers
+    wait on sync and publish tasks through the shared poller returned by
+    :func:`get_task_poller`, so setting up N repositories takes about as long
+    as setting up the slowest of them.
+
+    :param cfg: Information about a Pulp deployment.
+    :param max_workers: How many repositories to set up at once.
+    :param sync: Whether to sync each repository.
+    :param publish: Whether to publish each repository with its first
+        distributor.
+    """
+
+    def __init__(self, cfg, max_workers=5, sync=True, publish=True):
+        """Initialize instance attributes."""
+        self.cfg = cfg
+        self.max_workers = max_workers
+        self.sync = sync
+        self.publish = publish
+
+    def create(self, bodies, cleanup=None):
+        """Set up one repository per body.
+
+        Every repository is scheduled for deletion as soon as it is created,
+        even if a later step fails. If ``cleanup`` is given, it is called as
+        ``cleanup(client.delete, repo['_href'])``; ``unittest.TestCase``'s
+        ``addCleanup`` has this signature. If ``cleanup`` is not given, the
+        caller is responsible for deleting the returned repositories, and
+        repositories are deleted immediately if any of them fail.
+
+        :param bodies: An iterable of repository bodies, such as those returned
+            by ``gen_repo``.
+        :param cleanup: A callable for scheduling cleanup actions.
+        :returns: A list of detailed dicts of information about the
+            repositories, in the same order as ``bodies``.
+        :raises RepoFactoryError: If any repository could not be set up. Other
+            repositories are still set up before this exception is raised.
+        """
+        client = http_pool.Client(self.cfg, api.json_handler)
+        created = []  # append() is thread-safe
+
+        def set_up(body):
+            """Create, sync and publish one repository."""
+            repo = client.post(REPOSITORY_PATH, body)
+            if cleanup is None:
+                created.append(repo)
+            else:
+                cleanup(client.delete, repo['_href'])
+            repo = client.get(repo['_href'], params={'details': True})
+            if self.sync:
+                sync_repo_async(self.cfg, repo).result()
+            if self.publish:
+                publish_repo_async(self.cfg, repo).result()
+            return client.get(repo['_href'], params={'details': True})
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            bodies = tuple(bodies)
+            futures = [executor.submit(set_up, body) for body in bodies]
+        errors = [
+            (body, future.exception())
+            for body, future in zip(bodies, futures)
+            if future.exception() is not None
+        ]
+        if errors:
+            for repo in created:
+                client.delete(repo['_href'])
+            raise RepoFactoryError(errors)
+        return [future.result() for future in futures]
@@ -3,11 +3,14 @@
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import api, config, selectors
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
-from pulp_smash.pulp2.utils import search_units, sync_repo
+from pulp_smash.pulp2.utils import search_units
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import DOCKER_V2_FEED_URL
+from pulp_2_tests.repo_cache import acquire_source_repo, release_source_repo
 from pulp_2_tests.tests.docker.api_v2.utils import gen_repo
 from pulp_2_tests.tests.docker.utils import get_upstream_name, skip_if
 from pulp_2_tests.tests.docker.utils import set_up_module as setUpModule  # pylint:disable=unused-import
@@ -22,17 +25,17 @@ class CopyV2ContentTestCase(unittest.TestCase):
         super().setUpClass()
         cls.cfg = config.get_config()
         cls.repo = {}
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     @classmethod
     def tearDownClass(cls):
         """Clean up resources."""
         if cls.repo:
-            api.Client(cls.cfg).delete(cls.repo['_href'])
+            release_source_repo(cls.repo)
         super().tearDownClass()
 
     def test_01_set_up(self):
-        """Create a repository and populate with with schema v2 content."""
+        """Get a shared repository populated with schema v2 content."""
         body = gen_repo()
         body['importer_config'].update({
             'enable_v1': False,
@@ -40,12 +43,7 @@ class CopyV2ContentTestCase(unittest.TestCase):
             'feed': DOCKER_V2_FEED_URL,
             'upstream_name': get_upstream_name(self.cfg),
         })
-        type(self).repo = self.client.post(REPOSITORY_PATH, body)
-        sync_repo(self.cfg, self.repo)
-        type(self).repo = self.client.get(
-            self.repo['_href'],
-            params={'details': True}
-        )
+        type(self).repo = acquire_source_repo(self.cfg, body)
 
     @skip_if(bool, 'repo', False)
     def test_02_copy_tags(self):
@@ -55,7 +53,7 @@ class CopyV2ContentTestCase(unittest.TestCase):
 
         This test targets `Pulp #3892 <https://pulp.plan.io/issues/3892>`_.
         """
-        if not selectors.bug_is_fixed(3892, self.cfg.pulp_version):
+        if not bug_is_fixed(3892, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3892')
         repo = self.client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(self.client.delete, repo['_href'])
@@ -87,7 +85,7 @@ class CopyV2ContentTestCase(unittest.TestCase):
         * `Pulp #3242 <https://pulp.plan.io/issues/3242>`_.
         * `Pulp-2-tests #72 <https://github.com/PulpQE/Pulp-2-Tests/issues/72>`_.
         """
-        if not selectors.bug_is_fixed(3892, self.cfg.pulp_version):
+        if not bug_is_fixed(3892, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3892')
 
         # Step 1
@@ -154,7 +152,7 @@ class CopyV2ContentTestCase(unittest.TestCase):
         * `Pulp #3892 <https://pulp.plan.io/issues/3892>`_
         """
         for issue_id in (2384, 2385, 3892):
-            if not selectors.bug_is_fixed(issue_id, self.cfg.pulp_version):
+            if not bug_is_fixed(issue_id, self.cfg.pulp_version):
                 self.skipTest(
                     'https://pulp.plan.io/issues/{}'.format(issue_id)
                 )
@@ -8,10 +8,11 @@ import unittest
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, config, utils
+from pulp_smash import config, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPICrudTestCase, BaseAPITestCase
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.tests.docker.api_v2.utils import gen_repo
 from pulp_2_tests.tests.docker.utils import set_up_module
 
@@ -81,7 +82,7 @@ class UpdateTestCase(BaseAPITestCase):
         cls.responses = {}
 
         # Create a repository and a distributor
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         repo = client.post(REPOSITORY_PATH, gen_repo()).json()
         cls.resources.add(repo['_href'])
         cls.responses['add distributor'] = client.post(
@@ -14,11 +14,12 @@ The second upload should silently fail for all Pulp releases in the 2.x series.
 .. _Pulp #1406: https://pulp.plan.io/issues/1406
 .. _Pulp Smash #81: https://github.com/PulpQE/pulp-smash/issues/81
 """
-from pulp_smash import api, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, DuplicateUploadsMixin
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import DOCKER_IMAGE_URL
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.docker.api_v2.utils import gen_repo
 from pulp_2_tests.tests.docker.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -30,8 +31,9 @@ class DuplicateUploadsTestCase(BaseAPITestCase, DuplicateUploadsMixin):
     def setUpClass(cls):
         """Create a Docker repository."""
         super().setUpClass()
-        unit = utils.http_get(DOCKER_IMAGE_URL)
+        unit = http_get(DOCKER_IMAGE_URL)
         import_params = {'unit_type_id': 'docker_image'}
-        repo = api.Client(cls.cfg).post(REPOSITORY_PATH, gen_repo()).json()
+        repo = http_pool.Client(cls.cfg).post(
+            REPOSITORY_PATH, gen_repo()).json()
         cls.upload_import_unit_args = (cls.cfg, unit, import_params, repo)
         cls.resources.add(repo['_href'])
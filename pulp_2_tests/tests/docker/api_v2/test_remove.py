@@ -10,12 +10,14 @@ from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import search_units, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import (
     DOCKER_REMOVE_UPSTREAM_NAME,
     DOCKER_V2_FEED_URL,
 )
-
+from pulp_2_tests.tasks import unassociate_units_async
 from pulp_2_tests.tests.docker.api_v2.utils import gen_repo
+from pulp_2_tests.units import get_unit_counts
 
 
 # Docker Unit Counts Required for Verification Scenarios
@@ -271,7 +273,7 @@ class RemoveV2ContentTestCase(unittest.TestCase):
     def setUpClass(cls):
         """Set cfg and api for each test."""
         cls.cfg = config.get_config()
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo(
             importer_config={
                 'enable_v1': False,
@@ -312,33 +314,32 @@ class RemoveV2ContentTestCase(unittest.TestCase):
         )
 
     def get_docker_units_count(self, repo, unit_type):
-        """Return docker units filtered by type."""
-        units = {}
-        for unit in unit_type:
-            units[unit] = (len(search_units(
-                self.cfg,
-                repo,
-                {'type_ids': [unit], 'filters': {'unit': {}}},
-            )))
-        return units
+        """Return the number of docker units of each type."""
+        return get_unit_counts(self.cfg, repo, unit_type)
 
     def search_docker_units(self, repo, unit_type):
-        """Return docker units filtered by type."""
-        return search_units(
-            self.cfg, repo, {'type_ids': [unit_type], 'filters': {'unit': {}}}
-        )
+        """Return docker units filtered by type, with only their digests."""
+        return search_units(self.cfg, repo, {
+            'type_ids': [unit_type],
+            'filters': {'unit': {}},
+            'fields': {'unit': ['digest']},
+        })
 
     def delete_docker_units_sequential(self, repo, units):
-        """Sequentially delete docker units."""
-        for unit in units:
-            criteria = {
+        """Sequentially delete docker units.
+
+        One removal is requested per unit. Pulp applies them one after
+        another, and they are waited on together.
+        """
+        futures = [
+            unassociate_units_async(self.cfg, repo, {
                 'type_ids': DOCKER_UNIT_TYPES,
                 'filters': {'unit': {'_id': unit['unit_id']}},
-            }
-            self.client.post(
-                urljoin(repo['_href'], 'actions/unassociate/'),
-                {'source_repo_id': repo['id'], 'criteria': criteria},
-            )
+            })
+            for unit in units
+        ]
+        for future in futures:
+            future.result()
 
     def delete_docker_units(self, repo, units):
         """Batch delete docker units."""
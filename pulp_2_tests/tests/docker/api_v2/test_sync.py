@@ -4,9 +4,11 @@ import unittest
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, config, selectors
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import DOCKER_V2_FEED_URL
 from pulp_2_tests.tests.docker.api_v2.utils import gen_repo
 from pulp_2_tests.tests.docker.utils import (
@@ -29,7 +31,7 @@ class UpstreamNameTestCase(unittest.TestCase):
     def setUpClass(cls):
         """Create shared variables."""
         cls.cfg = config.get_config()
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_v2_valid_upstream_name(self):
         """Sync a v2 Docker repository with a valid ``upstream_name``.
@@ -66,7 +68,7 @@ class UpstreamNameTestCase(unittest.TestCase):
 
         This method tests `Pulp #3521 <https://pulp.plan.io/issues/3521>`_.
         """
-        if not selectors.bug_is_fixed(3521, self.cfg.pulp_version):
+        if not bug_is_fixed(3521, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3521')
         repo = self.client.get(repo['_href'], params={'details': True})
         self.assertEqual(repo['importers'][0]['last_override_config'], {})
@@ -3,9 +3,8 @@
 import random
 import unittest
 
-from jsonschema import validate
 from packaging.version import Version
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import (
     publish_repo,
@@ -13,11 +12,17 @@ from pulp_smash.pulp2.utils import (
     sync_repo,
 )
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import DOCKER_V2_FEED_URL
+from pulp_2_tests.lazy import validate
 from pulp_2_tests.tests.docker.api_v2.utils import (
     SyncPublishMixin,
+    create_sync_publish_repo,
     gen_distributor,
     gen_repo,
+    pull_image,
+    reload_crane,
 )
 from pulp_2_tests.tests.docker.utils import (
     get_upstream_name,
@@ -169,30 +174,49 @@ MANIFEST_LIST_V2 = {
 
 
 class V2RegistryTestCase(SyncPublishMixin, unittest.TestCase):
-    """Create, sync, publish and interact with a v2 Docker registry."""
+    """Create, sync, publish and interact with a v2 Docker registry.
+
+    The test methods only read from the registry, so a single repository is
+    created, synced and published for the whole class.
+    """
 
     @classmethod
     def setUpClass(cls):
-        """Create class-wide variables."""
+        """Create class-wide variables, and a docker repository."""
         super().setUpClass()
         cls.cfg = config.get_config()
+        cls.repo = {}
         if (os_is_f26(cls.cfg) and
-                not selectors.bug_is_fixed(3036, cls.cfg.pulp_version)):
+                not bug_is_fixed(3036, cls.cfg.pulp_version)):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3036')
         for issue_id in (2287, 2384):
-            if not selectors.bug_is_fixed(issue_id, cls.cfg.pulp_version):
+            if not bug_is_fixed(issue_id, cls.cfg.pulp_version):
                 raise unittest.SkipTest(
                     'https://pulp.plan.io/issues/{}'.format(issue_id)
                 )
+        cls.hrefs = []
+        try:
+            cls.repo = create_sync_publish_repo(
+                cls.cfg,
+                {
+                    'enable_v1': False,
+                    'enable_v2': True,
+                    'feed': DOCKER_V2_FEED_URL,
+                    'upstream_name': get_upstream_name(cls.cfg),
+                },
+                cleanup=lambda _, href: cls.hrefs.append(href),
+            )
+        except:  # noqa:E722
+            cls.tearDownClass()
+            raise
 
-    def setUp(self):
-        """Create docker repository."""
-        self.repo = self.create_sync_publish_repo(self.cfg, {
-            'enable_v1': False,
-            'enable_v2': True,
-            'feed': DOCKER_V2_FEED_URL,
-            'upstream_name': get_upstream_name(self.cfg),
-        })
+    @classmethod
+    def tearDownClass(cls):
+        """Delete the docker repository."""
+        client = http_pool.Client(cls.cfg)
+        for href in cls.hrefs:
+            client.delete(href)
+        super().tearDownClass()
 
     @skip_if(bool, 'repo', False)
     def test_get_crane_repositories_v2(self):
@@ -202,7 +226,7 @@ class V2RegistryTestCase(SyncPublishMixin, unittest.TestCase):
         <http://docs.pulpproject.org/plugins/crane/index.html#crane-admin>`_.
         """
         if (self.cfg.pulp_version < Version('2.14') or
-                not selectors.bug_is_fixed(2723, self.cfg.pulp_version)):
+                not bug_is_fixed(2723, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2723')
         repo_id = self.repo['id']
         repos = self.make_crane_client(self.cfg).get('/crane/repositories/v2')
@@ -223,9 +247,9 @@ class V2RegistryTestCase(SyncPublishMixin, unittest.TestCase):
 
         This test targets `Pulp #2336 <https://pulp.plan.io/issues/2336>`_.
         """
-        if not selectors.bug_is_fixed(2336, self.cfg.pulp_version):
+        if not bug_is_fixed(2336, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2336')
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         client.request_kwargs['url'] = self.adjust_url(
             client.request_kwargs['url']
         )
@@ -252,9 +276,9 @@ class V2RegistryTestCase(SyncPublishMixin, unittest.TestCase):
 
         This test targets `Pulp #2336 <https://pulp.plan.io/issues/2336>`_.
         """
-        if not selectors.bug_is_fixed(2336, self.cfg.pulp_version):
+        if not bug_is_fixed(2336, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2336')
-        client = api.Client(self.cfg, api.json_handler, {'headers': {
+        client = http_pool.Client(self.cfg, api.json_handler, {'headers': {
             'accept': 'application/vnd.docker.distribution.manifest.v2+json'
         }})
         client.request_kwargs['url'] = self.adjust_url(
@@ -287,7 +311,7 @@ class V2RegistryTestCase(SyncPublishMixin, unittest.TestCase):
         content_type = (
             'application/vnd.docker.distribution.manifest.list.v2+json'
         )
-        client = api.Client(
+        client = http_pool.Client(
             self.cfg,
             request_kwargs={'headers': {'accept': content_type}}
         )
@@ -312,21 +336,18 @@ class V2RegistryTestCase(SyncPublishMixin, unittest.TestCase):
         them together to form the docker image.This testcase is in reference to
         `Pulp #3638`_.
 
+        Blobs are fetched concurrently and streamed, and each blob's digest is
+        verified. (See
+        :func:`pulp_2_tests.tests.docker.api_v2.utils.pull_image`.)
+
         .. _Pulp #3638: https://pulp.plan.io/issues/3638
         """
-        client = self.make_crane_client(self.cfg)
-        response = client.get('/v2/{}/manifests/latest'.format(self.repo['id']))
-        client = api.Client(self.cfg)
-        client.request_kwargs['url'] = self.adjust_url(
-            client.request_kwargs['url']
-        )
-        self.assertIn('fsLayers', response, 'The blob data does not exist')
-        for blob in response['fsLayers']:
-            with self.subTest(blob=blob):
-                response = client.get(
-                    '/v2/{}/blobs/{}'.format(self.repo['id'], blob['blobSum'])
-                )
-                self.assertEqual(response.status_code, 200, response.content)
+        manifest, pulls = pull_image(self.cfg, self.repo['id'])
+        self.assertIn('fsLayers', manifest, 'The blob data does not exist')
+        for pull in pulls:
+            with self.subTest(blob=pull.digest):
+                self.assertEqual(pull.status_code, 200, pull)
+                self.assertEqual(pull.actual_digest, pull.digest, pull)
 
 
 class NonNamespacedImageTestCase(SyncPublishMixin, unittest.TestCase):
@@ -350,7 +371,7 @@ class NonNamespacedImageTestCase(SyncPublishMixin, unittest.TestCase):
 
         # Get and inspect /crane/repositories/v2.
         if (cfg.pulp_version >= Version('2.14') and
-                selectors.bug_is_fixed(2723, cfg.pulp_version)):
+                bug_is_fixed(2723, cfg.pulp_version)):
             client = self.make_crane_client(cfg)
             repo_id = repo['id']
             repos = client.get('/crane/repositories/v2')
@@ -401,16 +422,16 @@ class NoAmd64LinuxTestCase(SyncPublishMixin, unittest.TestCase):
         cls.cfg = config.get_config()
         cls.repo = {}
         if (os_is_f26(cls.cfg) and
-                not selectors.bug_is_fixed(3036, cls.cfg.pulp_version)):
+                not bug_is_fixed(3036, cls.cfg.pulp_version)):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3036')
-        if not selectors.bug_is_fixed(2384, cls.cfg.pulp_version):
+        if not bug_is_fixed(2384, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2384')
 
     @classmethod
     def tearDownClass(cls):
         """Clean up resources."""
         if cls.repo:
-            api.Client(cls.cfg).delete(cls.repo['_href'])
+            http_pool.Client(cls.cfg).delete(cls.repo['_href'])
         super().tearDownClass()
 
     def test_01_set_up(self):
@@ -421,10 +442,10 @@ class NoAmd64LinuxTestCase(SyncPublishMixin, unittest.TestCase):
         1. Create, sync and publish a Docker repository. Let the repository's
            upstream name reference a repository that has an image with a
            manifest list and no amd64/linux build.
-        2. Make Crane immediately re-read the metadata files published by Pulp.
-           (Restart Apache.)
+        2. Make Crane immediately re-read the metadata files published by Pulp,
+           and wait until Crane serves the repository.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config'].update({
             'enable_v1': False,
@@ -444,7 +465,7 @@ class NoAmd64LinuxTestCase(SyncPublishMixin, unittest.TestCase):
         publish_repo(self.cfg, self.repo)
 
         # Make Crane read metadata. (Now!)
-        cli.GlobalServiceManager(self.cfg).restart(('httpd',))
+        reload_crane(self.cfg, (self.repo,))
 
     @skip_if(bool, 'repo', False)
     def test_02_get_manifest_list(self):
@@ -463,7 +484,7 @@ class NoAmd64LinuxTestCase(SyncPublishMixin, unittest.TestCase):
         content_type = (
             'application/vnd.docker.distribution.manifest.list.v2+json'
         )
-        client = api.Client(self.cfg, request_kwargs={
+        client = http_pool.Client(self.cfg, request_kwargs={
             'headers': {'accept': content_type}
         })
         client.request_kwargs['url'] = self.adjust_url(
@@ -491,7 +512,7 @@ class NoAmd64LinuxTestCase(SyncPublishMixin, unittest.TestCase):
     @skip_if(bool, 'repo', False)
     def test_02_get_manifest_v2(self):
         """Get a v2 manifest. Assert that an HTTP 404 is returned."""
-        client = api.Client(self.cfg, api.echo_handler, {'headers': {
+        client = http_pool.Client(self.cfg, api.echo_handler, {'headers': {
             'accept': 'application/vnd.docker.distribution.manifest.v2+json'
         }})
         client.request_kwargs['url'] = self.adjust_url(
@@ -505,7 +526,7 @@ class NoAmd64LinuxTestCase(SyncPublishMixin, unittest.TestCase):
     @skip_if(bool, 'repo', False)
     def test_02_get_manifest_v1(self):
         """Get a v1 manifest. Assert that an HTTP 404 is returned."""
-        client = api.Client(self.cfg, api.echo_handler, {'headers': {
+        client = http_pool.Client(self.cfg, api.echo_handler, {'headers': {
             'accept': 'application/vnd.docker.distribution.manifest.v1+json'
         }})
         client.request_kwargs['url'] = self.adjust_url(
@@ -537,31 +558,36 @@ class RepoRegistryIdTestCase(SyncPublishMixin, unittest.TestCase):
         """
         cfg = config.get_config()
         if (cfg.pulp_version < Version('2.14') or
-                not selectors.bug_is_fixed(2723, cfg.pulp_version)):
+                not bug_is_fixed(2723, cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2723')
-        for i in range(1, 4):
-            repo_registry_id = '/'.join(utils.uuid4() for _ in range(i))
-            with self.subTest(repo_registry_id=repo_registry_id):
-                self.do_test(cfg, repo_registry_id)
-
-    def do_test(self, cfg, repo_registry_id):
-        """Execute the test with the given ``repo_registry_id``."""
         # Create, sync and publish.
-        importer_config = {
-            'enable_v1': False,
-            'enable_v2': True,
-            'feed': DOCKER_V2_FEED_URL,
-            'upstream_name': get_upstream_name(cfg),
-        }
-        distrib = gen_distributor()
-        distrib['distributor_config']['repo-registry-id'] = repo_registry_id
-        self.create_sync_publish_repo(cfg, importer_config, [distrib])
+        repo_registry_ids = [
+            '/'.join(utils.uuid4() for _ in range(i)) for i in range(1, 4)
+        ]
+        bodies = []
+        for repo_registry_id in repo_registry_ids:
+            distrib = gen_distributor()
+            distrib['distributor_config']['repo-registry-id'] = (
+                repo_registry_id
+            )
+            bodies.append(gen_repo(
+                importer_config={
+                    'enable_v1': False,
+                    'enable_v2': True,
+                    'feed': DOCKER_V2_FEED_URL,
+                    'upstream_name': get_upstream_name(cfg),
+                },
+                distributors=[distrib],
+            ))
+        self.create_sync_publish_repos(cfg, bodies)
 
         # Get and inspect /crane/repositories/v2.
         client = self.make_crane_client(cfg)
         repos = client.get('/crane/repositories/v2')
-        self.assertIn(repo_registry_id, repos.keys())
-        self.assertFalse(repos[repo_registry_id]['protected'])
+        for repo_registry_id in repo_registry_ids:
+            with self.subTest(repo_registry_id=repo_registry_id):
+                self.assertIn(repo_registry_id, repos.keys())
+                self.assertFalse(repos[repo_registry_id]['protected'])
 
 
 class DockerHeadersTestCase(SyncPublishMixin, unittest.TestCase):
@@ -612,7 +638,7 @@ class DockerHeadersTestCase(SyncPublishMixin, unittest.TestCase):
         )
 
         # Get the Content-Type of that tag
-        header = api.Client(cfg, api.code_handler).get(url).headers
+        header = http_pool.Client(cfg, api.code_handler).get(url).headers
 
         # Verify the header
         # application/vnd.docker.distribution.manifest.v1+prettyjws
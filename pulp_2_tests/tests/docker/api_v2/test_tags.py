@@ -11,6 +11,7 @@ from pulp_smash.exceptions import TaskReportError
 from pulp_smash.pulp2.constants import CONTENT_UPLOAD_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, search_units, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import DOCKER_V2_FEED_URL
 from pulp_2_tests.tests.docker.api_v2.utils import gen_repo
 from pulp_2_tests.tests.docker.utils import get_upstream_name, set_up_module
@@ -38,7 +39,7 @@ def create_docker_repo(cfg, upstream_name):
         'feed': DOCKER_V2_FEED_URL,
     })
     body['importer_config']['upstream_name'] = upstream_name
-    client = api.Client(cfg, api.json_handler)
+    client = http_pool.Client(cfg, api.json_handler)
     return client.post(REPOSITORY_PATH, body)
 
 
@@ -51,7 +52,7 @@ def import_upload(cfg, repo, params):
     :param params: A dict of information to pass as import_upload body.
     :return: A dict of information about the creation/update report.
     """
-    client = api.Client(cfg, api.json_handler)
+    client = http_pool.Client(cfg, api.json_handler)
     malloc = client.post(CONTENT_UPLOAD_PATH)
     body = {'unit_key': {}, 'upload_id': malloc['upload_id']}
     body.update(params)
@@ -68,9 +69,9 @@ class DockerTagTestCase(BaseAPITestCase):
         """Create and sync a docker repository."""
         super().setUp()
         self.repo = create_docker_repo(self.cfg, get_upstream_name(self.cfg))
-        self.addCleanup(api.Client(self.cfg).delete, self.repo['_href'])
+        self.addCleanup(http_pool.Client(self.cfg).delete, self.repo['_href'])
         sync_repo(self.cfg, self.repo)
-        self.repo = api.Client(self.cfg, api.json_handler).get(
+        self.repo = http_pool.Client(self.cfg, api.json_handler).get(
             self.repo['_href'], params={'details': True})
         self.tags = self._get_tags()
 
@@ -198,9 +199,9 @@ class DockerTagTestCase(BaseAPITestCase):
     def test_update_tag_another_repo(self):
         """Check if tagging fail for a manifest from another repo."""
         other = create_docker_repo(self.cfg, 'library/swarm')
-        self.addCleanup(api.Client(self.cfg).delete, other['_href'])
+        self.addCleanup(http_pool.Client(self.cfg).delete, other['_href'])
         sync_repo(self.cfg, other)
-        other = api.Client(self.cfg, api.json_handler).get(
+        other = http_pool.Client(self.cfg, api.json_handler).get(
             other['_href'], params={'details': True})
         other_manifest = random.choice(search_units(
             self.cfg, other, {'type_ids': ['docker_manifest']}))
@@ -4,9 +4,11 @@ import copy
 import json
 import unittest
 
-from pulp_smash import api, config, selectors
+from pulp_smash import config
 from pulp_smash.pulp2.utils import pulp_admin_login, upload_import_unit
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import DOCKER_V2_FEED_URL
 from pulp_2_tests.tests.docker.api_v2.utils import SyncPublishMixin
 from pulp_2_tests.tests.docker.utils import (
@@ -31,10 +33,10 @@ class UploadManifestListV2TestCase(SyncPublishMixin, unittest.TestCase):
         super().setUpClass()
         cls.cfg = config.get_config()
         if (os_is_f26(cls.cfg) and
-                not selectors.bug_is_fixed(3036, cls.cfg.pulp_version)):
+                not bug_is_fixed(3036, cls.cfg.pulp_version)):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3036')
         for issue_id in (2287, 2384, 2993, 3904):
-            if not selectors.bug_is_fixed(issue_id, cls.cfg.pulp_version):
+            if not bug_is_fixed(issue_id, cls.cfg.pulp_version):
                 raise unittest.SkipTest(
                     'https://pulp.plan.io/issues/{}'.format(issue_id)
                 )
@@ -89,7 +91,7 @@ class UploadManifestListV2TestCase(SyncPublishMixin, unittest.TestCase):
             new_manifest_list = crane_client.get(manifest_list_path)
             self.assertEqual(manifest_list, new_manifest_list)
         with self.subTest(comment='verify docker_manifest_list repo attr'):
-            new_repo = api.Client(self.cfg).get(repo['_href']).json()
+            new_repo = http_pool.Client(self.cfg).get(repo['_href']).json()
             self.assertEqual(
                 repo['content_unit_counts']['docker_manifest_list'] +
                 len(modified_manifest_list['manifests']),
@@ -1,10 +1,53 @@
 # coding=utf-8
 """Utility functions for Docker API tests."""
+import hashlib
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlsplit, urlunsplit
 
-from pulp_smash import api, cli, utils
+from pulp_smash import api, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, sync_repo
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.tasks import RepoFactory
+from pulp_2_tests.waiters import wait_until
+
+CRANE_WSGI_PATH = '/usr/share/crane/crane.wsgi'
+"""The path to Crane's WSGI script on a Pulp host."""
+
+
+class BlobPull(namedtuple('BlobPull', (
+        'digest',
+        'status_code',
+        'size',
+        'seconds',
+        'actual_digest',
+))):
+    """The outcome of fetching one blob, as returned by :func:`pull_image`.
+
+    :param digest: The digest listed in the manifest, such as
+        ``sha256:…``.
+    :param status_code: The HTTP status code of the final response.
+    :param size: The number of bytes received.
+    :param seconds: How long the blob took to fetch, including redirects.
+    :param actual_digest: The digest of the bytes received, computed with the
+        same algorithm as ``digest``.
+    """
+
+    __slots__ = ()
+
+    @property
+    def verified(self):
+        """Tell whether the blob was fetched and matches its digest."""
+        return self.status_code == 200 and self.digest == self.actual_digest
+
+    @property
+    def throughput(self):
+        """Return the number of bytes received per second."""
+        return self.size / self.seconds if self.seconds else float('inf')
 
 
 def gen_repo(**kwargs):
@@ -31,6 +74,99 @@ def gen_distributor(**kwargs):
     return data
 
 
+def get_registry_ids(repo):
+    """Return the names under which Crane serves ``repo``.
+
+    :param repo: A detailed dict of information about a repository.
+    :returns: A list with the ``repo-registry-id`` of each of the
+        repository's Docker web distributors, which defaults to the
+        repository's ID.
+    """
+    return [
+        distributor['config'].get('repo-registry-id', repo['id'])
+        for distributor in repo.get('distributors', ())
+        if distributor['distributor_type_id'] == 'docker_distributor_web'
+    ]
+
+
+def reload_crane(cfg, repos=(), timeout=120):
+    """Make Crane re-read the metadata files published by Pulp, and wait.
+
+    Crane reads the metadata files published by Pulp when its WSGI
+    application is loaded. Touching Crane's WSGI script makes ``mod_wsgi``
+    reload Crane alone on the next request, leaving Pulp's own WSGI
+    applications running. If the script isn't found, Apache is gracefully
+    reloaded instead. Crane is then polled until it serves every repository
+    in ``repos``.
+
+    :param cfg: Information about a Pulp deployment.
+    :param repos: An iterable of detailed dicts of information about
+        published repositories.
+    :param timeout: How many seconds to wait at most for Crane to serve the
+        repositories.
+    :raises pulp_2_tests.waiters.WaitTimeoutError: If Crane doesn't serve
+        every repository in time.
+    """
+    ssh.Client(cfg).run((
+        'sh', '-c',
+        'if [ -f {0} ]; then touch {0}; else apachectl graceful; fi'
+        .format(CRANE_WSGI_PATH),
+    ), sudo=True)
+    client = http_pool.Client(cfg, api.echo_handler)
+    client.request_kwargs['url'] = SyncPublishMixin.adjust_url(
+        client.request_kwargs['url']
+    )
+    paths = [
+        '/v2/{}/tags/list'.format(registry_id)
+        for repo in repos
+        for registry_id in get_registry_ids(repo)
+    ] or ['/v2/']
+
+    def crane_serves_repos():
+        try:
+            return all(client.get(path).status_code == 200 for path in paths)
+        except RequestsConnectionError:
+            return False
+
+    wait_until(crane_serves_repos, timeout, 'Crane to serve ' + str(paths))
+
+
+def create_sync_publish_repo(
+        cfg,
+        importer_config,
+        distributors=None,
+        cleanup=None):
+    """Create, sync and publish a repository, and make Crane serve it.
+
+    See :meth:`SyncPublishMixin.create_sync_publish_repo`. This function may
+    also be called from ``setUpClass``, to share a repository between the
+    test methods of a class.
+
+    :param cleanup: A function such as ``addCleanup``. If given, it is called
+        with ``(client.delete, repo_href)`` as soon as the repository is
+        created.
+    :returns: A detailed dict of information about the repository.
+    """
+    # create repository
+    client = http_pool.Client(cfg, api.json_handler)
+    body = gen_repo()
+    body['importer_config'].update(importer_config)
+    if distributors is None:
+        body['distributors'] = [gen_distributor()]
+    else:
+        body['distributors'] = distributors
+    repo = client.post(REPOSITORY_PATH, body)
+    if cleanup is not None:
+        cleanup(client.delete, repo['_href'])
+
+    # Sync, publish, and re-read metadata.
+    repo = client.get(repo['_href'], params={'details': True})
+    sync_repo(cfg, repo)
+    publish_repo(cfg, repo)
+    reload_crane(cfg, (repo,))
+    return client.get(repo['_href'], params={'details': True})
+
+
 class SyncPublishMixin():
     """Tools for test cases that sync and publish Docker repositories.
 
@@ -59,7 +195,7 @@ class SyncPublishMixin():
         Create an API client for talking to Crane. The client returned by this
         method is similar to the following ``client``:
 
-        >>> client = api.Client(cfg, api.json_handler)
+        >>> client = http_pool.Client(cfg, api.json_handler)
 
         However:
 
@@ -71,7 +207,7 @@ class SyncPublishMixin():
             deployment.
         :returns: An API client for talking with Crane.
         """
-        client = api.Client(
+        client = http_pool.Client(
             cfg,
             api.json_handler,
             {'headers': {'accept': 'application/json'}},
@@ -92,8 +228,9 @@ class SyncPublishMixin():
 
         1. Create a repository and schedule it for deletion.
         2. Sync and publish the repository.
-        3. Make Crane immediately re-read the metadata files published by Pulp.
-           (Restart Apache)
+        3. Make Crane immediately re-read the metadata files published by Pulp,
+           and wait until Crane serves the repository. (See
+           :func:`reload_crane`.)
 
         :param cfg: Information about a Pulp
             deployment.
@@ -103,20 +240,118 @@ class SyncPublishMixin():
             the repository. If no value is passed, one will be generated.
         :returns: A detailed dict of information about the repository.
         """
-        # create repository
-        client = api.Client(cfg, api.json_handler)
-        body = gen_repo()
-        body['importer_config'].update(importer_config)
-        if distributors is None:
-            body['distributors'] = [gen_distributor()]
-        else:
-            body['distributors'] = distributors
-        repo = client.post(REPOSITORY_PATH, body)
-        self.addCleanup(client.delete, repo['_href'])
-
-        # Sync, publish, and re-read metadata.
-        repo = client.get(repo['_href'], params={'details': True})
-        sync_repo(cfg, repo)
-        publish_repo(cfg, repo)
-        cli.GlobalServiceManager(cfg).restart(('httpd',))
-        return client.get(repo['_href'], params={'details': True})
+        return create_sync_publish_repo(
+            cfg, importer_config, distributors, self.addCleanup)
+
+    def create_sync_publish_repos(self, cfg, bodies, max_workers=5):
+        """Create, sync and publish several repositories concurrently.
+
+        This method is like :meth:`create_sync_publish_repo`, except that
+        repositories are set up in parallel by a
+        ``pulp_2_tests.tasks.RepoFactory``, and Crane is reloaded only once,
+        after all repositories have been published. Each repository is
+        scheduled for deletion as soon as it is created.
+
+        :param cfg: Information about a Pulp
+            deployment.
+        :param bodies: An iterable of repository bodies, as returned by
+            :func:`gen_repo`. If a body has no distributors, one will be
+            generated.
+        :param max_workers: How many repositories to set up at once.
+        :returns: A list of detailed dicts of information about the
+            repositories, in the same order as ``bodies``.
+        :raises pulp_2_tests.tasks.RepoFactoryError: If any repository could
+            not be set up.
+        """
+        bodies = tuple(bodies)
+        for body in bodies:
+            body.setdefault('distributors', [gen_distributor()])
+        factory = RepoFactory(cfg, max_workers)
+        repos = factory.create(bodies, self.addCleanup)
+        reload_crane(cfg, repos)
+        return repos
+
+
+def get_blob_digests(manifest):
+    """Return the digests of the blobs referenced by an image manifest.
+
+    Both schema 1 manifests, which list ``fsLayers``, and schema 2 manifests,
+    which list a ``config`` and ``layers``, are supported. Each digest is
+    listed once, in the order it first appears.
+
+    :param manifest: An image manifest, as a dict.
+    :returns: A list of digests, such as ``['sha256:…']``.
+    """
+    if 'fsLayers' in manifest:
+        digests = [layer['blobSum'] for layer in manifest['fsLayers']]
+    else:
+        digests = [manifest['config']['digest']]
+        digests.extend(layer['digest'] for layer in manifest['layers'])
+    return list(dict.fromkeys(digests))
+
+
+def pull_image(  # pylint:disable=too-many-arguments
+        cfg,
+        registry_id,
+        reference='latest',
+        headers=None,
+        max_workers=4,
+        chunk_size=1 << 16):
+    """Emulate ``docker pull``, by fetching a manifest and then its blobs.
+
+    Blobs are fetched concurrently, by at most ``max_workers`` threads. Each
+    blob is streamed in chunks of ``chunk_size`` bytes, and its digest is
+    computed as it is received, so that blobs are never held in memory.
+    Redirects, such as those from Crane to Pulp's streamer, are followed.
+
+    :param cfg: Information about a Pulp deployment.
+    :param registry_id: The name under which Crane serves the repository.
+    :param reference: A tag or digest identifying the image.
+    :param headers: Headers to send when fetching the manifest, such as an
+        ``accept`` header. Defaults to ``accept:application/json``, for which
+        Crane returns a schema 1 manifest.
+    :param max_workers: How many blobs to fetch at once.
+    :param chunk_size: How many bytes to read from a response at a time.
+    :returns: A ``(manifest, pulls)`` tuple, where ``pulls`` is a list of
+        :class:`BlobPull`, one per blob, in the order of
+        :func:`get_blob_digests`.
+    """
+    crane_client = SyncPublishMixin.make_crane_client(cfg)
+    if headers is not None:
+        crane_client.request_kwargs['headers'] = headers
+    manifest = crane_client.get(
+        '/v2/{}/manifests/{}'.format(registry_id, reference)
+    )
+    client = http_pool.Client(cfg, api.echo_handler)
+    client.request_kwargs['url'] = SyncPublishMixin.adjust_url(
+        client.request_kwargs['url']
+    )
+
+    def pull_blob(digest):
+        """Fetch and hash one blob."""
+        algorithm, _, _ = digest.partition(':')
+        hasher = hashlib.new(algorithm)
+        size = 0
+        started = time.monotonic()
+        response = client.get(
+            '/v2/{}/blobs/{}'.format(registry_id, digest),
+            stream=True,
+        )
+        try:
+            # Hash the bytes as sent, even if a content-encoding is declared.
+            for chunk in response.raw.stream(chunk_size, decode_content=False):
+                hasher.update(chunk)
+                size += len(chunk)
+        finally:
+            response.close()
+        return BlobPull(
+            digest,
+            response.status_code,
+            size,
+            time.monotonic() - started,
+            '{}:{}'.format(algorithm, hasher.hexdigest()),
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pulls = list(executor.map(pull_blob, get_blob_digests(manifest)))
+    return manifest, pulls
@@ -8,9 +8,11 @@ import re
 import unittest
 
 from packaging import version
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, cli, config, utils
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.tests.docker.cli import utils as docker_utils
 from pulp_2_tests.tests.docker.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -60,7 +62,7 @@ class CreateTestCase(unittest.TestCase):
 
         Assert only the first repository is created.
         """
-        client = cli.Client(self.cfg)
+        client = ssh.Client(self.cfg)
         command = 'pulp-admin docker repo create --repo-id ' + self.repo_id
         client.run(command.split())
 
@@ -99,7 +101,7 @@ class DeleteV2TestCase(unittest.TestCase):
     def test_data_gone(self):
         """Assert that the published data was cleaned up."""
         path = '/pulp/docker/v2/{}/tags/list'.format(self.repo_id)
-        response = api.Client(self.cfg, api.echo_handler).get(path)
+        response = http_pool.Client(self.cfg, api.echo_handler).get(path)
         self.assertEqual(response.status_code, 404)
 
     def test_repo_gone(self):
@@ -128,7 +130,7 @@ class UpdateEnableV1TestCase(unittest.TestCase):
 
         if cls.cfg.pulp_version < version.Version('2.8'):
             raise unittest.SkipTest('These tests require Pulp 2.8 or above.')
-        if not selectors.bug_is_fixed(1710, cls.cfg.pulp_version):
+        if not bug_is_fixed(1710, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1710')
 
         pulp_admin_login(cls.cfg)
@@ -182,7 +184,7 @@ class UpdateEnableV2TestCase(unittest.TestCase):
 
         if cls.cfg.pulp_version < version.Version('2.8'):
             raise unittest.SkipTest('These tests require Pulp 2.8 or above.')
-        if not selectors.bug_is_fixed(1710, cls.cfg.pulp_version):
+        if not bug_is_fixed(1710, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1710')
 
         pulp_admin_login(cls.cfg)
@@ -236,7 +238,7 @@ class UpdateDistributorTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < version.Version('2.8'):
             raise unittest.SkipTest('These tests require Pulp 2.8 or above.')
-        if not selectors.bug_is_fixed(1710, cls.cfg.pulp_version):
+        if not bug_is_fixed(1710, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1710')
 
         pulp_admin_login(cls.cfg)
@@ -1,8 +1,10 @@
 # coding=utf-8
 """Tests for syncing and publishing docker repositories."""
-from pulp_smash import cli, config, selectors, utils
+from pulp_smash import cli, config, utils
 from pulp_smash.pulp2.utils import BaseAPITestCase, pulp_admin_login
 
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.tests.docker.cli.utils import repo_create, repo_delete
 from pulp_2_tests.tests.docker.utils import get_upstream_name, set_up_module
 
@@ -26,11 +28,11 @@ class InvalidFeedTestCase(BaseAPITestCase):
             upstream_name=get_upstream_name(self.cfg),
         ).stdout)
         self.addCleanup(repo_delete, self.cfg, repo_id)
-        client = cli.Client(self.cfg, cli.echo_handler)
+        client = ssh.Client(self.cfg, cli.echo_handler)
         proc = client.run((
             'pulp-admin', 'docker', 'repo', 'sync', 'run', '--repo-id', repo_id
         ))
-        if selectors.bug_is_fixed(427, self.cfg.pulp_version):
+        if bug_is_fixed(427, self.cfg.pulp_version):
             with self.subTest():
                 self.assertNotEqual(proc.returncode, 0)
         with self.subTest():
@@ -8,7 +8,7 @@ example, an argument ``to_repo_id`` corresponds to the flag ``--to-repo-id``.
 
 For the meaning of each argument, see pulp-admin.
 """
-from pulp_smash import cli
+from pulp_2_tests import ssh
 
 
 def repo_copy(cfg, unit_type, from_repo_id=None, to_repo_id=None):
@@ -18,7 +18,7 @@ def repo_copy(cfg, unit_type, from_repo_id=None, to_repo_id=None):
         cmd.extend(('--from-repo-id', from_repo_id))
     if to_repo_id is not None:
         cmd.extend(('--to-repo-id', to_repo_id))
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
 
 
 def repo_create(  # pylint:disable=too-many-arguments
@@ -43,13 +43,13 @@ def repo_create(  # pylint:disable=too-many-arguments
         cmd.extend(('--repo-registry-id', repo_registry_id))
     if upstream_name is not None:
         cmd.extend(('--upstream-name', upstream_name))
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
 
 
 def repo_delete(cfg, repo_id):
     """Execute ``pulp-admin docker repo delete``."""
     cmd = 'pulp-admin docker repo delete --repo-id {}'.format(repo_id).split()
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
 
 
 def repo_list(cfg, repo_id=None, details=False):
@@ -59,7 +59,7 @@ def repo_list(cfg, repo_id=None, details=False):
         cmd.extend(('--repo-id', repo_id))
     if details:
         cmd.append('--details')
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
 
 
 def repo_search(cfg, unit_type, fields=None, repo_id=None):
@@ -69,14 +69,14 @@ def repo_search(cfg, unit_type, fields=None, repo_id=None):
         cmd.extend(('--fields', fields))
     if repo_id is not None:
         cmd.extend(('--repo-id', repo_id))
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
 
 
 def repo_sync(cfg, repo_id):
     """Execute ``pulp-admin docker repo sync run``."""
     cmd = 'pulp-admin docker repo sync run'.split()
     cmd.extend(('--repo-id', repo_id))
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
 
 
 def repo_update(  # pylint:disable=too-many-arguments
@@ -101,7 +101,7 @@ def repo_update(  # pylint:disable=too-many-arguments
         cmd.extend(('--upstream-name', upstream_name))
     if repo_registry_id is not None:
         cmd.extend(('--repo-registry-id', repo_registry_id))
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
 
 
 def repo_publish(cfg, repo_id, bg=None, force_full=None):  # pylint:disable=invalid-name
@@ -113,4 +113,4 @@ def repo_publish(cfg, repo_id, bg=None, force_full=None):  # pylint:disable=inva
         cmd += '--bg'
     if force_full:
         cmd += '--force-full'
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
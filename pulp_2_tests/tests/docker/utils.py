@@ -6,9 +6,11 @@ from functools import partial
 from unittest import SkipTest
 
 from packaging.version import Version
-from pulp_smash import cli, selectors, utils
+from pulp_smash import selectors, utils
 from pulp_smash.pulp2 import utils as pulp2_utils
 
+from pulp_2_tests import ssh
+from pulp_2_tests.capabilities import get_capabilities, require_unit_types
 from pulp_2_tests.constants import (
     DOCKER_UPSTREAM_NAME,
     DOCKER_UPSTREAM_NAME_NOLIST,
@@ -20,7 +22,7 @@ def set_up_module():
     pulp2_utils.require_pulp_2(SkipTest)
     pulp2_utils.require_issue_3159(SkipTest)
     pulp2_utils.require_issue_3687(SkipTest)
-    pulp2_utils.require_unit_types({'docker_image'}, SkipTest)
+    require_unit_types({'docker_image'}, SkipTest)
 
 
 def get_upstream_name(cfg):
@@ -46,13 +48,12 @@ def write_manifest_list(cfg, manifest_list):
     :return: The path to created file, and the path to dir that stores the
         file.
     """
-    sudo = '' if cli.is_root(cfg) else 'sudo'
-    client = cli.Client(cfg)
+    sudo = '' if ssh.is_root(cfg) else 'sudo'
+    client = ssh.Client(cfg)
     dir_path = client.run('mktemp --directory'.split()).stdout.strip()
     file_path = os.path.join(dir_path, utils.uuid4() + '.json')
     manifest_list_json = json.dumps(manifest_list)
-    # machine.session is used here to keep SSH session open
-    client.machine.session().run(
+    client.run_shell(
         "{} echo '{}' > {}".format(
             sudo,
             manifest_list_json,
@@ -64,8 +65,7 @@ def write_manifest_list(cfg, manifest_list):
 
 def os_is_f26(cfg, pulp_host=None):
     """Tell whether the given Pulp host's OS is F26."""
-    return (utils.get_os_release_id(cfg, pulp_host) == 'fedora' and
-            utils.get_os_release_version_id(cfg, pulp_host) == '26')
+    return get_capabilities(cfg, pulp_host).os_is('fedora', '26')
 
 
 skip_if = partial(selectors.skip_if, exc=SkipTest)  # pylint:disable=invalid-name
@@ -11,11 +11,13 @@ from random import choice, randrange
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, config, exceptions, selectors, utils
+from pulp_smash import api, config, exceptions, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, BaseAPICrudTestCase
 from requests.exceptions import HTTPError
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import OSTREE_FEED, OSTREE_BRANCHES
 from pulp_2_tests.tests.ostree.utils import gen_repo
 from pulp_2_tests.tests.ostree.utils import set_up_module as setUpModule  # pylint:disable=unused-import
@@ -82,7 +84,7 @@ class CreateDistributorsTestCase(BaseAPITestCase):
         repositories.
         """
         super().setUpClass()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         bodies = tuple(gen_repo() for _ in range(2))
         bodies[0]['distributors'] = [_gen_distributor(_gen_rel_path())]
         cls.repos = []
@@ -103,7 +105,7 @@ class CreateDistributorsTestCase(BaseAPITestCase):
         Create a unique relative path.  For example, if an existing relative
         path is ``foo/bar``, then this relative path might be ``biz/baz``.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(self.repos[1]['_href'], 'distributors/')
         body = _gen_distributor(_gen_rel_path())
         client.post(path, body)
@@ -114,7 +116,7 @@ class CreateDistributorsTestCase(BaseAPITestCase):
         Create a relative path that contains three segments. Most other tests
         in this module have relative paths with two segments.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(self.repos[1]['_href'], 'distributors/')
         body = _gen_distributor(_gen_rel_path(3))
         client.post(path, body)
@@ -126,9 +128,9 @@ class CreateDistributorsTestCase(BaseAPITestCase):
         path is ``foo/bar``, then this relative path would be ``foo/bar``.
         """
         if (self.cfg.pulp_version >= Version('2.14') and
-                not selectors.bug_is_fixed(2769, self.cfg.pulp_version)):
+                not bug_is_fixed(2769, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2769')
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(self.repos[1]['_href'], 'distributors/')
         body = _gen_distributor(
             self.repos[0]['distributors'][0]['config']['relative_path']
@@ -143,9 +145,9 @@ class CreateDistributorsTestCase(BaseAPITestCase):
         path is ``foo/bar``, then this relative path would be ``foo/bar/biz``.
         """
         if (self.cfg.pulp_version >= Version('2.14') and
-                not selectors.bug_is_fixed(2769, self.cfg.pulp_version)):
+                not bug_is_fixed(2769, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2769')
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(self.repos[1]['_href'], 'distributors/')
         body = _gen_distributor('/'.join((
             self.repos[0]['distributors'][0]['config']['relative_path'],
@@ -162,9 +164,9 @@ class CreateDistributorsTestCase(BaseAPITestCase):
         ``/foo/bar``.
         """
         if (self.cfg.pulp_version >= Version('2.14') and
-                not selectors.bug_is_fixed(2769, self.cfg.pulp_version)):
+                not bug_is_fixed(2769, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2769')
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(self.repos[1]['_href'], 'distributors/')
         body = _gen_distributor(
             '/' + self.repos[0]['distributors'][0]['config']['relative_path']
@@ -195,7 +197,7 @@ class UpdateDistributorsTestCase(BaseAPITestCase):
         repositories.
         """
         super().setUpClass()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         cls.repos = []
         try:
             for _ in range(2):
@@ -218,7 +220,7 @@ class UpdateDistributorsTestCase(BaseAPITestCase):
         be ``biz/baz``.
         """
         # update
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = {'distributor_config': {'relative_path': _gen_rel_path()}}
         client.put(self.repos[1]['distributors'][0]['_href'], body)
 
@@ -236,7 +238,7 @@ class UpdateDistributorsTestCase(BaseAPITestCase):
         in this module have relative paths with two segments.
         """
         # update
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = {'distributor_config': {'relative_path': _gen_rel_path(3)}}
         client.put(self.repos[1]['distributors'][0]['_href'], body)
 
@@ -254,11 +256,11 @@ class UpdateDistributorsTestCase(BaseAPITestCase):
         path is ``foo/bar``, then this relative path would be ``foo/bar``.
         """
         if (self.cfg.pulp_version >= Version('2.14') and
-                not selectors.bug_is_fixed(2769, self.cfg.pulp_version)):
+                not bug_is_fixed(2769, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2769')
 
         # update
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         old_path = self.repos[1]['distributors'][0]['config']['relative_path']
         new_path = self.repos[0]['distributors'][0]['config']['relative_path']
         with self.assertRaises(exceptions.TaskReportError):
@@ -280,11 +282,11 @@ class UpdateDistributorsTestCase(BaseAPITestCase):
         path is ``foo/bar``, then this relative path would be ``foo/bar/biz``.
         """
         if (self.cfg.pulp_version >= Version('2.14') and
-                not selectors.bug_is_fixed(2769, self.cfg.pulp_version)):
+                not bug_is_fixed(2769, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2769')
 
         # update
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         old_path = self.repos[1]['distributors'][0]['config']['relative_path']
         new_path = '/'.join((
             self.repos[0]['distributors'][0]['config']['relative_path'],
@@ -310,11 +312,11 @@ class UpdateDistributorsTestCase(BaseAPITestCase):
         ``/foo/bar``.
         """
         if (self.cfg.pulp_version >= Version('2.14') and
-                not selectors.bug_is_fixed(2769, self.cfg.pulp_version)):
+                not bug_is_fixed(2769, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2769')
 
         # update
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         old_path = self.repos[1]['distributors'][0]['config']['relative_path']
         new_path = (
             '/' + self.repos[0]['distributors'][0]['config']['relative_path']
@@ -351,9 +353,9 @@ class UpdateImportersTestCase(unittest.TestCase):
         3. Perform assertions about the just updated ``importer``.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(3210, cfg.pulp_version):
+        if not bug_is_fixed(3210, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3210')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = OSTREE_FEED
         body['importer_config']['branches'] = OSTREE_BRANCHES
@@ -6,6 +6,7 @@ from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import OSTREE_BRANCHES, OSTREE_FEED
 from pulp_2_tests.tests.ostree.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.ostree.utils import set_up_module as setUpModule  # pylint:disable=unused-import
@@ -26,7 +27,7 @@ class PublishTestCase(unittest.TestCase):
           the publish.
         """
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
 
         # Create a repository.
         body = gen_repo()
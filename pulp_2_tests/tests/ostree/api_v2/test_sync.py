@@ -9,11 +9,14 @@
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import api, selectors, utils
+from pulp_smash import api, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import OSTREE_FEED, OSTREE_BRANCHES
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.ostree.utils import gen_repo
 from pulp_2_tests.tests.ostree.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -25,11 +28,11 @@ def _sync_repo(cfg, href):
     response contents, as the default response handler does. Return ``call
     report, tasks``.
     """
-    response = api.Client(cfg, api.code_handler).post(
+    response = http_pool.Client(cfg, api.code_handler).post(
         urljoin(href, 'actions/sync/'),
         {'override_config': {}},
     )
-    tasks = tuple(api.poll_spawned_tasks(cfg, response.json()))
+    tasks = poll_spawned_tasks(cfg, response.json())
     return response, tasks
 
 
@@ -98,15 +101,15 @@ class SyncTestCase(_SyncMixin, BaseAPITestCase):
     def setUpClass(cls):
         """Create an OSTree repository with a valid feed and branch."""
         super().setUpClass()
-        if not selectors.bug_is_fixed(1934, cls.cfg.pulp_version):
+        if not bug_is_fixed(1934, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1934')
         body = gen_repo()
         body['importer_config']['feed'] = OSTREE_FEED
         body['importer_config']['branches'] = OSTREE_BRANCHES
-        repo = api.Client(cls.cfg).post(REPOSITORY_PATH, body).json()
+        repo = http_pool.Client(cls.cfg).post(REPOSITORY_PATH, body).json()
         cls.resources.add(repo['_href'])
         cls.report = sync_repo(cls.cfg, repo)
-        cls.tasks = tuple(api.poll_spawned_tasks(cls.cfg, cls.report.json()))
+        cls.tasks = poll_spawned_tasks(cls.cfg, cls.report.json())
 
     def test_task_progress_report(self):
         """Assert no task's progress report contains error details."""
@@ -127,7 +130,7 @@ class SyncInvalidFeedTestCase(
     def setUpClass(cls):
         """Set ``cls.body``."""
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         body = gen_repo()
         body['importer_config']['feed'] = utils.uuid4()
         body['importer_config']['branches'] = OSTREE_BRANCHES
@@ -147,7 +150,7 @@ class SyncInvalidBranchesTestCase(
     def setUpClass(cls):
         """Create and sync an OSTree repository."""
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         body = gen_repo()
         body['importer_config']['feed'] = OSTREE_FEED
         body['importer_config']['branches'] = [utils.uuid4()]
@@ -166,7 +169,7 @@ class SyncMissingAttrsTestCase(
     def setUpClass(cls):
         """Create and sync an OSTree repository."""
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         body = gen_repo()
         repo_href = client.post(REPOSITORY_PATH, body).json()['_href']
         cls.resources.add(repo_href)
@@ -12,6 +12,7 @@ from urllib.parse import urljoin
 from pulp_smash import api, config
 from pulp_smash.pulp2.constants import CONSUMERS_PATH, REPOSITORY_PATH
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_consumer,
     gen_distributor,
@@ -43,7 +44,7 @@ class BindConsumerTestCase(unittest.TestCase):
         * The response body contains the correct values.
         """
         cfg = config.get_config()
-        client = api.Client(cfg)
+        client = http_pool.Client(cfg)
 
         # Steps 1–2
         body = gen_repo()
@@ -105,7 +106,7 @@ class RegisterAndUpdateConsumerTestCase(unittest.TestCase):
         * `Pulp Smash #1007 <https://github.com/PulpQE/pulp-smash/issues/1007>`_
         """
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         tmp_cert_file = tempfile.NamedTemporaryFile(delete=False)
         self.addCleanup(os.unlink, tmp_cert_file.name)
 
@@ -20,6 +20,7 @@ from packaging.version import Version
 from pulp_smash import api, config
 from pulp_smash.pulp2.constants import CALL_REPORT_KEYS, GROUP_CALL_REPORT_KEYS
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.tests.platform.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
 _PATHS = {
@@ -56,7 +57,7 @@ class SeriesTestCase(_SuccessTestCase):
     def setUpClass(cls):
         """Make calls to the server and save the responses."""
         super().setUpClass()
-        client = api.Client(cls.cfg, api.echo_handler)
+        client = http_pool.Client(cls.cfg, api.echo_handler)
         for key, path in _PATHS.items():
             cls.responses[key] = client.post(path, {key + '_criteria': {}})
 
@@ -108,7 +109,7 @@ class FailureTestCase(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Make calls to the server and save the responses."""
-        client = api.Client(config.get_config(), api.echo_handler)
+        client = http_pool.Client(config.get_config(), api.echo_handler)
         cls.responses = {
             key: client.post(path, {key + '_criteriaa': {}})
             for key, path in _PATHS.items()
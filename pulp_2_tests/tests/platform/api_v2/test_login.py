@@ -6,9 +6,11 @@
 """
 import unittest
 
-from pulp_smash import api, config, selectors
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import ERROR_KEYS, LOGIN_KEYS, LOGIN_PATH
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.tests.platform.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
 
@@ -23,7 +25,7 @@ class LoginTestCase(unittest.TestCase):
         * The response has an HTTP 200 status code.
         * The response body is valid JSON and has correct keys.
         """
-        response = api.Client(config.get_config()).post(LOGIN_PATH)
+        response = http_pool.Client(config.get_config()).post(LOGIN_PATH)
         with self.subTest(comment='check response status code'):
             self.assertEqual(response.status_code, 200)
         with self.subTest(comment='check response body'):
@@ -38,11 +40,10 @@ class LoginTestCase(unittest.TestCase):
         * The response body is valid JSON and has correct keys.
         """
         cfg = config.get_config()
-        response = (
-            api.Client(cfg, api.echo_handler).post(LOGIN_PATH, auth=('', ''))
-        )
+        response = http_pool.Client(cfg, api.echo_handler).post(
+            LOGIN_PATH, auth=('', ''))
         with self.subTest(comment='check response status code'):
             self.assertEqual(response.status_code, 401)
-        if selectors.bug_is_fixed(1412, cfg.pulp_version):
+        if bug_is_fixed(1412, cfg.pulp_version):
             with self.subTest(comment='check response body'):
                 self.assertEqual(frozenset(response.json().keys()), ERROR_KEYS)
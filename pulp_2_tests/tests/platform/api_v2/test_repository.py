@@ -22,6 +22,8 @@ from pulp_smash import api, selectors, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH, ERROR_KEYS
 from pulp_smash.pulp2.utils import BaseAPITestCase
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.tests.platform.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
 
@@ -36,7 +38,7 @@ class CreateSuccessTestCase(BaseAPITestCase):
         second with all available attributes except importers and distributors.
         """
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         cls.bodies = [{'id': utils.uuid4()}]
         cls.bodies.append({
             'description': utils.uuid4(),
@@ -116,7 +118,7 @@ class CreateFailureTestCase(BaseAPITestCase):
         first repository is created in order to test duplicate ids.
         """
         super().setUpClass()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, {'id': utils.uuid4()})
         cls.resources.add(repo['_href'])
 
@@ -162,7 +164,7 @@ class CreateFailureTestCase(BaseAPITestCase):
         """Assert the JSON body returned contains the correct keys."""
         for body, response in zip(self.bodies, self.responses):
             with self.subTest(body=body):
-                if not selectors.bug_is_fixed(1413, self.cfg.pulp_version):
+                if not bug_is_fixed(1413, self.cfg.pulp_version):
                     self.skipTest('https://pulp.plan.io/issues/1413')
                 response_keys = frozenset(response.json().keys())
                 self.assertEqual(response_keys, ERROR_KEYS)
@@ -179,7 +181,7 @@ class ReadUpdateDeleteTestCase(BaseAPITestCase):
     def setUpClass(cls):
         """Create three repositories and read, update and delete them."""
         super().setUpClass()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         cls.repos = tuple((
             client.post(REPOSITORY_PATH, {'id': utils.uuid4()})
             for _ in range(3)
@@ -29,10 +29,12 @@ The assumptions explored in this module have the following dependencies::
 import random
 import unittest
 
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import USER_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.tests.platform.utils import set_up_module
 
 
@@ -47,7 +49,7 @@ def setUpModule():  # pylint:disable=invalid-name
     actions on them. Test cases should **not** change these users.
     """
     set_up_module()
-    client = api.Client(config.get_config(), api.json_handler)
+    client = http_pool.Client(config.get_config(), api.json_handler)
     del _USERS[:]  # Ensure idempotence
     for _ in range(3):
         _USERS.append(client.post(USER_PATH, {'login': utils.uuid4()}))
@@ -55,7 +57,7 @@ def setUpModule():  # pylint:disable=invalid-name
 
 def tearDownModule():  # pylint:disable=invalid-name
     """Delete the users created by :func:`setUpModule`."""
-    client = api.Client(config.get_config())
+    client = http_pool.Client(config.get_config())
     while _USERS:
         client.delete(_USERS.pop()['_href'])
 
@@ -89,7 +91,7 @@ class MinimalTestCase(_BaseTestCase):
     def setUpClass(cls):
         """Create one user. Execute searches."""
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         cls.searches = {
             'get': client.get(_SEARCH_PATH),
             'post': client.post(_SEARCH_PATH, {'criteria': {}}),
@@ -118,7 +120,7 @@ class SortTestCase(_BaseTestCase):
     def setUpClass(cls):
         """Create two users. Execute searches."""
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         for order in {'ascending', 'descending'}:
             json = {'criteria': {'sort': [['id', order]]}}
             cls.searches['post_' + order] = client.post(_SEARCH_PATH, json)
@@ -149,9 +151,9 @@ class FieldTestCase(_BaseTestCase):
     def setUpClass(cls):
         """Create one user. Execute searches."""
         super().setUpClass()
-        if not selectors.bug_is_fixed(1933, cls.cfg.pulp_version):
+        if not bug_is_fixed(1933, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1933')
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         cls.searches = {
             'get': client.get(_SEARCH_PATH, params={'field': 'name'}),
             'post': client.post(
@@ -181,9 +183,9 @@ class FieldsTestCase(_BaseTestCase):
     def setUpClass(cls):
         """Create one user. Execute searches."""
         super().setUpClass()
-        if not selectors.bug_is_fixed(1933, cls.cfg.pulp_version):
+        if not bug_is_fixed(1933, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1933')
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         cls.searches = {
             'get': client.get(_SEARCH_PATH, params='field=login&field=roles'),
             'post': client.post(
@@ -218,7 +220,8 @@ class FiltersIdTestCase(_BaseTestCase):
         super().setUpClass()
         cls.user = random.choice(_USERS)
         json = {'criteria': {'filters': {'id': cls.user['id']}}}
-        cls.searches['post'] = api.Client(cls.cfg).post(_SEARCH_PATH, json)
+        cls.searches['post'] = http_pool.Client(cls.cfg).post(
+            _SEARCH_PATH, json)
 
     def test_result_ids(self):
         """Assert the search results contain the correct IDs."""
@@ -244,7 +247,7 @@ class FiltersIdsTestCase(_BaseTestCase):
         """Search for exactly two users."""
         super().setUpClass()
         cls.user_ids = [user['id'] for user in random.sample(_USERS, 2)]  # pylint:disable=unsubscriptable-object
-        cls.searches['post'] = api.Client(cls.cfg).post(
+        cls.searches['post'] = http_pool.Client(cls.cfg).post(
             _SEARCH_PATH,
             {'criteria': {'filters': {'id': {'$in': cls.user_ids}}}},
         )
@@ -275,7 +278,7 @@ class LimitSkipTestCase(_BaseTestCase):
         """Create two users. Execute searches."""
         super().setUpClass()
         cls.user_ids = [user['id'] for user in random.sample(_USERS, 2)]  # pylint:disable=unsubscriptable-object
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         for criterion in {'limit', 'skip'}:
             key = 'post_' + criterion
             query = {'filters': {'id': {'$in': cls.user_ids}}, criterion: 1}
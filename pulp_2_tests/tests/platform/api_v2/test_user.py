@@ -17,6 +17,7 @@ from pulp_smash import api, utils
 from pulp_smash.pulp2.constants import LOGIN_PATH, USER_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.tests.platform.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
 
@@ -36,7 +37,7 @@ class CreateTestCase(BaseAPITestCase):
         all available attributes.
         """
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         cls.bodies = (
             {'login': utils.uuid4()},
             {key: utils.uuid4() for key in {'login', 'password', 'name'}},
@@ -87,7 +88,7 @@ class ReadUpdateDeleteTestCase(BaseAPITestCase):
         super().setUpClass()
 
         # Create three users and save their attributes.
-        client = api.Client(cls.cfg, response_handler=api.json_handler)
+        client = http_pool.Client(cls.cfg, response_handler=api.json_handler)
         hrefs = [
             client.post(USER_PATH, {'login': utils.uuid4()})['_href']
             for _ in range(3)
@@ -150,12 +151,13 @@ class ReadUpdateDeleteTestCase(BaseAPITestCase):
             self.responses['update'].json()['login'],
             self.update_body['delta']['password'],
         )
-        api.Client(self.cfg).post(LOGIN_PATH, auth=auth)
+        http_pool.Client(self.cfg).post(LOGIN_PATH, auth=auth)
 
     def test_create_duplicate_user(self):
         """Verify one cannot create a user with a duplicate login."""
         json = {'login': self.responses['read'].json()['login']}
-        response = api.Client(self.cfg, api.echo_handler).post(USER_PATH, json)
+        response = http_pool.Client(self.cfg, api.echo_handler).post(
+            USER_PATH, json)
         self.assertEqual(response.status_code, 409)
 
 
@@ -181,7 +183,7 @@ class SearchTestCase(BaseAPITestCase):
         super().setUpClass()
 
         # Create a super-user.
-        client = api.Client(cls.cfg, response_handler=api.json_handler)
+        client = http_pool.Client(cls.cfg, response_handler=api.json_handler)
         cls.user = client.post(USER_PATH, {'login': utils.uuid4()})
         client.put(cls.user['_href'], {'delta': {'roles': ['super-users']}})
         cls.user = client.get(cls.user['_href'])
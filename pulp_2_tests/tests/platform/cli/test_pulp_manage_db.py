@@ -10,9 +10,12 @@ and when :data:`CONFLICTING_SERVICES` are stopped. See:
 import inspect
 import unittest
 
-from pulp_smash import cli, config, exceptions, selectors
+from pulp_smash import cli, config, exceptions
 from pulp_smash.pulp2.utils import pulp_admin_login, reset_pulp
 
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
+from pulp_2_tests.services import ServiceTracker
 from pulp_2_tests.tests.platform.utils import set_up_module
 
 REQUIRED_SERVICES = frozenset(('mongod',))
@@ -46,18 +49,20 @@ class BaseTestCase(unittest.TestCase):
         if inspect.getmro(cls)[0] == BaseTestCase:
             raise unittest.SkipTest('Abstract base class.')
         cls.cfg = config.get_config()
-        if not selectors.bug_is_fixed(2186, cls.cfg.pulp_version):
+        if not bug_is_fixed(2186, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2186')
         cls.cmd = (
             'runuser', '--shell', '/bin/sh', '--command', 'pulp-manage-db',
             '-', 'apache'
         )
 
+    def setUp(self):
+        """Track the services each test stops."""
+        self.services = ServiceTracker(self.cfg)
+
     def tearDown(self):
-        """Start all of Pulp's services."""
-        cli.GlobalServiceManager(config.get_config()).start(
-            CONFLICTING_SERVICES.union(REQUIRED_SERVICES)
-        )
+        """Start the services stopped by the test, and wait until healthy."""
+        self.services.restore()
 
 
 class PositiveTestCase(BaseTestCase):
@@ -65,22 +70,22 @@ class PositiveTestCase(BaseTestCase):
 
     def test_conflicting_stopped(self):
         """Test with :data:`CONFLICTING_SERVICES` stopped."""
-        cli.GlobalServiceManager(self.cfg).stop((
+        self.services.stop((
             'pulp_celerybeat',
             'pulp_resource_manager',
             'pulp_workers',
         ))
-        cli.Client(self.cfg).run(self.cmd, sudo=True)
+        ssh.Client(self.cfg).run(self.cmd, sudo=True)
 
     def test_dry_run(self):
         """Make sure pulp-manage-db runs if --dry-run is passed."""
-        if not selectors.bug_is_fixed(2776, self.cfg.pulp_version):
+        if not bug_is_fixed(2776, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2776')
         cmd = (
             'runuser', '--shell', '/bin/sh', '--command',
             'pulp-manage-db --dry-run', '-', 'apache'
         )
-        cli.Client(self.cfg).run(cmd, sudo=True)
+        ssh.Client(self.cfg).run(cmd, sudo=True)
 
 
 class NegativeTestCase(BaseTestCase):
@@ -88,7 +93,7 @@ class NegativeTestCase(BaseTestCase):
 
     def test_required_stopped(self):
         """Test with :data:`REQUIRED_SERVICES` stopped."""
-        cli.GlobalServiceManager(self.cfg).stop(REQUIRED_SERVICES)
+        self.services.stop(REQUIRED_SERVICES)
         self._do_test()
 
     def test_conflicting_running(self):
@@ -97,7 +102,7 @@ class NegativeTestCase(BaseTestCase):
 
     def test_celerybeat_running(self):
         """Test with ``pulp_celerybeat`` running."""
-        cli.GlobalServiceManager(config.get_config()).stop((
+        self.services.stop((
             CONFLICTING_SERVICES.difference(('pulp_celerybeat',))
         ))
         self._do_test()
@@ -107,9 +112,9 @@ class NegativeTestCase(BaseTestCase):
 
         This test targets `Pulp #2684 <https://pulp.plan.io/issues/2684>`_.
         """
-        if not selectors.bug_is_fixed(2684, self.cfg.pulp_version):
+        if not bug_is_fixed(2684, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2684')
-        cli.GlobalServiceManager(config.get_config()).stop((
+        self.services.stop((
             CONFLICTING_SERVICES.difference(('pulp_resource_manager',))
         ))
         self._do_test()
@@ -119,9 +124,9 @@ class NegativeTestCase(BaseTestCase):
 
         This test targets `Pulp #2684 <https://pulp.plan.io/issues/2684>`_.
         """
-        if not selectors.bug_is_fixed(2684, self.cfg.pulp_version):
+        if not bug_is_fixed(2684, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2684')
-        cli.GlobalServiceManager(config.get_config()).stop((
+        self.services.stop((
             CONFLICTING_SERVICES.difference(('pulp_workers',))
         ))
         self._do_test()
@@ -131,7 +136,7 @@ class NegativeTestCase(BaseTestCase):
         # The debugging message produced by this method when it fails is
         # disgusting to look at, but very useful. If you ever have to deal with
         # it, copy the string you want and print it in a Python interpreter.
-        client = cli.Client(self.cfg, cli.echo_handler)
+        client = ssh.Client(self.cfg, cli.echo_handler)
         procs = (client.run(self.cmd), client.run(('systemctl', 'status')))
         with self.assertRaises(exceptions.CalledProcessError, msg=procs):
             procs[0].check_returncode()
@@ -1,11 +1,15 @@
 # coding=utf-8
-"""Tests to verify that Pulp has proper SELinux permissions."""
-import re
+"""Tests to verify that Pulp has proper SELinux permissions.
+
+Every label is collected once, with a single round trip, when the module is
+set up. (See :func:`pulp_2_tests.selinux_labels.collect_labels`.)
+"""
 import unittest
-from collections import namedtuple
 
-from pulp_smash import cli, config, selectors
+from pulp_smash import config
 
+from pulp_2_tests.bug_status import bug_is_fixed
+from pulp_2_tests.selinux_labels import collect_labels, strip_user
 from pulp_2_tests.tests.platform.utils import set_up_module, require_selinux
 
 
@@ -25,21 +29,24 @@ vary. See `Pulp Smash #444 (comment)
 <https://github.com/PulpQE/pulp-smash/issues/444#issuecomment-265798957>`_.
 """
 
-PS_FIELDS = ('label', 'args')
-"""The fields that ``ps`` should display. See ``man ps`` for details."""
-
-Process = namedtuple('Process', PS_FIELDS)
-"""A single line of output from ``ps``."""
+_AUDITS = []
+"""The :class:`pulp_2_tests.selinux_labels.LabelAudit` used by every test."""
 
 
 def setUpModule():  # pylint:disable=invalid-name
-    """Skip tests if the requirements are not met.
+    """Skip tests if the requirements are not met, and collect labels.
 
     Skipped if either default platform requirements aren't met or
     selinux is disabled by user config.
     """
     set_up_module()
     require_selinux()
+    _AUDITS.append(collect_labels(config.get_config()))
+
+
+def tearDownModule():  # pylint:disable=invalid-name
+    """Discard the collected labels."""
+    _AUDITS.clear()
 
 
 class ProcessLabelsTestCase(unittest.TestCase):
@@ -49,16 +56,6 @@ class ProcessLabelsTestCase(unittest.TestCase):
     <https://github.com/PulpQE/pulp-smash/issues/444>`_.
     """
 
-    @classmethod
-    def setUpClass(cls):
-        """Get all of the processes running on the target Pulp system."""
-        cfg = config.get_config()
-        cmd = ('ps', '-A', '-w', '-w', '-o', ','.join(PS_FIELDS))
-        cls.procs = [
-            Process(*line.split(maxsplit=1))
-            for line in cli.Client(cfg).run(cmd, sudo=True).stdout.splitlines()
-        ]
-
     def _do_test(self, label, arg):
         """Assert that certain processes have a label of ``label``.
 
@@ -66,12 +63,12 @@ class ProcessLabelsTestCase(unittest.TestCase):
         containing ``arg``. Assert that at least one such process exists, and
         that all such processes have a label of ``label``.
         """
-        procs = [proc for proc in self.procs if arg in proc.args]
+        procs = _AUDITS[0].processes_matching(arg)
         self.assertGreater(len(procs), 0, arg)
         for proc in procs:
             # Don't use subTest here. Doing so destroys traceback information
             # and leads to distractingly verbose output.
-            self.assertEqual(proc.label[proc.label.find(':'):], label, procs)
+            self.assertEqual(strip_user(proc.label), label, procs)
 
     def test_httpd(self):
         """Verify the labels of the ``wsgi:pulp*`` processes.
@@ -112,13 +109,6 @@ class FileLabelsTestCase(unittest.TestCase):
     <https://github.com/PulpQE/pulp-smash/issues/442>`_.
     """
 
-    @classmethod
-    def setUpClass(cls):
-        """Create a CLI client."""
-        cls.client = cli.Client(config.get_config())
-        cls.file_matcher = re.compile(r'^# file: (\S+)')
-        cls.label_matcher = re.compile(r'^security\.selinux="([\w:]+)"$')
-
     def _do_test(self, file_, label, recursive=False):
         """Assert that certain files have a label of ``label``.
 
@@ -127,38 +117,15 @@ class FileLabelsTestCase(unittest.TestCase):
         the leading "user" portion of the label, and assert that the result — a
         string in the form :role:type:level — has the given ``label``.
         """
-        # Typical output:
-        #
-        #     # getfattr --name=security.selinux /etc/passwd
-        #     getfattr: Removing leading '/' from absolute path names
-        #     # file: etc/passwd
-        #     security.selinux="system_u:object_r:passwd_file_t:s0"
-        #
-        cmd = []
-        cmd.extend(('getfattr', '--name=security.selinux'))
+        audit = _AUDITS[0]
         if recursive:
-            cmd.append('--recursive')
-        cmd.append(file_)
-        lines = self.client.run(cmd, sudo=True).stdout.splitlines()
-        matches = 0
-        getfattr_file = None  # tracks file currently under consideration
-        for line in lines:
-
-            match = self.file_matcher.match(line)
-            if match is not None:
-                getfattr_file = match.groups(1)
-                continue
-
-            match = self.label_matcher.match(line)
-            if match is not None:
-                matches += 1
-                # Strip "user" prefix from label. For example:
-                # user:role:type:level → :role:type:level
-                file_label = match.group(1)
-                file_label = file_label[file_label.find(':'):]
-                self.assertEqual(file_label, label, getfattr_file)
-
-        self.assertGreater(matches, 0, lines)
+            files = audit.files_below(file_)
+        else:
+            files = [audit.files[file_]] if file_ in audit.files else []
+        self.assertGreater(len(files), 0, file_)
+        for labeled_file in files:
+            self.assertEqual(
+                strip_user(labeled_file.label), label, labeled_file.path)
 
     def test_pulp_celery_fc(self):
         """Test files listed in ``pulp-celery.fc``."""
@@ -181,7 +148,7 @@ class FileLabelsTestCase(unittest.TestCase):
             ('/usr/share/pulp/wsgi', ':object_r:httpd_sys_content_t:s0'),
             ('/var/log/pulp', ':object_r:httpd_sys_rw_content_t:s0'),
         ]
-        if selectors.bug_is_fixed(2508, config.get_config().pulp_version):
+        if bug_is_fixed(2508, config.get_config().pulp_version):
             files_labels.append(
                 ('/var/lib/pulp', ':object_r:httpd_sys_rw_content_t:s0')
             )
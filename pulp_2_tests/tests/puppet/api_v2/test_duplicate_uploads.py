@@ -16,11 +16,13 @@ The second upload should silently fail for all Pulp releases in the 2.x series.
 """
 import unittest
 
-from pulp_smash import api, utils, config
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import DuplicateUploadsMixin
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import PUPPET_MODULE_URL_1
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.puppet.api_v2.utils import gen_repo
 from pulp_2_tests.tests.puppet.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -33,9 +35,9 @@ class DuplicateUploadsTestCase(unittest.TestCase, DuplicateUploadsMixin):
         """Create a Puppet repository."""
         cls.cfg = config.get_config()
         cls.resources = set()
-        unit = utils.http_get(PUPPET_MODULE_URL_1)
+        unit = http_get(PUPPET_MODULE_URL_1)
         import_params = {'unit_type_id': 'puppet_module'}
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         repo = cls.client.post(REPOSITORY_PATH, gen_repo())
         cls.upload_import_unit_args = (cls.cfg, unit, import_params, repo)
         cls.resources.add(repo['_href'])
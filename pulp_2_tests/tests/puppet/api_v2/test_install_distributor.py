@@ -10,14 +10,17 @@ import unittest
 
 from requests.exceptions import HTTPError
 
-from pulp_smash import api, cli, utils, selectors, config
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import (
     publish_repo,
     upload_import_unit,
 )
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import PUPPET_MODULE_1, PUPPET_MODULE_URL_1
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.puppet.utils import os_is_f27
 from pulp_2_tests.tests.puppet.api_v2.utils import (
     gen_install_distributor,
@@ -40,10 +43,10 @@ class InstallDistributorTestCase(unittest.TestCase):
         4. Check if the puppet_install_distributor config was properly used
         """
         cfg = config.get_config()
-        if (not selectors.bug_is_fixed(3314, cfg.pulp_version) and
+        if (not bug_is_fixed(3314, cfg.pulp_version) and
                 os_is_f27(cfg)):
             self.skipTest('https://pulp.plan.io/issues/3314')
-        cli_client = cli.Client(cfg)
+        cli_client = ssh.Client(cfg)
 
         # Create a directory and make sure Pulp can write to it.
         install_path = cli_client.run(('mktemp', '--directory')).stdout.strip()
@@ -66,11 +69,11 @@ class InstallDistributorTestCase(unittest.TestCase):
         distributor['distributor_config']['install_path'] = install_path
         body = gen_repo()
         body['distributors'] = [distributor]
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, body)
         self.addCleanup(client.delete, repo['_href'])
         repo = client.get(repo['_href'], params={'details': True})
-        unit = utils.http_get(PUPPET_MODULE_URL_1)
+        unit = http_get(PUPPET_MODULE_URL_1)
         upload_import_unit(
             cfg, unit, {'unit_type_id': 'puppet_module'}, repo)
 
@@ -99,13 +102,13 @@ class InstallDistributorThrowsOnErrorTestCase(unittest.TestCase):
         4. Assert that no repo is created
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1237, cfg.pulp_version):
+        if not bug_is_fixed(1237, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1237')
         distributor = gen_install_distributor()
         distributor['distributor_config']['install_path'] = ''
         body = gen_repo()
         body['distributors'] = [distributor]
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         with self.assertRaises(HTTPError):
             repo = client.post(REPOSITORY_PATH, body)
             self.addCleanup(client.delete, repo['_href'])
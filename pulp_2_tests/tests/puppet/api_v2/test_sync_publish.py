@@ -9,7 +9,7 @@ from itertools import product
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, config, exceptions, selectors, utils
+from pulp_smash import api, config, exceptions, utils
 from pulp_smash.pulp2.constants import (
     CALL_REPORT_KEYS,
     CONTENT_UPLOAD_PATH,
@@ -23,6 +23,8 @@ from pulp_smash.pulp2.utils import (
 )
 from requests.exceptions import HTTPError
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     PUPPET_FEED_2,
     PUPPET_MODULE_1,
@@ -32,6 +34,8 @@ from pulp_2_tests.constants import (
     PUPPET_MODULE_URL_2,
     PUPPET_QUERY_2,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.puppet.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.puppet.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -50,7 +54,7 @@ class CreateTestCase(unittest.TestCase):
             'queries': [PUPPET_QUERY_2],
         }
 
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         cls.repos = []
         cls.importers_iter = []
         for body in cls.bodies:
@@ -110,11 +114,11 @@ class SyncValidFeedTestCase(unittest.TestCase):
         * The synced-in module can be downloaded.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(3692, cfg.pulp_version):
+        if not bug_is_fixed(3692, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3692')
 
         # Create and sync a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config'] = {
             'feed': PUPPET_FEED_2,
@@ -138,7 +142,7 @@ class SyncValidFeedTestCase(unittest.TestCase):
 
         # Download the Puppet module directly from feed url.
         latest_version = response['results'][0]['metadata']['version']
-        module_file = utils.http_get(PUPPET_MODULE_URL_2 % latest_version)
+        module_file = http_get(PUPPET_MODULE_URL_2 % latest_version)
 
         client.response_handler = api.safe_handler
         # Download the Puppet module stored by Pulp.
@@ -164,7 +168,7 @@ class SyncValidFeedTestCase(unittest.TestCase):
         """
         # Create and sync a repository.
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config'] = {
             'feed': PUPPET_FEED_2,
@@ -190,7 +194,7 @@ class SyncValidFeedTestCase(unittest.TestCase):
         """Sync a repository, and verify no tasks contain an error message."""
         cfg = config.get_config()
         report = sync_repo(cfg, repo).json()
-        for task in api.poll_spawned_tasks(cfg, report):
+        for task in poll_spawned_tasks(cfg, report):
             self.assertIsNone(
                 task['progress_report']['puppet_importer']['metadata']['error_message']  # pylint:disable=line-too-long
             )
@@ -204,7 +208,7 @@ class SyncInvalidFeedTestCase(unittest.TestCase):
         """Create a puppet repository with an invalid feed and sync it."""
         cls.cfg = config.get_config()
         cls.resources = set()
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config'] = {'feed': 'http://' + utils.uuid4()}
         repo = cls.client.post(REPOSITORY_PATH, body)
@@ -213,7 +217,7 @@ class SyncInvalidFeedTestCase(unittest.TestCase):
         # Trigger a repository sync and collect completed tasks.
         cls.client.response_handler = api.code_handler
         cls.report = cls.client.post(urljoin(repo['_href'], 'actions/sync/'))
-        cls.tasks = list(api.poll_spawned_tasks(cls.cfg, cls.report.json()))
+        cls.tasks = list(poll_spawned_tasks(cls.cfg, cls.report.json()))
 
     @classmethod
     def tearDownClass(cls):
@@ -253,11 +257,11 @@ class SyncNoFeedTestCase(unittest.TestCase):
     def test_all(self):
         """Create and sync a puppet repository with no feed."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2628, cfg.pulp_version):
+        if not bug_is_fixed(2628, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2628')
 
         # Create a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
 
@@ -286,7 +290,7 @@ class SyncValidManifestFeedTestCase(unittest.TestCase):
         """Create repository with the feed pointing to a valid manifest."""
         cls.cfg = config.get_config()
         cls.resources = set()
-        cls.client = api.Client(cls.cfg)
+        cls.client = http_pool.Client(cls.cfg)
         body = gen_repo()
         body['importer_config'] = {
             'feed': 'http://repos.fedorapeople.org/repos/pulp/pulp/demo_repos/puppet_manifest/modules/'  # pylint:disable=line-too-long
@@ -296,7 +300,7 @@ class SyncValidManifestFeedTestCase(unittest.TestCase):
 
         # Trigger a repository sync and collect completed tasks.
         cls.report = sync_repo(cls.cfg, repo)
-        cls.tasks = list(api.poll_spawned_tasks(cls.cfg, cls.report.json()))
+        cls.tasks = list(poll_spawned_tasks(cls.cfg, cls.report.json()))
 
     @classmethod
     def tearDownClass(cls):
@@ -350,12 +354,12 @@ class PublishTestCase(unittest.TestCase):
         cls.modules = []  # Raw puppet modules.
 
         # Download a puppet module and create two repositories.
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         repos = [cls.client.post(REPOSITORY_PATH, gen_repo()) for _ in range(2)]
         for repo in repos:
             cls.resources.add(repo['_href'])
         cls.client.response_handler = api.safe_handler
-        cls.modules.append(utils.http_get(PUPPET_MODULE_URL_1))
+        cls.modules.append(http_get(PUPPET_MODULE_URL_1))
 
         # Begin an upload request, upload a puppet module, move the puppet
         # module into a repository, and end the upload request.
@@ -408,7 +412,7 @@ class PublishTestCase(unittest.TestCase):
         cls.responses['puppet releases'] = []
         author_name = PUPPET_MODULE_1['author'] + '/' + PUPPET_MODULE_1['name']
         for repo in repos:
-            if not selectors.bug_is_fixed(1440, cls.cfg.pulp_version):
+            if not bug_is_fixed(1440, cls.cfg.pulp_version):
                 continue
             cls.responses['puppet releases'].append(cls.client.get(
                 '/api/v1/releases.json',
@@ -566,14 +570,14 @@ class UploadPuppetModuleTestCase(unittest.TestCase):
         cfg = config.get_config()
         if cfg.pulp_version < Version('2.18'):
             raise unittest.SkipTest('This test requires Pulp 2.18 or newer')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
 
         # Create a puppet repo
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
 
         # upload puppet module with extraneous file to the repo.
-        module = utils.http_get(PUPPET_MODULE_EXTRANEOUS_FILE)
+        module = http_get(PUPPET_MODULE_EXTRANEOUS_FILE)
         upload_response = client.post(CONTENT_UPLOAD_PATH)
         self.addCleanup(client.delete, upload_response['_href'])
 
@@ -2,9 +2,11 @@
 """Tests that sync Puppet repositories."""
 import unittest
 
-from pulp_smash import cli, config, selectors, utils
+from pulp_smash import config, utils
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import PUPPET_FEED_2, PUPPET_QUERY_2
 from pulp_2_tests.tests.puppet.utils import set_up_module
 
@@ -15,7 +17,7 @@ def setUpModule():  # pylint:disable=invalid-name
     See `Pulp #2574 <https://pulp.plan.io/issues/2574>`_.
     """
     set_up_module()
-    if not selectors.bug_is_fixed(2574, config.get_config().pulp_version):
+    if not bug_is_fixed(2574, config.get_config().pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/2574')
 
 
@@ -28,7 +30,7 @@ def get_num_units_in_repo(cfg, repo_id):
     :returns: The number of puppet modules in a repository, as an ``int``.
     """
     keyword = 'Puppet Module:'
-    completed_proc = cli.Client(cfg).run((
+    completed_proc = ssh.Client(cfg).run((
         'pulp-admin puppet repo list --repo-id {} --fields content_unit_counts'
     ).format(repo_id).split())
     lines = [
@@ -73,12 +75,12 @@ class SyncDownloadedContentTestCase(unittest.TestCase):
         non-zero content unit counts.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1937, cfg.pulp_version):
+        if not bug_is_fixed(1937, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1937')
         pulp_admin_login(cfg)
 
         # Create two repos, schedule them for deletion, and sync them.
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
         repo_ids = [utils.uuid4() for _ in range(2)]
         for repo_id in repo_ids:
             client.run((
@@ -136,7 +138,7 @@ class SyncFromPuppetForgeTestCase(unittest.TestCase):
 
         # Create a repository and schedule it for deletion.
         repo_id = utils.uuid4()
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
         cmd = (
             'pulp-admin puppet repo create --repo-id {} --feed {} --queries {}'
         ).format(repo_id, PUPPET_FEED_2, PUPPET_QUERY_2)
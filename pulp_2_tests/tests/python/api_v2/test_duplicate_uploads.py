@@ -18,11 +18,13 @@ import unittest
 from urllib.parse import urlsplit
 
 from packaging.version import Version
-from pulp_smash import api, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, DuplicateUploadsMixin
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.capabilities import get_capabilities
 from pulp_2_tests.constants import PYTHON_EGG_URL
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.python.api_v2.utils import gen_repo
 from pulp_2_tests.tests.python.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -34,14 +36,15 @@ class DuplicateUploadsTestCase(BaseAPITestCase, DuplicateUploadsMixin):
     def setUpClass(cls):
         """Create a Python repo. Upload a Python package into it twice."""
         super().setUpClass()
-        if utils.fips_is_supported(cls.cfg) and utils.fips_is_enabled(cls.cfg):
+        if get_capabilities(cls.cfg).fips_enabled:
             raise unittest.SkipTest('https://pulp.plan.io/issues/3895')
-        unit = utils.http_get(PYTHON_EGG_URL)
+        unit = http_get(PYTHON_EGG_URL)
         import_params = {'unit_key': {}, 'unit_type_id': 'python_package'}
         if cls.cfg.pulp_version >= Version('2.11'):
             import_params['unit_key']['filename'] = (
                 urlsplit(PYTHON_EGG_URL).path.split('/')[-1]
             )
-        repo = api.Client(cls.cfg).post(REPOSITORY_PATH, gen_repo()).json()
+        repo = http_pool.Client(cls.cfg).post(
+            REPOSITORY_PATH, gen_repo()).json()
         cls.upload_import_unit_args = (cls.cfg, unit, import_params, repo)
         cls.resources.add(repo['_href'])
@@ -6,7 +6,7 @@ from os.path import basename
 from urllib.parse import urljoin, urlparse
 
 from packaging.version import Version
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH, ORPHANS_PATH
 from pulp_smash.pulp2.utils import (
     publish_repo,
@@ -15,11 +15,16 @@ from pulp_smash.pulp2.utils import (
     upload_import_unit,
 )
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
+from pulp_2_tests.capabilities import get_capabilities
 from pulp_2_tests.constants import (
     PYTHON_EGG_URL,
     PYTHON_PYPI_FEED_URL,
     PYTHON_WHEEL_URL,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.python.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.python.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 from pulp_2_tests.tests.python.utils import skip_if
@@ -50,7 +55,7 @@ class BaseTestCase(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Delete fixtures and orphans."""
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         for repo in cls.repos:
             client.delete(repo['_href'])
         client.delete(ORPHANS_PATH)
@@ -76,9 +81,9 @@ class BaseTestCase(unittest.TestCase):
         completely independent Pulp application.
         """
         if (self.cfg.pulp_version < Version('2.13') or
-                not selectors.bug_is_fixed(140, self.cfg.pulp_version)):
+                not bug_is_fixed(140, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/140')
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config'] = {
             'feed': get_repo_path(self.cfg, self.repos[0]),
@@ -101,7 +106,7 @@ class BaseTestCase(unittest.TestCase):
         * None of the tasks spawned by the "sync" request contain errors.
         """
         self.assertEqual(call_report.status_code, 202)
-        tasks = tuple(api.poll_spawned_tasks(cfg, call_report.json()))
+        tasks = poll_spawned_tasks(cfg, call_report.json())
         for i, task in enumerate(tasks):
             step_reports = task['progress_report']['python_importer']
             for step in step_reports:
@@ -133,15 +138,14 @@ class SyncTestCase(BaseTestCase):
         * `Pulp Smash #494 <https://github.com/PulpQE/pulp-smash/issues/494>`_
         """
         if (self.cfg.pulp_version < Version('2.17') or
-                not selectors.bug_is_fixed(3578, self.cfg.pulp_version)):
+                not bug_is_fixed(3578, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/3578')
-        if not selectors.bug_is_fixed(135, self.cfg.pulp_version):
+        if not bug_is_fixed(135, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/135')
-        if (utils.fips_is_supported(self.cfg) and
-                utils.fips_is_enabled(self.cfg) and
-                not selectors.bug_is_fixed(3769, self.cfg.pulp_version)):
+        if (get_capabilities(self.cfg).fips_enabled and
+                not bug_is_fixed(3769, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/3769')
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config'] = {
             'feed': PYTHON_PYPI_FEED_URL,
@@ -169,7 +173,7 @@ class UploadTestCase(BaseTestCase):
         See `Pulp #3895 <https://pulp.plan.io/issues/3895>`_.
         """
         super().setUpClass()
-        if utils.fips_is_supported(cls.cfg) and utils.fips_is_enabled(cls.cfg):
+        if get_capabilities(cls.cfg).fips_enabled:
             raise unittest.SkipTest('https://pulp.plan.io/issues/3895')
 
     def test_01_first_repo(self):
@@ -182,9 +186,9 @@ class UploadTestCase(BaseTestCase):
         * `Pulp Smash #492 <https://github.com/PulpQE/pulp-smash/issues/492>`_
         """
         if (self.cfg.pulp_version < Version('2.13') or
-                not selectors.bug_is_fixed(136, self.cfg.pulp_version)):
+                not bug_is_fixed(136, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/136')
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['distributors'] = [gen_distributor()]
         repo = client.post(REPOSITORY_PATH, body)
@@ -193,7 +197,7 @@ class UploadTestCase(BaseTestCase):
         # A for loop is easier, but it produces hard-to-debug test failures.
         def _upload_import_unit(url):
             """Upload and import the unit at ``url`` to ``repo``."""
-            unit = utils.http_get(url)
+            unit = http_get(url)
             upload_import_unit(self.cfg, unit, {
                 'unit_key': {'filename': basename(urlparse(url).path)},
                 'unit_type_id': 'python_package',
@@ -209,7 +213,7 @@ class UploadTestCase(BaseTestCase):
 
 def get_details(cfg, repo):
     """Return detailed information about a Python repository."""
-    return api.Client(cfg).get(repo['_href'], params={
+    return http_pool.Client(cfg).get(repo['_href'], params={
         'distributors': True,
         'importers': True,
     }).json()
@@ -6,13 +6,15 @@ from unittest import SkipTest
 from pulp_smash import selectors
 from pulp_smash.pulp2 import utils
 
+from pulp_2_tests.capabilities import require_unit_types
+
 
 def set_up_module():
     """Skip tests if Pulp 2 isn't under test or if Python isn't installed."""
     utils.require_pulp_2(SkipTest)
     utils.require_issue_3159(SkipTest)
     utils.require_issue_3687(SkipTest)
-    utils.require_unit_types({'python_package'}, SkipTest)
+    require_unit_types({'python_package'}, SkipTest)
 
 
 skip_if = partial(selectors.skip_if, exc=SkipTest)  # pylint:disable=invalid-name
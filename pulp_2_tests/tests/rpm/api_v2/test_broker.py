@@ -28,11 +28,15 @@ import time
 import unittest
 
 from packaging.version import Version
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import PULP_SERVICES, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import get_broker, publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM, RPM_SIGNED_FEED_URL, RPM_SIGNED_URL
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.services import ServiceTracker
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
@@ -44,6 +48,23 @@ from pulp_2_tests.tests.rpm.utils import (
     check_issue_3104,
 )
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
+from pulp_2_tests.waiters import wait_for_messaging_connection
+
+
+def _wait_with_broker_down(cfg, since, seconds):
+    """Wait until Pulp notices the broker is down, and ``seconds`` have passed.
+
+    Pulp's web server notices almost at once that the broker is gone, but
+    Pulp's workers need time to try, and fail, to connect to it. The broker
+    must stay down at least ``seconds`` for them to do so.
+
+    :param cfg: Information about a Pulp deployment.
+    :param since: The ``time.monotonic()`` at which the wait began, such as
+        when the broker was stopped.
+    :param seconds: The minimum number of seconds to wait after ``since``.
+    """
+    wait_for_messaging_connection(cfg, connected=False)
+    time.sleep(max(0, since + seconds - time.monotonic()))
 
 
 class BrokerTestCase(unittest.TestCase):
@@ -59,18 +80,19 @@ class BrokerTestCase(unittest.TestCase):
         if check_issue_2387(self.cfg):
             self.skipTest('https://pulp.plan.io/issues/2387')
         self.broker = (get_broker(self.cfg),)
-        self.svc_mgr = cli.GlobalServiceManager(self.cfg)
+        self.services = ServiceTracker(self.cfg)
+        self.services.track(PULP_SERVICES.union(self.broker))
 
     def tearDown(self):
-        """Ensure Pulp services and AMQP broker are running.
+        """Ensure Pulp services and AMQP broker are running and connected.
 
-        Stop all relevant services, then start them again. This approach is
-        slow, but see `when broker reconnect test fails, all following tests
-        fail <https://github.com/PulpQE/pulp-smash/issues/91>`_.
+        Only the services left stopped are started. A task is then dispatched.
+        If it doesn't finish, as when Pulp's workers fail to reconnect to the
+        broker, every service is restarted. See `when broker reconnect test
+        fails, all following tests fail
+        <https://github.com/PulpQE/pulp-smash/issues/91>`_.
         """
-        services = PULP_SERVICES.union(self.broker)
-        self.svc_mgr.stop(services)
-        self.svc_mgr.start(services)
+        self.services.restore()
 
     def test_broker_connect(self):
         """Test Pulp's support for initially connecting to a broker.
@@ -78,15 +100,18 @@ class BrokerTestCase(unittest.TestCase):
         Do the following:
 
         1. Stop both the broker and several other services.
-        2. Start the several other resources, wait, and start the broker.
+        2. Start the several other resources, wait at least 15 seconds, and
+           until Pulp reports that the broker is unreachable, and start the
+           broker.
         3. Test Pulp's health. Create an RPM repository, sync it, add a
            distributor, publish it, and download an RPM.
         """
         # Step 1 and 2.
-        self.svc_mgr.stop(PULP_SERVICES.union(self.broker))
-        self.svc_mgr.start(PULP_SERVICES)
-        time.sleep(15)  # Let services try to connect to the dead broker.
-        self.svc_mgr.start(self.broker)
+        self.services.stop(PULP_SERVICES.union(self.broker))
+        self.services.start(PULP_SERVICES)
+        # Let services try to connect to the dead broker.
+        _wait_with_broker_down(self.cfg, time.monotonic(), 15)
+        self.services.start(self.broker)
         self.health_check()  # Step 3.
 
     def test_broker_reconnect(self):
@@ -95,7 +120,8 @@ class BrokerTestCase(unittest.TestCase):
         Do the following:
 
         1. Start both the broker and several other services.
-        2. Stop the broker, wait, and start it again.
+        2. Stop the broker, wait at least 30 seconds, and until Pulp notices,
+           and start it again.
         3. Test Pulp's health. Create an RPM repository, sync it, add a
            distributor, publish it, and download an RPM.
 
@@ -104,21 +130,22 @@ class BrokerTestCase(unittest.TestCase):
         * `Pulp #1635 <https://pulp.plan.io/issues/1635>`_
         * `Pulp #2613 <https://pulp.plan.io/issues/2613>`_
         """
-        if not selectors.bug_is_fixed(1635, self.cfg.pulp_version):
+        if not bug_is_fixed(1635, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1635')
         if (self.cfg.pulp_version >= Version('2.13') and
-                not selectors.bug_is_fixed(2613, self.cfg.pulp_version)):
+                not bug_is_fixed(2613, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2613')
         # We assume that the broker and other services are already running. As
         # a result, we skip step 1 and go straight to step 2.
-        self.svc_mgr.stop(self.broker)
-        time.sleep(30)
-        self.svc_mgr.start(self.broker)
+        self.services.stop(self.broker)
+        _wait_with_broker_down(self.cfg, time.monotonic(), 30)
+        self.services.start(self.broker)
         self.health_check()  # Step 3.
 
     def health_check(self):
         """Execute step three of the test plan."""
-        client = api.Client(self.cfg, api.json_handler)
+        wait_for_messaging_connection(self.cfg)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -130,5 +157,5 @@ class BrokerTestCase(unittest.TestCase):
         pulp_rpm = get_unit(self.cfg, repo['distributors'][0], RPM).content
 
         # Does this RPM match the original RPM?
-        rpm = utils.http_get(RPM_SIGNED_URL)
+        rpm = http_get(RPM_SIGNED_URL)
         self.assertEqual(rpm, pulp_rpm)
@@ -7,11 +7,14 @@ sequences are encountered.
 """
 import unittest
 
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import upload_import_unit
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_WITH_NON_ASCII_URL, RPM_WITH_NON_UTF_8_URL
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_repo
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -29,10 +32,10 @@ class UploadNonAsciiTestCase(unittest.TestCase):
     def test_all(self):
         """Test whether one can upload an RPM with non-ascii metadata."""
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
-        rpm = utils.http_get(RPM_WITH_NON_ASCII_URL)
+        rpm = http_get(RPM_WITH_NON_ASCII_URL)
         upload_import_unit(cfg, rpm, {'unit_type_id': 'rpm'}, repo)
 
 
@@ -51,10 +54,10 @@ class UploadNonUtf8TestCase(unittest.TestCase):
     def test_all(self):
         """Test whether one can upload an RPM with non-ascii metadata."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1903, cfg.pulp_version):
+        if not bug_is_fixed(1903, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1903')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
-        rpm = utils.http_get(RPM_WITH_NON_UTF_8_URL)
+        rpm = http_get(RPM_WITH_NON_UTF_8_URL)
         upload_import_unit(cfg, rpm, {'unit_type_id': 'rpm'}, repo)
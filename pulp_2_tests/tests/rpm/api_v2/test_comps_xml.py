@@ -11,7 +11,7 @@ from urllib.parse import urljoin
 from xml.etree import ElementTree
 
 from packaging.version import Version
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import (
     CONTENT_UPLOAD_PATH,
     ORPHANS_PATH,
@@ -19,7 +19,10 @@ from pulp_smash.pulp2.constants import (
 )
 from pulp_smash.pulp2.utils import BaseAPITestCase, publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_SIGNED_FEED_URL
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
@@ -101,7 +104,7 @@ def _upload_import_package_group(cfg, repo, unit_metadata):
     :param unit_metadata: A dict of unit metadata.
     :returns: The call report generated when importing and uploading.
     """
-    client = api.Client(cfg, api.json_handler)
+    client = http_pool.Client(cfg, api.json_handler)
     malloc = client.post(CONTENT_UPLOAD_PATH)
     call_report = client.post(
         urljoin(repo['_href'], 'actions/import_upload/'),
@@ -132,7 +135,7 @@ class SyncRepoTestCase(BaseAPITestCase):
         super().setUpClass()
         if check_issue_3104(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
 
         # Create a repo.
         body = gen_repo()
@@ -200,7 +203,7 @@ class UploadPackageGroupsTestCase(BaseAPITestCase):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
 
         # Create a repository and add a distributor to it.
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['distributors'] = [gen_distributor()]
         repo = client.post(REPOSITORY_PATH, body)
@@ -216,7 +219,7 @@ class UploadPackageGroupsTestCase(BaseAPITestCase):
         cls.tasks = {}
         for key, package_group in cls.package_groups.items():
             report = _upload_import_package_group(cls.cfg, repo, package_group)
-            cls.tasks[key] = tuple(api.poll_spawned_tasks(cls.cfg, report))
+            cls.tasks[key] = poll_spawned_tasks(cls.cfg, report)
         publish_repo(cls.cfg, repo)
 
         # Fetch the generated repodata of type 'group' (a.k.a. 'comps')
@@ -328,7 +331,7 @@ class UploadPackageGroupsTestCase(BaseAPITestCase):
 
     def test_display_order_occurences(self):
         """Assert ``display_order`` occurs once if omitted from the unit."""
-        if not selectors.bug_is_fixed(1787, self.cfg.pulp_version):
+        if not bug_is_fixed(1787, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1787')
         input_id = self.package_groups['minimal']['id']
         output = _get_groups_by_id(self.root_element)[input_id]
@@ -340,7 +343,7 @@ class UploadPackageGroupsTestCase(BaseAPITestCase):
         This test may be skipped if `Pulp #1787
         <https://pulp.plan.io/issues/1787>`_ is open.
         """
-        if not selectors.bug_is_fixed(1787, self.cfg.pulp_version):
+        if not bug_is_fixed(1787, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1787')
         input_id = self.package_groups['minimal']['id']
         output = _get_groups_by_id(self.root_element)[input_id]
@@ -457,7 +460,7 @@ class UploadTwiceTestCase(unittest.TestCase):
         cfg = config.get_config()
         if check_issue_3104(cfg):
             self.skipTest('https://pulp.plan.io/issues/3104')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         self.addCleanup(client.delete, ORPHANS_PATH)
 
         # Create a repository.
@@ -8,7 +8,6 @@ import unittest
 from types import MappingProxyType
 from urllib.parse import urljoin
 
-from jsonschema import validate
 from pulp_smash import api, config
 from pulp_smash.pulp2.constants import (
     CONSUMERS_ACTIONS_CONTENT_REGENERATE_APPLICABILITY_PATH,
@@ -21,11 +20,13 @@ from pulp_smash.pulp2.utils import (
     sync_repo,
 )
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import (
     RPM2_DATA,
     RPM_DATA,
     RPM_UNSIGNED_FEED_URL,
 )
+from pulp_2_tests.lazy import validate
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_consumer,
     gen_distributor,
@@ -109,7 +110,7 @@ class BasicTestCase(unittest.TestCase):
         bind to this repository.
         """
         cls.cfg = config.get_config()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -126,7 +127,7 @@ class BasicTestCase(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Delete the repository created by :meth:`setUpClass`."""
-        api.Client(cls.cfg).delete(cls.repo['_href'])
+        http_pool.Client(cls.cfg).delete(cls.repo['_href'])
 
     def test_positive(self):
         """Verify content is made available when appropriate.
@@ -150,7 +151,7 @@ class BasicTestCase(unittest.TestCase):
            listed as eligible for an upgrade.
         """
         # Create a consumer.
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         consumer = client.post(CONSUMERS_PATH, gen_consumer())
         self.addCleanup(client.delete, consumer['consumer']['_href'])
 
@@ -219,7 +220,7 @@ class BasicTestCase(unittest.TestCase):
         versions are equal to what's offered by the repository.
         """
         # Create a consumer.
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         consumer = client.post(CONSUMERS_PATH, gen_consumer())
         self.addCleanup(client.delete, consumer['consumer']['_href'])
 
@@ -9,9 +9,11 @@ import unittest
 from io import StringIO
 from urllib.parse import urlsplit, urlunsplit
 
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import CONTENT_SOURCES_PATH
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import PULP_FIXTURES_BASE_URL
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -31,7 +33,7 @@ class ValidHeadersTestCase(unittest.TestCase):
     def setUpClass(cls):
         """Create a content source with valid headers."""
         cls.cfg = config.get_config()
-        if not selectors.bug_is_fixed(1282, cls.cfg.pulp_version):
+        if not bug_is_fixed(1282, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1282')
         cls.cs_kwargs = {
             'source_id': utils.uuid4(),
@@ -52,7 +54,7 @@ class ValidHeadersTestCase(unittest.TestCase):
         2. This list entry includes the headers defined in the configuration
            file.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         sources = client.get('/pulp/api/v2/content/sources/')
         source_id = self.cs_kwargs['source_id']
         sources_by_id = {source['source_id']: source for source in sources}
@@ -66,13 +68,13 @@ class ValidHeadersTestCase(unittest.TestCase):
 
         Assert that the refresh completes successfully.
         """
-        client = api.Client(self.cfg)
+        client = http_pool.Client(self.cfg)
         client.post('/pulp/api/v2/content/sources/action/refresh/')
 
     @classmethod
     def tearDownClass(cls):
         """Destroy the created content source."""
-        cli.Client(cls.cfg).run(('rm', '-f', cls.cs_path), sudo=True)
+        ssh.Client(cls.cfg).run(('rm', '-f', cls.cs_path), sudo=True)
 
 
 class InvalidHeadersTestCase(unittest.TestCase):
@@ -88,7 +90,7 @@ class InvalidHeadersTestCase(unittest.TestCase):
     def setUpClass(cls):
         """Create a content source with invalid headers."""
         cls.cfg = config.get_config()
-        if not selectors.bug_is_fixed(1282, cls.cfg.pulp_version):
+        if not bug_is_fixed(1282, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1282')
         cls.cs_kwargs = {
             'source_id': utils.uuid4(),
@@ -103,7 +105,7 @@ class InvalidHeadersTestCase(unittest.TestCase):
         Assert that the list doesn't include an entry corresponding to the
         newly defined content source configuration file.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         sources = client.get('/pulp/api/v2/content/sources/')
         source_id = self.cs_kwargs['source_id']
         sources_by_id = {source['source_id']: source for source in sources}
@@ -115,13 +117,13 @@ class InvalidHeadersTestCase(unittest.TestCase):
         Assert that the refresh completes successfully. It should complete
         successfully because the broken content source is completely skipped.
         """
-        client = api.Client(self.cfg)
+        client = http_pool.Client(self.cfg)
         client.post('/pulp/api/v2/content/sources/action/refresh/')
 
     @classmethod
     def tearDownClass(cls):
         """Destroy the created content source."""
-        cli.Client(cls.cfg).run(('rm', '-f', cls.cs_path), sudo=True)
+        ssh.Client(cls.cfg).run(('rm', '-f', cls.cs_path), sudo=True)
 
 
 def _gen_content_source(cfg, content_source_body):
@@ -131,11 +133,10 @@ def _gen_content_source(cfg, content_source_body):
         content source file. Consider using :func:`_gen_content_source_body`.
     :return: The path to the content source file.
     """
-    sudo = '' if cli.is_root(cfg) else 'sudo'
+    sudo = '' if ssh.is_root(cfg) else 'sudo'
     path = os.path.join(CONTENT_SOURCES_PATH, utils.uuid4() + '.conf')
-    client = cli.Client(cfg)
-    # machine.session is used here to keep SSH session open
-    client.machine.session().run(
+    client = ssh.Client(cfg)
+    client.run_shell(
         "{} bash -c \"echo >'{}' '{}'\""
         .format(sudo, path, content_source_body)
     )
@@ -6,7 +6,7 @@ import unittest
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH, ORPHANS_PATH
 from pulp_smash.pulp2.utils import (
     publish_repo,
@@ -14,8 +14,9 @@ from pulp_smash.pulp2.utils import (
     sync_repo,
     upload_import_unit,
 )
-import pytest
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     RPM_NAMESPACES,
     RPM_SIGNED_URL,
@@ -24,17 +25,28 @@ from pulp_2_tests.constants import (
     RPM_WITH_OLD_VERSION_URL,
     RPM_YUM_METADATA_FILE,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.lazy import pytest_mark
+from pulp_2_tests.remote_fs import take_snapshot
+from pulp_2_tests.repo_cache import acquire_source_repo, release_source_repo
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
     get_repodata_repomd_xml,
 )
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
+from pulp_2_tests.units import iter_units
 
 _PATH = '/var/lib/pulp/published/yum/https/repos/'
 
 
-@pytest.mark.recursive_conservative
+def _get_mtimes(cfg, path):
+    """Return a dict mapping each file in ``path`` to its mtime."""
+    snapshot = take_snapshot(cfg, path, max_depth=1)
+    return {name: snapshot[name].mtime for name in snapshot.listdir()}
+
+
+@pytest_mark('recursive_conservative')
 class CopyErrataRecursiveTestCase(unittest.TestCase):
     """Test that recursive copy of erratas copies RPM packages."""
 
@@ -48,7 +60,7 @@ class CopyErrataRecursiveTestCase(unittest.TestCase):
 
         Do the following:
 
-        1. Create and sync a repository with errata, and RPM packages.
+        1. Get a shared, synced repository with errata, and RPM packages.
         2. Create second repository.
         3. Copy units from from first repository to second repository
            using ``recursive`` as true, and filter  ``type_id`` as
@@ -56,17 +68,15 @@ class CopyErrataRecursiveTestCase(unittest.TestCase):
         4. Assert that RPM packages were copied.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(3004, cfg.pulp_version):
+        if not bug_is_fixed(3004, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3004')
 
         repos = []
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UPDATED_INFO_FEED_URL
-        body['distributors'] = [gen_distributor()]
-        repos.append(client.post(REPOSITORY_PATH, body))
-        self.addCleanup(client.delete, repos[0]['_href'])
-        sync_repo(cfg, repos[0])
+        repos.append(acquire_source_repo(cfg, body))
+        self.addCleanup(release_source_repo, repos[0])
 
         # Create a second repository.
         repos.append(client.post(REPOSITORY_PATH, gen_repo()))
@@ -105,11 +115,11 @@ class MtimeTestCase(unittest.TestCase):
            are the same.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2783, cfg.pulp_version):
+        if not bug_is_fixed(2783, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2783')
 
         # Create, sync and publish a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -121,33 +131,25 @@ class MtimeTestCase(unittest.TestCase):
         publish_repo(cfg, repo)
 
         # Get the mtime of the sqlite files.
-        cli_client = cli.Client(cfg, cli.echo_handler)
-        cmd = '' if cli.is_root(cfg) else 'sudo '
-        cmd += "bash -c \"stat --format %Y '{}'/*\"".format(os.path.join(
+        path = os.path.join(
             _PATH,
             repo['distributors'][0]['config']['relative_url'],
             'repodata',
-        ))
-        # machine.session is used here to keep SSH session open
-        mtimes_pre = (
-            cli_client.machine.session().run(cmd)[1].strip().split().sort()
         )
+        mtimes_pre = _get_mtimes(cfg, path)
 
         # Upload to the repo, and sync it.
-        rpm = utils.http_get(RPM_SIGNED_URL)
+        rpm = http_get(RPM_SIGNED_URL)
         upload_import_unit(cfg, rpm, {'unit_type_id': 'rpm'}, repo)
         sync_repo(cfg, repo)
 
         # Get the mtime of the sqlite files again.
         time.sleep(1)
-        # machine.session is used here to keep SSH session open
-        mtimes_post = (
-            cli_client.machine.session().run(cmd)[1].strip().split().sort()
-        )
+        mtimes_post = _get_mtimes(cfg, path)
         self.assertEqual(mtimes_pre, mtimes_post)
 
 
-@pytest.mark.recursive_conservative
+@pytest_mark('recursive_conservative')
 class CopyYumMetadataFileTestCase(unittest.TestCase):
     """Test the copy of metadata units between repos."""
 
@@ -173,7 +175,7 @@ class CopyYumMetadataFileTestCase(unittest.TestCase):
            present in the second repo still.
         """
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo(
             importer_config={'feed': RPM_YUM_METADATA_FILE},
             distributors=[gen_distributor()]
@@ -237,7 +239,7 @@ class CopyYumMetadataFileTestCase(unittest.TestCase):
         self.assertGreater(len(yum_meta_data_element), 0)
 
 
-@pytest.mark.recursive_conservative
+@pytest_mark('recursive_conservative')
 class CopyConservativeTestCase(unittest.TestCase):
     """Test ``recursive`` and ``recursive_conservative`` flags during copy.
 
@@ -267,7 +269,7 @@ class CopyConservativeTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.18.1'):
             raise unittest.SkipTest('This test requires Pulp 2.18.1 or newer.')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_recursive_noconservative_nodependency(self):
         """Recursive, non-conservative, and no old dependency.
@@ -284,7 +286,8 @@ class CopyConservativeTestCase(unittest.TestCase):
         repo = self.copy_units(True, False, False)
         versions = [
             unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
             if unit['metadata']['name'] == 'walrus'
         ]
         self.assertEqual(len(versions), 1, versions)
@@ -292,7 +295,8 @@ class CopyConservativeTestCase(unittest.TestCase):
 
         dst_unit_ids = [
             unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
         ]
         self.assertEqual(len(dst_unit_ids), 5, dst_unit_ids)
 
@@ -311,7 +315,8 @@ class CopyConservativeTestCase(unittest.TestCase):
         repo = self.copy_units(True, True, False)
         versions = [
             unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
             if unit['metadata']['name'] == 'walrus'
         ]
         self.assertEqual(len(versions), 1, versions)
@@ -319,7 +324,8 @@ class CopyConservativeTestCase(unittest.TestCase):
 
         dst_unit_ids = [
             unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
         ]
         self.assertEqual(len(dst_unit_ids), 5, dst_unit_ids)
 
@@ -338,7 +344,8 @@ class CopyConservativeTestCase(unittest.TestCase):
         repo = self.copy_units(True, True, True)
         versions = [
             unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
             if unit['metadata']['name'] == 'walrus'
         ]
         self.assertEqual(len(versions), 1, versions)
@@ -346,7 +353,8 @@ class CopyConservativeTestCase(unittest.TestCase):
 
         dst_unit_ids = [
             unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
         ]
         self.assertEqual(len(dst_unit_ids), 5, dst_unit_ids)
 
@@ -365,7 +373,8 @@ class CopyConservativeTestCase(unittest.TestCase):
         repo = self.copy_units(False, True, True)
         versions = [
             unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
             if unit['metadata']['name'] == 'walrus'
         ]
         self.assertEqual(len(versions), 1, versions)
@@ -373,7 +382,8 @@ class CopyConservativeTestCase(unittest.TestCase):
 
         dst_unit_ids = [
             unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
         ]
         self.assertEqual(len(dst_unit_ids), 5, dst_unit_ids)
 
@@ -391,7 +401,8 @@ class CopyConservativeTestCase(unittest.TestCase):
         repo = self.copy_units(False, False, False)
         dst_unit_ids = [
             unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
         ]
         self.assertEqual(len(dst_unit_ids), 1, dst_unit_ids)
 
@@ -417,7 +428,8 @@ class CopyConservativeTestCase(unittest.TestCase):
         # Search and return RPM packages after copied on B
         versions = [
             unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
             if unit['metadata']['name'] == 'walrus'
         ]
         self.assertEqual(len(versions), 2, versions)
@@ -428,7 +440,8 @@ class CopyConservativeTestCase(unittest.TestCase):
         )
         dst_unit_ids = [
             unit['metadata']['name']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
         ]
         # Expect to find one more unit since old and new version of
         # walrus are now on repo B
@@ -450,7 +463,7 @@ class CopyConservativeTestCase(unittest.TestCase):
         # `old_dependency` will import an older version, `0.71` of walrus to
         # the destiny repostiory.
         if old_dependency:
-            rpm = utils.http_get(RPM_WITH_OLD_VERSION_URL)
+            rpm = http_get(RPM_WITH_OLD_VERSION_URL)
             upload_import_unit(
                 self.cfg,
                 rpm,
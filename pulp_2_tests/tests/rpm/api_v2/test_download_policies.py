@@ -10,7 +10,7 @@ import unittest
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import (
     BaseAPITestCase,
@@ -19,12 +19,16 @@ from pulp_smash.pulp2.utils import (
     sync_repo,
 )
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     RPM,
     RPM_DATA,
     RPM_UNSIGNED_FEED_URL,
     RPM_UNSIGNED_URL,
 )
+from pulp_2_tests.download_cache import get_sha256_checksum
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
@@ -46,15 +50,15 @@ def setUpModule():  # pylint:disable=invalid-name
     cfg = config.get_config()
     if cfg.pulp_version < Version('2.8'):
         raise unittest.SkipTest('This module requires Pulp 2.8 or greater.')
-    if os_is_f26(cfg) and not selectors.bug_is_fixed(3036, cfg.pulp_version):
+    if os_is_f26(cfg) and not bug_is_fixed(3036, cfg.pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/3036')
     if check_issue_2798(cfg):
         raise unittest.SkipTest('https://pulp.plan.io/issues/2798')
     if check_issue_2387(cfg):
         raise unittest.SkipTest('https://pulp.plan.io/issues/2387')
-    if not selectors.bug_is_fixed(2272, cfg.pulp_version):
+    if not bug_is_fixed(2272, cfg.pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/2272')
-    if not selectors.bug_is_fixed(2144, cfg.pulp_version):
+    if not bug_is_fixed(2144, cfg.pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/2144')
 
 
@@ -71,7 +75,7 @@ def _create_repo(cfg, download_policy):
     distributor['auto_publish'] = True
     distributor['distributor_config']['relative_url'] = body['id']
     body['distributors'] = [distributor]
-    return api.Client(cfg, api.json_handler).post(REPOSITORY_PATH, body)
+    return http_pool.Client(cfg, api.json_handler).post(REPOSITORY_PATH, body)
 
 
 class BackgroundTestCase(BaseAPITestCase):
@@ -91,10 +95,10 @@ class BackgroundTestCase(BaseAPITestCase):
         super().setUpClass()
         if check_issue_3104(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
-        if (not selectors.bug_is_fixed(1905, cls.cfg.pulp_version) and
+        if (not bug_is_fixed(1905, cls.cfg.pulp_version) and
                 os_is_rhel6(cls.cfg)):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1905')
-        if not selectors.bug_is_fixed(4120, cls.cfg.pulp_version):
+        if not bug_is_fixed(4120, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/4120')
 
         # Required to ensure content is actually downloaded.
@@ -108,9 +112,9 @@ class BackgroundTestCase(BaseAPITestCase):
 
         # Record the tasks spawned when syncing the repository, and the state
         # of the repository itself after the sync.
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         cls.repo = client.get(repo['_href'], params={'details': True}).json()
-        cls.tasks = tuple(api.poll_spawned_tasks(cls.cfg, report))
+        cls.tasks = poll_spawned_tasks(cls.cfg, report)
 
         # Download an RPM.
         cls.rpm = get_unit(cls.cfg, cls.repo['distributors'][0], RPM)
@@ -137,7 +141,7 @@ class BackgroundTestCase(BaseAPITestCase):
     def test_rpm_checksum(self):
         """Assert the checksum of the downloaded RPM matches the metadata."""
         actual = hashlib.sha256(self.rpm.content).hexdigest()
-        expect = utils.get_sha256_checksum(RPM_UNSIGNED_URL)
+        expect = get_sha256_checksum(RPM_UNSIGNED_URL)
         self.assertEqual(actual, expect)
 
     def test_spawned_download_task(self):
@@ -170,7 +174,7 @@ class OnDemandTestCase(BaseAPITestCase):
         super().setUpClass()
         if check_issue_3104(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
-        if not selectors.bug_is_fixed(4120, cls.cfg.pulp_version):
+        if not bug_is_fixed(4120, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/4120')
 
         # Ensure `locally_stored_units` is 0 before we start.
@@ -183,7 +187,7 @@ class OnDemandTestCase(BaseAPITestCase):
         sync_repo(cls.cfg, repo)
 
         # Read the repository.
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         cls.repo = client.get(repo['_href'], params={'details': True}).json()
 
         # Download the same RPM twice.
@@ -213,7 +217,7 @@ class OnDemandTestCase(BaseAPITestCase):
     def test_rpm_checksum(self):
         """Assert the checksum of the downloaded RPM matches the metadata."""
         actual = hashlib.sha256(self.rpm.content).hexdigest()
-        expect = utils.get_sha256_checksum(RPM_UNSIGNED_URL)
+        expect = get_sha256_checksum(RPM_UNSIGNED_URL)
         self.assertEqual(actual, expect)
 
     def test_rpm_cache_lookup_header(self):
@@ -223,7 +227,7 @@ class OnDemandTestCase(BaseAPITestCase):
 
     def test_rpm_cache_control_header(self):
         """Assert the request has the Cache-Control header set."""
-        if not selectors.bug_is_fixed(2587, self.cfg.pulp_version):
+        if not bug_is_fixed(2587, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2587')
         key = 'Cache-Control'
         headers = self.rpm.headers
@@ -237,12 +241,12 @@ class OnDemandTestCase(BaseAPITestCase):
     def test_same_rpm_checksum(self):
         """Assert the checksum of the second RPM matches the metadata."""
         actual = hashlib.sha256(self.same_rpm.content).hexdigest()
-        expect = utils.get_sha256_checksum(RPM_UNSIGNED_URL)
+        expect = get_sha256_checksum(RPM_UNSIGNED_URL)
         self.assertEqual(actual, expect)
 
     def test_same_rpm_cache_header(self):
         """Assert the second request resulted in a cache hit from Squid."""
-        if not selectors.bug_is_fixed(2587, self.cfg.pulp_version):
+        if not bug_is_fixed(2587, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2587')
         headers = self.same_rpm.headers
         self.assertIn('HIT', headers['X-Cache-Lookup'], headers)
@@ -270,10 +274,10 @@ class FixFileCorruptionTestCase(unittest.TestCase):
         7. Trigger a repository download, with unit verification.
         """
         cls.cfg = config.get_config()
-        if (not selectors.bug_is_fixed(1905, cls.cfg.pulp_version) and
+        if (not bug_is_fixed(1905, cls.cfg.pulp_version) and
                 os_is_rhel6(cls.cfg)):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1905')
-        if not selectors.bug_is_fixed(4120, cls.cfg.pulp_version):
+        if not bug_is_fixed(4120, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/4120')
 
         # Ensure Pulp is empty of units otherwise we might just associate pre-
@@ -281,7 +285,7 @@ class FixFileCorruptionTestCase(unittest.TestCase):
         reset_pulp(cls.cfg)
 
         # Create and sync a repository.
-        api_client = api.Client(cls.cfg, api.json_handler)
+        api_client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo(
             importer_config={
                 'feed': RPM_UNSIGNED_FEED_URL,
@@ -300,7 +304,7 @@ class FixFileCorruptionTestCase(unittest.TestCase):
 
         # Corrupt an RPM. The file is there, but the checksum isn't right.
         rpm_abs_path = cls.get_rpm_abs_path()
-        cli_client = cli.Client(cls.cfg)
+        cli_client = ssh.Client(cls.cfg)
         checksum_cmd = ('sha256sum ' + rpm_abs_path).split()
         cls.sha_pre_corruption = cli_client.run(
             checksum_cmd, sudo=True).stdout.strip()
@@ -323,12 +327,12 @@ class FixFileCorruptionTestCase(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up resources."""
         if getattr(cls, 'repo', None):
-            api.Client(cls.cfg).delete(cls.repo['_href'])
+            http_pool.Client(cls.cfg).delete(cls.repo['_href'])
 
     @classmethod
     def get_rpm_abs_path(cls):
         """Return the absolute path to ``pulp_2_tests.constants.RPM``."""
-        return cli.Client(cls.cfg).run(
+        return ssh.Client(cls.cfg).run(
             'find /var/lib/pulp/content/units/rpm/ -type f -name'
             .split() + [RPM]
         ).stdout.strip()
@@ -410,7 +414,7 @@ class SwitchPoliciesTestCase(BaseAPITestCase):
         """Make sure Pulp and Squid are reset."""
         if check_issue_3104(self.cfg):
             self.skipTest('https://pulp.plan.io/issues/3104')
-        if not selectors.bug_is_fixed(4120, self.cfg.pulp_version):
+        if not bug_is_fixed(4120, self.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/4120')
         # Required to ensure content is actually downloaded.
         reset_squid(self.cfg)
@@ -425,7 +429,7 @@ class SwitchPoliciesTestCase(BaseAPITestCase):
 
         Return a tuple with the repository and tasks.
         """
-        client = api.Client(self.cfg)
+        client = http_pool.Client(self.cfg)
         # Create repo with the first download policy
         repo = _create_repo(self.cfg, first)
         self.addCleanup(client.delete, repo['_href'])
@@ -442,7 +446,7 @@ class SwitchPoliciesTestCase(BaseAPITestCase):
         self.assertEqual(
             repo['importers'][0]['config']['download_policy'], second)
         report = sync_repo(self.cfg, repo).json()
-        tasks = tuple(api.poll_spawned_tasks(self.cfg, report))
+        tasks = poll_spawned_tasks(self.cfg, report)
         return repo, tasks
 
     def _assert_background_immediate(self, repo):
@@ -464,7 +468,7 @@ class SwitchPoliciesTestCase(BaseAPITestCase):
 
         # Assert the checksum of the downloaded RPM matches the metadata.
         actual = hashlib.sha256(rpm.content).hexdigest()
-        expect = utils.get_sha256_checksum(RPM_UNSIGNED_URL)
+        expect = get_sha256_checksum(RPM_UNSIGNED_URL)
         self.assertEqual(actual, expect)
 
     def assert_background(self, repo, tasks):
@@ -520,7 +524,7 @@ class SwitchPoliciesTestCase(BaseAPITestCase):
 
         # Assert the checksum of the downloaded RPM matches the metadata.
         actual = hashlib.sha256(rpm.content).hexdigest()
-        expect = utils.get_sha256_checksum(RPM_UNSIGNED_URL)
+        expect = get_sha256_checksum(RPM_UNSIGNED_URL)
         self.assertEqual(actual, expect)
 
         # Assert the first request resulted in a cache miss from Squid.
@@ -528,7 +532,7 @@ class SwitchPoliciesTestCase(BaseAPITestCase):
 
         # Assert the checksum of the second RPM matches the metadata.
         actual = hashlib.sha256(same_rpm.content).hexdigest()
-        expect = utils.get_sha256_checksum(RPM_UNSIGNED_URL)
+        expect = get_sha256_checksum(RPM_UNSIGNED_URL)
         self.assertEqual(actual, expect)
 
         # Assert the second request resulted in a cache hit from Squid."""
@@ -545,7 +549,7 @@ class SwitchPoliciesTestCase(BaseAPITestCase):
 
     def test_background_to_on_demand(self):
         """Check if switching from background to on_demand works."""
-        if not selectors.bug_is_fixed(2587, self.cfg.pulp_version):
+        if not bug_is_fixed(2587, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2587')
         repo, _ = self.repository_setup('background', 'on_demand')
         self.assert_on_demand(repo)
@@ -557,7 +561,7 @@ class SwitchPoliciesTestCase(BaseAPITestCase):
 
     def test_immediate_to_on_demand(self):
         """Check if switching from immediate to on_demand works."""
-        if not selectors.bug_is_fixed(2587, self.cfg.pulp_version):
+        if not bug_is_fixed(2587, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2587')
         repo, _ = self.repository_setup('immediate', 'on_demand')
         self.assert_on_demand(repo)
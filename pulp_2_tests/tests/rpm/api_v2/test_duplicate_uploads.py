@@ -7,11 +7,14 @@ from urllib.parse import urljoin, urlsplit
 
 from packaging.version import Version
 
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import search_units, upload_import_unit
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import FILE_URL, FILE2_URL, RPM_UNSIGNED_URL
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_repo
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -32,7 +35,7 @@ class DuplicateUploadsTestCase(unittest.TestCase):
         * `Pulp Smash #81 <https://github.com/PulpQE/pulp-smash/issues/81>`_
         * `Pulp #1406 <https://pulp.plan.io/issues/1406>`_
         """
-        if not selectors.bug_is_fixed(1406, self.cfg.pulp_version):
+        if not bug_is_fixed(1406, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1406')
         self.do_test(RPM_UNSIGNED_URL, 'rpm', gen_repo())
 
@@ -44,7 +47,7 @@ class DuplicateUploadsTestCase(unittest.TestCase):
         * `Pulp Smash #582 <https://github.com/PulpQE/pulp-smash/issues/582>`_
         * `Pulp #2274 <https://pulp.plan.io/issues/2274>`_
         """
-        if not selectors.bug_is_fixed(2274, self.cfg.pulp_version):
+        if not bug_is_fixed(2274, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2274')
         body = {
             'id': utils.uuid4(),
@@ -55,7 +58,7 @@ class DuplicateUploadsTestCase(unittest.TestCase):
                 'distributor_type_id': 'iso_distributor',
             }],
         }
-        iso = utils.http_get(FILE_URL)
+        iso = http_get(FILE_URL)
         unit_key = {
             'checksum': hashlib.sha256(iso).hexdigest(),
             'name': os.path.basename(urlsplit(FILE_URL).path),
@@ -78,8 +81,8 @@ class DuplicateUploadsTestCase(unittest.TestCase):
         """
         if unit_key is None:
             unit_key = {}
-        client = api.Client(self.cfg, api.json_handler)
-        unit = utils.http_get(feed)
+        client = http_pool.Client(self.cfg, api.json_handler)
+        unit = http_get(feed)
         repo = client.post(REPOSITORY_PATH, body)
         self.addCleanup(client.delete, repo['_href'])
         for _ in range(2):
@@ -110,11 +113,11 @@ class DuplicateUploadAndCopyTestCase(unittest.TestCase):
         cfg = config.get_config()
         if cfg.pulp_version < Version('2.20'):
             raise unittest.SkipTest('This test requires Pulp 2.20 or newer.')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
 
         # 1. Create two iso-repo
         repos = []
-        iso = utils.http_get(FILE_URL)
+        iso = http_get(FILE_URL)
         unit_key = {
             'checksum': hashlib.sha256(iso).hexdigest(),
             'name': os.path.basename(urlsplit(FILE_URL).path),
@@ -152,7 +155,7 @@ class DuplicateUploadAndCopyTestCase(unittest.TestCase):
         self.assertEqual(len(units), 1, units)
 
         # 4. Upload a same-name, but different ISO to the source repo
-        iso2 = utils.http_get(FILE2_URL)
+        iso2 = http_get(FILE2_URL)
         unit_key = {
             'checksum': hashlib.sha256(iso2).hexdigest(),
             'name': os.path.basename(urlsplit(FILE_URL).path),
@@ -2,11 +2,14 @@
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import api, cli, config, selectors
+from pulp_smash import api, cli, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, sync_repo
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_LARGE_UPDATEINFO, RPM_UNSIGNED_FEED_URL
+from pulp_2_tests.tasks import sync_repo_async
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
@@ -44,7 +47,7 @@ class ApplyErratumTestCase(unittest.TestCase):
         pkg_mgr = cli.PackageManager(cfg)
         pkg_mgr.install((rpm_name + '-' + rpm_versions[0]))
         self.addCleanup(pkg_mgr.uninstall, rpm_name)
-        cli_client = cli.Client(cfg)
+        cli_client = ssh.Client(cfg)
         rpm = cli_client.run(('rpm', '-q', rpm_name)).stdout.strip()
         self.assertTrue(rpm.startswith('-'.join((rpm_name, rpm_versions[0]))))
 
@@ -59,7 +62,7 @@ class ApplyErratumTestCase(unittest.TestCase):
         Also, schedule it for deletion. Return a detailed dict of information
         about the repository.
         """
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -84,7 +87,7 @@ class ApplyErratumTestCase(unittest.TestCase):
             name=repo['_href'],
             repositoryid=repo['id']
         )
-        self.addCleanup(cli.Client(cfg).run, ('rm', repo_path), sudo=True)
+        self.addCleanup(ssh.Client(cfg).run, ('rm', repo_path), sudo=True)
 
 
 class LargePackageListTestCase(unittest.TestCase):
@@ -102,14 +105,14 @@ class LargePackageListTestCase(unittest.TestCase):
 
         1. Create two repositories, each with a feed URL of
            ``pulp_2_tests.constants.RPM_LARGE_UPDATEINFO``.
-        2. Sync both repositories. Assert that each sync finishes without
-           errors.
+        2. Sync both repositories in parallel. Assert that each sync finishes
+           without errors.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2681, cfg.pulp_version):
+        if not bug_is_fixed(2681, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2681')
         repos = []
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
 
         # Create repositories.
         for _ in range(2):
@@ -119,11 +122,10 @@ class LargePackageListTestCase(unittest.TestCase):
             self.addCleanup(client.delete, repo['_href'])
             repos.append(repo)
 
-        # Sync repositories.
-        for repo in repos:
-            report = sync_repo(cfg, repo)
-            tasks = tuple(api.poll_spawned_tasks(cfg, report.json()))
-            for i, task in enumerate(tasks):
+        # Sync repositories, and wait on both syncs at once.
+        futures = [sync_repo_async(cfg, repo) for repo in repos]
+        for future in futures:
+            for i, task in enumerate(future.result()):
                 with self.subTest(i=i):
                     error_details = task['progress_report']['yum_importer']['content']['error_details']  # pylint:disable=line-too-long
                     self.assertEqual(error_details, [], task)
@@ -6,13 +6,13 @@
 """
 import inspect
 import os
+import shlex
 import unittest
 from urllib.parse import urljoin, urlparse, urlunparse
 from xml.dom import minidom
 
-from dateutil.parser import parse
 from packaging.version import Version
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import (
     REPOSITORY_EXPORT_DISTRIBUTOR,
     REPOSITORY_GROUP_EXPORT_DISTRIBUTOR,
@@ -21,7 +21,12 @@ from pulp_smash.pulp2.constants import (
 )
 from pulp_smash.pulp2.utils import BaseAPITestCase, publish_repo, sync_repo
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM, RPM_SIGNED_FEED_URL, RPM_SIGNED_URL
+from pulp_2_tests.download_cache import get_sha256_checksum
+from pulp_2_tests.lazy import parse_datetime
+from pulp_2_tests.tasks import publish_repo_async
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     DisableSELinuxMixin,
     gen_distributor,
@@ -49,7 +54,7 @@ def _create_distributor(cfg, href, distributor_type_id, checksum_type=None):
     body['distributor_type_id'] = distributor_type_id
     if checksum_type is not None:
         body['distributor_config']['checksum_type'] = checksum_type
-    return api.Client(cfg).post(path, body).json()
+    return http_pool.Client(cfg).post(path, body).json()
 
 
 def _get_iso_url(cfg, entity, entity_type, distributor):
@@ -60,7 +65,7 @@ def _get_iso_url(cfg, entity, entity_type, distributor):
     """
     iso_name = '{}-{}-01.iso'.format(
         entity['id'],
-        parse(distributor['last_publish']).strftime('%Y-%m-%dT%H.%M')
+        parse_datetime(distributor['last_publish']).strftime('%Y-%m-%dT%H.%M')
     )
     path = '/pulp/exports/{}/'.format(entity_type)
     path = urljoin(path, distributor['config']['relative_url'])
@@ -68,6 +73,37 @@ def _get_iso_url(cfg, entity, entity_type, distributor):
     return urljoin(cfg.get_base_url(), iso_path)
 
 
+def _read_repodata(cfg, repomd_paths):
+    """Read several ``repomd.xml`` files, and checksum the files beside them.
+
+    Everything is read with a single round trip to the Pulp host.
+
+    :param cfg: Information about the Pulp deployment being targeted.
+    :param repomd_paths: An iterable of ``(path, checksum_type)`` pairs, where
+        ``path`` is the remote path to a ``repomd.xml`` file, and
+        ``checksum_type`` is such as "sha256".
+    :returns: A list of ``(repomd_xml, checksums)`` pairs, where
+        ``checksums`` maps the name of each file in the ``repodata`` directory
+        to its checksum.
+    """
+    commands = []
+    for path, checksum_type in repomd_paths:
+        commands.append(('cat', path))
+        commands.append((
+            'find', os.path.dirname(path), '-type', 'f',
+            '-exec', checksum_type + 'sum', '{}', '+',
+        ))
+    results = ssh.Client(cfg).run_batch(commands)
+    repodata = []
+    for i in range(0, len(results), 2):
+        checksums = {}
+        for line in results[i + 1].stdout.splitlines():
+            checksum, file_path = line.split('  ', 1)
+            checksums[os.path.basename(file_path)] = checksum
+        repodata.append((results[i].stdout, checksums))
+    return repodata
+
+
 class ExportDirMixin(DisableSELinuxMixin):
     """Mixin with repo export to dir utilities.
 
@@ -79,8 +115,9 @@ class ExportDirMixin(DisableSELinuxMixin):
     3. Make the directory readable. (See :meth:`change_export_dir_owner`.)
     4. Inspect the contents of the directory.
 
-    :meth:`publish_to_dir` conveniently executes steps 1–3. Consider using the
-    other methods only if more granularity is needed.
+    :meth:`publish_to_dir` conveniently executes steps 1–3, and
+    :meth:`publish_to_dirs` does so for several exports at once. Consider
+    using the other methods only if more granularity is needed.
 
     A class attribute named ``cfg`` must be present. It should be a
     `pulp_smash.config.PulpSmashConfig``.
@@ -98,32 +135,47 @@ class ExportDirMixin(DisableSELinuxMixin):
 
         :returns: The path to the created directory, as a string.
         """
+        return self.create_export_dirs(1)[0]
+
+    def create_export_dirs(self, count):
+        """Create ``count`` directories, and ensure Pulp can export to them.
+
+        This method is like :meth:`create_export_dir`, except that every
+        directory is created with a single round trip.
+
+        :returns: A list of paths to the created directories.
+        """
         # Issue 616 describes how SELinux prevents Pulp from writing to an
         # export directory. If that bug affects us, and if SELinux is present
         # and enforcing on the target system, then we disable SELinux for the
         # duration of this one test and re-enable it afterwards.
         self.maybe_disable_selinux(self.cfg, 616)
 
-        # Create a custom directory, and ensure apache can create files in it.
-        # We must schedule it for deletion, as Pulp doesn't do this during repo
-        # removal. Due to the amount of permission twiddling done below, we use
-        # root to reliably `rm -rf ${export_dir}`.
-        client = cli.Client(self.cfg)
-        export_dir = client.run('mktemp --directory'.split()).stdout.strip()
+        # Create custom directories, and ensure apache can create files in
+        # them. We must schedule them for deletion, as Pulp doesn't do this
+        # during repo removal. Due to the amount of permission twiddling done
+        # below, we use root to reliably `rm -rf ${export_dir}`.
+        client = ssh.Client(self.cfg)
+        script = (
+            'set -e; for _ in $(seq {}); do '
+            'dir="$(mktemp --directory)"; chown apache "$dir"; echo "$dir"; '
+            'done'.format(count)
+        )
+        export_dirs = client.run(
+            ('sh', '-c', script), sudo=True).stdout.split()
         self.addCleanup(
-            client.run, ('rm -rf {} ' + export_dir).split(), sudo=True)
-        client.run(('chown apache ' + export_dir).split(), sudo=True)
-        return export_dir
+            client.run, ('rm', '-rf') + tuple(export_dirs), sudo=True)
+        return export_dirs
 
-    def change_export_dir_owner(self, export_dir):
+    def change_export_dir_owner(self, *export_dirs):
         """Change the owner to the running Pulp Smash user.
 
-        Update the remote path ``dir`` owner to the user running Pulp Smash.
+        Update the owner of each remote path in ``export_dirs``, recursively,
+        to the user running Pulp Smash, with a single round trip.
         """
-        client = cli.Client(self.cfg)
-        uid = client.run('id -u'.split()).stdout.strip()
-        client.run(
-            ('chown -R {} {}'.format(uid, export_dir)).split(), sudo=True)
+        sudo = '' if ssh.is_root(self.cfg) else 'sudo '
+        ssh.Client(self.cfg).run_shell('{}chown -R "$(id -u)" {}'.format(
+            sudo, ' '.join(shlex.quote(path) for path in export_dirs)))
 
     def publish_to_dir(self, entity_href, distributor_id):
         """Create an export directory, publish to it, and change its owner.
@@ -135,13 +187,32 @@ class ExportDirMixin(DisableSELinuxMixin):
         :param distributor_id: The ID of the distributor to use when exporting.
         :returns: The path to the export directory.
         """
-        export_dir = self.create_export_dir()
-        publish_repo(self.cfg, repo={'_href': entity_href}, json={
-            'id': distributor_id,
-            'override_config': {'export_dir': export_dir},
-        })
-        self.change_export_dir_owner(export_dir)
-        return export_dir
+        return self.publish_to_dirs(((entity_href, distributor_id),))[0]
+
+    def publish_to_dirs(self, exports):
+        """Export several entities at once, each to a new directory.
+
+        The export directories are created, and their owner changed, with one
+        round trip each. Every export is requested before any is waited on.
+
+        :param exports: An iterable of ``(entity_href, distributor_id)``
+            pairs, as accepted by :meth:`publish_to_dir`.
+        :returns: A list of paths to the export directories, one per export.
+        """
+        exports = tuple(exports)
+        export_dirs = self.create_export_dirs(len(exports))
+        futures = [
+            publish_repo_async(self.cfg, {'_href': entity_href}, {
+                'id': distributor_id,
+                'override_config': {'export_dir': export_dir},
+            })
+            for (entity_href, distributor_id), export_dir
+            in zip(exports, export_dirs)
+        ]
+        for future in futures:
+            future.result()
+        self.change_export_dir_owner(*export_dirs)
+        return export_dirs
 
 
 class BaseExportChecksumTypeTestCase(ExportDirMixin, BaseAPITestCase):
@@ -164,7 +235,7 @@ class BaseExportChecksumTypeTestCase(ExportDirMixin, BaseAPITestCase):
             raise unittest.SkipTest('This test requires Pulp 2.9 or newer')
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
-        cls.repo = api.Client(cls.cfg).post(REPOSITORY_PATH, body).json()
+        cls.repo = http_pool.Client(cls.cfg).post(REPOSITORY_PATH, body).json()
         cls.resources.add(cls.repo['_href'])
         sync_repo(cls.cfg, cls.repo)
 
@@ -173,22 +244,34 @@ class BaseExportChecksumTypeTestCase(ExportDirMixin, BaseAPITestCase):
 
         Return the updated distributor information.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(entity['_href'], 'actions/publish/')
         client.post(path, {'id': distributor['id']})
         return client.get(distributor['_href'])
 
-    def _assert_checksum_type(self, path, checksum_type):
-        """Assert repomd.xml have the proper ``checksum_type``.
+    def _assert_repodata(self, repomd_xml, checksums, checksum_type):
+        """Assert repomd.xml have the proper ``checksum_type`` and checksums.
 
-        ``path`` must be the remote path of the repomd.xml file.
+        :param repomd_xml: The content of a repomd.xml file.
+        :param checksums: A dict mapping the name of each file in the
+            ``repodata`` directory to its checksum, as returned by
+            ``_read_repodata``.
+        :param checksum_type: The expected checksum type, such as "sha256".
         """
-        document = minidom.parseString(cli.Client(self.cfg).run(
-            'cat {}'.format(path).split()).stdout)
+        document = minidom.parseString(repomd_xml)
         self.assertTrue(all([
             element.attributes.get('type').value == checksum_type
             for element in document.getElementsByTagName('checksum')
         ]))
+        for data in document.getElementsByTagName('data'):
+            location = data.getElementsByTagName('location')[0]
+            href = location.getAttribute('href')
+            checksum = data.getElementsByTagName('checksum')[0]
+            self.assertEqual(
+                checksum.firstChild.data.strip(),
+                checksums.get(os.path.basename(href)),
+                href,
+            )
 
     def get_export_entity(self):
         """Provide the export entity.
@@ -230,22 +313,35 @@ class BaseExportChecksumTypeTestCase(ExportDirMixin, BaseAPITestCase):
         )
 
     def test_publish_to_dir_checksum_type(self):  # pylint:disable=invalid-name
-        """Publish to a directory choosing the checksum type."""
-        for distributor in self.distributors:  # pylint:disable=no-member
-            checksum_type = distributor['config']['checksum_type']
+        """Publish to a directory choosing the checksum type.
+
+        Every distributor exports at once, and every export is read back with
+        a single round trip.
+        """
+        distributors = self.distributors  # pylint:disable=no-member
+        export_dirs = self.publish_to_dirs(
+            (self.get_export_entity()['_href'], distributor['id'])
+            for distributor in distributors
+        )
+        checksum_types = [
+            distributor['config']['checksum_type']
+            for distributor in distributors
+        ]
+        repodata = _read_repodata(self.cfg, zip(
+            (
+                self.get_repomd_publish_path(export_dir, distributor)
+                for export_dir, distributor in zip(export_dirs, distributors)
+            ),
+            checksum_types,
+        ))
+        for checksum_type, (repomd_xml, checksums) in zip(
+                checksum_types, repodata):
             with self.subTest(msg=checksum_type):
-                export_dir = self.publish_to_dir(
-                    self.get_export_entity()['_href'],
-                    distributor['id'],
-                )
-                self._assert_checksum_type(
-                    self.get_repomd_publish_path(export_dir, distributor),
-                    checksum_type
-                )
+                self._assert_repodata(repomd_xml, checksums, checksum_type)
 
     def test_publish_to_web_checksum_type(self):  # pylint:disable=invalid-name
         """Publish to web choosing the checksum type."""
-        client = cli.Client(self.cfg)
+        client = ssh.Client(self.cfg)
         for distributor in self.distributors:  # pylint:disable=no-member
             checksum_type = distributor['config']['checksum_type']
             with self.subTest(msg=checksum_type):
@@ -274,10 +370,11 @@ class BaseExportChecksumTypeTestCase(ExportDirMixin, BaseAPITestCase):
                     ('umount {}'.format(export_dir)).split(),
                     sudo=True
                 )
-                self._assert_checksum_type(
-                    self.get_repomd_iso_publish_path(export_dir, distributor),
-                    checksum_type
-                )
+                repomd_path = self.get_repomd_iso_publish_path(
+                    export_dir, distributor)
+                repomd_xml, checksums = _read_repodata(
+                    self.cfg, ((repomd_path, checksum_type),))[0]
+                self._assert_repodata(repomd_xml, checksums, checksum_type)
 
 
 class ExportChecksumTypeTestCase(BaseExportChecksumTypeTestCase):
@@ -347,7 +444,7 @@ class RepoGroupExportChecksumTypeTestCase(BaseExportChecksumTypeTestCase):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
         body = gen_repo_group()
         body['repo_ids'] = [cls.repo['id']]
-        cls.repo_group = api.Client(cls.cfg).post(
+        cls.repo_group = http_pool.Client(cls.cfg).post(
             REPOSITORY_GROUP_PATH, body).json()
         cls.resources.add(cls.repo_group['_href'])
         cls.distributors = [
@@ -403,11 +500,11 @@ class ExportDistributorTestCase(ExportDirMixin, BaseAPITestCase):
         super().setUpClass()
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
-        cls.repo = api.Client(cls.cfg).post(REPOSITORY_PATH, body).json()
+        cls.repo = http_pool.Client(cls.cfg).post(REPOSITORY_PATH, body).json()
         cls.resources.add(cls.repo['_href'])
         sync_repo(cls.cfg, cls.repo)
         if (cls.cfg.pulp_version >= Version('2.9') and
-                not selectors.bug_is_fixed(1928, cls.cfg.pulp_version)):
+                not bug_is_fixed(1928, cls.cfg.pulp_version)):
             cls.distributor = None
         else:
             cls.distributor = _create_distributor(
@@ -435,7 +532,7 @@ class ExportDistributorTestCase(ExportDirMixin, BaseAPITestCase):
         """
         # Publish the repository, and re-read the distributor.
         publish_repo(self.cfg, self.repo, {'id': self.distributor['id']})
-        client = api.Client(self.cfg)
+        client = http_pool.Client(self.cfg)
         distributor = client.get(self.distributor['_href']).json()
 
         # Fetch the ISO file via HTTP and HTTPS.
@@ -466,7 +563,7 @@ class ExportDistributorTestCase(ExportDirMixin, BaseAPITestCase):
             path = os.path.join(path, 'Packages', RPM[0], RPM)
         else:
             path = os.path.join(path, RPM)
-        actual = cli.Client(self.cfg).run(
+        actual = ssh.Client(self.cfg).run(
             ('sha256sum', path)).stdout.strip().split()[0]
-        expect = utils.get_sha256_checksum(RPM_SIGNED_URL)
+        expect = get_sha256_checksum(RPM_SIGNED_URL)
         self.assertEqual(actual, expect)
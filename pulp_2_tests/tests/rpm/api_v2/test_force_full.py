@@ -10,11 +10,14 @@ publication steps, even steps that normally would be skipped.
 This module tests Pulp's handling of "full" publishes.
 """
 from packaging.version import Version
-from pulp_smash import api, selectors
+from pulp_smash import api
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_SIGNED_FEED_URL
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -30,7 +33,7 @@ class ForceFullTestCase(BaseAPITestCase):
     def setUpClass(cls):
         """Create and sync a repository."""
         super().setUpClass()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -64,7 +67,7 @@ class ForceFullTestCase(BaseAPITestCase):
             'id': self.repo['distributors'][0]['id'],
             'override_config': {'force_full': False}
         }).json()
-        last_task = next(api.poll_spawned_tasks(self.cfg, call_report))
+        last_task = poll_spawned_tasks(self.cfg, call_report)[0]
         task_steps = last_task['result']['details']
         step = self.get_step(task_steps, 'rpms')
         self.assertGreater(step['num_processed'], 0, step)
@@ -77,10 +80,10 @@ class ForceFullTestCase(BaseAPITestCase):
         .. _Pulp #1966: https://pulp.plan.io/issues/1966
         """
         if (self.cfg.pulp_version >= Version('2.9') and
-                not selectors.bug_is_fixed(1966, self.cfg.pulp_version)):
+                not bug_is_fixed(1966, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/1966')
         call_report = publish_repo(self.cfg, self.repo).json()
-        last_task = next(api.poll_spawned_tasks(self.cfg, call_report))
+        last_task = poll_spawned_tasks(self.cfg, call_report)[0]
         task_steps = last_task['result']['details']
         step = self.get_step(task_steps, 'rpms')
         self.assertEqual(step['num_processed'], 0, step)
@@ -103,7 +106,7 @@ class ForceFullTestCase(BaseAPITestCase):
             'id': self.repo['distributors'][0]['id'],
             'override_config': {'force_full': True}
         }).json()
-        last_task = next(api.poll_spawned_tasks(self.cfg, call_report))
+        last_task = poll_spawned_tasks(self.cfg, call_report)[0]
         task_steps = last_task['result']['details']
         step = self.get_step(task_steps, 'rpms')
         self.assertGreater(step['num_processed'], 0, step)
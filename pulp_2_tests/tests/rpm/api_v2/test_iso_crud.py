@@ -8,10 +8,12 @@ from urllib.parse import urljoin, urlparse
 
 import requests
 from packaging.version import Version
-from pulp_smash import api, config, exceptions, selectors, utils
+from pulp_smash import api, config, exceptions, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, search_units, sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     FILE_FEED_URL,
     FILE_MIXED_FEED_URL,
@@ -78,7 +80,8 @@ class CreateTestCase(BaseAPITestCase):
             'importer_type_id': 'iso_importer',
             'notes': {utils.uuid4(): utils.uuid4()},
         }
-        cls.response = api.Client(cls.cfg).post(REPOSITORY_PATH, cls.body)
+        cls.response = http_pool.Client(cls.cfg).post(
+            REPOSITORY_PATH, cls.body)
 
     def test_status_code(self):
         """Assert the response has an HTTP 201 status code."""
@@ -148,7 +151,7 @@ class ReadUpdateDeleteTestCase(BaseAPITestCase):
         cls.responses = {}
 
         # Create repositories.
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         repos = {
             key: client.post(REPOSITORY_PATH, body)
             for key, body in cls.bodies.items()
@@ -207,7 +210,7 @@ class ReadUpdateDeleteTestCase(BaseAPITestCase):
     def test_read_distributors(self):
         """Assert each read w/distributors contains info about distributors."""
         if (self.cfg.pulp_version < Version('2.8') and
-                not selectors.bug_is_fixed(1452, self.cfg.pulp_version)):
+                not bug_is_fixed(1452, self.cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/1452')
         for key in {'read_distributors', 'read_details'}:
             with self.subTest(key=key):
@@ -246,11 +249,11 @@ class AddImporterDistributorTestCase(BaseAPITestCase):
         """
         super().setUpClass()
         if (cls.cfg.pulp_version >= Version('2.10') and
-                not selectors.bug_is_fixed(2082, cls.cfg.pulp_version)):
+                not bug_is_fixed(2082, cls.cfg.pulp_version)):
             raise SkipTest('https://pulp.plan.io/issues/2082')
 
         # Steps 1 and 2.
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         href = client.post(REPOSITORY_PATH, {'id': utils.uuid4()})['_href']
         cls.resources.add(href)
         cls.pre_imp = client.get(urljoin(href, 'importers/'))
@@ -322,7 +325,7 @@ class PulpManifestTestCase(BaseAPITestCase):
         lists.
         """
         pulp_manifest_count = len(self.parse_pulp_manifest(FILE_FEED_URL))
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, _gen_iso_repo(FILE_FEED_URL))
         self.addCleanup(client.delete, repo['_href'])
         sync_repo(self.cfg, repo)
@@ -340,14 +343,14 @@ class PulpManifestTestCase(BaseAPITestCase):
         if self.cfg.pulp_version < Version('2.11'):
             self.skipTest(
                 'Pulp reports 404 for ISO repos only on 2.11 or greater.')
-        if not selectors.bug_is_fixed(3899, self.cfg.pulp_version):
+        if not bug_is_fixed(3899, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3899')
         pulp_manifest = self.parse_pulp_manifest(FILE_MIXED_FEED_URL)
         missing = [
             row['name'] for row in pulp_manifest
             if row['name'].startswith('missing')
         ]
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, _gen_iso_repo(FILE_MIXED_FEED_URL))
         self.addCleanup(client.delete, repo['_href'])
         with self.assertRaises(exceptions.TaskReportError) as context:
@@ -402,11 +405,11 @@ class ISOUpdateTestCase(unittest.TestCase):
         """
         cfg = config.get_config()
         for issue_id in (2773, 3047, 3100, 4857, 4865):
-            if not selectors.bug_is_fixed(issue_id, cfg.pulp_version):
+            if not bug_is_fixed(issue_id, cfg.pulp_version):
                 self.skipTest('https://pulp.plan.io/issues/' + str(issue_id))
 
         # Step 1
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, _gen_iso_repo(FILE_FEED_URL))
         self.addCleanup(client.delete, repo['_href'])
         repo = client.get(repo['_href'], params={'details': True})
@@ -5,17 +5,20 @@ import os
 import unittest
 from urllib.parse import urljoin, urlparse, urlsplit
 
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.exceptions import TaskReportError
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, sync_repo, upload_import_unit
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     FILE_FEED_COUNT,
     FILE_FEED_URL,
     FILE_INVALID_FEED_URL,
     FILE_URL,
 )
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     TemporaryUserMixin,
     get_dists_by_type_id,
@@ -57,9 +60,9 @@ class ServeHttpsFalseTestCase(TemporaryUserMixin, unittest.TestCase):
 
     def test_all(self):
         """Publish w/an rsync distributor when ``serve_https`` is false."""
-        if not selectors.bug_is_fixed(2657, self.cfg.pulp_version):
+        if not bug_is_fixed(2657, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2657')
-        if (not selectors.bug_is_fixed(3313, self.cfg.pulp_version) and
+        if (not bug_is_fixed(3313, self.cfg.pulp_version) and
                 os_is_f27(self.cfg)):
             self.skipTest('https://pulp.plan.io/issues/3313')
 
@@ -68,7 +71,7 @@ class ServeHttpsFalseTestCase(TemporaryUserMixin, unittest.TestCase):
         ssh_identity_file = self.write_private_key(self.cfg, priv_key)
 
         # Create a repo
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = {
             'distributors': [],
             'id': utils.uuid4(),
@@ -116,7 +119,7 @@ class ServeHttpsFalseTestCase(TemporaryUserMixin, unittest.TestCase):
         })
 
         # Verify the correct units are on the remote system.
-        cli_client = cli.Client(self.cfg)
+        cli_client = ssh.Client(self.cfg)
         path = dists['iso_rsync_distributor']['config']['remote']['root']
         path = os.path.join(path, 'content/units')
         cmd = ('find', path, '-name', '*.iso')
@@ -140,7 +143,7 @@ class UploadIsoTestCase(unittest.TestCase):
         """
         # create a repo
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = {
             'id': utils.uuid4(),
             'importer_type_id': 'iso_importer',
@@ -155,7 +158,7 @@ class UploadIsoTestCase(unittest.TestCase):
         repo = client.get(repo['_href'], params={'details': True})
 
         # upload an ISO to the repository
-        iso = utils.http_get(FILE_URL)
+        iso = http_get(FILE_URL)
         iso_name = os.path.basename(urlsplit(FILE_URL).path)
         upload_import_unit(cfg, iso, {
             'unit_type_id': 'iso',
@@ -189,7 +192,7 @@ class SyncInvalidFileTestCase(unittest.TestCase):
     def test_all(self):
         """Perform sync on an invalid file repository."""
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = {
             'id': utils.uuid4(),
             'importer_config': {'feed': FILE_INVALID_FEED_URL},
@@ -16,11 +16,13 @@ references.
 import unittest
 
 from packaging.version import Version
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.exceptions import TaskReportError
 from pulp_smash.pulp2.utils import publish_repo, sync_repo
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     RPM,
     RPM_MIRRORLIST_BAD,
@@ -28,6 +30,7 @@ from pulp_2_tests.constants import (
     RPM_MIRRORLIST_MIXED,
     RPM_UNSIGNED_URL,
 )
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
@@ -50,13 +53,13 @@ def setUpModule():  # pylint:disable=invalid-name
     set_up_module()
     cfg = config.get_config()
     if (cfg.pulp_version >= Version('2.15.1') and
-            not selectors.bug_is_fixed(3310, cfg.pulp_version)):
+            not bug_is_fixed(3310, cfg.pulp_version)):
         raise unittest.SkipTest('https://pulp.plan.io/issues/3310')
 
 
 def tearDownModule():  # pylint:disable=invalid-name
     """Delete orphan content units."""
-    api.Client(config.get_config()).delete(ORPHANS_PATH)
+    http_pool.Client(config.get_config()).delete(ORPHANS_PATH)
 
 
 class UtilsMixin():
@@ -84,7 +87,7 @@ class UtilsMixin():
         if relative_url is not None:
             distributor['distributor_config']['relative_url'] = relative_url
         body['distributors'] = [distributor]
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, body)
         self.addCleanup(client.delete, repo['_href'])
         return client.get(repo['_href'], params={'details': True})
@@ -103,7 +106,7 @@ class UtilsMixin():
         .. _issue #2321: https://pulp.plan.io/issues/2321
         """
         if (cfg.pulp_version >= Version('2.11') and
-                not selectors.bug_is_fixed(2321, cfg.pulp_version)):
+                not bug_is_fixed(2321, cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2321')
 
     def check_issue_2326(self, cfg):
@@ -112,7 +115,7 @@ class UtilsMixin():
         .. _issue #2326: https://pulp.plan.io/issues/2326
         """
         if (cfg.pulp_version >= Version('2.11') and
-                not selectors.bug_is_fixed(2326, cfg.pulp_version)):
+                not bug_is_fixed(2326, cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2326')
 
     def check_issue_2363(self, cfg):
@@ -121,7 +124,7 @@ class UtilsMixin():
         .. _issue #2363: https://pulp.plan.io/issues/2363
         """
         if (cfg.pulp_version >= Version('2.11') and
-                not selectors.bug_is_fixed(2363, cfg.pulp_version)):
+                not bug_is_fixed(2363, cfg.pulp_version)):
             self.skipTest('https://pulp.plan.io/issues/2363')
 
 
@@ -147,7 +150,7 @@ class GoodMirrorlistTestCase(UtilsMixin, unittest.TestCase):
         sync_repo(cfg, repo)
         publish_repo(cfg, repo)
         actual_rpm = get_unit(cfg, repo['distributors'][0], RPM).content
-        target_rpm = utils.http_get(RPM_UNSIGNED_URL)
+        target_rpm = http_get(RPM_UNSIGNED_URL)
         self.assertEqual(actual_rpm, target_rpm)
 
 
@@ -165,7 +168,7 @@ class GoodRelativeUrlTestCase(UtilsMixin, unittest.TestCase):
         sync_repo(cfg, repo)
         publish_repo(cfg, repo)
         actual_rpm = get_unit(cfg, repo['distributors'][0], RPM).content
-        target_rpm = utils.http_get(RPM_UNSIGNED_URL)
+        target_rpm = http_get(RPM_UNSIGNED_URL)
         self.assertEqual(actual_rpm, target_rpm)
 
 
@@ -189,7 +192,7 @@ class MixedMirrorlistTestCase(UtilsMixin, unittest.TestCase):
         sync_repo(cfg, repo)
         publish_repo(cfg, repo)
         actual_rpm = get_unit(cfg, repo['distributors'][0], RPM).content
-        target_rpm = utils.http_get(RPM_UNSIGNED_URL)
+        target_rpm = http_get(RPM_UNSIGNED_URL)
         self.assertEqual(actual_rpm, target_rpm)
 
 
@@ -207,7 +210,7 @@ class MixedRelativeUrlTestCase(UtilsMixin, unittest.TestCase):
         sync_repo(cfg, repo)
         publish_repo(cfg, repo)
         actual_rpm = get_unit(cfg, repo['distributors'][0], RPM).content
-        target_rpm = utils.http_get(RPM_UNSIGNED_URL)
+        target_rpm = http_get(RPM_UNSIGNED_URL)
         self.assertEqual(actual_rpm, target_rpm)
 
 
@@ -9,11 +9,9 @@ from types import MappingProxyType
 from urllib.parse import urljoin
 from xml.etree import ElementTree
 
-import pytest
-from jsonschema import validate
 from packaging.version import Version
 
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import (
     CONSUMERS_ACTIONS_CONTENT_REGENERATE_APPLICABILITY_PATH,
     CONSUMERS_CONTENT_APPLICABILITY_PATH,
@@ -29,6 +27,8 @@ from pulp_smash.pulp2.utils import (
     upload_import_unit,
 )
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     MODULE_ARTIFACT_RPM_DATA,
     MODULE_ARTIFACT_RPM_DATA_2,
@@ -52,6 +52,8 @@ from pulp_2_tests.constants import (
     RPM_WITH_OLD_VERSION_URL,
     RPM_WITH_VENDOR_URL,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.lazy import pytest_mark, validate
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_consumer,
     gen_distributor,
@@ -65,8 +67,9 @@ from pulp_2_tests.tests.rpm.utils import (
     gen_yum_config_file,
     os_support_modularity,
 )
+from pulp_2_tests.units import iter_units
 
-pytestmark = pytest.mark.recursive_conservative  # pylint:disable=invalid-name
+pytestmark = pytest_mark('recursive_conservative')  # pylint:disable=invalid-name
 
 
 # MappingProxyType is used to make an immutable dict.
@@ -165,7 +168,7 @@ class CheckIsModularFlagAfterSyncTestCase(unittest.TestCase):
         cfg = config.get_config()
         if cfg.pulp_version < Version('2.18'):
             raise unittest.SkipTest('This test requires Pulp 2.18 or newer.')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo(
             importer_config={'feed': RPM_WITH_MODULES_FEED_URL},
             distributors=[gen_distributor()]
@@ -225,17 +228,17 @@ class CheckIsModularFlagAfterRPMUploadTestCase(unittest.TestCase):
         cfg = config.get_config()
         if cfg.pulp_version < Version('2.20'):
             raise unittest.SkipTest('This test requires Pulp 2.20 or newer.')
-        if not selectors.bug_is_fixed(4869, cfg.pulp_version):
+        if not bug_is_fixed(4869, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/4869')
 
         # Setup Client and gen_repo
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
 
         # RPM Gets
-        modular_rpm = utils.http_get(RPM_WITH_MODULAR_URL)
-        non_modular_rpm = utils.http_get(RPM_WITH_VENDOR_URL)
+        modular_rpm = http_get(RPM_WITH_MODULAR_URL)
+        non_modular_rpm = http_get(RPM_WITH_VENDOR_URL)
 
         # Upload Units
         upload_import_unit(cfg, modular_rpm, {'unit_type_id': 'rpm'}, repo)
@@ -271,7 +274,7 @@ class CheckModulesYamlTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.18.1'):
             raise unittest.SkipTest('This test requires Pulp 2.18.1 or newer.')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_no_modules_yaml_generated_non_modular(self):
         """Verify no ``modules.yaml`` is generated for non modular content.
@@ -337,7 +340,7 @@ class CheckModulesYamlTestCase(unittest.TestCase):
     @staticmethod
     def list_repo_data_files(cfg, repo):
         """Return a list of all the files present inside repodata dir."""
-        return cli.Client(cfg).run((
+        return ssh.Client(cfg).run((
             'find',
             '/var/lib/pulp/published/yum/master/yum_distributor/{}/'.format(
                 repo['id']
@@ -363,7 +366,7 @@ class CheckModulesYamlTestCase(unittest.TestCase):
     @staticmethod
     def get_sha1_vals_file(cfg, filepath):
         """Return a list containing sha1 checksum of the file and filepath."""
-        return cli.Client(cfg).run((
+        return ssh.Client(cfg).run((
             'sha1sum',
             filepath
         ), sudo=True).stdout.split()
@@ -393,7 +396,7 @@ class CopyModularDefaultsTestCase(unittest.TestCase):
             raise unittest.SkipTest('This test requires Pulp 2.19 or newer.')
         if check_issue_4405(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/4405')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_copy_modulemd_defaults(self):
         """Test copy of modulemd_defaults in RPM repository."""
@@ -447,7 +450,7 @@ class CopyModularDefaultsTestCase(unittest.TestCase):
         self.addCleanup(self.client.delete, repos[1]['_href'])
         # Add `old_dependency` for OLD RPM on B
         if old_dependency:
-            rpm = utils.http_get(RPM_WITH_OLD_VERSION_URL)
+            rpm = http_get(RPM_WITH_OLD_VERSION_URL)
             upload_import_unit(
                 self.cfg,
                 rpm,
@@ -535,10 +538,10 @@ class CopyModulesTestCase(unittest.TestCase):
             )
         if check_issue_4405(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/4405')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         cls.COPY_MODULES_LIST = [MODULE_FIXTURES_PACKAGE_STREAM]
         if cls.cfg.pulp_version >= Version('2.20'):
-            if not selectors.bug_is_fixed(4962, cls.cfg.pulp_version):
+            if not bug_is_fixed(4962, cls.cfg.pulp_version):
                 raise unittest.SkipTest('https://pulp.plan.io/issues/4962')
             cls.COPY_MODULES_LIST.append(MODULE_FIXTURES_DUCK_4_STREAM)
             cls.COPY_MODULES_LIST.append(MODULE_FIXTURES_DUCK_5_STREAM)
@@ -619,7 +622,7 @@ class CopyModulesTestCase(unittest.TestCase):
         self.addCleanup(self.client.delete, repos[1]['_href'])
         # Add `old_rpm` for OLD RPM on B
         if old_rpm:
-            rpm = utils.http_get(module['old'])
+            rpm = http_get(module['old'])
             upload_import_unit(
                 self.cfg, rpm,
                 {'unit_type_id': 'rpm'},
@@ -657,7 +660,7 @@ class ManageModularContentTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.17'):
             raise unittest.SkipTest('This test requires Pulp 2.17 or newer.')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_sync_publish_repo(self):
         """Test sync and publish modular RPM repository."""
@@ -747,7 +750,7 @@ class ManageModularContentTestCase(unittest.TestCase):
 
     def test_remove_modulemd(self):
         """Test sync and remove modular RPM repository."""
-        if not selectors.bug_is_fixed(3985, self.cfg.pulp_version):
+        if not bug_is_fixed(3985, self.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3985')
         repo_initial = self.create_sync_modular_repo()
         criteria = {
@@ -824,7 +827,7 @@ class ManageModularErrataTestCase(unittest.TestCase):
             raise unittest.SkipTest('This test requires Pulp 2.18 or newer.')
         if check_issue_4405(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/4405')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_sync_publish_update_info(self):
         """Test sync,publish of Modular RPM repo and checks the update info.
@@ -1177,7 +1180,7 @@ class ModularApplicabilityTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.18'):
             raise unittest.SkipTest('This test requires Pulp 2.18 or newer.')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_modular_rpm(self):
         """Verify content is made available if appropriate.
@@ -1456,7 +1459,7 @@ class ModularErrataCopyTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.19'):
             raise unittest.SkipTest('This test requires Pulp 2.19 or newer.')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_recursive_noconservative_nodependency(self):
         """Recursive, non-conservative, and no old dependency."""
@@ -1487,7 +1490,8 @@ class ModularErrataCopyTestCase(unittest.TestCase):
         """Make assertions over a repo with an older version of RPM present."""
         versions = sorted([
             unit['metadata']['version']
-            for unit in search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(
+                self.cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
             if unit['metadata']['name'] == 'duck'
         ])
 
@@ -1580,7 +1584,7 @@ class ModularErrataCopyTestCase(unittest.TestCase):
             'recursive_conservative': recursive_conservative
         }
         if old_dependency:
-            rpm = utils.http_get(RPM_MODULAR_OLD_VERSION_URL)
+            rpm = http_get(RPM_MODULAR_OLD_VERSION_URL)
             upload_import_unit(
                 self.cfg,
                 rpm,
@@ -1616,7 +1620,7 @@ class PackageManagerModuleListTestCase(unittest.TestCase):
             raise unittest.SkipTest(
                 'This test requires an OS that supports modularity.'
             )
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo(
             importer_config={'feed': RPM_WITH_MODULES_FEED_URL},
             distributors=[gen_distributor()]
@@ -1637,7 +1641,7 @@ class PackageManagerModuleListTestCase(unittest.TestCase):
             name=repo['_href'],
             repositoryid=repo['id']
         )
-        cli_client = cli.Client(cfg)
+        cli_client = ssh.Client(cfg)
         self.addCleanup(cli_client.run, ('rm', repo_path), sudo=True)
         lines = cli_client.run((
             ('dnf', 'module', 'list', '--all')
@@ -1657,7 +1661,7 @@ class UploadModuleTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.17'):
             raise unittest.SkipTest('This test requires Pulp 2.17 or newer.')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_upload_module(self):
         """Verify whether uploaded module.yaml is updated in the pulp repo."""
@@ -1727,7 +1731,7 @@ class UploadModuleTestCase(unittest.TestCase):
         form ``repodata/[…]-modules.yaml.gz``.
         """
         repo_path = urljoin(path, 'repodata/repomd.xml')
-        response = utils.http_get(repo_path)
+        response = http_get(repo_path)
         root_elem = ElementTree.fromstring(response)
 
         # <ns0:repomd xmlns:ns0="http://linux.duke.edu/metadata/repo">
@@ -1745,7 +1749,7 @@ class UploadModuleTestCase(unittest.TestCase):
         ]
         xpath = '{{{}}}location'.format(RPM_NAMESPACES['metadata/repo'])
         relative_path = data_elements[0].find(xpath).get('href')
-        unit = utils.http_get(urljoin(path, relative_path))
+        unit = http_get(urljoin(path, relative_path))
         with io.BytesIO(unit) as compressed:
             with gzip.GzipFile(fileobj=compressed) as decompressed:
                 unit = decompressed.read()
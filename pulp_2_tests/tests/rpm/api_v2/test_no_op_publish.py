@@ -33,7 +33,9 @@ from pulp_smash import api, config, exceptions, utils
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import RPM_SIGNED_FEED_URL
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.rpm.utils import check_issue_2277, check_issue_3104
 from pulp_2_tests.tests.rpm.utils import set_up_module
@@ -66,7 +68,7 @@ def setUpModule():  # pylint:disable=invalid-name
         raise unittest.SkipTest('https://pulp.plan.io/issues/2277')
 
     # Create and sync a repository.
-    client = api.Client(cfg, api.json_handler)
+    client = http_pool.Client(cfg, api.json_handler)
     _CLEANUP.append((client.delete, [ORPHANS_PATH], {}))
     body = gen_repo()
     body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
@@ -112,7 +114,7 @@ class BaseTestCase(BaseAPITestCase):
         if inspect.getmro(cls)[0] == BaseTestCase:
             raise unittest.SkipTest('Abstract base class.')
         super().setUpClass()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         repo_href = client.post(REPOSITORY_PATH, gen_repo())['_href']
         cls.resources.add(repo_href)  # mark for deletion
         client.post(
@@ -130,7 +132,7 @@ class BaseTestCase(BaseAPITestCase):
     def test_first_publish(self):
         """Assert the first publish is a full publish."""
         call_report = self.call_reports[0]
-        last_task = next(api.poll_spawned_tasks(self.cfg, call_report))
+        last_task = poll_spawned_tasks(self.cfg, call_report)[0]
         self.assertIsInstance(last_task['result']['summary'], dict)
 
 
@@ -140,7 +142,7 @@ class NoOpPublishMixin():
     def test_second_publish_tasks(self):
         """Assert the second publish's last task reports a no-op publish."""
         call_report = self.call_reports[1]
-        last_task = next(api.poll_spawned_tasks(self.cfg, call_report))
+        last_task = poll_spawned_tasks(self.cfg, call_report)[0]
 
         if hasattr(self, 'cfg') and self.cfg.pulp_version < Version('2.10'):
             summary = 'Skipped. Nothing changed since last publish'
@@ -170,7 +172,7 @@ class PubTwiceTestCase(BaseTestCase, NoOpPublishMixin):
     def setUpClass(cls):
         """Publish a repository twice."""
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         distributor = cls.repo['distributors'][0]
         for _ in range(2):
             cls.call_reports.append(
@@ -188,7 +190,7 @@ class PubTwiceWithOverrideTestCase(BaseTestCase, NoOpPublishMixin):
     def setUpClass(cls):
         """Publish a repository twice, with an override config both times."""
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         relative_url = utils.uuid4() + '/'
         for _ in range(2):
             cls.call_reports.append(publish_repo(cls.cfg, cls.repo, {
@@ -209,7 +211,7 @@ class ChangeRepoTestCase(BaseTestCase):
         super().setUpClass()
         if check_issue_3104(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         relative_url = cls.repo['distributors'][0]['config']['relative_url']
 
         # Publish, remove a unit, and publish again
@@ -229,7 +231,7 @@ class ChangeRepoTestCase(BaseTestCase):
     def test_second_publish_tasks(self):
         """Assert the second publish's last task reports a no-op publish."""
         call_report = self.call_reports[1]
-        last_task = next(api.poll_spawned_tasks(self.cfg, call_report))
+        last_task = poll_spawned_tasks(self.cfg, call_report)[0]
         self.assertIsInstance(last_task['result']['summary'], dict, last_task)
 
     def test_second_publish_repomd(self):
@@ -15,21 +15,26 @@ import unittest
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, config, selectors
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_DATA, RPM_SIGNED_FEED_URL
+from pulp_2_tests.orphans import (
+    count_orphans,
+    delete_orphans,
+    get_orphan_counts,
+    sample_orphans,
+)
+from pulp_2_tests.repo_cache import invalidate_source_repos
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_repo
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 from pulp_2_tests.tests.rpm.utils import skip_if
 
 
-def _count_orphans(orphans):
-    """Count the total number of orphans across all content types."""
-    return sum(content_type['count'] for content_type in orphans.values())
-
-
 class OrphansTestCase(unittest.TestCase):
     """Establish that API calls related to orphans function correctly.
 
@@ -46,10 +51,13 @@ class OrphansTestCase(unittest.TestCase):
         """Create orphans.
 
         Create, sync and delete an RPM repository. Doing this creates orphans
-        that the test methods can make use of.
+        that the test methods can make use of. Shared source repositories are
+        discarded beforehand, as they would keep some units from becoming
+        orphans.
         """
+        invalidate_source_repos()
         cls.cfg = config.get_config()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
         repo = client.post(REPOSITORY_PATH, body)
@@ -67,8 +75,8 @@ class OrphansTestCase(unittest.TestCase):
         skip based on this variable. If this method fails, it may indicate that
         other repositories exist and have references to the same content units.
         """
-        orphans = api.Client(config.get_config()).get(ORPHANS_PATH).json()
-        actual_count = _count_orphans(orphans)
+        orphans = get_orphan_counts(self.cfg)
+        actual_count = sum(orphans.values())
         # Support for package langpacks has been added in Pulp 2.9. In earlier
         # versions, langpacks are ignored.
         expected_count = RPM_DATA['metadata']['size']['installed']
@@ -80,10 +88,8 @@ class OrphansTestCase(unittest.TestCase):
     @skip_if(bool, 'orphans_available', False)
     def test_01_get_by_href(self):
         """Get an orphan by its href."""
-        client = api.Client(config.get_config())
-        orphans = client.get(urljoin(ORPHANS_PATH, 'erratum/')).json()
-        orphan = random.choice(orphans)
-        response = client.get(orphan['_href'])
+        orphan = self.choose_orphan()
+        response = http_pool.Client(self.cfg).get(orphan['_href'])
         with self.subTest(comment='verify status code'):
             self.assertEqual(response.status_code, 200)
         with self.subTest(comment='verify href'):
@@ -92,18 +98,17 @@ class OrphansTestCase(unittest.TestCase):
     @skip_if(bool, 'orphans_available', False)
     def test_01_get_by_invalid_type(self):
         """Get orphans by content type. Specify a non-existent content type."""
-        client = api.Client(config.get_config(), api.echo_handler)
+        client = http_pool.Client(config.get_config(), api.echo_handler)
         response = client.get(urljoin(ORPHANS_PATH, 'foo/'))
         self.assertEqual(response.status_code, 404)
 
     @skip_if(bool, 'orphans_available', False)
     def test_02_delete_by_href(self):
         """Delete an orphan by its href."""
-        client = api.Client(config.get_config(), api.json_handler)
-        orphans_pre = client.get(ORPHANS_PATH)
-        orphan = random.choice(client.get(urljoin(ORPHANS_PATH, 'erratum/')))
-        client.delete(orphan['_href'])
-        orphans_post = client.get(ORPHANS_PATH)
+        orphans_pre = get_orphan_counts(self.cfg)
+        orphan = self.choose_orphan()
+        http_pool.Client(self.cfg, api.json_handler).delete(orphan['_href'])
+        orphans_post = get_orphan_counts(self.cfg)
         self.check_one_orphan_deleted(orphans_pre, orphans_post, orphan)
 
     @skip_if(bool, 'orphans_available', False)
@@ -112,79 +117,83 @@ class OrphansTestCase(unittest.TestCase):
 
         This test exercises `Pulp #1923 <https://pulp.plan.io/issues/1923>`_.
         """
-        client = api.Client(config.get_config(), api.json_handler)
-        orphans_pre = client.get(ORPHANS_PATH)
-        orphan = random.choice(client.get(urljoin(ORPHANS_PATH, 'erratum/')))
-        client.post('pulp/api/v2/content/actions/delete_orphans/', [{
-            'content_type_id': 'erratum',
-            'unit_id': orphan['_id'],
-        }])
-        orphans_post = client.get(ORPHANS_PATH)
+        orphans_pre = get_orphan_counts(self.cfg)
+        orphan = self.choose_orphan()
+        delete_orphans(self.cfg, [orphan])
+        orphans_post = get_orphan_counts(self.cfg)
         self.check_one_orphan_deleted(orphans_pre, orphans_post, orphan)
 
     @skip_if(bool, 'orphans_available', False)
     def test_03_delete_by_content_type(self):
         """Delete orphans by their content type."""
-        client = api.Client(self.cfg, api.json_handler)
-        orphans_pre = client.get(ORPHANS_PATH)
+        client = http_pool.Client(self.cfg, api.json_handler)
+        orphans_pre = get_orphan_counts(self.cfg)
         call_report = client.delete(urljoin(ORPHANS_PATH, 'erratum/'))
-        orphans_post = client.get(ORPHANS_PATH)
+        orphans_post = get_orphan_counts(self.cfg)
         with self.subTest(comment='verify "result" field'):
-            if not selectors.bug_is_fixed(1268, self.cfg.pulp_version):
+            if not bug_is_fixed(1268, self.cfg.pulp_version):
                 self.skipTest('https://pulp.plan.io/issues/1268')
-            task = tuple(api.poll_spawned_tasks(self.cfg, call_report))[-1]
+            task = poll_spawned_tasks(self.cfg, call_report)[-1]
             self.assertIsInstance(task['result'], int)
             self.assertGreater(task['result'], 0)
         with self.subTest(comment='verify total count'):
             self.assertEqual(
-                _count_orphans(orphans_pre) - orphans_pre['erratum']['count'],
-                _count_orphans(orphans_post),
+                sum(orphans_pre.values()) - orphans_pre['erratum'],
+                sum(orphans_post.values()),
                 orphans_post,
             )
         with self.subTest(comment='verify erratum count'):
-            self.assertEqual(orphans_post['erratum']['count'], 0, orphans_post)
+            self.assertEqual(orphans_post['erratum'], 0, orphans_post)
 
     def test_04_delete_all(self):
         """Delete all orphans."""
-        call_report = api.Client(self.cfg).delete(ORPHANS_PATH).json()
-        if not selectors.bug_is_fixed(1268, self.cfg.pulp_version):
+        call_report = http_pool.Client(self.cfg).delete(ORPHANS_PATH).json()
+        if not bug_is_fixed(1268, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1268')
-        task = tuple(api.poll_spawned_tasks(self.cfg, call_report))[-1]
+        task = poll_spawned_tasks(self.cfg, call_report)[-1]
         self.assertIsInstance(task['result'], dict)
         self.assertGreater(sum(task['result'].values()), 0)
 
     def test_05_no_orphans_exist(self):
         """Assert no orphans exist."""
-        orphans = api.Client(config.get_config()).get(ORPHANS_PATH).json()
-        self.assertEqual(_count_orphans(orphans), 0, orphans)
+        self.assertEqual(count_orphans(self.cfg), 0)
+
+    def choose_orphan(self):
+        """Return a random erratum orphan.
+
+        Orphans are sampled from a random point among all errata. If none are
+        found there, as may happen on a host with many errata in
+        repositories, every erratum orphan is listed instead.
+        """
+        orphans = sample_orphans(self.cfg, 'erratum', 10)
+        if not orphans:
+            orphans = http_pool.Client(self.cfg, api.json_handler).get(
+                urljoin(ORPHANS_PATH, 'erratum/'))
+        return random.choice(orphans)
 
     def check_one_orphan_deleted(self, orphans_pre, orphans_post, orphan):
         """Ensure that a specific orphan is well and truly deleted.
 
-        :param orphans_pre: The response to GET
-            ``pulp_smash.pulp2.constants.ORPHANS_PATH`` before the orphan was
-            deleted.
-        :param orphans_post: The response to GET
-            ``pulp_smash.pulp2.constants.ORPHANS_PATH`` after the orphan was
-            deleted.
+        :param orphans_pre: The orphan counts, as returned by
+            :func:`pulp_2_tests.orphans.get_orphan_counts`, before the orphan
+            was deleted.
+        :param orphans_post: The orphan counts after the orphan was deleted.
         :param orphan: A dict describing the orphan that was deleted.
         :returns: Nothing.
         """
         with self.subTest(comment='verify total count'):
             self.assertEqual(
-                _count_orphans(orphans_pre) - 1,
-                _count_orphans(orphans_post),
+                sum(orphans_pre.values()) - 1,
+                sum(orphans_post.values()),
                 orphan,
             )
         with self.subTest(comment='verify erratum count'):
             self.assertEqual(
-                orphans_pre['erratum']['count'] - 1,
-                orphans_post['erratum']['count'],
+                orphans_pre['erratum'] - 1,
+                orphans_post['erratum'],
                 orphan,
             )
-        response = api.Client(
-            config.get_config(),
-            api.echo_handler
-        ).get(orphan['_href'])
+        response = http_pool.Client(self.cfg, api.echo_handler).get(
+            orphan['_href'])
         with self.subTest(comment='verify erratum is unavailable'):
             self.assertEqual(response.status_code, 404)
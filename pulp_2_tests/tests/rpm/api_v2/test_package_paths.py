@@ -31,10 +31,12 @@ situations.
 """
 import unittest
 
-from pulp_smash import api, config, selectors
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     RPM,
     RPM_ALT_LAYOUT_FEED_URL,
@@ -85,7 +87,7 @@ class ReuseContentTestCase(unittest.TestCase):
         if check_issue_2354(cfg):
             self.skipTest('https://pulp.plan.io/issues/2354')
         if (os_is_f26(cfg) and
-                not selectors.bug_is_fixed(3036, cfg.pulp_version)):
+                not bug_is_fixed(3036, cfg.pulp_version)):
             # Here, the calls to get_unit() cause pulp_streamer.service to die
             # without logging out anything. In Pulp #3036, certain actions
             # cause pulp_streamer.service to die while logging out a core dump.
@@ -115,7 +117,7 @@ class ReuseContentTestCase(unittest.TestCase):
         test. Return a detailed dict of information about the just-created
         repository.
         """
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = feed
         body['importer_config']['download_policy'] = download_policy
@@ -8,11 +8,14 @@ import random
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import api, config, selectors
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, search_units, sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_SIGNED_FEED_URL, RPM_UNSIGNED_FEED_URL
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.rpm.utils import (
     check_issue_2277,
@@ -60,7 +63,7 @@ class RemoveMissingTestCase(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Delete all resources named by ``resources``."""
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         for repo in cls.repos.values():
             client.delete(repo['_href'])
         client.delete(ORPHANS_PATH)
@@ -70,7 +73,7 @@ class RemoveMissingTestCase(unittest.TestCase):
 
         The repositories created in later steps sync from this one.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -87,7 +90,7 @@ class RemoveMissingTestCase(unittest.TestCase):
         """
         # We disable SSL validation for a practical reason: each HTTPS feed
         # must have a certificate to work, which is burdensome to do here.
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = urljoin(
             self.cfg.get_base_url(),
@@ -116,7 +119,7 @@ class RemoveMissingTestCase(unittest.TestCase):
         the child repository, and verify it has the same contents as the root
         repository.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = urljoin(
             self.cfg.get_base_url(),
@@ -146,7 +149,7 @@ class RemoveMissingTestCase(unittest.TestCase):
             'filters': {'unit': {'name': unit['metadata']['name']}},
             'type_ids': [unit['unit_type_id']],
         }
-        api.Client(self.cfg).post(
+        http_pool.Client(self.cfg).post(
             urljoin(self.repos['root']['_href'], 'actions/unassociate/'),
             {'criteria': criteria}
         ).json()
@@ -203,11 +206,11 @@ class RemoveCountTestCase(unittest.TestCase):
         """Re-sync a child repository with the ``remove_missing`` enabled."""
         repos = []
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2616, cfg.pulp_version):
+        if not bug_is_fixed(2616, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2616')
 
         # Create 1st repo, sync and publish it.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -246,7 +249,7 @@ class RemoveCountTestCase(unittest.TestCase):
 
         # Re-sync 2nd repo.
         report = sync_repo(cfg, repos[1])
-        tasks = tuple(api.poll_spawned_tasks(cfg, report.json()))
+        tasks = poll_spawned_tasks(cfg, report.json())
         self.assertEqual(
             tasks[0]['result']['removed_count'],
             len(marked_units),
@@ -268,4 +271,5 @@ def _get_rpm_ids(search_body):
 
 def _get_details(cfg, repo):
     """Get detailed information about the given repository."""
-    return api.Client(cfg).get(repo['_href'], params={'details': True}).json()
+    return http_pool.Client(cfg).get(
+        repo['_href'], params={'details': True}).json()
@@ -7,10 +7,12 @@ import os
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, sync_repo
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_NAMESPACES, RPM_UNSIGNED_FEED_URL
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
@@ -44,11 +46,11 @@ class RepoMDTestCase(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up class-wide resources."""
         if cls.repo:
-            api.Client(cls.cfg).delete(cls.repo['_href'])
+            http_pool.Client(cls.cfg).delete(cls.repo['_href'])
 
     def test_01_set_up(self):
         """Create and publish a repo, and fetch and parse its ``repomd.xml``."""
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['distributors'] = [gen_distributor()]
         self.repo.update(client.post(REPOSITORY_PATH, body))
@@ -115,7 +117,7 @@ class FastForwardIntegrityTestCase(unittest.TestCase):
     def test_all(self):
         """Ensure fast-forward publishes use files referenced by repomd.xml."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1088, cfg.pulp_version):
+        if not bug_is_fixed(1088, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1088')
         repo = self._create_sync_repo(cfg)
         old_phrase = 'A dummy package of'
@@ -129,7 +131,8 @@ class FastForwardIntegrityTestCase(unittest.TestCase):
 
         # Create a dummy-primary.xml. Trigger a regular publish.
         self._create_dummy_primary_xml(cfg, repo, old_phrase, new_phrase)
-        api.Client(cfg).post(urljoin(repo['_href'], 'actions/unassociate/'), {
+        client = http_pool.Client(cfg)
+        client.post(urljoin(repo['_href'], 'actions/unassociate/'), {
             'criteria': {
                 'filters': {'unit': {'name': 'bear'}},
                 'type_ids': ['rpm'],
@@ -171,7 +174,7 @@ class FastForwardIntegrityTestCase(unittest.TestCase):
             dummy_xml_path += '.gz'
 
         # Alter bogus-primary.xml.
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
         client.run(['cp', primary_xml_path, dummy_xml_path])
         if gzipped:
             client.run(['gunzip', dummy_xml_path])
@@ -194,14 +197,14 @@ class FastForwardIntegrityTestCase(unittest.TestCase):
             cmd = ['gunzip', '--to-stdout', primary_xml_path]
         else:
             cmd = ['cat', primary_xml_path]
-        return cli.Client(cfg).run(cmd).stdout
+        return ssh.Client(cfg).run(cmd).stdout
 
     def _create_sync_repo(self, cfg):
         """Create and sync a repository. Return a detailed dict of repo info.
 
         Also, schedule the repository for deletion with ``addCleanup()``.
         """
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -219,7 +222,7 @@ class FastForwardIntegrityTestCase(unittest.TestCase):
         repository's ``[…]-primary.xml`` file. The path is likely to be in the
         form ``repodata/[…]-primary.xml.gz``.
         """
-        client = api.Client(cfg, xml_handler)
+        client = http_pool.Client(cfg, xml_handler)
         path = urljoin(
             '/pulp/repos/',
             repo['distributors'][0]['config']['relative_url']
@@ -22,6 +22,7 @@ from pulp_smash import api
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import RPM_NAMESPACES, RPM_SIGNED_FEED_URL
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
@@ -45,7 +46,7 @@ def get_parse_repodata_xml(cfg, distributor, file_path):
     """
     path = urljoin('/pulp/repos/', distributor['config']['relative_url'])
     path = urljoin(path, file_path)
-    return api.Client(cfg, xml_handler).get(path)
+    return http_pool.Client(cfg, xml_handler).get(path)
 
 
 def get_parse_repodata_primary_xml(cfg, distributor):
@@ -114,7 +115,7 @@ class RepositoryLayoutTestCase(BaseAPITestCase):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
         if check_issue_2277(self.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2277')
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
         repo = client.post(REPOSITORY_PATH, body)
@@ -12,11 +12,15 @@ import unittest
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, upload_import_unit
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
+from pulp_2_tests.capabilities import get_capabilities
 from pulp_2_tests.constants import RPM_UNSIGNED_URL
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 
@@ -40,16 +44,16 @@ class RepoviewTestCase(unittest.TestCase):
         cfg = config.get_config()
         if cfg.pulp_version < Version('2.9'):
             self.skipTest('https://pulp.plan.io/issues/189')
-        if utils.fips_is_supported(cfg) and utils.fips_is_enabled(cfg):
+        if get_capabilities(cfg).fips_enabled:
             self.skipTest('https://pulp.plan.io/issues/3775')
 
         # Create a repo, and add content
-        client = api.Client(cfg)
+        client = http_pool.Client(cfg)
         body = gen_repo()
         body['distributors'] = [gen_distributor()]
         repo = client.post(REPOSITORY_PATH, body).json()
         self.addCleanup(client.delete, repo['_href'])
-        rpm = utils.http_get(RPM_UNSIGNED_URL)
+        rpm = http_get(RPM_UNSIGNED_URL)
         upload_import_unit(cfg, rpm, {'unit_type_id': 'rpm'}, repo)
 
         # Get info about the repo distributor
@@ -79,7 +83,7 @@ class RepoviewTestCase(unittest.TestCase):
             )
 
         # Publish the repo a third time
-        if not selectors.bug_is_fixed(2349, cfg.pulp_version):
+        if not bug_is_fixed(2349, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2349')
         publish_repo(cfg, repo)
         response = client.get(pub_path)
@@ -6,7 +6,7 @@ import unittest
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import (
     publish_repo,
@@ -15,11 +15,14 @@ from pulp_smash.pulp2.utils import (
     upload_import_unit,
 )
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     RPM2_UNSIGNED_URL,
     RPM_UNSIGNED_FEED_URL,
     RPM_UNSIGNED_URL,
 )
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
@@ -55,7 +58,7 @@ class UnassociateTestCase(unittest.TestCase):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2620')
 
         # Create, sync and publish a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -113,7 +116,7 @@ class RemoveOldRepodataTestCase(unittest.TestCase):
 
         Assert that there are more metadata files after the second publish.
         """
-        if not selectors.bug_is_fixed(2788, self.cfg.pulp_version):
+        if not bug_is_fixed(2788, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2788')
         found = self.do_test({
             'generate_sqlite': True,
@@ -132,9 +135,9 @@ class RemoveOldRepodataTestCase(unittest.TestCase):
         """
         if self.cfg.pulp_version < Version('2.17.1'):
             self.skipTest('This test requires Pulp version 2.17.1 or newer.')
-        if not selectors.bug_is_fixed(3816, self.cfg.pulp_version):
+        if not bug_is_fixed(3816, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3816')
-        if not selectors.bug_is_fixed(2788, self.cfg.pulp_version):
+        if not bug_is_fixed(2788, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2788')
         found = self.do_test({
             'generate_sqlite': True,
@@ -148,7 +151,7 @@ class RemoveOldRepodataTestCase(unittest.TestCase):
 
         Assert there are more metadata files after the second publish.
         """
-        if not selectors.bug_is_fixed(2788, self.cfg.pulp_version):
+        if not bug_is_fixed(2788, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2788')
         found = self.do_test({
             'generate_sqlite': True,
@@ -169,12 +172,12 @@ class RemoveOldRepodataTestCase(unittest.TestCase):
     def do_test(self, distributor_config_update):
         """Implement most of the test logic."""
         rpms = tuple(
-            utils.http_get(url)
+            http_get(url)
             for url in (RPM_UNSIGNED_URL, RPM2_UNSIGNED_URL)
         )
 
         # Create a repository.
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['distributors'] = [gen_distributor()]
         body['distributors'][0]['distributor_config'].update(
@@ -185,7 +188,7 @@ class RemoveOldRepodataTestCase(unittest.TestCase):
         repo = client.get(repo['_href'], params={'details': True})
 
         # Upload an RPM, publish the repo, and count metadata files twice.
-        cli_client = cli.Client(self.cfg)
+        cli_client = ssh.Client(self.cfg)
         find_repodata_cmd = (
             'find',
             os.path.join(
@@ -16,6 +16,7 @@ from pulp_smash import api
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import RPM_UNSIGNED_FEED_URL
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.rpm.utils import check_issue_3104
@@ -34,7 +35,7 @@ class RetainOldCountTestCase(BaseAPITestCase):
         super().setUpClass()
         if check_issue_3104(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -80,7 +81,7 @@ class RetainOldCountTestCase(BaseAPITestCase):
         """
         # We disable SSL validation for a practical reason: each HTTPS feed
         # must have a certificate to work, which is burdensome to do here.
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = urljoin(
             self.cfg.get_base_url(),
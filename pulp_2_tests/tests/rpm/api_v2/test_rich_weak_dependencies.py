@@ -3,9 +3,8 @@
 import unittest
 from urllib.parse import urljoin
 
-import pytest
 from packaging.version import Version
-from pulp_smash import api, cli, config, utils
+from pulp_smash import api, cli, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import (
     publish_repo,
@@ -15,18 +14,22 @@ from pulp_smash.pulp2.utils import (
     upload_import_unit,
 )
 
+from pulp_2_tests import http_pool, ssh
 from pulp_2_tests.constants import (
     RPM_RICH_WEAK,
     RPM_RICH_WEAK_FEED_URL,
     RPM2_RICH_WEAK_DATA,
     SRPM_RICH_WEAK_FEED_URL,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.lazy import pytest_mark
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.rpm.utils import (
     gen_yum_config_file,
     rpm_rich_weak_dependencies,
 )
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
+from pulp_2_tests.units import iter_units
 
 
 class SyncPublishTestCase(unittest.TestCase):
@@ -38,7 +41,7 @@ class SyncPublishTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.17'):
             raise unittest.SkipTest('This test requires Pulp 2.17 or newer.')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_rpm(self):
         """Sync and publish an RPM repo. See :meth:`do_test`."""
@@ -89,10 +92,10 @@ class UploadRPMTestCase(unittest.TestCase):
         cfg = config.get_config()
         if cfg.pulp_version < Version('2.17'):
             raise unittest.SkipTest('This test requires Pulp 2.17 or newer.')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
-        rpm = utils.http_get(urljoin(RPM_RICH_WEAK_FEED_URL + '/', RPM_RICH_WEAK))
+        rpm = http_get(urljoin(RPM_RICH_WEAK_FEED_URL + '/', RPM_RICH_WEAK))
         upload_import_unit(cfg, rpm, {'unit_type_id': 'rpm'}, repo)
         units = search_units(cfg, repo)
 
@@ -113,7 +116,7 @@ class PackageManagerConsumeRPMTestCase(unittest.TestCase):
             raise unittest.SkipTest('This test requires Pulp 2.17 or newer.')
         if not rpm_rich_weak_dependencies(cfg):
             raise unittest.SkipTest('This test requires RPM 4.12 or newer.')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo(
             importer_config={'feed': RPM_RICH_WEAK_FEED_URL},
             distributors=[gen_distributor()]
@@ -132,7 +135,7 @@ class PackageManagerConsumeRPMTestCase(unittest.TestCase):
             name=repo['_href'],
             repositoryid=repo['id']
         )
-        cli_client = cli.Client(cfg)
+        cli_client = ssh.Client(cfg)
         self.addCleanup(cli_client.run, ('rm', repo_path), sudo=True)
         rpm_name = 'Cobbler'
         pkg_mgr = cli.PackageManager(cfg)
@@ -162,7 +165,7 @@ class SearchContentTestCase(unittest.TestCase):
         if cfg.pulp_version < Version('2.17.1'):
             raise unittest.SkipTest('This test requires Pulp 2.17.1 or newer.')
         pulp_admin_login(cfg)
-        api_client = api.Client(cfg, api.json_handler)
+        api_client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo(
             importer_config={'feed': RPM_RICH_WEAK_FEED_URL},
         )
@@ -171,7 +174,7 @@ class SearchContentTestCase(unittest.TestCase):
         sync_repo(cfg, repo)
         repo = api_client.get(repo['_href'], params={'details': True})
 
-        result = cli.Client(cfg).run(
+        result = ssh.Client(cfg).run(
             'pulp-admin rpm repo content rpm --repo-id {} '
             '--match name=Cobbler'
             .format(repo['id']).split()
@@ -182,7 +185,7 @@ class SearchContentTestCase(unittest.TestCase):
                 self.assertEqual(result.stdout.count(field), 1, result)
 
 
-@pytest.mark.recursive_conservative
+@pytest_mark('recursive_conservative')
 class CopyRecursiveUnitsTestCase(unittest.TestCase):
     """Test copy units for a repository rich/weak dependencies.
 
@@ -202,7 +205,7 @@ class CopyRecursiveUnitsTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.17'):
             raise unittest.SkipTest('This test requires Pulp 2.17 or newer.')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_recursive(self):
         """Test recursive copy for a repository with rich/weak dependencies.
@@ -212,7 +215,7 @@ class CopyRecursiveUnitsTestCase(unittest.TestCase):
         repo = self.do_test(True, False)
         dst_unit_ids = [
             unit['metadata']['name'] for unit in
-            search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            iter_units(self.cfg, repo, {'type_ids': ['rpm']}, ('name',))
         ]
         self.assertEqual(
             len(dst_unit_ids),
@@ -230,7 +233,7 @@ class CopyRecursiveUnitsTestCase(unittest.TestCase):
         repo = self.do_test(True, True)
         dst_unit_ids = [
             unit['metadata']['name'] for unit in
-            search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            iter_units(self.cfg, repo, {'type_ids': ['rpm']}, ('name',))
         ]
         self.assertEqual(
             len(dst_unit_ids),
@@ -246,7 +249,7 @@ class CopyRecursiveUnitsTestCase(unittest.TestCase):
         repo = self.do_test(False, False)
         dst_unit_ids = [
             unit['metadata']['name'] for unit in
-            search_units(self.cfg, repo, {'type_ids': ['rpm']})
+            iter_units(self.cfg, repo, {'type_ids': ['rpm']}, ('name',))
         ]
         self.assertEqual(len(dst_unit_ids), 1, dst_unit_ids)
 
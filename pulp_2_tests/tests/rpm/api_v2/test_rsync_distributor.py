@@ -57,11 +57,13 @@ import unittest
 from urllib.parse import urljoin, urlparse
 
 from packaging.version import Version
-from pulp_smash import api, cli, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import publish_repo, sync_repo, upload_import_unit
 from requests.exceptions import HTTPError
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     RPM2_UNSIGNED_URL,
     RPM_SIGNED_FEED_COUNT,
@@ -69,6 +71,9 @@ from pulp_2_tests.constants import (
     RPM_UNSIGNED_URL,
     RPM_YUM_METADATA_FILE,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.remote_fs import take_snapshot
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     DisableSELinuxMixin,
     TemporaryUserMixin,
@@ -107,9 +112,9 @@ def setUpModule():  # pylint:disable=invalid-name
     """
     set_up_module()
     cfg = config.get_config()
-    if not selectors.bug_is_fixed(1759, cfg.pulp_version):
+    if not bug_is_fixed(1759, cfg.pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/1759')
-    if not selectors.bug_is_fixed(3313, cfg.pulp_version) and os_is_f27(cfg):
+    if not bug_is_fixed(3313, cfg.pulp_version) and os_is_f27(cfg):
         raise unittest.SkipTest('https://pulp.plan.io/issues/3313')
     if cfg.pulp_selinux_enabled:
         set_pulp_manage_rsync(cfg, True)
@@ -118,7 +123,7 @@ def setUpModule():  # pylint:disable=invalid-name
 def tearDownModule():  # pylint:disable=invalid-name
     """Delete orphan content units."""
     cfg = config.get_config()
-    api.Client(cfg).delete(ORPHANS_PATH)
+    http_pool.Client(cfg).delete(ORPHANS_PATH)
     if cfg.pulp_selinux_enabled:
         set_pulp_manage_rsync(cfg, False)
 
@@ -152,7 +157,7 @@ class _RsyncDistUtilsMixin():  # pylint:disable=too-few-public-methods
         """
         if feed_url is None:
             feed_url = RPM_SIGNED_FEED_URL
-        api_client = api.Client(cfg, api.json_handler)
+        api_client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = feed_url
         body['distributors'] = [gen_distributor()]
@@ -180,7 +185,7 @@ class _RsyncDistUtilsMixin():  # pylint:disable=too-few-public-methods
         :returns: Nothing.
         """
         tasks = [
-            task for task in api.poll_spawned_tasks(cfg, call_report)
+            task for task in poll_spawned_tasks(cfg, call_report)
             if task['task_type'] == 'pulp.server.managers.repo.publish.publish'
         ]
         self.assertEqual(len(tasks), 1, tasks)
@@ -221,19 +226,16 @@ class _RsyncDistUtilsMixin():  # pylint:disable=too-few-public-methods
         """
         if num_units is None:
             num_units = RPM_SIGNED_FEED_COUNT
-        cli_client = cli.Client(cfg)
-        path = distributor_cfg['config']['remote']['root']
+        snapshot = take_snapshot(
+            cfg, distributor_cfg['config']['remote']['root'])
         remote_units_path = (
             distributor_cfg['config'].get('remote_units_path', 'content/units')
         )
+        parent = ''
         for segment in _split_path(remote_units_path):
-            cmd = ('ls', '-1', path)
-            files = set(
-                cli_client.run(cmd, sudo=True).stdout.strip().split('\n'))
-            self.assertIn(segment, files)
-            path = os.path.join(path, segment)
-        cmd = ('find', path, '-name', '*.rpm')
-        files = cli_client.run(cmd, sudo=True).stdout.strip().split('\n')
+            self.assertIn(segment, snapshot.listdir(parent))
+            parent = os.path.join(parent, segment)
+        files = snapshot.glob(os.path.join(parent, '*.rpm'))
         self.assertEqual(len(files), num_units, files)
 
     @staticmethod
@@ -250,8 +252,7 @@ class _RsyncDistUtilsMixin():  # pylint:disable=too-few-public-methods
         :returns: set of file/directory names
         """
         path = distributor_cfg['config']['remote']['root']
-        cmd = ('ls', '-1', path)
-        return set(cli.Client(cfg).run(cmd, sudo=True).stdout.splitlines())
+        return set(take_snapshot(cfg, path, max_depth=1).listdir())
 
 
 class PublishBeforeYumDistTestCase(
@@ -280,7 +281,7 @@ class PublishBeforeYumDistTestCase(
     def test_all(self):
         """Publish the rpm rsync distributor before the yum distributor."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2187, cfg.pulp_version):
+        if not bug_is_fixed(2187, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2187')
 
         # Create a user and a repository.
@@ -303,7 +304,7 @@ class PublishBeforeYumDistTestCase(
         self.assertNotIn('content', dirs)
 
         # Publish with the rsync distributor again, and verify again.
-        if selectors.bug_is_fixed(2722, cfg.pulp_version):
+        if bug_is_fixed(2722, cfg.pulp_version):
             self.verify_publish_is_skip(cfg, publish_repo(*args).json())
             dirs = self.remote_root_files(cfg,
                                           distribs['rpm_rsync_distributor'])
@@ -345,7 +346,7 @@ class ForceFullTestCase(
     def test_all(self):
         """Use the ``force_full`` RPM rsync distributor option."""
         cfg = config.get_config()
-        cli_client = cli.Client(cfg)
+        cli_client = ssh.Client(cfg)
 
         # Create a user and repo with an importer and distribs. Sync the repo.
         ssh_user, priv_key = self.make_user(cfg)
@@ -380,7 +381,7 @@ class ForceFullTestCase(
 
         # Publish the repo with ``force_full`` set to true. Verify that the RPM
         # rsync distributor placed files.
-        if not selectors.bug_is_fixed(2202, cfg.pulp_version):
+        if not bug_is_fixed(2202, cfg.pulp_version):
             return
         publish_repo(cfg, repo, {
             'id': distribs['rpm_rsync_distributor']['id'],
@@ -442,9 +443,9 @@ class VerifyOptionsTestCase(_RsyncDistUtilsMixin, unittest.TestCase):
 
     def test_predistributor_id(self):
         """Pass a bogus ID as the ``predistributor_id`` config option."""
-        if not selectors.bug_is_fixed(2191, self.cfg.pulp_version):
+        if not bug_is_fixed(2191, self.cfg.pulp_version):
             raise self.skipTest('https://pulp.plan.io/issues/2191')
-        api_client = api.Client(self.cfg, api.json_handler)
+        api_client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -465,7 +466,7 @@ class VerifyOptionsTestCase(_RsyncDistUtilsMixin, unittest.TestCase):
 
     def test_root(self):
         """Pass a relative path to the ``root`` configuration option."""
-        if not selectors.bug_is_fixed(2192, self.cfg.pulp_version):
+        if not bug_is_fixed(2192, self.cfg.pulp_version):
             raise self.skipTest('https://pulp.plan.io/issues/2192')
         remote = self.remote.copy()
         remote['root'] = remote['root'][1:]
@@ -564,9 +565,9 @@ class DeleteTestCase(
     def test_all(self):
         """Use the ``delete`` RPM rsync distributor option."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2221, cfg.pulp_version):
+        if not bug_is_fixed(2221, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2221')
-        api_client = api.Client(cfg)
+        api_client = http_pool.Client(cfg)
 
         # Create a user and repo with an importer and distribs. Sync the repo.
         ssh_user, priv_key = self.make_user(cfg)
@@ -608,7 +609,7 @@ class DeleteTestCase(
 
     def _verify_units_not_in_repo(self, cfg, repo_href):
         """Verify no content units are in the specified repository."""
-        repo = api.Client(cfg).get(repo_href).json()
+        repo = http_pool.Client(cfg).get(repo_href).json()
         for key, val in repo['content_unit_counts'].items():
             with self.subTest(key=key):
                 self.assertEqual(val, 0)
@@ -624,9 +625,8 @@ class DeleteTestCase(
             rpm_rsync_distributor['config']['remote']['root'],
             yum_distributor['config']['relative_url'],
         )
-        cmd = ['find', path, '-name', '*.rpm']
-        files = cli.Client(cfg).run(cmd, sudo=True).stdout.strip().split('\n')
-        self.assertEqual(files, [''])  # strange, but correct
+        files = take_snapshot(cfg, path).glob('*.rpm')
+        self.assertEqual(files, [])
 
 
 class AddUnitTestCase(
@@ -659,10 +659,10 @@ class AddUnitTestCase(
     def test_all(self):
         """Add a content unit to a repo in the middle of several publishes."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2532, cfg.pulp_version):
+        if not bug_is_fixed(2532, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2532')
         rpms = (
-            utils.http_get(RPM_UNSIGNED_URL), utils.http_get(RPM2_UNSIGNED_URL)
+            http_get(RPM_UNSIGNED_URL), http_get(RPM2_UNSIGNED_URL)
         )
 
         # Create a user and a repository.
@@ -713,7 +713,7 @@ class PublishTwiceTestCase(
     def test_all(self):
         """Publish with a yum and rsync distributor twice."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2666, cfg.pulp_version):
+        if not bug_is_fixed(2666, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2666')
         if check_issue_2844(cfg):
             self.skipTest('https://pulp.plan.io/issues/2844')
@@ -732,7 +732,7 @@ class PublishTwiceTestCase(
         for url in (RPM_UNSIGNED_URL, RPM2_UNSIGNED_URL):
             upload_import_unit(
                 cfg,
-                utils.http_get(url),
+                http_get(url),
                 {'unit_type_id': 'rpm'},
                 repo
             )
@@ -796,7 +796,7 @@ class RsyncExtraArgsTestCase(
     def test_all(self):
         """Use the ``rsync_extra_args`` RPM rsync distributor option."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(3317, cfg.pulp_version):
+        if not bug_is_fixed(3317, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3317')
 
         # Create a user and repo with an importer and distribs. Sync the repo.
@@ -888,22 +888,9 @@ class SymlinkTestCase(
             'repodata'
         )
 
-        # Assert that the productid was not saved as symlink
-        productid_symlink = self.find_productid(True, path)
+        # Assert that the productid was saved as a file, not as a symlink
+        snapshot = take_snapshot(self.cfg, path)
+        productid_symlink = snapshot.glob('*productid*', 'l')
         self.assertEqual(len(productid_symlink), 0, productid_symlink)
-
-        # Assert that the productid was saved as a file
-        productid_file = self.find_productid(False, path)
+        productid_file = snapshot.glob('*productid*', 'f')
         self.assertEqual(len(productid_file), 1, productid_file)
-
-    def find_productid(self, verify_simlink, path):
-        """Find productid given a path."""
-        cli_client = cli.Client(self.cfg)
-        if verify_simlink is True:
-            cmd = 'find {} -type l -name *productid*'.format(path)
-        else:
-            cmd = 'find {} -type f -name *productid*'.format(path)
-        return cli_client.run(
-            cmd.split(),
-            sudo=True
-        ).stdout.splitlines()
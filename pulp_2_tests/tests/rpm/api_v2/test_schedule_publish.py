@@ -4,16 +4,18 @@
 .. _publication:
     https://docs.pulpproject.org/en/latest/dev-guide/integration/rest-api/repo/publish.html#scheduling-a-publish
 """
-import time
 from urllib.parse import urljoin
 
 from pulp_smash import api, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import RPM_SIGNED_FEED_URL
+from pulp_2_tests.lazy import parse_datetime
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_repo, gen_distributor
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
+from pulp_2_tests.waiters import wait_for_schedule_runs
 
 
 class CreateSuccessTestCase(BaseAPITestCase):
@@ -30,7 +32,7 @@ class CreateSuccessTestCase(BaseAPITestCase):
         3. Schedule publish to run every 30 seconds
         """
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
 
         # Create a repo with a valid feed and sync it
         body = gen_repo()
@@ -83,7 +85,7 @@ class CreateFailureTestCase(BaseAPITestCase):
         Each schedule is created to test a different failure scenario.
         """
         super().setUpClass()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
 
         # Create a repo with a valid feed and sync it
         body = gen_repo()
@@ -154,7 +156,7 @@ class ReadUpdateDeleteTestCase(BaseAPITestCase):
     def setUpClass(cls):
         """Create three schedules and read, update and delete them."""
         super().setUpClass()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
 
         # Create a repo with a valid feed and sync it
         body = gen_repo()
@@ -258,11 +260,12 @@ class ScheduledPublishTestCase(BaseAPITestCase):
         1. Create a repository with a valid feed
         2. Sync it
         3. Schedule publish to run every 2 minutes
-        4. Wait for 130 seconds and read the schedule to get the number of
-           "publish" runs
+        4. Wait until the schedule reports two "publish" runs, and read it.
+           The test methods check that the second run happened about 120
+           seconds after the schedule's first run.
         """
         super().setUpClass()
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
 
         # Create a repo with a valid feed and sync it
         body = gen_repo()
@@ -283,16 +286,28 @@ class ScheduledPublishTestCase(BaseAPITestCase):
         schedule_path = urljoin(repo['_href'], scheduling_url)
         schedule = client.post(schedule_path, {'schedule': 'PT2M'})
 
-        # Wait for publish to run
-        time.sleep(130)
-
-        # Read the schedule
-        cls.response = client.get(schedule['_href'])
+        # Wait for publish to run twice, and read the schedule
+        cls.response = wait_for_schedule_runs(
+            cls.cfg, schedule['_href'], 2, timeout=200)
 
     def test_total_run_count(self):
         """Check for the expected total run count."""
         self.assertEqual(self.response['total_run_count'], 2)
 
+    def test_run_spacing(self):
+        """Check that publish didn't run more often than every 2 minutes.
+
+        The last run should be about 120 seconds after the first run. Allow
+        for some clock skew between Pulp's processes.
+        """
+        first_run = parse_datetime(self.response['first_run'])
+        last_run_at = parse_datetime(self.response['last_run_at'])
+        self.assertGreaterEqual(
+            (last_run_at - first_run).total_seconds(),
+            115,
+            self.response,
+        )
+
     def test_no_failure(self):
         """Make sure any failure ever happened."""
         self.assertEqual(self.response['consecutive_failures'], 0)
@@ -4,7 +4,6 @@
 .. _syncronization:
     https://docs.pulpproject.org/en/latest/dev-guide/integration/rest-api/repo/sync.html#scheduling-a-sync
 """
-import time
 from urllib.parse import urljoin
 
 from packaging.version import Version
@@ -12,9 +11,11 @@ from pulp_smash import api, utils
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import RPM_SIGNED_FEED_URL
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_repo
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
+from pulp_2_tests.waiters import wait_for_schedule_runs
 
 _MUTABLE_ATTRS = {
     'consecutive_failures',
@@ -48,7 +49,8 @@ class CreateRepoMixin():  # pylint:disable=too-few-public-methods
         """
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
-        href = api.Client(cls.cfg).post(REPOSITORY_PATH, body).json()['_href']
+        href = http_pool.Client(cls.cfg).post(
+            REPOSITORY_PATH, body).json()['_href']
         cls.resources.add(href)
         return (href, body['importer_type_id'])
 
@@ -70,7 +72,7 @@ class CreateSuccessTestCase(CreateRepoMixin, BaseAPITestCase):
 
         # Schedule a sync
         path = urljoin(href, _SCHEDULE_PATH.format(importer_type_id))
-        cls.response = api.Client(cls.cfg).post(path, _SCHEDULE)
+        cls.response = http_pool.Client(cls.cfg).post(path, _SCHEDULE)
         cls.response_json = cls.response.json()
 
     def test_status_code(self):
@@ -108,7 +110,7 @@ class CreateFailureTestCase(CreateRepoMixin, BaseAPITestCase):
         bad_repo_path = '{}/{}/'.format(REPOSITORY_PATH, utils.uuid4())
 
         # Use client to get paths with bodies. Save responses and status_codes.
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         client.response_handler = api.echo_handler
         paths = (
             urljoin(href, scheduling_path),
@@ -168,7 +170,7 @@ class ReadUpdateDeleteTestCase(CreateRepoMixin, BaseAPITestCase):
         cls.update_body = {'schedule': 'PT1M'}
 
         # Create schedules
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         path = urljoin(href, _SCHEDULE_PATH.format(importer_type_id))
         for _ in range(3):
             cls.schedules.append(client.post(path, _SCHEDULE))
@@ -242,19 +244,18 @@ class ScheduledSyncTestCase(CreateRepoMixin, BaseAPITestCase):
 
         1. Create a repository with a valid feed
         2. Schedule sync to run every 30 seconds
-        3. Wait for 40 seconds and read the schedule to get the number of
-           "sync" runs.
+        3. Wait until the schedule reports two "sync" runs, and read it.
 
         """
         super().setUpClass()
         href, importer_type_id = cls.create_repo()
 
-        # Schedule a sync to run every 30 seconds. Wait 40 seconds and read it.
-        client = api.Client(cls.cfg, api.json_handler)
+        # Schedule a sync to run every 30 seconds. Wait for two runs.
+        client = http_pool.Client(cls.cfg, api.json_handler)
         schedule_path = urljoin(href, _SCHEDULE_PATH.format(importer_type_id))
         schedule = client.post(schedule_path, _SCHEDULE)
-        time.sleep(40)
-        cls.response = client.get(schedule['_href'])
+        cls.response = wait_for_schedule_runs(
+            cls.cfg, schedule['_href'], 2, timeout=90)
 
     def test_consecutive_failures(self):
         """Assert the sync encountered no consecutive failures."""
@@ -21,6 +21,7 @@ from pulp_smash import api
 from pulp_smash.pulp2.constants import CONTENT_UNITS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import (
     RPM,
     RPM_SIGNED_FEED_URL,
@@ -45,7 +46,7 @@ class BaseSearchTestCase(BaseAPITestCase):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2620')
         body = gen_repo()
         body['importer_config']['feed'] = cls.get_feed_url()
-        cls.repo = api.Client(cls.cfg).post(REPOSITORY_PATH, body).json()
+        cls.repo = http_pool.Client(cls.cfg).post(REPOSITORY_PATH, body).json()
         cls.resources.add(cls.repo['_href'])
         sync_repo(cls.cfg, cls.repo)
 
@@ -96,7 +97,7 @@ class SearchForRpmTestCase(BaseSearchTestCase):
             """Make assertions about search results."""
             self.get_unit_by_filename(units, RPM)
 
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(CONTENT_UNITS_PATH, 'rpm/search/')
         with self.subTest(method='get'):
             verify(client.get(path))
@@ -121,7 +122,7 @@ class SearchForRpmTestCase(BaseSearchTestCase):
             unit = self.get_unit_by_filename(units, RPM)
             self.assertIn(self.repo['id'], unit['repository_memberships'])
 
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(CONTENT_UNITS_PATH, 'rpm/search/')
         with self.subTest(method='get'):
             verify(client.get(path, params={'include_repos': True}))
@@ -152,7 +153,7 @@ class SearchForSrpmTestCase(BaseSearchTestCase):
             """Make assertions about search results."""
             self.get_unit_by_filename(units, SRPM)
 
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(CONTENT_UNITS_PATH, 'srpm/search/')
         with self.subTest(method='get'):
             verify(client.get(path))
@@ -177,7 +178,7 @@ class SearchForSrpmTestCase(BaseSearchTestCase):
             unit = self.get_unit_by_filename(units, SRPM)
             self.assertIn(self.repo['id'], unit['repository_memberships'])
 
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         path = urljoin(CONTENT_UNITS_PATH, 'srpm/search/')
         with self.subTest(method='get'):
             verify(client.get(path, params={'include_repos': True}))
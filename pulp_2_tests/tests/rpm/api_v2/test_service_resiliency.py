@@ -9,15 +9,18 @@ import unittest
 from urllib.parse import urljoin
 
 from requests.exceptions import HTTPError
-from pulp_smash import api, cli, config, selectors
+from pulp_smash import api, cli, config
 from pulp_smash.pulp2.constants import (
-    PULP_SERVICES,
+    ORPHANS_PATH,
     REPOSITORY_PATH,
     TASKS_PATH,
 )
-from pulp_smash.pulp2.utils import get_broker, reset_pulp, sync_repo
+from pulp_smash.pulp2.utils import get_broker, sync_repo
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_MIRRORLIST_LARGE, RPM_UNSIGNED_FEED_URL
+from pulp_2_tests.services import ServiceTracker
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -47,31 +50,34 @@ class MissingWorkersTestCase(unittest.TestCase):
     def setUp(self):
         """Ensure there is only one Pulp worker."""
         self.cfg = config.get_config()
-        if not selectors.bug_is_fixed(2835, self.cfg.pulp_version):
+        if not bug_is_fixed(2835, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2835')
-        sudo = '' if cli.is_root(self.cfg) else 'sudo'
-        # machine.session is used here to keep SSH session open
-        cli.Client(self.cfg).machine.session().run(
+        sudo = '' if ssh.is_root(self.cfg) else 'sudo'
+        ssh.Client(self.cfg).run_shell(
             "{} bash -c 'echo PULP_CONCURRENCY=1 >> {}'"
             .format(sudo, _PULP_WORKERS_CFG)
         )
-        cli.GlobalServiceManager(self.cfg).restart(PULP_SERVICES)
+        self.services = ServiceTracker(self.cfg)
+        self.services.restart(('pulp_workers',))
 
     def test_all(self):
         """Test that Pulp deals well with missing workers."""
-        # Create a repository. No repository addCleanup is necessary, because
-        # Pulp will be reset after this test.
-        client = api.Client(self.cfg, api.json_handler)
+        # Create a repository. After tearDown, once the workers are back,
+        # delete it and the content the interrupted sync left behind.
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed_url'] = RPM_MIRRORLIST_LARGE
         body['distributors'] = [gen_distributor()]
         repo = client.post(REPOSITORY_PATH, body)
+        cleanup_client = http_pool.Client(self.cfg, api.safe_handler)
+        self.addCleanup(cleanup_client.delete, ORPHANS_PATH)
+        self.addCleanup(cleanup_client.delete, repo['_href'])
         repo = client.get(repo['_href'], params={'details': True})
 
         # Start syncing the repository and restart pulp_workers.
         client.response_handler = api.code_handler
         client.post(urljoin(repo['_href'], 'actions/sync/'))
-        cli.GlobalServiceManager(self.cfg).restart(('pulp_workers',))
+        self.services.restart(('pulp_workers',))
 
         # Update and sync the repository.
         client.response_handler = api.safe_handler
@@ -81,14 +87,16 @@ class MissingWorkersTestCase(unittest.TestCase):
         sync_repo(self.cfg, repo)
 
     def tearDown(self):
-        """Reset the number of Pul pworkers, and reset Pulp.
+        """Reset the number of Pulp workers, and wait until they're healthy.
 
-        Reset Pulp because :meth:`test_all` may break Pulp.
+        Only ``pulp_workers`` reads :data:`_PULP_WORKERS_CFG`, so it's the only
+        service restarted.
         """
         # Delete last line from file.
-        cli.Client(self.cfg).run(
+        ssh.Client(self.cfg).run(
             ('sed', '-i', '$d', _PULP_WORKERS_CFG), sudo=True)
-        reset_pulp(self.cfg)
+        self.services.restart(('pulp_workers',))
+        self.services.restore()
 
 
 class TaskDispatchTestCase(unittest.TestCase):
@@ -110,11 +118,11 @@ class TaskDispatchTestCase(unittest.TestCase):
            so, and assert that no tasks are left in the ``waiting`` state.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2770, cfg.pulp_version):
+        if not bug_is_fixed(2770, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2770')
 
         # Create a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         repo = client.post(REPOSITORY_PATH, body)
@@ -25,11 +25,13 @@ import inspect
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.constants import PULP_FIXTURES_KEY_ID
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import upload_import_unit
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     DRPM_SIGNED_URL,
     DRPM_UNSIGNED_URL,
@@ -38,6 +40,7 @@ from pulp_2_tests.constants import (
     SRPM_SIGNED_URL,
     SRPM_UNSIGNED_URL,
 )
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_repo
 from pulp_2_tests.tests.rpm.utils import check_issue_3875, set_up_module
 
@@ -50,21 +53,21 @@ _UNSIGNED_PACKAGES = {}
 def setUpModule():  # pylint:disable=invalid-name
     """Conditionally skip tests. Create repositories with fixture data."""
     cfg = config.get_config()
-    if not selectors.bug_is_fixed(1991, cfg.pulp_version):
+    if not bug_is_fixed(1991, cfg.pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/1991')
     set_up_module()
 
     # Fetch RPMs.
-    _SIGNED_PACKAGES['rpm'] = utils.http_get(RPM_SIGNED_URL)
-    _SIGNED_PACKAGES['srpm'] = utils.http_get(SRPM_SIGNED_URL)
-    _UNSIGNED_PACKAGES['rpm'] = utils.http_get(RPM_UNSIGNED_URL)
-    _UNSIGNED_PACKAGES['srpm'] = utils.http_get(SRPM_UNSIGNED_URL)
-    if selectors.bug_is_fixed(1806, cfg.pulp_version):
-        _SIGNED_PACKAGES['drpm'] = utils.http_get(DRPM_SIGNED_URL)
-        _UNSIGNED_PACKAGES['drpm'] = utils.http_get(DRPM_UNSIGNED_URL)
+    _SIGNED_PACKAGES['rpm'] = http_get(RPM_SIGNED_URL)
+    _SIGNED_PACKAGES['srpm'] = http_get(SRPM_SIGNED_URL)
+    _UNSIGNED_PACKAGES['rpm'] = http_get(RPM_UNSIGNED_URL)
+    _UNSIGNED_PACKAGES['srpm'] = http_get(SRPM_UNSIGNED_URL)
+    if bug_is_fixed(1806, cfg.pulp_version):
+        _SIGNED_PACKAGES['drpm'] = http_get(DRPM_SIGNED_URL)
+        _UNSIGNED_PACKAGES['drpm'] = http_get(DRPM_UNSIGNED_URL)
 
     # Create repos, and upload RPMs to them.
-    client = api.Client(cfg, api.json_handler)
+    client = http_pool.Client(cfg, api.json_handler)
     try:
         repo = client.post(REPOSITORY_PATH, gen_repo())
         _REPOS['signed'] = repo
@@ -87,7 +90,7 @@ def tearDownModule():  # pylint:disable=invalid-name
     """Delete repositories with fixture data."""
     _SIGNED_PACKAGES.clear()
     _UNSIGNED_PACKAGES.clear()
-    client = api.Client(config.get_config())
+    client = http_pool.Client(config.get_config())
     for _ in range(len(_REPOS)):
         client.delete(_REPOS.popitem()[1]['_href'])
     client.delete(ORPHANS_PATH)
@@ -112,7 +115,7 @@ class _BaseTestCase(unittest.TestCase):
         In addition, schedule the repository for deletion with the
         ``addCleanup`` method. Return information about the repository.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config'] = importer_config
         repo = client.post(REPOSITORY_PATH, body)
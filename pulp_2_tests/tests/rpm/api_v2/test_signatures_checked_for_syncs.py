@@ -21,11 +21,13 @@ except that packages are synced in to Pulp instead of being uploaded.
 import inspect
 import unittest
 
-from pulp_smash import api, config, selectors
+from pulp_smash import api, config
 from pulp_smash.constants import PULP_FIXTURES_KEY_ID
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     DRPM_SIGNED_FEED_COUNT,
     DRPM_SIGNED_FEED_URL,
@@ -46,16 +48,16 @@ from pulp_2_tests.tests.rpm.utils import set_up_module
 
 def setUpModule():  # pylint:disable=invalid-name
     """Conditionally skip tests."""
-    if not selectors.bug_is_fixed(1991, config.get_config().pulp_version):
+    if not bug_is_fixed(1991, config.get_config().pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/1991')
-    if not selectors.bug_is_fixed(2242, config.get_config().pulp_version):
+    if not bug_is_fixed(2242, config.get_config().pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/2242')
     set_up_module()
 
 
 def tearDownModule():  # pylint:disable=invalid-name
     """Delete orphan content units."""
-    api.Client(config.get_config()).delete(ORPHANS_PATH)
+    http_pool.Client(config.get_config()).delete(ORPHANS_PATH)
 
 
 class _BaseTestCase(unittest.TestCase):
@@ -78,7 +80,7 @@ class _BaseTestCase(unittest.TestCase):
         (``addCleanup()`` is used.) An up-to-date dict of information about the
         repo is returned.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config'] = importer_config
         self.addCleanup(client.delete, ORPHANS_PATH)
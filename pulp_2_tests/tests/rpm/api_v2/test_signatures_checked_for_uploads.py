@@ -47,12 +47,14 @@ For more information, see `Pulp #1991`_ and `Pulp Smash #347`_.
 import unittest
 from itertools import chain
 
-from pulp_smash import api, config, exceptions, selectors, utils
+from pulp_smash import config, exceptions
 from pulp_smash.constants import PULP_FIXTURES_KEY_ID
 from pulp_smash.pulp2.constants import REPOSITORY_PATH
 from pulp_smash.pulp2.utils import BaseAPITestCase, upload_import_unit
 from requests.exceptions import HTTPError
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     DRPM_SIGNED_URL,
     DRPM_UNSIGNED_URL,
@@ -61,6 +63,7 @@ from pulp_2_tests.constants import (
     SRPM_SIGNED_URL,
     SRPM_UNSIGNED_URL,
 )
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_repo
 from pulp_2_tests.tests.rpm.utils import set_up_module
 
@@ -80,17 +83,17 @@ def setUpModule():  # pylint:disable=invalid-name
       version of Pulp under test.
     """
     cfg = config.get_config()
-    if not selectors.bug_is_fixed(1991, cfg.pulp_version):
+    if not bug_is_fixed(1991, cfg.pulp_version):
         raise unittest.SkipTest('https://pulp.plan.io/issues/1991')
     set_up_module()
     try:
-        _SIGNED_PACKAGES['rpm'] = utils.http_get(RPM_SIGNED_URL)
-        _SIGNED_PACKAGES['srpm'] = utils.http_get(SRPM_SIGNED_URL)
-        _UNSIGNED_PACKAGES['rpm'] = utils.http_get(RPM_UNSIGNED_URL)
-        _UNSIGNED_PACKAGES['srpm'] = utils.http_get(SRPM_UNSIGNED_URL)
-        if selectors.bug_is_fixed(1806, cfg.pulp_version):
-            _SIGNED_PACKAGES['drpm'] = utils.http_get(DRPM_SIGNED_URL)
-            _UNSIGNED_PACKAGES['drpm'] = utils.http_get(DRPM_UNSIGNED_URL)
+        _SIGNED_PACKAGES['rpm'] = http_get(RPM_SIGNED_URL)
+        _SIGNED_PACKAGES['srpm'] = http_get(SRPM_SIGNED_URL)
+        _UNSIGNED_PACKAGES['rpm'] = http_get(RPM_UNSIGNED_URL)
+        _UNSIGNED_PACKAGES['srpm'] = http_get(SRPM_UNSIGNED_URL)
+        if bug_is_fixed(1806, cfg.pulp_version):
+            _SIGNED_PACKAGES['drpm'] = http_get(DRPM_SIGNED_URL)
+            _UNSIGNED_PACKAGES['drpm'] = http_get(DRPM_UNSIGNED_URL)
     except:  # noqa:E722
         _SIGNED_PACKAGES.clear()
         _UNSIGNED_PACKAGES.clear()
@@ -110,7 +113,7 @@ def _create_repository(cfg, importer_config):
     """
     body = gen_repo()
     body['importer_config'] = importer_config
-    return api.Client(cfg).post(REPOSITORY_PATH, body).json()
+    return http_pool.Client(cfg).post(REPOSITORY_PATH, body).json()
 
 
 # NOTE: We could inherit from unittest.TestCase and create a separate
@@ -365,7 +368,7 @@ class AllowAnyKeyTestCase(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up resources."""
         if cls.repo:
-            api.Client(cls.cfg).delete(cls.repo['_href'])
+            http_pool.Client(cls.cfg).delete(cls.repo['_href'])
 
     def test_all_packages(self):
         """Import signed and unsigned DRPM, RPM & SRPM packages into the repo.
@@ -409,4 +412,4 @@ class KeyLengthTestCase(unittest.TestCase):
                         'allowed_keys': [allowed_key]
                     })
                 if repo is not None:
-                    api.Client(cfg).delete(repo['_href'])
+                    http_pool.Client(cfg).delete(repo['_href'])
@@ -19,11 +19,13 @@ import inspect
 import unittest
 from urllib.parse import urlparse
 
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config
 from pulp_smash.constants import PULP_FIXTURES_KEY_ID
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import search_units, sync_repo, upload_import_unit
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     DRPM_SIGNED_FEED_URL,
     DRPM_SIGNED_URL,
@@ -38,6 +40,7 @@ from pulp_2_tests.constants import (
     SRPM_UNSIGNED_FEED_URL,
     SRPM_UNSIGNED_URL,
 )
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_repo
 from pulp_2_tests.tests.rpm.utils import check_issue_2620
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
@@ -69,9 +72,9 @@ class _BaseTestCase(unittest.TestCase):
         if inspect.getmro(cls)[0] == _BaseTestCase:
             raise unittest.SkipTest('Abstract base class.')
         cls.cfg = config.get_config()
-        if not selectors.bug_is_fixed(1156, cls.cfg.pulp_version):
+        if not bug_is_fixed(1156, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1156')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def _find_unit(self, repo_href, pkg_url):
         """Search the given repository for a package.
@@ -116,7 +119,7 @@ class UploadPackageTestCase(_BaseTestCase):
         repo = self.client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(self.client.delete, repo['_href'])
 
-        pkg = utils.http_get(pkg_url)
+        pkg = http_get(pkg_url)
         pkg_filename = _get_pkg_filename(pkg_url)
         pkg_unit_type = _get_pkg_unit_type(pkg_filename)
         upload_import_unit(
@@ -130,7 +133,7 @@ class UploadPackageTestCase(_BaseTestCase):
 
     def test_signed_drpm(self):
         """Import a signed DRPM into Pulp. Verify its signature."""
-        if not selectors.bug_is_fixed(1806, self.cfg.pulp_version):
+        if not bug_is_fixed(1806, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1806')
         repo_href = self._create_repo_import_unit(DRPM_SIGNED_URL)
         unit = self._find_unit(repo_href, DRPM_SIGNED_URL)
@@ -154,7 +157,7 @@ class UploadPackageTestCase(_BaseTestCase):
 
     def test_unsigned_drpm(self):
         """Import an unsigned DRPM into Pulp. Verify it has no signature."""
-        if not selectors.bug_is_fixed(1806, self.cfg.pulp_version):
+        if not bug_is_fixed(1806, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1806')
         repo_href = self._create_repo_import_unit(DRPM_UNSIGNED_URL)
         unit = self._find_unit(repo_href, DRPM_UNSIGNED_URL)
@@ -12,23 +12,20 @@ For information on repository sync and publish operations, see
 import inspect
 import os
 import unittest
-from threading import Thread
 from urllib.parse import urljoin
 
 from packaging.version import Version
-from pulp_smash import api, cli, config, exceptions, selectors, utils
+from pulp_smash import api, cli, config, exceptions, utils
 from pulp_smash.pulp2.constants import (
     ORPHANS_PATH,
     REPOSITORY_PATH,
 )
-from pulp_smash.pulp2.utils import (
-    publish_repo,
-    search_units,
-    sync_repo,
-)
+from pulp_smash.pulp2.utils import publish_repo, sync_repo
 
 from requests.exceptions import HTTPError
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     DRPM_UNSIGNED_FEED_URL,
     RPM,
@@ -51,7 +48,11 @@ from pulp_2_tests.constants import (
     RPM_ZCHUNK_FEED_URL,
     SRPM_SIGNED_FEED_URL,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.remote_fs import take_snapshot
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import (
+    create_sync_publish_repos,
     gen_distributor,
     gen_repo,
     get_repodata_repomd_xml,
@@ -62,6 +63,7 @@ from pulp_2_tests.tests.rpm.utils import (
     check_issue_4529,
 )
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
+from pulp_2_tests.units import iter_units
 
 
 # This class is left public for documentation purposes.
@@ -78,7 +80,7 @@ class SyncRepoBaseTestCase(unittest.TestCase):
         if inspect.getmro(cls)[0] == SyncRepoBaseTestCase:
             raise unittest.SkipTest('Abstract base class.')
         cls.cfg = config.get_config()
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = cls.get_feed_url()
         cls.repo = cls.client.post(REPOSITORY_PATH, body)
@@ -108,7 +110,7 @@ class SyncRepoBaseTestCase(unittest.TestCase):
         client's response handler. (For more information, see the source of
         ``pulp_smash.api.safe_handler``.)
         """
-        tasks = tuple(api.poll_spawned_tasks(self.cfg, self.report.json()))
+        tasks = poll_spawned_tasks(self.cfg, self.report.json())
         for i, task in enumerate(tasks):
             with self.subTest(i=i):
                 error_details = task['progress_report']['yum_importer']['content']['error_details']  # pylint:disable=line-too-long
@@ -140,7 +142,7 @@ class SyncRpmRepoTestCase(SyncRepoBaseTestCase):
         # langpack support was added in 2.9
         if self.cfg.pulp_version >= Version('2.9'):
             content_unit_counts['package_langpacks'] = 1
-        repo = api.Client(self.cfg).get(self.repo['_href']).json()
+        repo = http_pool.Client(self.cfg).get(self.repo['_href']).json()
         self.assertEqual(repo['content_unit_counts'], content_unit_counts)
 
     def test_no_change_in_second_sync(self):
@@ -150,7 +152,7 @@ class SyncRpmRepoTestCase(SyncRepoBaseTestCase):
         was changed when doing a second sync.
         """
         report = sync_repo(self.cfg, self.repo)
-        tasks = tuple(api.poll_spawned_tasks(self.cfg, report.json()))
+        tasks = poll_spawned_tasks(self.cfg, report.json())
         with self.subTest(comment='spawned tasks'):
             self.assertEqual(len(tasks), 1)
         for count_type in ('added_count', 'removed_count', 'updated_count'):
@@ -187,7 +189,7 @@ class SyncInvalidMetadataTestCase(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Delete orphan content units."""
-        api.Client(config.get_config()).delete(ORPHANS_PATH)
+        http_pool.Client(config.get_config()).delete(ORPHANS_PATH)
 
     def test_incomplete_filelists(self):
         """Sync a repository with an incomplete ``filelists.xml`` file."""
@@ -212,7 +214,7 @@ class SyncInvalidMetadataTestCase(unittest.TestCase):
     def do_test(self, feed_url):
         """Implement the logic described by each of the ``test*`` methods."""
         cfg = config.get_config()
-        client = api.Client(cfg)
+        client = http_pool.Client(cfg)
         body = gen_repo()
         body['importer_config']['feed'] = feed_url
         repo = client.post(REPOSITORY_PATH, body).json()
@@ -247,7 +249,7 @@ class ChangeFeedTestCase(unittest.TestCase):
     def setUpClass(cls):
         """Set config and client used by each test case."""
         cls.cfg = config.get_config()
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
 
     def test_all(self):
         """Sync a repository, change its feed, and sync it again."""
@@ -281,7 +283,7 @@ class ChangeFeedTestCase(unittest.TestCase):
         sync_repo(self.cfg, repo)
         publish_repo(self.cfg, repo)
 
-        rpm = utils.http_get(RPM_UNSIGNED_URL)
+        rpm = http_get(RPM_UNSIGNED_URL)
         response = get_unit(self.cfg, repo['distributors'][0], RPM)
         with self.subTest():
             self.assertIn(
@@ -320,9 +322,11 @@ class SyncInParallelTestCase(unittest.TestCase):
 
         Specifically, do the following:
 
-        1. Create several repositories. Ensure each repository has an importer
-           whose feed references a repository containing one or more errata.
-        2. Sync each repository. Assert each sync completed successfully.
+        1. Create several repositories in parallel. Ensure each repository has
+           an importer whose feed references a repository containing one or
+           more errata.
+        2. Sync each repository in parallel. Assert each sync completed
+           successfully.
         3. Get a summary of information about each repository, and assert the
            repo has an appropriate number of errata.
 
@@ -333,49 +337,15 @@ class SyncInParallelTestCase(unittest.TestCase):
         .. _Pulp #2721: https://pulp.plan.io/issues/2721
         """
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
-        repos = []  # append() is thread-safe
-
-        def create_repo():
-            """Create a repository and schedule its deletion.
-
-            Append a dict of information about the repository to ``repos``.
-            """
-            body = gen_repo()
+        bodies = [gen_repo() for _ in range(5)]
+        for body in bodies:
             body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
-            repo = client.post(REPOSITORY_PATH, body)
-            self.addCleanup(client.delete, repo['_href'])
-            repos.append(repo)
-
-        def get_repo(repo):
-            """Get information about a repository. Append it to ``repos``.
-
-            :param repo: A dict of information about a repository.
-            """
-            repos.append(client.get(repo['_href']))
-
-        threads = tuple(Thread(target=create_repo) for _ in range(5))
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
-
-        threads = tuple(
-            Thread(target=sync_repo, args=(cfg, repo)) for repo in repos
-        )
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
-
-        threads = tuple(
-            Thread(target=get_repo, args=(repo,)) for repo in repos
+        repos = create_sync_publish_repos(
+            cfg,
+            bodies,
+            self.addCleanup,
+            publish=False,
         )
-        repos.clear()
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
         for repo in repos:
             with self.subTest():
                 self.assertEqual(
@@ -456,7 +426,7 @@ class ErrorReportTestCase(unittest.TestCase):
     def run_task(self, repo_body):
         """Implement the logic described by each of the ``test*`` methods."""
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, repo_body)
         self.addCleanup(client.delete, repo['_href'])
         repo = client.get(repo['_href'], params={'details': True})
@@ -514,7 +484,7 @@ class SyncSha512RPMPackageTestCase(unittest.TestCase):
         cfg = config.get_config()
         if cfg.pulp_version < Version('2.18'):
             raise unittest.SkipTest('This test requires Pulp 2.18 or newer.')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo(
             importer_config={'feed': RPM_SHA_512_FEED_URL},
             distributors=[gen_distributor(auto_publish=True)]
@@ -578,7 +548,7 @@ class SyncZchunkRepoSkipTestCase(unittest.TestCase):
         cfg = config.get_config()
         if check_issue_4529(cfg):
             self.skipTest('https://pulp.plan.io/issues/4529')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
 
         # Sync Repo
         # Publish to ensure search path is constant
@@ -592,7 +562,7 @@ class SyncZchunkRepoSkipTestCase(unittest.TestCase):
 
         # Check there are no search_units found of .zck
         self.assertFalse(
-            cli.Client(cfg).run((
+            ssh.Client(cfg).run((
                 'find',
                 os.path.join(
                     '/var/lib/pulp/published/yum/master/yum_distributor/',
@@ -607,7 +577,7 @@ class SyncZchunkRepoSkipTestCase(unittest.TestCase):
         # Verify other content units were copied
         copied_unit_ids = [
             unit['metadata']['name']
-            for unit in search_units(cfg, repo, {'type_ids': ['rpm']})
+            for unit in iter_units(cfg, repo, {'type_ids': ['rpm']}, ('name',))
         ]
         self.assertEqual(
             len(copied_unit_ids),
@@ -641,7 +611,7 @@ class YumMetadataSymlinkTesCase(unittest.TestCase):
 
     def test_broken_simlinks(self):
         """Test broken symlinks."""
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo(
             importer_config={'feed': RPM_YUM_METADATA_FILE},
             distributors=[gen_distributor(auto_publish=True)]
@@ -664,25 +634,12 @@ class YumMetadataSymlinkTesCase(unittest.TestCase):
             'repodata'
         )
 
-        # Assert that the productid was not saved as symlink
-        productid_symlink = self.find_productid(True, path)
+        # Assert that the productid was saved as a file, not as a symlink
+        snapshot = take_snapshot(self.cfg, path)
+        productid_symlink = snapshot.glob('*productid*', 'l')
         self.assertEqual(len(productid_symlink), 0, productid_symlink)
-
-        # Assert that the productid was saved as a file
-        productid_file = self.find_productid(False, path)
-        self.assertEqual(len(productid_file), 1, productid_symlink)
-
-    def find_productid(self, verify_simlink, path):
-        """Find productid given a path."""
-        cli_client = cli.Client(self.cfg)
-        if verify_simlink is True:
-            cmd = 'find {} -type l -name *productid*'.format(path)
-        else:
-            cmd = 'find {} -type f -name *productid*'.format(path)
-        return cli_client.run(
-            cmd.split(),
-            sudo=True
-        ).stdout.splitlines()
+        productid_file = snapshot.glob('*productid*', 'f')
+        self.assertEqual(len(productid_file), 1, productid_file)
 
 
 class PulpStreamerDecodeTestCase(unittest.TestCase):
@@ -722,7 +679,7 @@ class PulpStreamerDecodeTestCase(unittest.TestCase):
         cfg = config.get_config()
 
         # skipping until curl is refactored out
-        if not selectors.bug_is_fixed(4907, cfg.pulp_version):
+        if not bug_is_fixed(4907, cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/4907')
 
         if cfg.pulp_version < Version('2.19.1'):
@@ -731,7 +688,7 @@ class PulpStreamerDecodeTestCase(unittest.TestCase):
             )
 
         # Create, sync and publish a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
 
         body = gen_repo(
             importer_config={
@@ -748,7 +705,7 @@ class PulpStreamerDecodeTestCase(unittest.TestCase):
         sync_repo(cfg, repo)
 
         # Create temp directory and file and download compressed file
-        cli_client = cli.Client(cfg, cli.echo_handler)
+        cli_client = ssh.Client(cfg, cli.echo_handler)
         tempdir = cli_client.run(('mktemp', '-d')).stdout.strip()
         self.addCleanup(cli_client.run, ('rm', '-Rf', tempdir), sudo=True)
 
@@ -12,10 +12,12 @@ Client Tasks`_.
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import api, config, selectors
+from pulp_smash import api, config
 from pulp_smash.pulp2.constants import REPOSITORY_PATH, TASKS_PATH
 from pulp_smash.pulp2.utils import publish_repo, sync_repo
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_SIGNED_FEED_URL
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
@@ -46,15 +48,15 @@ class TasksOperationsTestCase(unittest.TestCase):
         6. Purge tasks.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1418, cfg.pulp_version):
+        if not bug_is_fixed(1418, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1418')
-        if not selectors.bug_is_fixed(1483, cfg.pulp_version):
+        if not bug_is_fixed(1483, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1483')
-        if not selectors.bug_is_fixed(1664, cfg.pulp_version):
+        if not bug_is_fixed(1664, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1664')
 
         # Create, sync and publish a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
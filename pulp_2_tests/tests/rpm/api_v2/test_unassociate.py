@@ -9,9 +9,8 @@ import time
 import unittest
 from urllib.parse import urljoin
 
-from dateutil.parser import parse
 from packaging.version import Version
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import (
     BaseAPITestCase,
@@ -21,6 +20,8 @@ from pulp_smash.pulp2.utils import (
     upload_import_unit,
 )
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     DRPM_UNSIGNED_FEED_URL,
     RPM,
@@ -29,6 +30,9 @@ from pulp_2_tests.constants import (
     RPM_UNSIGNED_URL,
     SRPM_UNSIGNED_FEED_URL,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.lazy import parse_datetime
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import gen_distributor, gen_repo
 from pulp_2_tests.tests.rpm.utils import check_issue_2620
 from pulp_2_tests.tests.rpm.utils import set_up_module
@@ -81,7 +85,7 @@ class RemoveUnitsTestCase(unittest.TestCase):
         """
         body = gen_repo()
         body['importer_config']['feed'] = feed
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, body)
         self.addCleanup(client.delete, repo['_href'])
         repo = client.get(repo['_href'], params={'details': True})
@@ -100,7 +104,7 @@ class RemoveUnitsTestCase(unittest.TestCase):
             }
             self.assertEqual(removed_ids & remaining_ids, set())
 
-        if selectors.bug_is_fixed(2630, self.cfg.pulp_version):
+        if bug_is_fixed(2630, self.cfg.pulp_version):
             with self.subTest('last removed unit'):
                 lur_before = self.get_repo_last_unit_removed(repo)
                 time.sleep(1)  # ensure last_unit_removed increments
@@ -137,7 +141,10 @@ class RemoveUnitsTestCase(unittest.TestCase):
             self.assertIsNone(lur_before)
             self.assertIsNotNone(lur_after)
         else:
-            self.assertGreater(parse(lur_after), parse(lur_before))
+            self.assertGreater(
+                parse_datetime(lur_after),
+                parse_datetime(lur_before),
+            )
 
     def get_repo_last_unit_removed(self, repo):
         """Get the repository's ``last_unit_removed`` attribute."""
@@ -169,7 +176,7 @@ class RepublishTestCase(BaseAPITestCase):
     def setUpClass(cls):
         """Create a repository."""
         cls.cfg = config.get_config()
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         body = gen_repo()
         body['distributors'] = [gen_distributor()]
         cls.repo = client.post(REPOSITORY_PATH, body).json()
@@ -177,14 +184,14 @@ class RepublishTestCase(BaseAPITestCase):
     @classmethod
     def tearDownClass(cls):
         """Remove the created repository and any orphans."""
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         client.delete(cls.repo['_href'])
         client.delete(ORPHANS_PATH)
 
     def test_01_add_unit(self):
         """Add a content unit to the repository. Publish the repository."""
         repo_before = self.get_repo()
-        rpm = utils.http_get(RPM_UNSIGNED_URL)
+        rpm = http_get(RPM_UNSIGNED_URL)
         upload_import_unit(
             self.cfg,
             rpm,
@@ -194,7 +201,7 @@ class RepublishTestCase(BaseAPITestCase):
         publish_repo(self.cfg, repo_before)
         repo_after = self.get_repo()
         with self.subTest(comment='last_unit_added'):
-            if not selectors.bug_is_fixed(1847, self.cfg.pulp_version):
+            if not bug_is_fixed(1847, self.cfg.pulp_version):
                 self.skipTest('https://pulp.plan.io/issues/1847')
             pre = repo_before['last_unit_added']
             post = repo_after['last_unit_added']
@@ -227,10 +234,10 @@ class RepublishTestCase(BaseAPITestCase):
         publish_repo(self.cfg, repo_before)
         repo_after = self.get_repo()
         with self.subTest(comment='last_unit_added'):
-            if not selectors.bug_is_fixed(1847, self.cfg.pulp_version):
+            if not bug_is_fixed(1847, self.cfg.pulp_version):
                 self.skipTest('https://pulp.plan.io/issues/1847')
-            pre = parse(repo_before['last_unit_added'])
-            post = parse(repo_after['last_unit_added'])
+            pre = parse_datetime(repo_before['last_unit_added'])
+            post = parse_datetime(repo_after['last_unit_added'])
             self.assertEqual(pre, post)
         with self.subTest(comment='last_unit_removed'):
             pre = repo_before['last_unit_removed']
@@ -238,8 +245,9 @@ class RepublishTestCase(BaseAPITestCase):
             self.assertIsNone(pre)
             self.assertIsNotNone(post)
         with self.subTest(comment='last_publish'):
-            pre = parse(repo_before['distributors'][0]['last_publish'])
-            post = parse(repo_after['distributors'][0]['last_publish'])
+            pre = repo_before['distributors'][0]['last_publish']
+            post = repo_after['distributors'][0]['last_publish']
+            pre, post = parse_datetime(pre), parse_datetime(post)
             self.assertGreater(post, pre)
 
     def test_04_find_unit(self):
@@ -287,7 +295,7 @@ def _remove_unit(cfg, repo, unit):
         'filters': {'unit': {key: value}},
         'type_ids': [unit['unit_type_id']],
     }}
-    return api.Client(cfg).post(path, body).json()
+    return http_pool.Client(cfg).post(path, body).json()
 
 
 class SelectiveAssociateTestCase(unittest.TestCase):
@@ -311,7 +319,7 @@ class SelectiveAssociateTestCase(unittest.TestCase):
                 'Selective association is available on Pulp 2.11+ see Pulp '
                 '#2457 for more information'
             )
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
         repo = client.post(REPOSITORY_PATH, body)
@@ -326,7 +334,7 @@ class SelectiveAssociateTestCase(unittest.TestCase):
         for unit in to_remove:
             _remove_unit(cfg, repo, unit)
         report = client.post(urljoin(repo['_href'], 'actions/sync/'))
-        tasks = tuple(api.poll_spawned_tasks(cfg, report))
+        tasks = poll_spawned_tasks(cfg, report)
         self.assertEqual(len(tasks), 1, tasks)
         self.assertEqual(
             tasks[0]['result']['added_count'], len(to_remove), to_remove)
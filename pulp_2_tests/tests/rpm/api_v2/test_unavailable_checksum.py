@@ -7,16 +7,19 @@ from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.exceptions import TaskReportError
 from pulp_smash.pulp2.utils import publish_repo, search_units, sync_repo
 
+from pulp_2_tests import http_pool
 from pulp_2_tests.constants import (
     DRPM_UNSIGNED_FEED_URL,
     RPM_NAMESPACES,
     RPM_UNSIGNED_FEED_URL,
     SRPM_UNSIGNED_FEED_URL,
 )
+from pulp_2_tests.repo_cache import invalidate_source_repos
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
     get_repodata,
+    iter_repodata,
 )
 from pulp_2_tests.tests.rpm.utils import check_issue_3104
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
@@ -31,10 +34,12 @@ class UnavailableChecksumTestCase(unittest.TestCase):
 
         This is necessary to assure that the content unit is not already
         present in Pulp with a different checksum type. See `Pulp #4157
-        <https://pulp.plan.io/issues/4157>`_.
+        <https://pulp.plan.io/issues/4157>`_. Shared source repositories are
+        discarded first, so that none of them keep the content unit alive.
         """
+        invalidate_source_repos()
         cls.cfg = config.get_config()
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         cls.client.delete(ORPHANS_PATH)
 
     def test_rpm(self):
@@ -137,7 +142,7 @@ class UpdatedChecksumTestCase(unittest.TestCase):
         cfg = config.get_config()
         if check_issue_3104(cfg):
             self.skipTest('https://pulp.plan.io/issues/3104')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
 
         # Create and sync a repository.
         body = gen_repo()
@@ -181,9 +186,8 @@ class UpdatedChecksumTestCase(unittest.TestCase):
 
     def verify_primary_xml(self, cfg, distributor, checksum_type):
         """Verify a published repo's primary.xml uses the given checksum."""
-        primary_xml = get_repodata(cfg, distributor, 'primary')
         xpath = '{{{}}}package'.format(RPM_NAMESPACES['metadata/common'])
-        packages = primary_xml.findall(xpath)
+        packages = iter_repodata(cfg, distributor, 'primary', xpath)
         xpath = '{{{}}}checksum'.format(RPM_NAMESPACES['metadata/common'])
         checksum_types = {
             package.find(xpath).get('type') for package in packages
@@ -192,17 +196,15 @@ class UpdatedChecksumTestCase(unittest.TestCase):
 
     def verify_filelists_xml(self, cfg, distributor, checksum_type):
         """Verify a published repo's filelists.xml uses the given checksum."""
-        filelist_xml = get_repodata(cfg, distributor, 'filelists')
         xpath = '{{{}}}package'.format(RPM_NAMESPACES['metadata/filelists'])
-        packages = filelist_xml.findall(xpath)
+        packages = iter_repodata(cfg, distributor, 'filelists', xpath)
         pkgids_len = {len(package.get('pkgid')) for package in packages}
         self.verify_pkgid_len(pkgids_len, checksum_type)
 
     def verify_other_xml(self, cfg, distributor, checksum_type):
         """Verify a published repo's other.xml uses the given checksum."""
-        other_xml = get_repodata(cfg, distributor, 'other')
         xpath = '{{{}}}package'.format(RPM_NAMESPACES['metadata/other'])
-        packages = other_xml.findall(xpath)
+        packages = iter_repodata(cfg, distributor, 'other', xpath)
         pkgids_len = {len(package.get('pkgid')) for package in packages}
         self.verify_pkgid_len(pkgids_len, checksum_type)
 
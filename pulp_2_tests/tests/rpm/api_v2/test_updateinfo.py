@@ -44,7 +44,7 @@ from urllib.parse import urljoin
 from xml.etree import ElementTree
 
 from packaging.version import Version
-from pulp_smash import api, config, selectors, utils
+from pulp_smash import api, config, utils
 from pulp_smash.exceptions import TaskReportError
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import (
@@ -57,6 +57,8 @@ from pulp_smash.pulp2.utils import (
 )
 from requests.exceptions import HTTPError
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     ERRATA_PACKAGES_UPDATEINFO,
     ERRATA_UPDATE_INFO,
@@ -73,6 +75,8 @@ from pulp_2_tests.constants import (
     RPM_UNSIGNED_FEED_URL,
     RPM_UNSIGNED_URL,
 )
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.tasks import poll_spawned_tasks
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
@@ -179,7 +183,7 @@ class DateUpdateErrataTestCase(unittest.TestCase):
     def setUpClass(cls):
         """Create class-wide variables."""
         cls.cfg = config.get_config()
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo(
             importer_config={'feed': RPM_UNSIGNED_FEED_URL},
             distributors=[gen_distributor()]
@@ -262,7 +266,7 @@ class UpdateInfoTestCase(BaseAPITestCase):
         cls.tasks = {}
 
         # Create a repo.
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['distributors'] = [gen_distributor()]
         repo = client.post(REPOSITORY_PATH, body)
@@ -271,13 +275,13 @@ class UpdateInfoTestCase(BaseAPITestCase):
         try:
             # Populate and publish the repo.
             repo = client.get(repo['_href'], params={'details': True})
-            unit = utils.http_get(RPM_UNSIGNED_URL)
+            unit = http_get(RPM_UNSIGNED_URL)
             upload_import_unit(
                 cls.cfg, unit, {'unit_type_id': 'rpm'}, repo
             )
             for key, erratum in cls.errata.items():
                 report = upload_import_erratum(cls.cfg, erratum, repo)
-                cls.tasks[key] = tuple(api.poll_spawned_tasks(cls.cfg, report))
+                cls.tasks[key] = poll_spawned_tasks(cls.cfg, report)
             publish_repo(cls.cfg, repo)
 
             # Fetch and parse updateinfo.xml.
@@ -338,7 +342,7 @@ class UpdateInfoTestCase(BaseAPITestCase):
         .. _Pulp #1782: https://pulp.plan.io/issues/1782
         .. _Pulp #2032: https://pulp.plan.io/issues/2032
         """
-        if not selectors.bug_is_fixed(2032, self.cfg.pulp_version):
+        if not bug_is_fixed(2032, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2032')
         erratum = self.errata['full']
         update_element = (
@@ -442,7 +446,7 @@ class UpdateRepoTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if check_issue_3104(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
-        cls.client = api.Client(cls.cfg, api.json_handler)
+        cls.client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_SIGNED_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -528,11 +532,11 @@ class PkglistsTestCase(unittest.TestCase):
         cfg = config.get_config()
         if check_issue_3104(cfg):
             self.skipTest('https://pulp.plan.io/issues/3104')
-        if not selectors.bug_is_fixed(2227, cfg.pulp_version):
+        if not bug_is_fixed(2227, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2277')
 
         # Create, sync and publish a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_PKGLISTS_UPDATEINFO_FEED_URL
         body['distributors'] = [gen_distributor()]
@@ -587,7 +591,7 @@ class CleanUpTestCase(unittest.TestCase):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
         if check_issue_2620(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2620')
-        client = api.Client(cls.cfg, api.json_handler)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         body = gen_repo()
         body['distributors'] = [gen_distributor()]
         body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
@@ -602,14 +606,14 @@ class CleanUpTestCase(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Remove the created repository and any orphans."""
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         client.delete(cls.repo['_href'])
         client.delete(ORPHANS_PATH)
 
     def test_01_first_publish(self):
         """Populate and publish the repository."""
         sync_repo(self.cfg, self.repo)
-        client = api.Client(self.cfg)
+        client = http_pool.Client(self.cfg)
         client.post(urljoin(self.repo['_href'], 'actions/unassociate/'), {
             'criteria': {
                 'filters': {'unit': {'filename': RPM}},
@@ -633,7 +637,7 @@ class CleanUpTestCase(unittest.TestCase):
         publish_repo(self.cfg, self.repo)
         self.updateinfo_xml_hrefs.append(self.get_updateinfo_xml_href())
 
-        client = api.Client(self.cfg)
+        client = http_pool.Client(self.cfg)
         with self.subTest(comment='check number of RPMs in repo'):
             units = (
                 search_units(self.cfg, self.repo, {'type_ids': ('rpm',)})
@@ -702,11 +706,11 @@ class OpenSuseErrataTestCase(unittest.TestCase):
     def test_01_create_sync_publish(self):
         """Create, sync, and publish an openSUSE repository."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(3377, cfg.pulp_version):
+        if not bug_is_fixed(3377, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3377')
 
         # Create, sync, and publish a repository.
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['download_policy'] = 'on_demand'
         body['importer_config']['feed'] = OPENSUSE_FEED_URL
@@ -790,7 +794,7 @@ class ErratumMultipleRepositoriesTestCase(unittest.TestCase):
             raise unittest.SkipTest(
                 'This test requires Pulp 2.20 or newer.'
             )
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repos = []
         urls = [
             RPM_PACKAGES_UPDATEINFO_FEED_URL,
@@ -12,7 +12,7 @@ Content`_ and `Publication`_.
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import api, config, exceptions, selectors, utils
+from pulp_smash import api, config, exceptions, utils
 from pulp_smash.pulp2.constants import ORPHANS_PATH, REPOSITORY_PATH
 from pulp_smash.pulp2.utils import (
     BaseAPITestCase,
@@ -22,6 +22,8 @@ from pulp_smash.pulp2.utils import (
     upload_import_unit,
 )
 
+from pulp_2_tests import http_pool
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     DRPM,
     DRPM_UNSIGNED_URL,
@@ -37,6 +39,7 @@ from pulp_2_tests.constants import (
     SRPM,
     SRPM_UNSIGNED_URL,
 )
+from pulp_2_tests.download_cache import http_get
 from pulp_2_tests.tests.rpm.api_v2.utils import (
     gen_distributor,
     gen_repo,
@@ -63,12 +66,12 @@ class UploadDrpmTestCase(unittest.TestCase):
     def test_all(self):
         """Import a DRPM into a repository and search it for content units."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1806, cfg.pulp_version):
+        if not bug_is_fixed(1806, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1806')
-        client = api.Client(cfg)
+        client = http_pool.Client(cfg)
         repo = client.post(REPOSITORY_PATH, gen_repo()).json()
         self.addCleanup(client.delete, repo['_href'])
-        drpm = utils.http_get(DRPM_UNSIGNED_URL)
+        drpm = http_get(DRPM_UNSIGNED_URL)
         upload_import_unit(cfg, drpm, {'unit_type_id': 'drpm'}, repo)
         units = search_units(cfg, repo)
 
@@ -100,14 +103,14 @@ class UploadDrpmTestCaseWithCheckSumType(unittest.TestCase):
         3. Search for all content units in the repository.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1806, cfg.pulp_version):
+        if not bug_is_fixed(1806, cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/1806')
-        if not selectors.bug_is_fixed(2627, cfg.pulp_version):
+        if not bug_is_fixed(2627, cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2627')
-        client = api.Client(cfg)
+        client = http_pool.Client(cfg)
         repo = client.post(REPOSITORY_PATH, gen_repo()).json()
         self.addCleanup(client.delete, repo['_href'])
-        drpm = utils.http_get(DRPM_UNSIGNED_URL)
+        drpm = http_get(DRPM_UNSIGNED_URL)
         upload_import_unit(
             cfg,
             drpm,
@@ -146,10 +149,10 @@ class UploadedDrpmChecksumTypeTestCase(unittest.TestCase):
         * `Pulp Smash #663 <https://github.com/PulpQE/pulp-smash/issues/663>`_
         """
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
-        drpm = utils.http_get(DRPM_UNSIGNED_URL)
+        drpm = http_get(DRPM_UNSIGNED_URL)
         upload_import_unit(cfg, drpm, {
             'unit_metadata': {'checksumtype': 'md5'},
             'unit_type_id': 'drpm',
@@ -159,7 +162,7 @@ class UploadedDrpmChecksumTypeTestCase(unittest.TestCase):
         with self.subTest(comment='verify checksumtype'):
             self.assertEqual(units[0]['metadata']['checksumtype'], 'md5')
         with self.subTest(comment='verify checksum'):
-            if not selectors.bug_is_fixed(2774, cfg.pulp_version):
+            if not bug_is_fixed(2774, cfg.pulp_version):
                 self.skipTest('https://pulp.plan.io/issues/2774')
             self.assertEqual(
                 units[0]['metadata']['checksum'],
@@ -187,9 +190,9 @@ class UploadSrpmTestCase(unittest.TestCase):
         cfg = config.get_config()
         if check_issue_2620(cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2620')
-        cls.client = api.Client(cfg, api.json_handler)
+        cls.client = http_pool.Client(cfg, api.json_handler)
         cls.repo = cls.client.post(REPOSITORY_PATH, gen_repo())
-        srpm = utils.http_get(SRPM_UNSIGNED_URL)
+        srpm = http_get(SRPM_UNSIGNED_URL)
         upload_import_unit(cfg, srpm, {'unit_type_id': 'srpm'}, cls.repo)
         cls.units = search_units(cfg, cls.repo, {}, api.safe_handler)
 
@@ -232,8 +235,8 @@ class UploadRpmTestCase(BaseAPITestCase):
             raise unittest.SkipTest('https://pulp.plan.io/issues/3104')
         if check_issue_2620(cls.cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2620')
-        cls.rpm = utils.http_get(RPM_UNSIGNED_URL)
-        client = api.Client(cls.cfg, api.json_handler)
+        cls.rpm = http_get(RPM_UNSIGNED_URL)
+        client = http_pool.Client(cls.cfg, api.json_handler)
         cls.repos = []
         try:
             for _ in range(2):
@@ -251,7 +254,7 @@ class UploadRpmTestCase(BaseAPITestCase):
     @classmethod
     def tearDownClass(cls):
         """Clean up resources created during the test."""
-        client = api.Client(cls.cfg)
+        client = http_pool.Client(cls.cfg)
         for repo in cls.repos:
             client.delete(repo['_href'])
         client.delete(ORPHANS_PATH)
@@ -277,7 +280,7 @@ class UploadRpmTestCase(BaseAPITestCase):
 
         Execute :meth:`verify_repo_search` and :meth:`verify_repo_download`.
         """
-        api.Client(self.cfg).post(
+        http_pool.Client(self.cfg).post(
             urljoin(self.repos[1]['_href'], 'actions/associate/'),
             {'source_repo_id': self.repos[0]['id']}
         )
@@ -340,7 +343,7 @@ class UploadRpmTestCase(BaseAPITestCase):
                 RPM_DATA['metadata']['files'],
             )
 
-        if selectors.bug_is_fixed(2754, self.cfg.pulp_version):
+        if bug_is_fixed(2754, self.cfg.pulp_version):
             # Test that additional fields are available.
             # Affected by Pulp issue #2754
 
@@ -393,7 +396,7 @@ class VendorInfoTestCase(unittest.TestCase):
     def setUpClass(cls):
         """Create class-wide variables."""
         cls.cfg = config.get_config()
-        if not selectors.bug_is_fixed(2781, cls.cfg.pulp_version):
+        if not bug_is_fixed(2781, cls.cfg.pulp_version):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2781')
 
     def test_upload(self):
@@ -402,10 +405,10 @@ class VendorInfoTestCase(unittest.TestCase):
         Create a repository, upload an RPM with a non-null vendor, and perform
         several checks. See :meth:`do_test`.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
-        rpm = utils.http_get(RPM_WITH_VENDOR_URL)
+        rpm = http_get(RPM_WITH_VENDOR_URL)
         upload_import_unit(self.cfg, rpm, {'unit_type_id': 'rpm'}, repo)
         self.do_test(repo)
 
@@ -415,7 +418,7 @@ class VendorInfoTestCase(unittest.TestCase):
         Create a repository, sync in an RPM with a non-null vendor, and perform
         several checks. See :meth:`do_test`.
         """
-        client = api.Client(self.cfg, api.json_handler)
+        client = http_pool.Client(self.cfg, api.json_handler)
         body = gen_repo()
         body['importer_config']['feed'] = RPM_WITH_VENDOR_FEED_URL
         repo = client.post(REPOSITORY_PATH, body)
@@ -502,16 +505,16 @@ class UploadInvalidRPMTestCase(unittest.TestCase):
         3. Verify that the repository contains no RPMs.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2543, cfg.pulp_version):
+        if not bug_is_fixed(2543, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2543')
-        if not selectors.bug_is_fixed(3090, cfg.pulp_version):
+        if not bug_is_fixed(3090, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/3090')
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         repo = client.post(REPOSITORY_PATH, gen_repo())
         self.addCleanup(client.delete, repo['_href'])
 
         # Upload invalid RPM
-        rpm = utils.http_get(RPM_INVALID_URL)
+        rpm = http_get(RPM_INVALID_URL)
         with self.assertRaises(exceptions.TaskReportError) as context:
             upload_import_unit(cfg, rpm, {'unit_type_id': 'rpm'}, repo)
         task = context.exception.task
@@ -543,11 +546,11 @@ class UploadLargeMetadataRPM(unittest.TestCase):
         * `Pulp-2-Tests #88 <https://github.com/PulpQE/Pulp-2-Tests/issues/88>`_
         """
         cfg = config.get_config()
-        client = api.Client(cfg, api.json_handler)
+        client = http_pool.Client(cfg, api.json_handler)
         body = gen_repo(distributors=[gen_distributor()])
         repo = client.post(REPOSITORY_PATH, body)
         self.addCleanup(client.delete, repo['_href'])
-        rpm = utils.http_get(RPM_LARGE_METADATA_FEED)
+        rpm = http_get(RPM_LARGE_METADATA_FEED)
         upload_import_unit(cfg, rpm, {'unit_type_id': 'rpm'}, repo)
         repo = client.get(repo['_href'], params={'details': True})
         publish_repo(cfg, repo)
@@ -2,18 +2,27 @@
 """Utility functions for RPM API tests."""
 import gzip
 import io
-import time
-import unittest
+import threading
+from collections import OrderedDict, namedtuple
 from os.path import basename, join
 from urllib.parse import urljoin
 from xml.etree import ElementTree
 
 import requests
 from packaging.version import Version
-from pulp_smash import api, cli, exceptions, selectors, utils
-from pulp_smash.pulp2.utils import search_units
+from pulp_smash import cli, exceptions, utils
 
+from pulp_2_tests import http_pool, ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_NAMESPACES
+from pulp_2_tests.download_cache import http_get
+from pulp_2_tests.tasks import RepoFactory
+from pulp_2_tests.units import iter_units
+from pulp_2_tests.user_pool import (
+    acquire_user,
+    get_leased_user,
+    release_user,
+)
 
 
 def gen_consumer():
@@ -56,6 +65,40 @@ def gen_distributor(**kwargs):
     return data
 
 
+def create_sync_publish_repos(  # pylint:disable=too-many-arguments
+        cfg,
+        bodies,
+        cleanup=None,
+        sync=True,
+        publish=True,
+        max_workers=5):
+    """Create, sync and publish several RPM repositories concurrently.
+
+    A typical invocation is as follows:
+
+        >>> bodies = [gen_repo(distributors=[gen_distributor()]) for _ in ...]
+        >>> for body in bodies:
+        ...     body['importer_config']['feed'] = RPM_UNSIGNED_FEED_URL
+        >>> repos = create_sync_publish_repos(cfg, bodies, self.addCleanup)
+
+    :param cfg: Information about a Pulp host.
+    :param bodies: An iterable of repository bodies, as returned by
+        :func:`gen_repo`.
+    :param cleanup: A callable for scheduling cleanup actions, such as
+        ``self.addCleanup``. See ``pulp_2_tests.tasks.RepoFactory.create``.
+    :param sync: Whether to sync each repository.
+    :param publish: Whether to publish each repository with its first
+        distributor.
+    :param max_workers: How many repositories to set up at once.
+    :returns: A list of detailed dicts of information about the repositories,
+        in the same order as ``bodies``.
+    :raises pulp_2_tests.tasks.RepoFactoryError: If any repository could not
+        be set up.
+    """
+    factory = RepoFactory(cfg, max_workers, sync, publish)
+    return factory.create(bodies, cleanup)
+
+
 def get_repodata_repomd_xml(cfg, distributor, response_handler=None):
     """Download the given repository's ``repodata/repomd.xml`` file.
 
@@ -74,7 +117,7 @@ def get_repodata_repomd_xml(cfg, distributor, response_handler=None):
     path = urljoin(path, 'repodata/repomd.xml')
     if response_handler is None:
         response_handler = xml_handler
-    return api.Client(cfg, response_handler).get(path)
+    return http_pool.Client(cfg, response_handler).get(path)
 
 
 def get_repodata(
@@ -98,6 +141,50 @@ def get_repodata(
         given, :func:`get_repodata_repomd_xml` is consulted.
     :returns: Whatever is dictated by ``response_handler``.
     """
+    path = _get_repodata_path(cfg, distributor, type_, repomd_xml)
+    if response_handler is None:
+        response_handler = xml_handler
+    return http_pool.Client(cfg, response_handler).get(path)
+
+
+def iter_repodata(cfg, distributor, type_, tag, repomd_xml=None):
+    """Lazily yield elements from a file in a ``repodata/`` directory.
+
+    This function is a streaming counterpart to :func:`get_repodata`. The file
+    is downloaded and decompressed incrementally, and each element named
+    ``tag`` is yielded as soon as it has been parsed. For example:
+
+        >>> tag = '{{{}}}package'.format(RPM_NAMESPACES['metadata/common'])
+        >>> names = [
+        ...     package.findtext('{{{}}}name'.format(...))
+        ...     for package in iter_repodata(cfg, distributor, 'primary', tag)
+        ... ]
+
+    Memory usage is constant with respect to the number of elements in the
+    file, so this function is suitable for checking the ``primary.xml``,
+    ``filelists.xml`` and ``other.xml`` files of large repositories. See
+    :func:`xml_iter_handler` for caveats.
+
+    :param cfg: Information about a Pulp host.
+    :param distributor: A dict of information about a repository distributor.
+    :param type_: The type of file to fetch from a repository's ``repodata/``
+        directory. Valid values might be "primary" or "filelists".
+    :param tag: The fully qualified tag of the elements to yield, such as
+        ``{http://linux.duke.edu/metadata/common}package``.
+    :param repomd_xml: A ``repomd.xml`` file as an ``ElementTree``. If not
+        given, :func:`get_repodata_repomd_xml` is consulted.
+    :returns: A generator yielding ``xml.etree.Element`` instances.
+    """
+    path = _get_repodata_path(cfg, distributor, type_, repomd_xml)
+    client = http_pool.Client(cfg, xml_iter_handler(tag))
+    yield from client.get(path, stream=True)
+
+
+def _get_repodata_path(cfg, distributor, type_, repomd_xml=None):
+    """Return the path to a file of the given ``type_`` in ``repodata/``.
+
+    See :func:`get_repodata` for a description of the parameters.
+    """
     # Download and search through ``.../repodata/repomd.xml``.
     if repomd_xml is None:
         repomd_xml = get_repodata_repomd_xml(cfg, distributor)
@@ -117,10 +204,7 @@ def get_repodata(
     path = urljoin('/pulp/repos/', distributor['config']['relative_url'])
     if not path.endswith('/'):
         path += '/'
-    path = urljoin(path, location_elements[0].get('href'))
-    if response_handler is None:
-        response_handler = xml_handler
-    return api.Client(cfg, response_handler).get(path)
+    return urljoin(path, location_elements[0].get('href'))
 
 
 def get_xml_content_from_fixture(fixture_path, data_type):
@@ -151,7 +235,7 @@ def get_xml_content_from_fixture(fixture_path, data_type):
 
     """
     repo_path = urljoin(fixture_path, 'repodata/repomd.xml')
-    response = utils.http_get(repo_path)
+    response = http_get(repo_path)
     root_elem = ElementTree.fromstring(response)
 
     xpath = '{{{}}}data'.format(RPM_NAMESPACES['metadata/repo'])
@@ -200,6 +284,70 @@ def xml_handler(_, response):
     return ElementTree.fromstring(xml_bytes)
 
 
+def xml_iter_handler(tag):
+    """Return a response handler that lazily yields XML elements.
+
+    The returned handler is a streaming counterpart to :func:`xml_handler`. When
+    it handles a response, it will check the status code of ``response`` and
+    return a generator. The generator decompresses the response body
+    incrementally (if the request URL ended in ``.gz``), parses it with
+    ``xml.etree.ElementTree.iterparse``, and yields each element named ``tag``
+    once that element has been completely parsed. A typical invocation is as
+    follows:
+
+        >>> client = http_pool.Client(cfg, xml_iter_handler(tag))
+        >>> for element in client.get(path, stream=True):
+        ...     pass
+
+    Note:
+
+    * The request should be made with ``stream=True``. Otherwise, Requests
+      will load the entire response body into memory before this handler is
+      called.
+    * Each element is cleared after it is yielded, so as to keep memory usage
+      constant. Callers must extract whatever information they need from an
+      element before advancing the generator, or make a copy with
+      ``copy.deepcopy``.
+    * The ``Content-Type`` and ``Content-Encoding`` response headers are
+      ignored due to https://pulp.plan.io/issues/1781.
+
+    :param tag: The fully qualified tag of the elements to yield, such as
+        ``{http://linux.duke.edu/metadata/common}package``.
+    :returns: A response handler.
+    """
+    def handler(_, response):
+        """Check the status code of ``response`` and return a generator."""
+        response.raise_for_status()
+        return _iterparse_response(response, tag)
+    return handler
+
+
+def _iterparse_response(response, tag):
+    """Incrementally parse ``response``, yielding elements named ``tag``."""
+    # Mimic ``response.content``, which transparently decodes the body
+    # according to any transfer encodings the server has applied.
+    response.raw.decode_content = True
+    try:
+        if response.request.url.endswith('.gz'):  # See xml_handler()
+            source = gzip.GzipFile(fileobj=response.raw)
+        else:
+            source = response.raw
+        root = None
+        for event, element in ElementTree.iterparse(
+                source, events=('start', 'end')):
+            if root is None:
+                root = element
+            if event == 'end' and element.tag == tag:
+                yield element
+                # Drop the element's contents and detach it from the tree.
+                # Without the latter step, the root element would accumulate
+                # an (empty) child for each element parsed.
+                element.clear()
+                root.clear()
+    finally:
+        response.close()
+
+
 class DisableSELinuxMixin():  # pylint:disable=too-few-public-methods
     """A mixin providing the ability to temporarily disable SELinux."""
 
@@ -231,9 +379,9 @@ class DisableSELinuxMixin():  # pylint:disable=too-few-public-methods
         # We cannot execute `PATH=${PATH}:/usr/sbin which getenforce` because
         # Plumbum does a good job of preventing shell expansions. See:
         # https://github.com/PulpQE/pulp-smash/issues/89
-        if selectors.bug_is_fixed(pulp_issue_id, cfg.pulp_version):
+        if bug_is_fixed(pulp_issue_id, cfg.pulp_version):
             return
-        client = cli.Client(cfg, cli.echo_handler)
+        client = ssh.Client(cfg, cli.echo_handler)
         cmd = 'test -e /usr/sbin/getenforce'.split()
         if client.run(cmd).returncode != 0:
             return
@@ -259,6 +407,9 @@ class TemporaryUserMixin():
         ssh_user, priv_key = self.make_user(cfg)
         ssh_identity_file = self.write_private_key(cfg, priv_key)
 
+    Users are leased from :mod:`pulp_2_tests.user_pool`, which creates them in
+    batches and deletes them in the background.
+
     This mixin requires that the ``unittest.TestCase`` class from the standard
     library be a parent class.
     """
@@ -272,92 +423,9 @@ class TemporaryUserMixin():
             host being targeted.
         :returns: A ``(username, private_key)`` tuple.
         """
-        creator = self._make_user(cfg)
-        username = next(creator)
-        self.addCleanup(self.delete_user, cfg, username)
-        private_key = next(creator)
-        return (username, private_key)
-
-    @staticmethod
-    def _make_user(cfg):
-        """Create a user account on a target system.
-
-        This method is implemented as a generator. When executed, it will yield
-        a username and private key. The corresponding public key is made the
-        one and only key in the user's ``authorized_keys`` file.
-
-        The username and private key are yielded one-by-one rather than as a
-        pair because the user creation and key creation steps are executed
-        serially.  Should the latter fail, the calling function will still be
-        able to delete the created user.
-
-        The user is given a home directory. When deleting this user, make sure
-        to pass ``--remove`` to ``userdel``. Otherwise, the home directory will
-        be left in place.
-        """
-        client = cli.Client(cfg)
-
-        # According to useradd(8), usernames may be up to 32 characters long.
-        # But long names break the rsync publish process: (SNIP == username)
-        #
-        #     unix_listener:
-        #     "/tmp/rsync_distributor-[SNIP]@example.com:22.64tcAiD8em417CiN"
-        #     too long for Unix domain socket
-        #
-        username = utils.uuid4()[:12]
-        cmd = 'useradd --create-home {0}'
-        client.run((cmd.format(username)).split(), sudo=True)
-        yield username
-
-        cmd = 'runuser --shell /bin/sh {} --command'.format(username).split()
-        cmd.append('ssh-keygen -N "" -f /home/{}/.ssh/mykey'.format(username))
-        client.run(cmd, sudo=True)
-        cmd = 'cp /home/{0}/.ssh/mykey.pub /home/{0}/.ssh/authorized_keys'
-        client.run((cmd.format(username)).split(), sudo=True)
-        cmd = 'cat /home/{0}/.ssh/mykey'
-        private_key = client.run(
-            (cmd.format(username)).split(), sudo=True).stdout
-        yield private_key
-
-    @staticmethod
-    def delete_user(cfg, username):
-        """Delete a user.
-
-        The Pulp rsync distributor has a habit of leaving (idle?) SSH sessions
-        open even after publishing a repository. When executed, this function
-        will:
-
-        1. Poll the process list until all processes belonging to ``username``
-           have died, or raise a ``unittest.SkipTest`` exception if the time
-           limit is exceeded.
-        2. Delete ``username``.
-        """
-        client = cli.Client(cfg)
-
-        # values are arbitrary
-        iter_time = 2  # seconds
-        iter_limit = 15  # unitless
-
-        # Wait for user's processes to die.
-        cmd = ('ps', '-wwo', 'args', '--user', username, '--no-headers')
-        i = 0
-        while i <= iter_limit:
-            try:
-                user_processes = client.run(cmd, sudo=True).stdout.splitlines()
-            except exceptions.CalledProcessError:
-                break
-            i += 1
-            time.sleep(iter_time)
-        else:
-            raise unittest.SkipTest(
-                'User still has processes running after {}+ seconds. Aborting '
-                'test. User processes: {}'
-                .format(iter_time * iter_limit, user_processes)
-            )
-
-        # Delete user.
-        cmd = ('userdel', '--remove', username)
-        client.run(cmd, sudo=True)
+        user = acquire_user(cfg)
+        self.addCleanup(release_user, cfg, user)
+        return (user.username, user.private_key)
 
     def write_private_key(self, cfg, private_key):
         """Write the given private key to a file on disk.
@@ -366,16 +434,21 @@ class TemporaryUserMixin():
         ``600``. In addition, schedule the key for deletion with
         ``self.addCleanup``.
 
+        The keys of users created by :meth:`make_user` have already been
+        written, and the existing file is returned.
+
         :param cfg: Information about the
             host being targeted.
         :returns: The path to the private key on disk, as a string.
         """
-        client = cli.Client(cfg)
+        user = get_leased_user(private_key)
+        if user is not None:
+            return user.identity_file
+        client = ssh.Client(cfg)
         ssh_identity_file = client.run(['mktemp']).stdout.strip()
         self.addCleanup(
             client.run, ('rm ' + ssh_identity_file).split(), sudo=True)
-        # machine.session is used here to keep SSH session open
-        client.machine.session().run(
+        client.run_shell(
             "echo '{}' > {}".format(private_key, ssh_identity_file)
         )
         client.run(['chmod', '600', ssh_identity_file])
@@ -399,8 +472,11 @@ def get_unit(cfg, distributor, unit_name, primary_xml=None):
 
         >>> foo_rpm = get_unit(cfg, repo['distributors'][0], 'foo.rpm')
 
-    If multiple units are being fetched, efficiency can be improved by passing
-    in a parsed ``primary.xml`` file:
+    By default, the distributor's metadata is looked up with
+    :meth:`PublishedRepodata.get`, so ``primary.xml`` is downloaded and indexed
+    only once per published revision of the repository, no matter how many
+    units are fetched. Alternatively, a parsed ``primary.xml`` file may be
+    passed in:
 
         >>> distributor = repo['distributors'][0]
         >>> primary_xml = get_repodata(cfg, distributor, 'primary')
@@ -413,26 +489,270 @@ def get_unit(cfg, distributor, unit_name, primary_xml=None):
     :param unit_name: The name of a content unit to be fetched. For example:
         "bear-4.1-1.noarch.rpm".
     :param primary_xml: A ``primary.xml`` file as an ``ElementTree``. If not
-        given, :func:`get_repodata` is consulted.
+        given, :meth:`PublishedRepodata.get` is consulted.
     :returns: A raw response. The unit is available as ``response.content``.
+    :raises: ``KeyError`` if no package named ``unit_name`` is listed in
+        ``primary.xml``.
     """
     if primary_xml is None:
-        primary_xml = get_repodata(cfg, distributor, 'primary')
+        return PublishedRepodata.get(cfg, distributor).get_unit(unit_name)
 
-    # Create a dict in the form {foo.rpm: Packages/f/foo.rpm}
+    # Find the href in the form Packages/f/foo.rpm
     xpath = '{{{}}}package'.format(RPM_NAMESPACES['metadata/common'])
     packages = primary_xml.findall(xpath)
     xpath = '{{{}}}location'.format(RPM_NAMESPACES['metadata/common'])
-    hrefs = [package.find(xpath).get('href') for package in packages]
-    href_map = {basename(href): href for href in hrefs}
-    href = href_map[unit_name]
+    for package in packages:
+        href = package.find(xpath).get('href')
+        if basename(href) == unit_name:
+            break
+    else:
+        raise KeyError(unit_name)
+    return _get_published_file(cfg, distributor, href)
+
+
+def _get_published_file(cfg, distributor, href):
+    """Download a file from a published repository.
 
-    # Fetch the unit.
+    :param cfg: Information about a Pulp host.
+    :param distributor: A dict of information about a repository distributor.
+    :param href: The path to a file, relative to the distributor's
+        ``relative_url``. For example: "Packages/f/foo.rpm".
+    :returns: A raw response.
+    """
     path = urljoin('/pulp/repos/', distributor['config']['relative_url'])
     if not path.endswith('/'):
         path += '/'
     path = urljoin(path, href)
-    return api.Client(cfg).get(path)
+    return http_pool.Client(cfg).get(path)
+
+
+RepodataPackage = namedtuple('RepodataPackage', (
+    'name',
+    'epoch',
+    'version',
+    'release',
+    'arch',
+    'checksum_type',
+    'checksum',
+    'location',
+))
+"""A ``<package>`` element from a ``primary.xml`` file, in summarized form.
+
+``location`` is the package's href, relative to the root of the published
+repository. For example: "Packages/b/bear-4.1-1.noarch.rpm".
+"""
+
+
+class PublishedRepodata():  # pylint:disable=too-many-instance-attributes
+    """The parsed and indexed ``repodata/`` files of a published repository.
+
+    Downloading and parsing a ``repodata/`` file is slow, and doing so
+    repeatedly is wasteful. This class downloads and parses each data file at
+    most once, and indexes the packages listed in ``primary.xml``. Instances
+    should be created with :meth:`get`, which caches them by distributor and
+    ``repomd.xml`` revision. A typical usage is as follows:
+
+    .. code-block:: python
+
+        @classmethod
+        def setUpClass(cls):
+            ...
+            cls.repodata = PublishedRepodata.get(cfg, repo['distributors'][0])
+
+        def test_bear(self):
+            self.assertIn('bear', self.repodata.by_name)
+
+    Instances are immutable in the sense that they describe a single published
+    revision of a repository. After a repository is re-published, call
+    :meth:`get` again to get an up-to-date instance.
+
+    The package indexes are built lazily, on first access, by streaming
+    ``primary.xml`` with :func:`iter_repodata`. They are:
+
+    ``by_name``
+        A dict mapping package names to tuples of :data:`RepodataPackage`.
+    ``by_nevra``
+        A dict mapping ``(name, epoch, version, release, arch)`` tuples to a
+        :data:`RepodataPackage`.
+    ``by_checksum``
+        A dict mapping package checksums to a :data:`RepodataPackage`.
+    ``by_location``
+        A dict mapping package hrefs, such as "Packages/b/bear.rpm", to a
+        :data:`RepodataPackage`.
+    ``by_filename``
+        A dict mapping package file names, such as "bear.rpm", to a
+        :data:`RepodataPackage`.
+
+    :param cfg: Information about a Pulp host.
+    :param distributor: A dict of information about a repository distributor.
+    :param repomd_xml: The distributor's ``repomd.xml`` file, as an
+        ``ElementTree``.
+    """
+
+    cache_size = 16
+    """The number of instances retained by :meth:`get`."""
+
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, cfg, distributor, repomd_xml):
+        """Initialize instance attributes."""
+        self.cfg = cfg
+        self.distributor = distributor
+        self.repomd_xml = repomd_xml
+        self.packages = None
+        self.by_name = None
+        self.by_nevra = None
+        self.by_checksum = None
+        self.by_location = None
+        self.by_filename = None
+        self._xml = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, cfg, distributor):
+        """Return metadata about the given distributor's latest publish.
+
+        Download the distributor's ``repomd.xml`` file. (This file is small.)
+        If an instance describing the same distributor and revision is cached,
+        return it. Otherwise, create, cache and return a new instance.
+
+        :param cfg: Information about a Pulp host.
+        :param distributor: A dict of information about a repository
+            distributor.
+        :returns: A :class:`PublishedRepodata` instance.
+        """
+        repomd_xml = get_repodata_repomd_xml(cfg, distributor)
+        key = cls._get_cache_key(cfg, distributor, repomd_xml)
+        with cls._cache_lock:
+            if key in cls._cache:
+                cls._cache.move_to_end(key)
+                return cls._cache[key]
+            repodata = cls(cfg, distributor, repomd_xml)
+            cls._cache[key] = repodata
+            while len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+        return repodata
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget all instances cached by :meth:`get`."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @staticmethod
+    def _get_cache_key(cfg, distributor, repomd_xml):
+        """Return a key identifying a published revision of a repository.
+
+        The ``<revision>`` element of ``repomd.xml`` has a resolution of one
+        second. The checksum of each data file is also included in the key, so
+        that back-to-back publishes are told apart.
+        """
+        namespace = RPM_NAMESPACES['metadata/repo']
+        checksums = tuple(sorted(
+            element.text for element in repomd_xml.findall(
+                '{{{0}}}data/{{{0}}}checksum'.format(namespace)
+            )
+        ))
+        return (
+            cfg.get_hosts('api')[0].hostname,
+            distributor['config']['relative_url'],
+            repomd_xml.findtext('{{{}}}revision'.format(namespace)),
+            checksums,
+        )
+
+    @property
+    def revision(self):
+        """Return the ``<revision>`` of this instance's ``repomd.xml``."""
+        return self.repomd_xml.findtext(
+            '{{{}}}revision'.format(RPM_NAMESPACES['metadata/repo'])
+        )
+
+    def get_xml(self, type_):
+        """Return a file of the given ``type_``, parsed as an ``ElementTree``.
+
+        The file is downloaded and parsed only once. See :func:`get_repodata`.
+        """
+        with self._lock:
+            if type_ not in self._xml:
+                self._xml[type_] = get_repodata(
+                    self.cfg,
+                    self.distributor,
+                    type_,
+                    repomd_xml=self.repomd_xml,
+                )
+            return self._xml[type_]
+
+    def iter_xml(self, type_, tag):
+        """Lazily yield elements from a file of the given ``type_``.
+
+        Nothing is cached. See :func:`iter_repodata`.
+        """
+        return iter_repodata(
+            self.cfg,
+            self.distributor,
+            type_,
+            tag,
+            repomd_xml=self.repomd_xml,
+        )
+
+    def index(self):
+        """Build the package indexes, if they have not been built already.
+
+        This method is called automatically by :meth:`get_unit`. Call it
+        explicitly before reading one of the ``by_*`` attributes.
+
+        :returns: This instance.
+        """
+        with self._lock:
+            if self.packages is None:
+                self._index()
+        return self
+
+    def _index(self):
+        """Stream ``primary.xml`` and build the package indexes."""
+        namespace = RPM_NAMESPACES['metadata/common']
+        tag = '{{{}}}package'.format(namespace)
+        packages = []
+        for element in self.iter_xml('primary', tag):
+            version = element.find('{{{}}}version'.format(namespace))
+            checksum = element.find('{{{}}}checksum'.format(namespace))
+            location = element.find('{{{}}}location'.format(namespace))
+            packages.append(RepodataPackage(
+                name=element.findtext('{{{}}}name'.format(namespace)),
+                epoch=version.get('epoch'),
+                version=version.get('ver'),
+                release=version.get('rel'),
+                arch=element.findtext('{{{}}}arch'.format(namespace)),
+                checksum_type=checksum.get('type'),
+                checksum=checksum.text,
+                location=location.get('href'),
+            ))
+        by_name = {}
+        for package in packages:
+            by_name.setdefault(package.name, []).append(package)
+        self.by_name = {name: tuple(pkgs) for name, pkgs in by_name.items()}
+        self.by_nevra = {package[:5]: package for package in packages}
+        self.by_checksum = {package.checksum: package for package in packages}
+        self.by_location = {package.location: package for package in packages}
+        self.by_filename = {
+            basename(package.location): package for package in packages
+        }
+        self.packages = tuple(packages)
+
+    def get_unit(self, unit_name):
+        """Download a package from the published repository.
+
+        :param unit_name: The file name of a package. For example:
+            "bear-4.1-1.noarch.rpm".
+        :returns: A raw response. The unit is available as
+            ``response.content``.
+        :raises: ``KeyError`` if no package named ``unit_name`` is listed in
+            ``primary.xml``.
+        """
+        package = self.index().by_filename[unit_name]
+        return _get_published_file(
+            self.cfg, self.distributor, package.location)
 
 
 def get_dists_by_type_id(cfg, repo):
@@ -443,7 +763,8 @@ def get_dists_by_type_id(cfg, repo):
     :param repo_href: A dict of information about a repository.
     :returns: A dict in the form ``{'type_id': {distributor_info}}``.
     """
-    dists = api.Client(cfg).get(urljoin(repo['_href'], 'distributors/')).json()
+    dists = http_pool.Client(cfg).get(
+        urljoin(repo['_href'], 'distributors/')).json()
     return {dist['distributor_type_id']: dist for dist in dists}
 
 
@@ -465,7 +786,7 @@ def set_pulp_manage_rsync(cfg, boolean):
     :returns: Information about the executed command, or ``None`` if no command
         was executed.
     """
-    client = cli.Client(cfg)
+    client = ssh.Client(cfg)
     try:
         # setsebool is installed at /usr/sbin/setsebool on some distros, and
         # requires root privileges to discover.
@@ -486,7 +807,7 @@ def get_rpm_names_versions(cfg, repo):
         versions sorted in ascending order. For example: ``{'walrus': ['0.71',
         '5.21']}``.
     """
-    rpms = search_units(cfg, repo, {'type_ids': ['rpm']})
+    rpms = iter_units(cfg, repo, {'type_ids': ['rpm']}, ('name', 'version'))
     names_versions = {}
     for rpm in rpms:
         rpm_name = rpm['metadata']['name']
@@ -503,7 +824,7 @@ def get_rpm_published_path(cfg, repo, rpm_name):
         '/var/lib/pulp/published/yum/https/repos/',
         repo['distributors'][0]['config']['relative_url']
     )
-    return cli.Client(cfg).run(
+    return ssh.Client(cfg).run(
         'find {} -name'.format(_path)
         .split() + [rpm_name], sudo=True
     ).stdout.strip()
@@ -7,9 +7,11 @@ sequences are encountered.
 """
 import unittest
 
-from pulp_smash import cli, config, selectors, utils
+from pulp_smash import config, utils
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_WITH_NON_ASCII_URL, RPM_WITH_NON_UTF_8_URL
 from pulp_2_tests.tests.rpm.utils import set_up_module
 
@@ -33,7 +35,7 @@ class UploadNonAsciiTestCase(unittest.TestCase):
     def test_all(self):
         """Test whether one can upload an RPM with non-ascii metadata."""
         cfg = config.get_config()
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
 
         # Get the RPM
         rpm = client.run(('mktemp',)).stdout.strip()
@@ -74,9 +76,9 @@ class UploadNonUtf8TestCase(unittest.TestCase):
     def test_all(self):
         """Test whether one can upload an RPM with non-utf-8 metadata."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1903, cfg.pulp_version):
+        if not bug_is_fixed(1903, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1903')
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
 
         # Get the RPM
         rpm = client.run(('mktemp',)).stdout.strip()
@@ -4,12 +4,14 @@ import subprocess
 import unittest
 from urllib.parse import urljoin
 
-import pytest
 from packaging.version import Version
-from pulp_smash import cli, config, selectors, utils
+from pulp_smash import cli, config, utils
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_UNSIGNED_FEED_URL
+from pulp_2_tests.lazy import pytest_mark
 from pulp_2_tests.tests.rpm.cli.utils import count_langpacks
 from pulp_2_tests.tests.rpm.utils import (
     check_issue_2277,
@@ -33,7 +35,7 @@ def setUpModule():  # pylint:disable=invalid-name
     """
     set_up_module()
     cfg = config.get_config()
-    client = cli.Client(config.get_config())
+    client = ssh.Client(config.get_config())
 
     # log in, then create repository
     pulp_admin_login(cfg)
@@ -59,7 +61,7 @@ def setUpModule():  # pylint:disable=invalid-name
 
 def tearDownModule():  # pylint:disable=invalid-name
     """Delete the repository created by ``setUpModule``."""
-    cli.Client(config.get_config()).run(
+    ssh.Client(config.get_config()).run(
         'pulp-admin rpm repo delete --repo-id {}'.format(_REPO_ID).split()
     )
 
@@ -79,7 +81,7 @@ class UtilsMixin():  # pylint:disable=too-few-public-methods
         :return: The repository's ID.
         """
         repo_id = utils.uuid4()
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
         client.run(
             'pulp-admin rpm repo create --repo-id {}'.format(repo_id).split()
         )
@@ -106,7 +108,7 @@ class CopyTestCase(UtilsMixin, unittest.TestCase):
         if check_issue_2620(cfg):
             self.skipTest('https://pulp.plan.io/issues/2620')
         repo_id = self.create_repo(cfg)
-        cli.Client(cfg).run(
+        ssh.Client(cfg).run(
             'pulp-admin rpm repo copy rpm --from-repo-id {} --to-repo-id {} '
             '--str-eq name=chimpanzee'.format(_REPO_ID, repo_id).split()
         )
@@ -115,7 +117,7 @@ class CopyTestCase(UtilsMixin, unittest.TestCase):
         self.assertEqual(len(rpms['chimpanzee']), 1, rpms)
 
 
-@pytest.mark.recursive_conservative
+@pytest_mark('recursive_conservative')
 class CopyRecursiveTestCase(UtilsMixin, unittest.TestCase):
     """Recursively copy a "chimpanzee" unit from one repository to another.
 
@@ -140,7 +142,7 @@ class CopyRecursiveTestCase(UtilsMixin, unittest.TestCase):
         if check_issue_2620(cfg):
             self.skipTest('https://pulp.plan.io/issues/2620')
         repo_id = self.create_repo(cfg)
-        proc = cli.Client(cfg).run((
+        proc = ssh.Client(cfg).run((
             'pulp-admin', 'rpm', 'repo', 'copy', 'rpm', '--from-repo-id',
             _REPO_ID, '--to-repo-id', repo_id, '--str-eq', 'name=chimpanzee',
             '--recursive',
@@ -177,10 +179,10 @@ class CopyLangpacksTestCase(UtilsMixin, unittest.TestCase):
         * A non-zero number of langpacks are present in the target repository.
         """
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(1367, cfg.pulp_version):
+        if not bug_is_fixed(1367, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1367')
         repo_id = self.create_repo(cfg)
-        completed_proc = cli.Client(cfg).run(
+        completed_proc = ssh.Client(cfg).run(
             'pulp-admin rpm repo copy langpacks --from-repo-id {} '
             '--to-repo-id {}'.format(_REPO_ID, repo_id).split()
         )
@@ -222,7 +224,7 @@ class UpdateRpmTestCase(UtilsMixin, unittest.TestCase):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2277')
         if check_issue_2620(cfg):
             raise unittest.SkipTest('https://pulp.plan.io/issues/2620')
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
         pkg_mgr = cli.PackageManager(cfg)
 
         # Create the second repository.
@@ -261,7 +263,7 @@ class UpdateRpmTestCase(UtilsMixin, unittest.TestCase):
         :param rpm_version: The version of the RPM to copy.
         :param repo_id: The repository to which the RPM is copied.
         """
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
 
         # Copy the package and its dependencies to the new repo
         proc = client.run((
@@ -307,7 +309,7 @@ def _get_rpm_names_versions(cfg, repo_id):
         '5.21']}``.
     """
     keyword = 'Filename:'
-    completed_proc = cli.Client(cfg).run(
+    completed_proc = ssh.Client(cfg).run(
         'pulp-admin rpm repo content rpm --repo-id {}'.format(repo_id).split()
     )
     names_versions = {}
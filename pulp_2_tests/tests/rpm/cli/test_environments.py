@@ -4,9 +4,10 @@ import subprocess
 import unittest
 
 from packaging.version import Version
-from pulp_smash import cli, config, utils
+from pulp_smash import config, utils
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import ssh
 from pulp_2_tests.constants import RPM_SIGNED_FEED_URL
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
@@ -35,7 +36,7 @@ class UploadPackageEnvTestCase(unittest.TestCase):
             raise unittest.SkipTest('These tests require Pulp 2.9 or above.')
         pulp_admin_login(cls.cfg)
         cls.repo_id = utils.uuid4()
-        cls.client = cli.Client(cls.cfg)
+        cls.client = ssh.Client(cls.cfg)
         cls.client.run(
             'pulp-admin rpm repo create --repo-id {} --feed {}'
             .format(cls.repo_id, RPM_SIGNED_FEED_URL).split()
@@ -3,8 +3,9 @@
 import unittest
 
 from packaging.version import Version
-from pulp_smash import cli, config, utils
+from pulp_smash import config, utils
 
+from pulp_2_tests import ssh
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 from pulp_2_tests.tests.rpm.cli.utils import count_langpacks
 
@@ -29,7 +30,7 @@ class UploadAndRemoveLangpacksTestCase(unittest.TestCase):
         cls.cfg = config.get_config()
         if cls.cfg.pulp_version < Version('2.9'):
             raise unittest.SkipTest('This test requires Pulp 2.9 or greater.')
-        cls.client = cli.Client(cls.cfg)
+        cls.client = ssh.Client(cls.cfg)
         cls.repo_id = utils.uuid4()
         cls.client.run(
             'pulp-admin rpm repo create --repo-id {}'
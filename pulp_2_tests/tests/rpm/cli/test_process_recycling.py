@@ -1,14 +1,16 @@
 # coding=utf-8
 """Test Pulp's ability to recycle processes."""
-import time
 import unittest
 
-from pulp_smash import cli, config, selectors, utils
+from pulp_smash import cli, config, utils
 from pulp_smash.pulp2.constants import PULP_SERVICES
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import RPM_UNSIGNED_FEED_URL
 from pulp_2_tests.tests.rpm.utils import os_is_f27, set_up_module
+from pulp_2_tests.waiters import wait_for_worker_heartbeats
 
 
 def setUpModule():  # pylint:disable=invalid-name
@@ -27,7 +29,7 @@ def get_pulp_worker_procs(cfg):
     cmd = ('ps', 'aux')
     return tuple((
         proc for proc
-        in cli.Client(cfg).run(cmd, sudo=True).stdout.splitlines()
+        in ssh.Client(cfg).run(cmd, sudo=True).stdout.splitlines()
         if 'celery worker' in proc and 'resource_manager' not in proc
     ))
 
@@ -58,9 +60,9 @@ class MaxTasksPerChildTestCase(unittest.TestCase):
     def test_all(self):
         """Test Pulp's handling of its ``PULP_MAX_TASKS_PER_CHILD`` setting."""
         cfg = config.get_config()
-        if not selectors.bug_is_fixed(2172, cfg.pulp_version):
+        if not bug_is_fixed(2172, cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2172')
-        pulp_3540_testable = selectors.bug_is_fixed(3540, cfg.pulp_version)
+        pulp_3540_testable = bug_is_fixed(3540, cfg.pulp_version)
         if os_is_f27(cfg) and not pulp_3540_testable:
             self.skipTest('https://pulp.plan.io/issues/3540')
         svc_mgr = cli.GlobalServiceManager(cfg)
@@ -82,11 +84,11 @@ class MaxTasksPerChildTestCase(unittest.TestCase):
             self.assertNotIn('--maxtasksperchild=2', proc, procs_over_time)
 
         # Step 2
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
         client.run(set_cmd, sudo=True)
         self.addCleanup(svc_mgr.restart, PULP_SERVICES)
         if not pulp_3540_testable:
-            self.addCleanup(time.sleep, 30)
+            self.addCleanup(wait_for_worker_heartbeats, cfg)
         self.addCleanup(client.run, unset_cmd, sudo=True)
         svc_mgr.restart(PULP_SERVICES)
         procs_over_time.append(get_pulp_worker_procs(cfg))
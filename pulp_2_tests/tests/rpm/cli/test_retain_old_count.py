@@ -13,9 +13,10 @@ import re
 import unittest
 from urllib.parse import urljoin
 
-from pulp_smash import cli, config, utils
+from pulp_smash import config, utils
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import ssh
 from pulp_2_tests.constants import RPM_UNSIGNED_FEED_URL
 from pulp_2_tests.tests.rpm.utils import check_issue_3104
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
@@ -39,7 +40,7 @@ class RetainOldCountTestCase(unittest.TestCase):
         cls.repo_id = None
         cls.relative_url = utils.uuid4() + '/'
         pulp_admin_login(cls.cfg)
-        client = cli.Client(cls.cfg)
+        client = ssh.Client(cls.cfg)
         repo_id = utils.uuid4()
         client.run((
             'pulp-admin', 'rpm', 'repo', 'create', '--repo-id', repo_id,
@@ -64,7 +65,7 @@ class RetainOldCountTestCase(unittest.TestCase):
     def tearDownClass(cls):
         """Destroy the repository created by :meth:`setUpClass`."""
         if cls.repo_id:
-            cli.Client(cls.cfg).run((
+            ssh.Client(cls.cfg).run((
                 'pulp-admin', 'rpm', 'repo', 'delete', '--repo-id', cls.repo_id
             ))
 
@@ -99,7 +100,7 @@ class RetainOldCountTestCase(unittest.TestCase):
 
         Implement the logic described by the ``test_retain_*`` methods.
         """
-        client = cli.Client(self.cfg)
+        client = ssh.Client(self.cfg)
         repo_id = utils.uuid4()
         feed = urljoin(
             self.cfg.get_base_url(),
@@ -2,9 +2,10 @@
 """Tests that perform searches."""
 import unittest
 
-from pulp_smash import cli, config, utils
+from pulp_smash import config, utils
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import ssh
 from pulp_2_tests.tests.rpm.utils import set_up_module as setUpModule  # pylint:disable=unused-import
 
 
@@ -25,7 +26,7 @@ class SearchReposWithFiltersTestCase(unittest.TestCase):
         """Create a repository."""
         cfg = config.get_config()
         pulp_admin_login(cfg)
-        cls.client = cli.Client(cfg)
+        cls.client = ssh.Client(cfg)
         cls.repo_id = utils.uuid4()
         cls.client.run(
             'pulp-admin rpm repo create --repo-id {}'
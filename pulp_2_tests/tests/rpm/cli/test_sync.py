@@ -4,10 +4,12 @@ import random
 import unittest
 
 from packaging.version import Version
-from pulp_smash import cli, config, selectors, utils
+from pulp_smash import config, utils
 from pulp_smash.exceptions import CalledProcessError
 from pulp_smash.pulp2.utils import pulp_admin_login, reset_pulp
 
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import (
     RPM_KICKSTART_FEED_URL,
     RPM_UNSIGNED_FEED_URL,
@@ -43,7 +45,7 @@ class _BaseTestCase(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         """Delete orphan content units."""
-        cli.Client(config.get_config()).run((
+        ssh.Client(config.get_config()).run((
             'pulp-admin', 'orphan', 'remove', '--all'
         ))
 
@@ -68,7 +70,7 @@ class RemovedContentTestCase(_BaseTestCase):
         if check_issue_2620(cfg):
             self.skipTest('https://pulp.plan.io/issues/2620')
         repo_id = utils.uuid4()
-        client = cli.Client(cfg)
+        client = ssh.Client(cfg)
         client.run((
             'pulp-admin', 'rpm', 'repo', 'create', '--repo-id', repo_id,
             '--feed', RPM_UNSIGNED_FEED_URL,
@@ -127,7 +129,7 @@ class ForceSyncTestCase(_BaseTestCase):
         Using the tuple to target rpms units
         and looking for the .rpm extension, respectively.
         """
-        if not selectors.bug_is_fixed(1982, self.cfg.pulp_version):
+        if not bug_is_fixed(1982, self.cfg.pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1982')
         self._do_test(('rpm', 'rpm'), RPM_UNSIGNED_FEED_URL)
 
@@ -155,7 +157,7 @@ class ForceSyncTestCase(_BaseTestCase):
     def _do_test(self, unit_type, feed):
         """Test whether one can force Pulp to perform a full sync."""
         # Create and sync a repository.
-        client = cli.Client(self.cfg)
+        client = ssh.Client(self.cfg)
         repo_id = utils.uuid4()
         client.run((
             'pulp-admin', 'rpm', 'repo', 'create', '--repo-id', repo_id,
@@ -221,7 +223,7 @@ class ForceSyncDuplicateSRPMFailure(unittest.TestCase):
 
     def setUp(self):
         """Delete orphan content units."""
-        cli.Client(config.get_config()).run((
+        ssh.Client(config.get_config()).run((
             'pulp-admin', 'orphan', 'remove', '--all'
         ))
 
@@ -236,7 +238,7 @@ class ForceSyncDuplicateSRPMFailure(unittest.TestCase):
     def do_test(self, unit_type, feed):
         """Test whether Pulp can sync with --srpm skip."""
         repo_id = utils.uuid4()
-        client = cli.Client(self.cfg)
+        client = ssh.Client(self.cfg)
         client.run((
             'pulp-admin', 'rpm', 'repo', 'create', '--repo-id', repo_id,
             '--feed', feed, '--skip', 'srpm',
@@ -263,7 +265,7 @@ def get_rpm_names(cfg, repo_id):
     :returns: The names of all modules in a repository, as an ``list``.
     """
     keyword = 'Name:'
-    proc = cli.Client(cfg).run((
+    proc = ssh.Client(cfg).run((
         'pulp-admin', 'rpm', 'repo', 'content', 'rpm', '--repo-id', repo_id
     ))
     return [
@@ -288,7 +290,7 @@ def list_units(cfg, unit_type):
     This method should be extensible to take any ``unit_type`` and
     operate as required.
     """
-    return cli.Client(cfg).run((
+    return ssh.Client(cfg).run((
         'find',
         '/var/lib/pulp/content/units/{}'.format(unit_type[0]),
         '-type',
@@ -309,4 +311,4 @@ def sync_repo(cfg, repo_id, force_sync=False):
     cmd = ['pulp-admin', 'rpm', 'repo', 'sync', 'run', '--repo-id', repo_id]
     if force_sync:
         cmd.append('--force-full')
-    return cli.Client(cfg).run(cmd)
+    return ssh.Client(cfg).run(cmd)
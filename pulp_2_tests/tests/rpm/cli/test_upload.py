@@ -3,9 +3,11 @@
 import os
 import unittest
 
-from pulp_smash import cli, config, selectors, utils
+from pulp_smash import config, utils
 from pulp_smash.pulp2.utils import pulp_admin_login
 
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
 from pulp_2_tests.constants import DRPM, DRPM_UNSIGNED_URL
 from pulp_2_tests.tests.rpm.utils import set_up_module
 
@@ -37,11 +39,11 @@ class UploadDrpmTestCase(unittest.TestCase):
            ``--skip-existing`` flag during the upload. Verify that Pulp skips
            the upload.
         """
-        if not selectors.bug_is_fixed(1806, config.get_config().pulp_version):
+        if not bug_is_fixed(1806, config.get_config().pulp_version):
             self.skipTest('https://pulp.plan.io/issues/1806')
 
         # Create a repository
-        client = cli.Client(config.get_config())
+        client = ssh.Client(config.get_config())
         repo_id = utils.uuid4()
         client.run(
             'pulp-admin rpm repo create --repo-id {}'.format(repo_id).split()
@@ -93,11 +95,11 @@ class UploadDrpmTestCase(unittest.TestCase):
            ``--skip-existing`` flag during the upload. Verify that Pulp skips
            the upload.
         """
-        if not selectors.bug_is_fixed(2627, config.get_config().pulp_version):
+        if not bug_is_fixed(2627, config.get_config().pulp_version):
             self.skipTest('https://pulp.plan.io/issues/2627')
 
         # Create a repository
-        client = cli.Client(config.get_config())
+        client = ssh.Client(config.get_config())
         repo_id = utils.uuid4()
         client.run(
             'pulp-admin rpm repo create --repo-id {}'.format(repo_id).split()
@@ -1,6 +1,6 @@
 # coding=utf-8
 """Utility functions for RPM CLI tests."""
-from pulp_smash import cli
+from pulp_2_tests import ssh
 
 
 def count_langpacks(cfg, repo_id):
@@ -14,7 +14,7 @@ def count_langpacks(cfg, repo_id):
     # This function could be refactored to take a third "keyword" argument. But
     # what do we do about the "rpm" word in the command below?
     keyword = 'Package Langpacks:'
-    completed_proc = cli.Client(cfg).run(
+    completed_proc = ssh.Client(cfg).run(
         'pulp-admin rpm repo list --repo-id {} --fields content_unit_counts'
         .format(repo_id).split()
     )
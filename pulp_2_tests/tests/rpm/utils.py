@@ -6,10 +6,12 @@ from io import StringIO
 from unittest import SkipTest
 
 from packaging.version import Version
-from pulp_smash import cli, selectors, utils
+from pulp_smash import selectors
 from pulp_smash.pulp2 import utils as pulp2_utils
 
-from pulp_2_tests.constants import RPM_PKG_RICH_WEAK_VERSION
+from pulp_2_tests import ssh
+from pulp_2_tests.bug_status import bug_is_fixed
+from pulp_2_tests.capabilities import get_capabilities, require_unit_types
 
 
 def set_up_module():
@@ -17,7 +19,7 @@ def set_up_module():
     pulp2_utils.require_pulp_2(SkipTest)
     pulp2_utils.require_issue_3159(SkipTest)
     pulp2_utils.require_issue_3687(SkipTest)
-    pulp2_utils.require_unit_types({'rpm'}, SkipTest)
+    require_unit_types({'rpm'}, SkipTest)
 
 
 def check_issue_2277(cfg):
@@ -28,7 +30,7 @@ def check_issue_2277(cfg):
     .. _Pulp #2277: https://pulp.plan.io/issues/2277
     """
     if (cfg.pulp_version >= Version('2.10') and
-            not selectors.bug_is_fixed(2277, cfg.pulp_version)):
+            not bug_is_fixed(2277, cfg.pulp_version)):
         return True
     return False
 
@@ -41,7 +43,7 @@ def check_issue_2387(cfg):
     .. _Pulp #2387: https://pulp.plan.io/issues/2387
     """
     if (cfg.pulp_version >= Version('2.10') and os_is_rhel6(cfg) and
-            not selectors.bug_is_fixed(2387, cfg.pulp_version)):
+            not bug_is_fixed(2387, cfg.pulp_version)):
         return True
     return False
 
@@ -54,7 +56,7 @@ def check_issue_2354(cfg):
     .. _Pulp #2354: https://pulp.plan.io/issues/2354
     """
     if (cfg.pulp_version >= Version('2.10') and
-            not selectors.bug_is_fixed(2354, cfg.pulp_version)):
+            not bug_is_fixed(2354, cfg.pulp_version)):
         return True
     return False
 
@@ -67,7 +69,7 @@ def check_issue_2620(cfg):
     .. _Pulp #2620: https://pulp.plan.io/issues/2620
     """
     if (cfg.pulp_version >= Version('2.12') and
-            not selectors.bug_is_fixed(2620, cfg.pulp_version)):
+            not bug_is_fixed(2620, cfg.pulp_version)):
         return True
     return False
 
@@ -80,7 +82,7 @@ def check_issue_2798(cfg):
     .. _Pulp #2798: https://pulp.plan.io/issues/2798
     """
     return (cfg.pulp_version >= Version('2.14') and
-            not selectors.bug_is_fixed(2798, cfg.pulp_version))
+            not bug_is_fixed(2798, cfg.pulp_version))
 
 
 def check_issue_2844(cfg):
@@ -91,7 +93,7 @@ def check_issue_2844(cfg):
     .. _Pulp #2844: https://pulp.plan.io/issues/2844
     """
     return (cfg.pulp_version >= Version('2.14') and
-            not selectors.bug_is_fixed(2844, cfg.pulp_version))
+            not bug_is_fixed(2844, cfg.pulp_version))
 
 
 def check_issue_3104(cfg):
@@ -102,7 +104,7 @@ def check_issue_3104(cfg):
     .. _Pulp #3104: https://pulp.plan.io/issues/3104
     """
     return (cfg.pulp_version >= Version('2.15') and
-            not selectors.bug_is_fixed(3104, cfg.pulp_version))
+            not bug_is_fixed(3104, cfg.pulp_version))
 
 
 def check_issue_3875(cfg):
@@ -113,7 +115,7 @@ def check_issue_3875(cfg):
     .. _Pulp #3875: https://pulp.plan.io/issues/3875
     """
     return (cfg.pulp_version >= Version('2.17') and
-            not selectors.bug_is_fixed(3875, cfg.pulp_version))
+            not bug_is_fixed(3875, cfg.pulp_version))
 
 
 def check_issue_3876(cfg):
@@ -124,7 +126,7 @@ def check_issue_3876(cfg):
     .. _Pulp #3876: https://pulp.plan.io/issues/3876
     """
     return (cfg.pulp_version >= Version('2.17') and
-            not selectors.bug_is_fixed(3876, cfg.pulp_version))
+            not bug_is_fixed(3876, cfg.pulp_version))
 
 
 def check_issue_4405(cfg):
@@ -135,7 +137,7 @@ def check_issue_4405(cfg):
     .. _Pulp #4405: https://pulp.plan.io/issues/4405
     """
     return (cfg.pulp_version >= Version('2.19') and
-            not selectors.bug_is_fixed(4405, cfg.pulp_version))
+            not bug_is_fixed(4405, cfg.pulp_version))
 
 
 def check_issue_4529(cfg):
@@ -146,25 +148,22 @@ def check_issue_4529(cfg):
     .. _Pulp #4529: https://pulp.plan.io/issues/4529
     """
     return (cfg.pulp_version >= Version('2.19.1') and
-            not selectors.bug_is_fixed(4529, cfg.pulp_version))
+            not bug_is_fixed(4529, cfg.pulp_version))
 
 
 def os_is_f26(cfg, pulp_host=None):
     """Tell whether the given Pulp host's OS is F26."""
-    return (utils.get_os_release_id(cfg, pulp_host) == 'fedora' and
-            utils.get_os_release_version_id(cfg, pulp_host) == '26')
+    return get_capabilities(cfg, pulp_host).os_is('fedora', '26')
 
 
 def os_is_f27(cfg, pulp_host=None):
     """Tell whether the given Pulp host's OS is F27."""
-    return (utils.get_os_release_id(cfg, pulp_host) == 'fedora' and
-            utils.get_os_release_version_id(cfg, pulp_host) == '27')
+    return get_capabilities(cfg, pulp_host).os_is('fedora', '27')
 
 
 def os_is_f28(cfg, pulp_host=None):
     """Tell whether the given Pulp host's OS is F28."""
-    return (utils.get_os_release_id(cfg, pulp_host) == 'fedora' and
-            utils.get_os_release_version_id(cfg, pulp_host) == '28')
+    return get_capabilities(cfg, pulp_host).os_is('fedora', '28')
 
 
 def os_is_rhel6(cfg):
@@ -174,13 +173,7 @@ def os_is_rhel6(cfg):
         being targeted.
     :returns: True or false.
     """
-    response = cli.Client(cfg, cli.echo_handler).run((
-        'grep',
-        '-i',
-        'red hat enterprise linux server release 6',
-        '/etc/redhat-release',
-    ))
-    return response.returncode == 0
+    return get_capabilities(cfg).os_is_rhel6
 
 
 def rpm_rich_weak_dependencies(cfg):
@@ -196,8 +189,7 @@ def rpm_rich_weak_dependencies(cfg):
     :param cfg: Information about the system.
     :returns: True or False.
     """
-    response = cli.Client(cfg).run(('rpm', '--version'))
-    return Version(response.stdout.split()[2]) >= Version(RPM_PKG_RICH_WEAK_VERSION)
+    return get_capabilities(cfg).supports_rich_weak_dependencies
 
 
 def gen_yum_config_file(cfg, repositoryid, baseurl, name, **kwargs):
@@ -237,11 +229,10 @@ def gen_yum_config_file(cfg, repositoryid, baseurl, name, **kwargs):
         section.write('[{}]\n'.format(repositoryid))
         for key, value in kwargs.items():
             section.write('{}: {}\n'.format(key, value))
-        # machine.session is used here to keep SSH session open
-        cli.Client(cfg).machine.session().run(
+        ssh.Client(cfg).run_shell(
             'echo "{}" | {}tee {} > /dev/null'.format(
                 section.getvalue(),
-                '' if cli.is_root(cfg) else 'sudo ',
+                '' if ssh.is_root(cfg) else 'sudo ',
                 path
             )
         )
@@ -256,8 +247,7 @@ def os_support_modularity(cfg, pulp_host=None):
     :param cfg: Information about the system being targeted.
     :returns: True or False.
     """
-    return (utils.get_os_release_id(cfg, pulp_host) == 'fedora' and
-            utils.get_os_release_version_id(cfg, pulp_host) >= '28')
+    return get_capabilities(cfg, pulp_host).supports_modularity
 
 
 skip_if = partial(selectors.skip_if, exc=SkipTest)  # pylint:disable=invalid-name
@@ -0,0 +1,105 @@
+# coding=utf-8
+"""Tools for inspecting the content units in a repository cheaply.
+
+``pulp_smash.pulp2.utils.search_units`` returns every matching unit, with
+every field, in one response. Tests that only need to know how many units of
+each type a repository holds pay for transferring each unit body.
+:func:`get_unit_counts` instead reads the counts that Pulp maintains for each
+repository, with a single request:
+
+.. code-block:: python
+
+    from pulp_2_tests.units import get_unit_counts
+
+    counts = get_unit_counts(cfg, repo, ('docker_blob', 'docker_manifest'))
+    assert counts == {'docker_blob': 8, 'docker_manifest': 4}
+
+Tests that only read a few fields of each unit should ask for them, with
+:func:`iter_units` or :func:`search_units`. Only these fields are transferred,
+and units are fetched a page at a time:
+
+.. code-block:: python
+
+    from pulp_2_tests.units import iter_units
+
+    for unit in iter_units(cfg, repo, {'type_ids': ['rpm']}, ('name',)):
+        print(unit['metadata']['name'])
+"""
+import copy
+from urllib.parse import urljoin
+
+from pulp_smash import api
+
+from pulp_2_tests import http_pool
+
+PAGE_SIZE = 1000
+"""The default number of units fetched per request by :func:`iter_units`."""
+
+
+def get_unit_counts(cfg, repo, type_ids=None):
+    """Return the number of content units of each type in ``repo``.
+
+    The counts are read from the repository's ``content_unit_counts``, which
+    Pulp updates whenever units are associated or unassociated.
+
+    :param cfg: Information about a Pulp deployment.
+    :param repo: A dict of information about a repository.
+    :param type_ids: An iterable of unit type IDs. If given, the returned dict
+        has exactly these keys, and types absent from the repository are
+        counted as zero. Otherwise, only the types present are returned.
+    :returns: A dict mapping unit type IDs to counts.
+    """
+    counts = http_pool.Client(cfg, api.json_handler).get(
+        repo['_href'])['content_unit_counts']
+    if type_ids is None:
+        return dict(counts)
+    return {type_id: counts.get(type_id, 0) for type_id in type_ids}
+
+
+def iter_units(cfg, repo, criteria=None, fields=None, page_size=PAGE_SIZE):
+    """Search for units in ``repo``, and yield them one by one.
+
+    Units are fetched with a ``limit`` of ``page_size`` and an increasing
+    ``skip``, so that at most one page of units is held in memory, and no
+    request returns more than ``page_size`` units. Pages are sorted by unit
+    ID, so that each unit is yielded exactly once.
+
+    :param cfg: Information about a Pulp deployment.
+    :param repo: A dict of information about a repository.
+    :param criteria: A unit association criteria, as a dict, without
+        ``limit`` or ``skip``. Defaults to ``{}``.
+    :param fields: An iterable of unit fields to fetch, such as ``('name',
+        'version')``. If given, each unit's ``metadata`` only holds these
+        fields, plus the ``_id`` and ``_content_type_id`` fields. By default,
+        every field is fetched.
+    :param page_size: The number of units fetched per request.
+    :returns: A generator of units, in the format of
+        ``pulp_smash.pulp2.utils.search_units``.
+    """
+    criteria = copy.deepcopy(criteria) if criteria else {}
+    if fields is not None:
+        criteria.setdefault('fields', {})['unit'] = sorted(
+            set(fields) | {'_id', '_content_type_id'}
+        )
+    criteria.setdefault('sort', {'association': [['unit_id', 'ascending']]})
+    criteria['limit'] = page_size
+    client = http_pool.Client(cfg, api.json_handler)
+    path = urljoin(repo['_href'], 'search/units/')
+    skip = 0
+    while True:
+        criteria['skip'] = skip
+        page = client.post(path, {'criteria': criteria})
+        yield from page
+        if len(page) < page_size:
+            return
+        skip += page_size
+
+
+def search_units(cfg, repo, criteria=None, fields=None, page_size=PAGE_SIZE):
+    """Search for units in ``repo``, and return them as a list.
+
+    This function is like ``pulp_smash.pulp2.utils.search_units``, except
+    that it may only fetch some fields and that it pages through results. See
+    :func:`iter_units`.
+    """
+    return list(iter_units(cfg, repo, criteria, fields, page_size))
@@ -0,0 +1,206 @@
+# coding=utf-8
+"""A pool of throwaway users with SSH keypairs, for rsync distributor tests.
+
+Tests of the rsync distributor need a user on the Pulp host that Pulp can SSH
+into, and a private key readable by Pulp. Creating such a user takes several
+commands, and deleting it means waiting for the SSH sessions that Pulp leaves
+open to die. This module creates users in batches with one remote script per
+batch, and leases each user to exactly one test:
+
+.. code-block:: python
+
+    user = acquire_user(cfg)
+    self.addCleanup(release_user, cfg, user)
+    distributor_config = {
+        'remote': {
+            'root': '/home/' + user.username,
+            'ssh_identity_file': user.identity_file,
+            'ssh_user': user.username,
+        },
+    }
+
+Users are never reused, as tests leave files in their home directories.
+Released users are deleted by a script that runs detached on the Pulp host, so
+tests don't wait for the deletion. Users that were never leased are deleted
+when the Python interpreter exits.
+"""
+import atexit
+import base64
+import shlex
+import threading
+from collections import namedtuple
+
+from pulp_smash import utils
+
+from pulp_2_tests import ssh
+
+SSHUser = namedtuple(
+    'SSHUser', 'username private_key identity_file pulp_host')
+"""A user on a Pulp host that may be logged into with an SSH key.
+
+``identity_file`` is a copy of ``private_key``, owned by user "apache" and
+labeled for use by Pulp. ``pulp_host`` is the host on which the user exists.
+"""
+
+_PROVISION_SCRIPT = '''\
+set -e
+user={user}
+home="/home/$user"
+useradd --create-home "$user"
+trap '[ $? -eq 0 ] || userdel --remove "$user"' EXIT
+runuser --shell /bin/sh "$user" --command \\
+    "mkdir -p $home/.ssh && ssh-keygen -q -N '' -f $home/.ssh/mykey"
+cp "$home/.ssh/mykey.pub" "$home/.ssh/authorized_keys"
+identity_file="$(mktemp)"
+cp "$home/.ssh/mykey" "$identity_file"
+chmod 600 "$identity_file"
+chown apache "$identity_file"
+case "$(getenforce 2>/dev/null || echo Disabled)" in
+    Disabled) ;;
+    *) chcon -t httpd_sys_rw_content_t "$identity_file" ;;
+esac
+printf '{marker} %s %s %s\\n' "$user" "$identity_file" \\
+    "$(base64 -w 0 "$home/.ssh/mykey")"
+'''
+
+_REAP_SCRIPT = '''\
+user={user}
+for _ in $(seq 30); do
+    pgrep -u "$user" >/dev/null || break
+    sleep 1
+done
+pkill -KILL -u "$user"
+userdel --remove "$user"
+rm -f {identity_file}
+'''
+
+
+class UserPool():
+    """Create, lease and delete throwaway users on the Pulp hosts.
+
+    Most callers should use the module-level functions, which share a single
+    instance of this class.
+
+    :param batch_size: How many users to create when the pool for a host is
+        empty.
+    """
+
+    def __init__(self, batch_size=4):
+        """Initialize instance attributes."""
+        self.batch_size = batch_size
+        self._free = {}  # hostname → (cfg, pulp_host, [SSHUser, …])
+        self._leased = {}  # private key → SSHUser
+        self._lock = threading.Lock()
+
+    def acquire(self, cfg, pulp_host=None):
+        """Return an :class:`SSHUser` that no one else uses.
+
+        :param cfg: Information about a Pulp deployment.
+        :param pulp_host: The host on which the user exists. Defaults to the
+            first host with the "shell" role.
+        """
+        if pulp_host is None:
+            pulp_host = cfg.get_hosts('shell')[0]
+        with self._lock:
+            _, _, free = self._free.setdefault(
+                pulp_host.hostname, (cfg, pulp_host, []))
+            if not free:
+                free.extend(self._provision(cfg, pulp_host, self.batch_size))
+            user = free.pop()
+            self._leased[user.private_key] = user
+            return user
+
+    def get_leased(self, private_key):
+        """Return the leased user with ``private_key``, or ``None``."""
+        with self._lock:
+            return self._leased.get(private_key)
+
+    def release(self, cfg, user):
+        """Delete a user returned by :meth:`acquire`, without waiting.
+
+        The user is deleted from the host it was acquired on. The deletion
+        waits up to 30 seconds for the user's processes, such as SSH sessions
+        left open by Pulp, to exit, and then kills them.
+        """
+        with self._lock:
+            self._leased.pop(user.private_key, None)
+        self._reap(cfg, user.pulp_host, (user,))
+
+    def close(self):
+        """Delete the users that were never leased."""
+        with self._lock:
+            pools = tuple(self._free.values())
+            self._free.clear()
+        for cfg, pulp_host, free in pools:
+            if free:
+                self._reap(cfg, pulp_host, free)
+
+    @staticmethod
+    def _provision(cfg, pulp_host, count):
+        """Create ``count`` users in a single round trip. Return them."""
+        # According to useradd(8), usernames may be up to 32 characters long.
+        # But long names break the rsync publish process: (SNIP == username)
+        #
+        #     unix_listener:
+        #     "/tmp/rsync_distributor-[SNIP]@example.com:22.64tcAiD8em417CiN"
+        #     too long for Unix domain socket
+        #
+        # Users that fail to be created are skipped. The script fails only if
+        # no user could be created.
+        marker = 'PULP_2_TESTS_USER'
+        script = 'created=0\n'
+        for _ in range(count):
+            username = utils.uuid4()[:12]
+            script += '(\n{})\n[ $? -ne 0 ] || created=1\n'.format(
+                _PROVISION_SCRIPT.format(user=username, marker=marker))
+        script += '[ "$created" -eq 1 ]\n'
+        stdout = ssh.Client(cfg, pulp_host=pulp_host).run(
+            ('sh', '-c', script), sudo=True).stdout
+        users = []
+        for line in stdout.splitlines():
+            if line.startswith(marker + ' '):
+                username, identity_file, key = line.split()[1:]
+                users.append(SSHUser(
+                    username,
+                    base64.b64decode(key).decode('utf-8'),
+                    identity_file,
+                    pulp_host,
+                ))
+        return users
+
+    @staticmethod
+    def _reap(cfg, pulp_host, users):
+        """Delete ``users`` with a script that runs detached on the host."""
+        script = ''.join(
+            '(\n{})\n'.format(_REAP_SCRIPT.format(
+                user=user.username,
+                identity_file=shlex.quote(user.identity_file)))
+            for user in users
+        )
+        ssh.Client(cfg, pulp_host=pulp_host).run((
+            'setsid', 'sh', '-c',
+            'sh -c {} >/dev/null 2>&1 </dev/null &'.format(
+                shlex.quote(script)),
+        ), sudo=True)
+
+
+_POOL = UserPool()
+atexit.register(_POOL.close)
+
+
+def acquire_user(cfg, pulp_host=None):
+    """Return a throwaway user. See :meth:`UserPool.acquire`.
+
+    Every call should be paired with a call to :func:`release_user`.
+    """
+    return _POOL.acquire(cfg, pulp_host)
+
+
+def get_leased_user(private_key):
+    """Return the leased user with ``private_key``, or ``None``."""
+    return _POOL.get_leased(private_key)
+
+
+def release_user(cfg, user):
+    """Delete a user returned by :func:`acquire_user`."""
+    _POOL.release(cfg, user)
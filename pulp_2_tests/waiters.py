@@ -0,0 +1,195 @@
+# coding=utf-8
+"""Tools for waiting until a condition holds on a Pulp deployment.
+
+Some tests need Pulp to reach a certain state, such as a schedule having run
+a number of times or a service having noticed that the broker is gone. Sleeping
+for a fixed time is slow when the state is reached early, and flaky when it is
+reached late. :func:`wait_until` instead polls a predicate with exponential
+backoff, and returns as soon as the predicate holds:
+
+.. code-block:: python
+
+    from pulp_2_tests.waiters import wait_for_schedule_runs
+
+    schedule = client.post(schedule_path, {'schedule': 'PT30S'})
+    schedule = wait_for_schedule_runs(cfg, schedule['_href'], 2)
+
+Each wait is recorded, with how long it took, in :data:`WAIT_RECORDS`.
+"""
+import threading
+import time
+from collections import namedtuple
+
+from pulp_smash import api
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from pulp_2_tests import http_pool
+
+STATUS_PATH = '/pulp/api/v2/status/'
+"""The path to Pulp's status endpoint."""
+
+WaitRecord = namedtuple('WaitRecord', 'description elapsed attempts satisfied')
+"""How long a call to :func:`wait_until` took, and whether it succeeded."""
+
+WAIT_RECORDS = []
+"""A list of :class:`WaitRecord`, one per call to :func:`wait_until`."""
+
+_WAIT_RECORDS_LOCK = threading.Lock()
+
+
+class WaitTimeoutError(Exception):
+    """A condition did not hold before the deadline.
+
+    :param description: A description of the condition.
+    :param timeout: The number of seconds waited.
+    :param last: The last value returned by the predicate.
+    """
+
+    def __init__(self, description, timeout, last):
+        """Initialize instance attributes."""
+        super().__init__(
+            'Timed out after {}s waiting for {}. Last value: {!r}'
+            .format(timeout, description, last)
+        )
+        self.description = description
+        self.timeout = timeout
+        self.last = last
+
+
+def wait_until(  # pylint:disable=too-many-arguments
+        predicate,
+        timeout=60,
+        description=None,
+        min_interval=0.5,
+        max_interval=10,
+        backoff=1.5):
+    """Call ``predicate`` until it returns a truthy value.
+
+    :param predicate: A callable taking no arguments.
+    :param timeout: How many seconds to wait at most.
+    :param description: A description of the condition, used in records and
+        error messages. Defaults to the predicate's name.
+    :param min_interval: How many seconds to wait after the first attempt.
+    :param max_interval: The maximum number of seconds between attempts.
+    :param backoff: The factor by which the interval grows after each attempt.
+    :returns: The truthy value returned by ``predicate``.
+    :raises WaitTimeoutError: If ``predicate`` doesn't return a truthy value
+        within ``timeout`` seconds.
+    """
+    if description is None:
+        description = getattr(predicate, '__name__', repr(predicate))
+    started = time.monotonic()
+    deadline = started + timeout
+    interval = min_interval
+    attempts = 0
+    while True:
+        attempts += 1
+        value = predicate()
+        now = time.monotonic()
+        if value or now >= deadline:
+            with _WAIT_RECORDS_LOCK:
+                WAIT_RECORDS.append(WaitRecord(
+                    description, now - started, attempts, bool(value)))
+            if value:
+                return value
+            raise WaitTimeoutError(description, timeout, value)
+        time.sleep(min(interval, deadline - now))
+        interval = min(interval * backoff, max_interval)
+
+
+def get_status(cfg, pulp_host=None):
+    """Return the body of Pulp's status endpoint, or ``None``.
+
+    ``None`` is returned if the endpoint can't be reached or doesn't answer
+    with HTTP 200, as is the case while services restart.
+    """
+    client = http_pool.Client(cfg, api.echo_handler, pulp_host=pulp_host)
+    try:
+        response = client.get(STATUS_PATH)
+    except RequestsConnectionError:
+        return None
+    if response.status_code != 200:
+        return None
+    return response.json()
+
+
+def get_worker_heartbeats(status):
+    """Return a dict mapping each known worker to its last heartbeat."""
+    return {
+        worker['_id']: worker['last_heartbeat']
+        for worker in status.get('known_workers', ())
+    }
+
+
+def wait_for_schedule_runs(cfg, schedule_href, count, timeout=300):
+    """Wait until a schedule has run at least ``count`` times.
+
+    :param cfg: Information about a Pulp deployment.
+    :param schedule_href: The href of a sync or publish schedule.
+    :param count: The minimum ``total_run_count``.
+    :param timeout: How many seconds to wait at most.
+    :returns: The schedule, as a dict.
+    """
+    client = http_pool.Client(cfg, api.json_handler)
+
+    def schedule_has_run():
+        schedule = client.get(schedule_href)
+        return schedule if schedule['total_run_count'] >= count else None
+
+    return wait_until(
+        schedule_has_run,
+        timeout,
+        'schedule {} to run {} times'.format(schedule_href, count),
+        max_interval=5,
+    )
+
+
+def wait_for_messaging_connection(cfg, connected=True, timeout=120):
+    """Wait until Pulp reports that its broker connection is up or down.
+
+    :param cfg: Information about a Pulp deployment.
+    :param connected: Whether to wait for the connection to be up, or down.
+    :param timeout: How many seconds to wait at most.
+    :returns: The body of Pulp's status endpoint.
+    """
+    def messaging_is_in_state():
+        status = get_status(cfg)
+        if status is None:
+            return None
+        state = status.get('messaging_connection', {}).get('connected')
+        return status if state is connected else None
+
+    return wait_until(
+        messaging_is_in_state,
+        timeout,
+        'messaging connection to be {}'.format('up' if connected else 'down'),
+    )
+
+
+def wait_for_worker_heartbeats(cfg, timeout=120):
+    """Wait until every known worker has sent a new heartbeat.
+
+    The heartbeats reported by Pulp's status endpoint when this function is
+    called are compared to later ones. Workers that have stopped beating time
+    out.
+
+    :param cfg: Information about a Pulp deployment.
+    :param timeout: How many seconds to wait at most.
+    :returns: The body of Pulp's status endpoint.
+    """
+    status = wait_until(lambda: get_status(cfg), timeout, 'status endpoint')
+    before = get_worker_heartbeats(status)
+
+    def workers_have_beaten():
+        status = get_status(cfg)
+        if status is None:
+            return None
+        after = get_worker_heartbeats(status)
+        if not after:
+            return None
+        for worker, heartbeat in after.items():
+            if before.get(worker) == heartbeat:
+                return None
+        return status
+
+    return wait_until(workers_have_beaten, timeout, 'worker heartbeats')
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""Measure how Crane and Pulp's streamer behave under concurrent pulls.
+
+Several clients, each in its own thread, repeatedly emulate ``docker pull``
+against published Docker repositories for a fixed duration. Each pull fetches
+the manifest list, the schema 2 manifest and every blob the manifest
+references. Latency percentiles, requests per second and error rates are
+printed as JSON, along with the Pulp version and the benchmark parameters, so
+that runs against different Pulp versions can be compared:
+
+.. code-block:: sh
+
+    scripts/crane_benchmark.py my-registry-id
+    scripts/crane_benchmark.py --clients 16 --duration 120 repo-1 repo-2
+
+The repositories must already be published, and are referenced by the name
+Crane serves them under. Pulp Smash's settings file is used to find Crane. The
+script exits non-zero if any request fails.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+_TOP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MANIFEST_LIST_V2 = 'application/vnd.docker.distribution.manifest.list.v2+json'
+MANIFEST_V2 = 'application/vnd.docker.distribution.manifest.v2+json'
+
+
+def percentile(values, fraction):
+    """Return the nearest-rank percentile of a sorted list of numbers.
+
+    :param values: A sorted, non-empty list of numbers.
+    :param fraction: A number in ``(0, 1]``, such as ``0.95``.
+    """
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+def summarize(samples, seconds):
+    """Summarize the samples recorded for one kind of request.
+
+    :param samples: A list of ``(latency, ok, size)`` tuples.
+    :param seconds: How long the benchmark ran.
+    :returns: A dict, suitable for serializing as JSON.
+    """
+    latencies = sorted(latency for latency, _, _ in samples)
+    errors = sum(1 for _, ok, _ in samples if not ok)
+    summary = {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': errors / len(samples) if samples else 0,
+        'requests_per_second': len(samples) / seconds,
+        'bytes_per_second': sum(size for _, _, size in samples) / seconds,
+    }
+    if latencies:
+        summary['latency_ms'] = {
+            name: percentile(latencies, fraction) * 1000
+            for name, fraction in (('p50', .5), ('p95', .95), ('p99', .99))
+        }
+        summary['latency_ms']['max'] = latencies[-1] * 1000
+    return summary
+
+
+def main():  # pylint:disable=too-many-locals
+    """Run the benchmark, and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        'registry_ids', nargs='+', metavar='registry_id',
+        help='The name of a published Docker repository, as served by Crane.',
+    )
+    parser.add_argument(
+        '--clients', type=int, default=4,
+        help='How many clients pull at once. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--duration', type=float, default=60,
+        help='How many seconds to pull for. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--reference', default='latest',
+        help='The tag or digest to pull. (default: %(default)s)',
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, _TOP)
+    from pulp_smash import api, config
+    from pulp_2_tests.tests.docker.api_v2.utils import (
+        SyncPublishMixin,
+        get_blob_digests,
+    )
+    cfg = config.get_config()
+
+    # Find the blobs of each image once, so that every pull fetches the same
+    # blobs.
+    client = SyncPublishMixin.make_crane_client(cfg)
+    client.request_kwargs['headers'] = {'accept': MANIFEST_V2}
+    blobs = {
+        registry_id: get_blob_digests(client.get(
+            '/v2/{}/manifests/{}'.format(registry_id, args.reference)))
+        for registry_id in args.registry_ids
+    }
+
+    samples = defaultdict(list)  # kind → [(latency, ok, size), …]
+    samples_lock = threading.Lock()
+    deadline = time.monotonic() + args.duration
+
+    def pull(index):
+        """Pull images one after another until the deadline."""
+        client = SyncPublishMixin.make_crane_client(cfg)
+        client.response_handler = api.echo_handler
+        registry_ids = args.registry_ids
+        while time.monotonic() < deadline:
+            registry_id = registry_ids[index % len(registry_ids)]
+            index += 1
+            manifest_path = '/v2/{}/manifests/{}'.format(
+                registry_id, args.reference)
+            steps = [
+                ('manifest_list', manifest_path, {'accept': MANIFEST_LIST_V2}),
+                ('manifest', manifest_path, {'accept': MANIFEST_V2}),
+            ] + [
+                ('blob', '/v2/{}/blobs/{}'.format(registry_id, digest), None)
+                for digest in blobs[registry_id]
+            ]
+            for kind, path, headers in steps:
+                started = time.monotonic()
+                size = 0
+                try:
+                    response = client.get(path, headers=headers, stream=True)
+                    try:
+                        for chunk in response.raw.stream(
+                                1 << 16, decode_content=False):
+                            size += len(chunk)
+                    finally:
+                        response.close()
+                    ok = response.status_code < 400
+                except Exception:  # pylint:disable=broad-except
+                    ok = False
+                sample = (time.monotonic() - started, ok, size)
+                with samples_lock:
+                    samples[kind].append(sample)
+
+    started = time.monotonic()
+    threads = [
+        threading.Thread(target=pull, args=(index,))
+        for index in range(args.clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.monotonic() - started
+
+    report = {
+        'pulp_version': str(cfg.pulp_version),
+        'registry_ids': args.registry_ids,
+        'reference': args.reference,
+        'clients': args.clients,
+        'seconds': seconds,
+        'requests': {
+            kind: summarize(kind_samples, seconds)
+            for kind, kind_samples in sorted(samples.items())
+        },
+        'total': summarize(
+            [sample for kind in samples.values() for sample in kind],
+            seconds,
+        ),
+    }
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 1 if report['total']['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
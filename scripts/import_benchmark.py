@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""Measure how long it takes to import and collect the tests.
+
+Every test module is loaded by ``unittest``, as test discovery does, in a fresh
+interpreter started with ``python -X importtime``. The total collection time
+is printed, followed by the packages and modules that took longest to import:
+
+.. code-block:: sh
+
+    scripts/import_benchmark.py
+    scripts/import_benchmark.py --budget 1  # Fail if slower than 1 second.
+
+``-X importtime`` requires Python 3.7 or newer.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+_TOP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_LOAD_TESTS = '''
+import json, sys, time, unittest
+started = time.perf_counter()
+suite = unittest.TestLoader().loadTestsFromNames(sys.argv[1:])
+print(json.dumps({
+    'seconds': time.perf_counter() - started,
+    'tests': suite.countTestCases(),
+}))
+'''
+
+
+def parse_importtime(stderr):
+    """Parse the output of ``python -X importtime``.
+
+    :returns: A list of ``(module, self_us, cumulative_us)`` tuples.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header.
+        imports.append((
+            fields[2].strip(),
+            int(fields[0]),
+            int(fields[1]),
+        ))
+    return imports
+
+
+def main():
+    """Measure the collection time, and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--top', type=int, default=15,
+        help='How many packages and modules to list. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--budget', type=float,
+        help='Exit non-zero if collection takes longer, in seconds.',
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, _TOP)
+    from pulp_2_tests.shard import discover_modules
+    modules = discover_modules()
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _LOAD_TESTS] + modules,
+        cwd=_TOP,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=False,
+    )
+    if process.returncode != 0:
+        sys.stderr.write(process.stderr)
+        return process.returncode
+    result = json.loads(process.stdout.splitlines()[-1])
+    imports = parse_importtime(process.stderr)
+
+    by_package = defaultdict(int)
+    for module, self_us, _ in imports:
+        by_package[module.split('.')[0]] += self_us
+    own = [item for item in imports if item[0].startswith('pulp_2_tests.')]
+
+    print('Collected {} tests from {} modules in {:.3f}s ({} imports).'.format(
+        result['tests'], len(modules), result['seconds'], len(imports)))
+    print('\nSlowest packages, by total self time:')
+    for package, self_us in sorted(
+            by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print('  {:>8.1f}ms  {}'.format(self_us / 1000, package))
+    print('\nSlowest pulp_2_tests modules, by cumulative time:')
+    for module, _, cumulative_us in sorted(
+            own, key=lambda item: -item[2])[:args.top]:
+        print('  {:>8.1f}ms  {}'.format(cumulative_us / 1000, module))
+
+    if args.budget is not None and result['seconds'] > args.budget:
+        print('\nCollection took longer than {}s.'.format(args.budget))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
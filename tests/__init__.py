@@ -0,0 +1,6 @@
+# coding=utf-8
+"""Unit tests for the helpers in :mod:`pulp_2_tests`.
+
+Unlike the tests in :mod:`pulp_2_tests.tests`, these tests don't need a Pulp
+deployment. Run them with ``make test``.
+"""
@@ -0,0 +1,130 @@
+# coding=utf-8
+"""Unit tests for :mod:`pulp_2_tests.bug_status`."""
+import datetime
+import json
+import os
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+from packaging.version import Version
+from pulp_smash import selectors
+
+from pulp_2_tests import bug_status
+
+# pylint:disable=protected-access
+
+
+def _write_snapshot(bugs, created=None):
+    """Write a snapshot of ``bugs`` to a temporary file, and return its path.
+
+    :param bugs: A dict mapping issue IDs to bugs.
+    :param created: A ``datetime.datetime``. Defaults to now.
+    """
+    if created is None:
+        created = datetime.datetime.now(datetime.timezone.utc)
+    handle, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(handle, 'w') as snapshot:
+        json.dump({
+            'version': bug_status.SNAPSHOT_VERSION,
+            'created': created.isoformat(),
+            'tracker': bug_status.TRACKER_URL,
+            'bugs': {str(bug_id): bug for bug_id, bug in bugs.items()},
+        }, snapshot)
+    return path
+
+
+class StatusesTestCase(unittest.TestCase):
+    """Test that bug statuses are classified like Pulp Smash does."""
+
+    def test_statuses(self):
+        """Assert each status is testable exactly when Pulp Smash says so."""
+        table = (
+            (bug_status.TESTABLE_STATUSES, selectors._TESTABLE_BUGS),
+            (bug_status.UNTESTABLE_STATUSES, selectors._UNTESTABLE_BUGS),
+        )
+        statuses = set().union(*(ours | theirs for ours, theirs in table))
+        for status in sorted(statuses):
+            for ours, theirs in table:
+                with self.subTest(status=status):
+                    self.assertEqual(status in ours, status in theirs)
+
+
+class BugIsFixedTestCase(unittest.TestCase):
+    """Test :func:`pulp_2_tests.bug_status.bug_is_fixed` with a snapshot."""
+
+    def setUp(self):
+        """Reset the cached snapshot, and restore it afterwards."""
+        patcher = mock.patch.object(bug_status, '_SNAPSHOT', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_bug_is_fixed(self):
+        """Evaluate bugs of each status and release against versions."""
+        table = (
+            # status, target platform release, Pulp version, fixed
+            ('NEW', None, '2.19', False),
+            ('POST', '2.18', '2.19', False),
+            ('CLOSED - WONTFIX', None, '2.19', False),
+            ('MODIFIED', None, '2.19', True),
+            ('VERIFIED', '2.18', '2.19', True),
+            ('VERIFIED', '2.19', '2.19', True),
+            ('VERIFIED', '2.20', '2.19', False),
+            ('CLOSED - CURRENTRELEASE', '2.13', '2.12', False),
+            ('CLOSED - WORKSFORME', None, '2.19', True),
+        )
+        bugs = {
+            bug_id: {'status': status, 'target_platform_release': release}
+            for bug_id, (status, release, _, _) in enumerate(table)
+        }
+        path = _write_snapshot(bugs)
+        self.addCleanup(os.remove, path)
+        bug_status.load_snapshot(path)
+        with mock.patch.object(selectors, 'bug_is_fixed') as fallback:
+            for bug_id, (status, release, version, fixed) in enumerate(table):
+                with self.subTest(status=status, release=release,
+                                  version=version):
+                    self.assertEqual(
+                        bug_status.bug_is_fixed(bug_id, Version(version)),
+                        fixed,
+                    )
+        fallback.assert_not_called()
+
+    def test_stale_snapshot(self):
+        """Assert a warning is emitted when loading an old snapshot."""
+        created = (
+            datetime.datetime.now(datetime.timezone.utc) -
+            bug_status.MAX_SNAPSHOT_AGE -
+            datetime.timedelta(days=1)
+        )
+        path = _write_snapshot({}, created)
+        self.addCleanup(os.remove, path)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            bug_status.load_snapshot(path)
+        self.assertEqual(len(caught), 1, caught)
+
+
+class GetSnapshotPathTestCase(unittest.TestCase):
+    """Test :func:`pulp_2_tests.bug_status.get_snapshot_path`."""
+
+    def test_environment(self):
+        """Assert the path is read from ``PULP_2_TESTS_BUG_STATUS``."""
+        with mock.patch.dict(
+                os.environ, {'PULP_2_TESTS_BUG_STATUS': '/tmp/bugs.json'}):
+            self.assertEqual(bug_status.get_snapshot_path(), '/tmp/bugs.json')
+
+    def test_current_directory(self):
+        """Assert ``bug_status.json`` in the current directory is ignored."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            try:
+                with open('bug_status.json', 'w') as handle:
+                    handle.write('{}')
+                with mock.patch.dict(os.environ):
+                    os.environ.pop('PULP_2_TESTS_BUG_STATUS', None)
+                    self.assertIsNone(bug_status.get_snapshot_path())
+            finally:
+                os.chdir(cwd)
@@ -0,0 +1,101 @@
+# coding=utf-8
+"""Unit tests for :mod:`pulp_2_tests.http_pool`."""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+from packaging.version import Version
+from pulp_smash import api
+
+from pulp_2_tests import http_pool
+
+
+def _make_response(status_code, content=b''):
+    """Return a ``requests.Response`` with the given status and body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content  # pylint:disable=protected-access
+    response.headers['Content-Type'] = 'application/json'
+    response.url = 'https://pulp.example.com/pulp/api/v2/repositories/foo/'
+    return response
+
+
+def _make_client(response_handler):
+    """Return a client whose config only has what ``api.Client`` reads.
+
+    Handlers that read an attribute missing from the config, such as
+    ``_cfg``, raise ``AttributeError``.
+    """
+    cfg = mock.Mock(spec=(
+        'get_base_url',
+        'get_hosts',
+        'get_requests_kwargs',
+        'pulp_version',
+    ))
+    cfg.get_base_url.return_value = 'https://pulp.example.com'
+    cfg.get_requests_kwargs.return_value = {}
+    cfg.pulp_version = Version('2.19')
+    return http_pool.Client(cfg, response_handler, pulp_host=mock.Mock())
+
+
+class ClientTestCase(unittest.TestCase):
+    """Test :class:`pulp_2_tests.http_pool.Client`."""
+
+    def test_handler_receives_client(self):
+        """Assert the response handler is passed the client itself."""
+        handler = mock.Mock()
+        client = _make_client(handler)
+        response = _make_response(200)
+        session = mock.Mock()
+        session.request.return_value = response
+        with mock.patch.object(http_pool, 'get_session', return_value=session):
+            client.get('/pulp/api/v2/status/')
+        handler.assert_called_once_with(client, response)
+
+    def test_safe_handler_202(self):
+        """Send a request Pulp answers with HTTP 202, with ``safe_handler``.
+
+        ``safe_handler`` polls the tasks spawned by the request. There are
+        none, so no other request is sent.
+        """
+        client = _make_client(api.safe_handler)
+        response = _make_response(202, b'{"spawned_tasks": []}')
+        session = mock.Mock()
+        session.request.return_value = response
+        with mock.patch.object(http_pool, 'get_session', return_value=session):
+            self.assertIs(client.delete('repositories/foo/'), response)
+        args, kwargs = session.request.call_args
+        self.assertEqual(args, ('DELETE',))
+        self.assertEqual(
+            kwargs['url'],
+            'https://pulp.example.com/repositories/foo/',
+        )
+
+
+class GetSessionTestCase(unittest.TestCase):
+    """Test :func:`pulp_2_tests.http_pool.get_session`."""
+
+    def tearDown(self):
+        """Close the sessions created by the test."""
+        http_pool.close_sessions()
+
+    def test_shared_across_threads(self):
+        """Assert every thread gets the same session for a host."""
+        url = 'https://pulp.example.com/pulp/api/v2/status/'
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = set(executor.map(
+                lambda _: id(http_pool.get_session(url)), range(8)))
+        self.assertEqual(sessions, {id(http_pool.get_session(url))})
+
+    def test_one_per_host(self):
+        """Assert hosts and schemes get sessions of their own."""
+        sessions = {
+            id(http_pool.get_session(url)) for url in (
+                'https://pulp.example.com/a/',
+                'https://pulp.example.com/b/',
+                'http://pulp.example.com/a/',
+                'https://other.example.com/a/',
+            )
+        }
+        self.assertEqual(len(sessions), 3)
@@ -0,0 +1,63 @@
+# coding=utf-8
+"""Unit tests for :mod:`pulp_2_tests.tasks`."""
+import unittest
+from unittest import mock
+
+from pulp_smash import exceptions
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from pulp_2_tests import tasks
+
+
+def _make_poller(responses):
+    """Return a poller whose searches return, or raise, ``responses``."""
+    with mock.patch.object(tasks.http_pool, 'Client') as client:
+        client.return_value.post.side_effect = responses
+        return tasks.TaskPoller(
+            mock.Mock(), min_interval=0.01, max_interval=0.01)
+
+
+def _make_call_report(task_id):
+    """Return a call report spawning one task."""
+    return {'spawned_tasks': [{'task_id': task_id}]}
+
+
+def _make_task(task_id):
+    """Return a finished task, which spawned no tasks."""
+    return {
+        '_href': '/pulp/api/v2/tasks/{}/'.format(task_id),
+        'spawned_tasks': [],
+        'state': 'finished',
+        'task_id': task_id,
+    }
+
+
+class TaskPollerTestCase(unittest.TestCase):
+    """Test :class:`pulp_2_tests.tasks.TaskPoller`."""
+
+    def test_transient_error(self):
+        """Assert polling goes on after a poll fails."""
+        task = _make_task('foo')
+        poller = _make_poller((RequestsConnectionError(), [task]))
+        future = poller.submit(_make_call_report('foo'), timeout=10)
+        self.assertEqual(future.result(timeout=10), (task,))
+        poller.shutdown()
+
+    def test_error_past_deadline(self):
+        """Assert a tree fails if polls fail until its deadline."""
+        poller = _make_poller(RequestsConnectionError())
+        future = poller.submit(_make_call_report('foo'), timeout=0.05)
+        with self.assertRaises(exceptions.TaskTimedOutError):
+            future.result(timeout=10)
+        poller.shutdown()
+
+    def test_cancelled(self):
+        """Assert a cancelled tree doesn't stop other trees from resolving."""
+        task = _make_task('bar')
+        poller = _make_poller(lambda *args, **kwargs: [task])
+        with poller._cond:  # pylint:disable=protected-access
+            cancelled = poller.submit(_make_call_report('foo'), timeout=10)
+            self.assertTrue(cancelled.cancel())
+            future = poller.submit(_make_call_report('bar'), timeout=10)
+        self.assertEqual(future.result(timeout=10), (task,))
+        poller.shutdown()